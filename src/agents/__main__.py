@@ -11,6 +11,9 @@ def main():
     parser.add_argument("--n_candidates", type=int, default=3, help="Number of candidates per iteration")
     parser.add_argument("--n_iterations", type=int, default=1, help="Number of iterations")
     parser.add_argument("--days", type=int, default=2500, help="Lookback days")
+    parser.add_argument("--checkpoint_dir", type=str, default=None,
+                        help="Save progress here; rerun with --resume to continue after an interruption")
+    parser.add_argument("--resume", action="store_true", help="Resume the run saved in --checkpoint_dir")
     
     args = parser.parse_args()
     
@@ -22,18 +25,26 @@ def main():
     orchestrator.initialize_data(start_date=start_date, end_date=end_date)
     
     # Run iterations
-    if args.n_iterations > 1:
+    if args.resume:
+        if not args.checkpoint_dir:
+            parser.error("--resume requires --checkpoint_dir")
+        results = orchestrator.resume_from_checkpoint(args.checkpoint_dir)
+    elif args.n_iterations > 1 or args.checkpoint_dir:
         results = orchestrator.run_multiple_iterations(
             n_iterations=args.n_iterations,
-            n_candidates_per_iteration=args.n_candidates
+            n_candidates_per_iteration=args.n_candidates,
+            checkpoint_dir=args.checkpoint_dir
         )
     else:
         results = orchestrator.run_iteration(n_candidates=args.n_candidates)
     
     print("\n" + "="*60)
     print("Iteration Complete!")
-    print(f"Successful: {len(results.get('successful', []))}")
-    print(f"Failed: {len(results.get('failed', []))}")
+    if isinstance(results, dict):
+        print(f"Successful: {results.get('total_successful', len(results.get('successful', [])))}")
+        print(f"Failed: {results.get('total_failed', len(results.get('failed', [])))}")
+    else:
+        print(f"Result: {results}")
     print("="*60)
 
 
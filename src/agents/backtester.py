@@ -10,6 +10,8 @@ sys.path.append(str(Path(__file__).parent.parent.parent))
 
 from src.memory.schemas import AgentResult, AgentContent, AgentArtifact
 from src.tools.run_backtest import run_backtest
+from src.factors.context import CandidateContext
+from src.data.market_data import MarketData
 
 
 class BacktesterAgent:
@@ -30,7 +32,10 @@ class BacktesterAgent:
         prices_df,
         returns_df,
         run_id: Optional[str] = None,
-        split_cfg: Optional[Dict[str, Any]] = None
+        split_cfg: Optional[Dict[str, Any]] = None,
+        n_trials: Optional[int] = None,
+        context: Optional[CandidateContext] = None,
+        market_data: Optional[MarketData] = None
     ) -> AgentResult:
         """Run a backtest.
         
@@ -40,6 +45,10 @@ class BacktesterAgent:
             returns_df: Returns DataFrame
             run_id: Optional run ID for output directory
             split_cfg: Walk-forward split configuration
+            n_trials: Number of candidates tried so far (for the deflated Sharpe ratio)
+            context: Candidate context from the feature step; its parsed spec
+                and precomputed signals are used instead of recomputing them
+            market_data: OHLCV panels for custom code, if signals must be computed
         
         Returns:
             AgentResult with backtest metrics and artifacts
@@ -60,7 +69,10 @@ class BacktesterAgent:
                 prices_df=prices_df,
                 returns_df=returns_df,
                 split_cfg=split_cfg,
-                output_dir=output_dir
+                output_dir=output_dir,
+                n_trials=n_trials,
+                context=context,
+                market_data=market_data
             )
             
             if not result.get('is_valid', False):
@@ -0,0 +1,297 @@
+"""Producer/consumer pipeline overlapping LLM proposals with CPU-bound evaluation.
+
+Proposals are requested concurrently (in threads, since the LLM clients are
+blocking) and put on a bounded queue. Consumers take proposals off the
+queue and run the CPU-heavy evaluation in a process pool. Each finished
+candidate is handed to a finalize callback as soon as it completes, so the
+LLM keeps proposing while earlier candidates are being backtested.
+"""
+
+import asyncio
+import os
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional, Tuple, Union
+
+import pandas as pd
+
+from ..data.market_data import MarketData
+from ..data.universe import UniverseMembership
+from ..factors.context import CandidateContext
+
+# Worker-process state, set once per process by init_candidate_worker
+_WORKER: Dict[str, Any] = {}
+
+
+def _timed_call(fn: Callable, args: Tuple) -> Tuple[Any, float, float]:
+    """Run fn(*args) in a worker, returning (result, wall seconds, CPU seconds)."""
+    wall_start = time.perf_counter()
+    cpu_start = time.process_time()
+    result = fn(*args)
+    return result, time.perf_counter() - wall_start, time.process_time() - cpu_start
+
+
+class CandidatePipeline:
+    """Run proposal, evaluation and finalization stages concurrently."""
+
+    def __init__(
+        self,
+        max_workers: Optional[int] = None,
+        queue_size: int = 4,
+        max_concurrent_proposals: int = 2,
+        initializer: Optional[Callable] = None,
+        initargs: Tuple = (),
+        executor: Optional[Executor] = None
+    ):
+        """Initialize the pipeline.
+
+        Args:
+            max_workers: Evaluation processes (default: CPU count)
+            queue_size: Proposals buffered ahead of the workers
+            max_concurrent_proposals: LLM requests in flight at once
+            initializer: Called once in each worker process
+            initargs: Arguments for the initializer
+            executor: Executor to use instead of a new process pool
+        """
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.queue_size = queue_size
+        self.max_concurrent_proposals = max_concurrent_proposals
+        self.initializer = initializer
+        self.initargs = initargs
+        self.executor = executor
+
+    def run(
+        self,
+        n_candidates: int,
+        propose_fn: Callable[[], Optional[Any]],
+        prepare_fn: Callable[[Any], Optional[Tuple]],
+        worker_fn: Callable[..., Any],
+        finalize_fn: Callable[[Tuple, Any], None],
+        error_fn: Optional[Callable[[Any, Exception], None]] = None
+    ) -> Dict[str, Any]:
+        """Run the pipeline to completion.
+
+        Args:
+            n_candidates: Number of proposals to request
+            propose_fn: Returns a proposal, or None on failure (runs in a thread)
+            prepare_fn: Turns a proposal into worker arguments, or None to drop it
+            worker_fn: Picklable CPU-bound evaluation (runs in the pool)
+            finalize_fn: Called with (worker arguments, worker result) as each
+                candidate completes. Runs in a thread; calls never overlap.
+            error_fn: Called with (proposal, exception) if preparing,
+                evaluating or finalizing a candidate fails
+
+        Returns:
+            Timing and utilization statistics
+        """
+        return asyncio.run(
+            self._run(n_candidates, propose_fn, prepare_fn, worker_fn, finalize_fn, error_fn)
+        )
+
+    async def _run(self, n_candidates, propose_fn, prepare_fn, worker_fn, finalize_fn, error_fn) -> Dict[str, Any]:
+        loop = asyncio.get_running_loop()
+        queue: asyncio.Queue = asyncio.Queue(maxsize=self.queue_size)
+        llm_slots = asyncio.Semaphore(self.max_concurrent_proposals)
+        finalize_lock = asyncio.Lock()
+        finalizers = set()
+
+        stats = {
+            'n_proposed': 0,
+            'n_evaluated': 0,
+            'n_errors': 0,
+            'proposal_seconds': 0.0,
+            'worker_seconds': 0.0,
+            'worker_cpu_seconds': 0.0
+        }
+
+        async def produce():
+            async with llm_slots:
+                start = time.perf_counter()
+                try:
+                    proposal = await asyncio.to_thread(propose_fn)
+                except Exception as e:
+                    print(f"  Error proposing factor: {e}")
+                    proposal = None
+                stats['proposal_seconds'] += time.perf_counter() - start
+            if proposal is not None:
+                stats['n_proposed'] += 1
+                await queue.put(proposal)
+
+        def handle_error(proposal, error: Exception):
+            stats['n_errors'] += 1
+            print(f"  Error: {error}")
+            if error_fn is not None:
+                error_fn(proposal, error)
+
+        async def finalize(proposal, args, result):
+            # Serialized, but off the consumer path so workers pick up the next proposal
+            async with finalize_lock:
+                try:
+                    await asyncio.to_thread(finalize_fn, args, result)
+                except Exception as e:
+                    handle_error(proposal, e)
+
+        async def consume():
+            while True:
+                proposal = await queue.get()
+                if proposal is None:
+                    return
+                try:
+                    args = await asyncio.to_thread(prepare_fn, proposal)
+                    if args is None:
+                        continue
+                    result, wall, cpu = await loop.run_in_executor(executor, _timed_call, worker_fn, args)
+                except Exception as e:
+                    async with finalize_lock:
+                        handle_error(proposal, e)
+                    continue
+
+                stats['n_evaluated'] += 1
+                stats['worker_seconds'] += wall
+                stats['worker_cpu_seconds'] += cpu
+
+                task = asyncio.create_task(finalize(proposal, args, result))
+                finalizers.add(task)
+                task.add_done_callback(finalizers.discard)
+
+        owns_executor = self.executor is None
+        executor = self.executor or ProcessPoolExecutor(
+            max_workers=self.max_workers,
+            initializer=self.initializer,
+            initargs=self.initargs
+        )
+
+        wall_start = time.perf_counter()
+        try:
+            consumers = [asyncio.create_task(consume()) for _ in range(self.max_workers)]
+            await asyncio.gather(*(produce() for _ in range(n_candidates)))
+            for _ in consumers:
+                await queue.put(None)
+            await asyncio.gather(*consumers)
+            await asyncio.gather(*list(finalizers))
+        finally:
+            if owns_executor:
+                executor.shutdown(wait=True)
+        wall = time.perf_counter() - wall_start
+
+        stats['wall_seconds'] = wall
+        stats['max_workers'] = self.max_workers
+        stats['worker_utilization'] = stats['worker_seconds'] / (wall * self.max_workers) if wall > 0 else 0.0
+        stats['llm_utilization'] = (
+            stats['proposal_seconds'] / (wall * self.max_concurrent_proposals) if wall > 0 else 0.0
+        )
+        return stats
+
+
+def init_candidate_worker(
+    prices_df: Union[pd.DataFrame, str],
+    returns_df: Optional[pd.DataFrame],
+    db_path: str,
+    screening_thresholds: Dict[str, Any],
+    duplicate_threshold: float,
+    output_base_dir: str = "experiments/runs",
+    universe: Optional[UniverseMembership] = None
+):
+    """Set up per-process state for evaluate_candidate (process pool initializer).
+
+    prices_df may be a panel snapshot directory; its fields are then
+    memory-mapped on first use rather than pickled into every worker, and
+    returns_df (if None) is computed from the closes. universe is sent as
+    its membership spells and each worker builds the mask itself.
+    """
+    if isinstance(prices_df, str):
+        market_data = MarketData.from_snapshot(prices_df, universe=universe, returns=returns_df)
+    else:
+        market_data = MarketData.from_frames(universe=universe, close=prices_df, returns=returns_df)
+
+    from .feature_agent import FeatureAgent
+    from .backtester import BacktesterAgent
+    from ..backtest.screening import ScreeningCascade
+    from ..memory.store import ExperimentStore
+
+    _WORKER.update({
+        'market_data': market_data,
+        'prices_df': market_data.close,
+        'returns_df': market_data.returns,
+        'store': ExperimentStore(db_path),
+        'feature_agent': FeatureAgent(),
+        'backtester': BacktesterAgent(output_base_dir=Path(output_base_dir)),
+        'screening': ScreeningCascade(screening_thresholds),
+        'duplicate_threshold': duplicate_threshold
+    })
+
+
+def evaluate_candidate(
+    factor_yaml: str,
+    factor_id: int,
+    run_id: str,
+    n_trials: int,
+    context: Optional[CandidateContext] = None
+) -> Dict[str, Any]:
+    """Compute, deduplicate, screen and backtest one candidate in a worker.
+
+    Args:
+        factor_yaml: Factor DSL YAML
+        factor_id: Factor ID in the experiment store
+        run_id: Backtest output directory name
+        n_trials: Number of candidates tried so far (for the deflated Sharpe ratio)
+        context: Candidate context already parsed by the caller
+
+    Returns:
+        Dictionary with 'status' (feature_failed, duplicate, screened,
+        backtest_failed or backtested) and the results of the stages that ran
+    """
+    from ..memory.fingerprint import signal_fingerprint
+
+    worker = _WORKER
+    # Parsed, validated and computed once, then shared by every stage below
+    if context is None:
+        context = CandidateContext.from_yaml(factor_yaml)
+
+    feature_result = worker['feature_agent'].compute_features(
+        factor_yaml,
+        worker['prices_df'],
+        worker['returns_df'],
+        context=context,
+        market_data=worker['market_data']
+    )
+    if feature_result.status != "SUCCESS":
+        return {'status': 'feature_failed', 'feature_result': feature_result}
+
+    spec = context.spec
+    signals_df = context.signals
+
+    # Checked and indexed atomically, so concurrent workers see each other's candidates
+    matches = worker['store'].add_fingerprint_if_unique(
+        spec.name,
+        signal_fingerprint(signals_df),
+        factor_id=factor_id,
+        threshold=worker['duplicate_threshold']
+    )
+    if matches:
+        return {'status': 'duplicate', 'duplicate': matches[0]}
+
+    screen = worker['screening'].screen(signals_df, worker['returns_df'], spec)
+    if not screen['passed']:
+        return {'status': 'screened', 'screen': screen}
+
+    backtest_start = time.perf_counter()
+    backtest_result = worker['backtester'].run_backtest(
+        factor_yaml=factor_yaml,
+        prices_df=worker['prices_df'],
+        returns_df=worker['returns_df'],
+        run_id=run_id,
+        n_trials=n_trials,
+        context=context,
+        market_data=worker['market_data']
+    )
+    backtest_seconds = time.perf_counter() - backtest_start
+
+    return {
+        'status': 'backtested' if backtest_result.status == "SUCCESS" else 'backtest_failed',
+        'feature_result': feature_result,
+        'backtest_result': backtest_result,
+        'screen': screen,
+        'backtest_seconds': backtest_seconds
+    }
@@ -0,0 +1,110 @@
+"""Durable checkpoints for long-running discovery loops.
+
+A checkpoint is a directory holding the loop state as JSON (state.json) and
+computed signal panels as parquet files keyed by a hash of the factor YAML
+and of the data they were computed on.
+The state file is replaced atomically (write to a temporary file, fsync,
+rename), so a crash at any point leaves either the previous or the new
+state on disk, never a partial one.
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+import threading
+from datetime import date, datetime
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+import numpy as np
+import pandas as pd
+
+
+def _json_default(value: Any) -> Any:
+    """Convert numpy, pandas and datetime values for json.dump."""
+    if isinstance(value, np.generic):
+        return value.item()
+    if isinstance(value, np.ndarray):
+        return value.tolist()
+    if isinstance(value, (pd.Timestamp, datetime, date)):
+        return value.isoformat()
+    if isinstance(value, Path):
+        return str(value)
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def signal_cache_key(factor_yaml: str, data_hash: Optional[str] = None) -> str:
+    """Key under which a factor's computed signals are stored.
+
+    Args:
+        factor_yaml: Factor DSL YAML
+        data_hash: Content hash of the data the signals were computed on
+            (see data.quality.panel_hash), so new data never hits old signals
+    """
+    key = factor_yaml if data_hash is None else f"{data_hash}\n{factor_yaml}"
+    return hashlib.sha256(key.encode('utf-8')).hexdigest()[:32]
+
+
+class LoopCheckpoint:
+    """Atomic JSON state plus a signal cache for one loop run."""
+
+    def __init__(self, directory: str):
+        """Open (or create) a checkpoint directory.
+
+        Args:
+            directory: Checkpoint directory; existing state is loaded
+        """
+        self.directory = Path(directory)
+        self.state_path = self.directory / 'state.json'
+        self.signals_dir = self.directory / 'signals'
+        self._lock = threading.Lock()
+
+        self.state: Dict[str, Any] = {}
+        if self.state_path.exists():
+            with open(self.state_path) as f:
+                self.state = json.load(f)
+
+    @property
+    def exists(self) -> bool:
+        """Whether a saved state was loaded."""
+        return bool(self.state)
+
+    def save(self):
+        """Write the current state atomically."""
+        with self._lock:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            self.state['updated_at'] = datetime.now().isoformat()
+            fd, tmp_path = tempfile.mkstemp(dir=self.directory, prefix='.state.', suffix='.tmp')
+            try:
+                with os.fdopen(fd, 'w') as f:
+                    json.dump(self.state, f, indent=2, default=_json_default)
+                    f.flush()
+                    os.fsync(f.fileno())
+                os.replace(tmp_path, self.state_path)
+            except BaseException:
+                if os.path.exists(tmp_path):
+                    os.unlink(tmp_path)
+                raise
+
+    def update(self, **fields):
+        """Set top-level state fields and save."""
+        self.state.update(fields)
+        self.save()
+
+    def save_signals(self, factor_yaml: str, signals_df: pd.DataFrame, data_hash: Optional[str] = None) -> str:
+        """Store a computed signal panel; returns its cache key."""
+        key = signal_cache_key(factor_yaml, data_hash)
+        self.signals_dir.mkdir(parents=True, exist_ok=True)
+        path = self.signals_dir / f"{key}.parquet"
+        tmp_path = path.with_suffix('.parquet.tmp')
+        signals_df.to_parquet(tmp_path)
+        os.replace(tmp_path, path)
+        return key
+
+    def load_signals(self, key: str) -> Optional[pd.DataFrame]:
+        """Load a stored signal panel, or None if it is missing."""
+        path = self.signals_dir / f"{key}.parquet"
+        if not path.exists():
+            return None
+        return pd.read_parquet(path)
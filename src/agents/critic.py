@@ -9,34 +9,20 @@ sys.path.append(str(Path(__file__).parent.parent.parent))
 
 from src.memory.schemas import AgentResult, AgentContent, AgentArtifact
 
-try:
-    from langchain_community.llms import Ollama
-except (ImportError, Exception):
-    try:
-        from langchain.llms import Ollama
-    except (ImportError, Exception):
-        # Mock Ollama
-        class Ollama:
-            def __init__(self, **kwargs): pass
-            def __call__(self, *args, **kwargs): return "Mock response"
-
 try:
     from langchain_core.prompts import PromptTemplate
-    from langchain.chains import LLMChain
 except (ImportError, Exception):
     try:
         from langchain.prompts import PromptTemplate
-        from langchain.chains import LLMChain
     except (ImportError, Exception):
-        # Mock classes
+        # Mock PromptTemplate
         class PromptTemplate:
-            def __init__(self, **kwargs): pass
-        class LLMChain:
-            def __init__(self, **kwargs): pass
-            def run(self, **kwargs): return "Mock response"
+            def __init__(self, template: str = "", **kwargs): self.template = template
+            def format(self, **kwargs): return self.template.format(**kwargs)
 
 from ..memory.lessons import LessonManager
 from ..memory.store import ExperimentStore
+from .llm_gateway import LLMGateway, get_llm_gateway
 from ..tools.write_lesson import write_lesson
 from ..analysis.guidelines import get_analysis_guidelines
 
@@ -47,10 +33,12 @@ class CriticAgent:
     def __init__(
         self,
         model_name: str = "deepseek-r1",
-        db_path: str = "experiments.db"
+        db_path: str = "experiments.db",
+        llm_gateway: Optional[LLMGateway] = None
     ):
         """Initialize critic agent."""
-        self.llm = Ollama(model=model_name, temperature=0.3)
+        self.model_name = model_name
+        self.llm_gateway = llm_gateway or get_llm_gateway()
         self.store = ExperimentStore(db_path)
         self.lesson_manager = LessonManager(self.store)
         self.guidelines = get_analysis_guidelines()
@@ -192,12 +180,12 @@ Provide a structured critique with explicit evaluation of each metric requiremen
             issues_str = "\n".join([f"- {i.get('type', 'Unknown')}: {i.get('detail', '')}" for i in issues]) if issues else "None"
             
             # Generate critique
-            chain = LLMChain(llm=self.llm, prompt=self.critique_prompt)
-            critique_text = chain.run(
+            prompt = self.critique_prompt.format(
                 metrics=metrics_str,
                 issues=issues_str,
                 factor_yaml=factor_yaml
             )
+            critique_text = self.llm_gateway.complete(prompt, model=self.model_name, temperature=0.3)
             
             # Determine if passed
             critical_issues = [i for i in issues if i.get('severity') in ['error', 'critical']]
@@ -10,6 +10,8 @@ sys.path.append(str(Path(__file__).parent.parent.parent))
 
 from src.memory.schemas import AgentResult, AgentContent, AgentArtifact
 from src.factors.dsl import DSLParser
+from src.data.market_data import MarketData
+from src.factors.context import CandidateContext
 from src.tools.compute_factor import compute_factor
 
 
@@ -24,7 +26,9 @@ class FeatureAgent:
         self,
         factor_yaml: str,
         prices_df: pd.DataFrame,
-        returns_df: Optional[pd.DataFrame] = None
+        returns_df: Optional[pd.DataFrame] = None,
+        context: Optional[CandidateContext] = None,
+        market_data: Optional[MarketData] = None
     ) -> AgentResult:
         """Compute factor features from DSL.
         
@@ -32,28 +36,31 @@ class FeatureAgent:
             factor_yaml: Factor DSL YAML string
             prices_df: Prices DataFrame
             returns_df: Optional returns DataFrame
+            context: Candidate context to reuse and fill in (parsed spec,
+                validation, signals) for later steps such as the backtest
+            market_data: Lazily loaded OHLCV panels for custom code
         
         Returns:
             AgentResult with signals and validation status
         """
-        # Parse and validate
-        try:
-            spec = self.parser.parse(factor_yaml)
-        except Exception as e:
+        # Parse and validate (once per candidate)
+        if context is None:
+            context = CandidateContext.from_yaml(factor_yaml, self.parser)
+        
+        if context.parse_error is not None:
             return AgentResult(
                 agent="FeatureEngineer",
                 step="ValidateAndCompute",
                 status="FAILURE",
                 content=AgentContent(
-                    summary=f"DSL Parsing failed: {str(e)}",
-                    data={"error": str(e)}
+                    summary=f"DSL Parsing failed: {context.parse_error}",
+                    data={"error": context.parse_error}
                 )
             )
         
-        # Validate no-lookahead
-        is_valid, warnings = self.parser.validate_no_lookahead(spec)
+        warnings = context.warnings
         
-        if not is_valid:
+        if not context.is_valid:
             return AgentResult(
                 agent="FeatureEngineer",
                 step="ValidateAndCompute",
@@ -68,7 +75,7 @@ class FeatureAgent:
             )
         
         # Compute signals
-        result = compute_factor(factor_yaml, prices_df, returns_df)
+        result = compute_factor(factor_yaml, prices_df, returns_df, context=context, market_data=market_data)
         
         if result['signals'] is None:
             return AgentResult(
@@ -0,0 +1,150 @@
+"""Persistent, content-addressed cache of LLM responses.
+
+Responses are keyed by a SHA-256 of (model, prompt, temperature, seed) and
+stored in SQLite, so re-running a discovery loop replays identical prompts
+from disk instead of the LLM. Entries expire after a TTL, and the least
+recently used entries are evicted once the cache exceeds its entry or
+byte limits.
+"""
+
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+# Cache modes used by the gateway
+CACHE_MODES = ('off', 'read_write', 'cache_only')
+
+
+def cache_key(model: Optional[str], prompt: str, temperature: Optional[float], seed: Optional[int]) -> str:
+    """SHA-256 hex digest identifying one LLM request."""
+    payload = json.dumps([model, prompt, temperature, seed], ensure_ascii=False)
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+
+class LLMResponseCache:
+    """SQLite-backed LLM response cache with TTL and LRU size eviction."""
+
+    def __init__(
+        self,
+        path: str = "data/cache/llm_responses.sqlite",
+        ttl_seconds: Optional[float] = 30 * 24 * 3600,
+        max_entries: Optional[int] = 100_000,
+        max_bytes: Optional[int] = 512 * 1024 * 1024
+    ):
+        """Initialize the cache.
+
+        Args:
+            path: SQLite file (created if missing)
+            ttl_seconds: Age after which entries expire (None: never)
+            max_entries: Maximum number of entries (None: unbounded)
+            max_bytes: Maximum total size of stored responses (None: unbounded)
+        """
+        self.path = Path(path)
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+
+    def _connection(self) -> sqlite3.Connection:
+        # Opened on first use, so constructing agents does not create the file
+        if self._conn is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(str(self.path), timeout=30, check_same_thread=False)
+            with self._conn:
+                self._conn.execute("""
+                    CREATE TABLE IF NOT EXISTS llm_responses (
+                        key TEXT PRIMARY KEY,
+                        model TEXT,
+                        response TEXT NOT NULL,
+                        size INTEGER NOT NULL,
+                        created_at REAL NOT NULL,
+                        last_used REAL NOT NULL
+                    )
+                """)
+                self._conn.execute(
+                    "CREATE INDEX IF NOT EXISTS idx_llm_responses_last_used ON llm_responses (last_used)"
+                )
+        return self._conn
+
+    def get(self, key: str) -> Optional[str]:
+        """Return the cached response for a key, or None if missing or expired."""
+        now = time.time()
+        with self._lock:
+            conn = self._connection()
+            row = conn.execute(
+                "SELECT response, created_at FROM llm_responses WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            with conn:
+                if self.ttl_seconds is not None and now - row[1] > self.ttl_seconds:
+                    conn.execute("DELETE FROM llm_responses WHERE key = ?", (key,))
+                    return None
+                conn.execute("UPDATE llm_responses SET last_used = ? WHERE key = ?", (now, key))
+            return row[0]
+
+    def put(self, key: str, response: str, model: Optional[str] = None):
+        """Store a response and evict entries over the limits."""
+        now = time.time()
+        with self._lock:
+            conn = self._connection()
+            with conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO llm_responses (key, model, response, size, created_at, last_used) "
+                    "VALUES (?, ?, ?, ?, ?, ?)",
+                    (key, model, response, len(response.encode('utf-8')), now, now)
+                )
+                self._evict(conn, now)
+
+    def _evict(self, conn: sqlite3.Connection, now: float):
+        if self.ttl_seconds is not None:
+            conn.execute("DELETE FROM llm_responses WHERE created_at < ?", (now - self.ttl_seconds,))
+
+        count, total = conn.execute(
+            "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM llm_responses"
+        ).fetchone()
+        if self.max_entries is not None and count > self.max_entries:
+            conn.execute(
+                "DELETE FROM llm_responses WHERE key IN "
+                "(SELECT key FROM llm_responses ORDER BY last_used, key LIMIT ?)",
+                (count - self.max_entries,)
+            )
+            total = conn.execute("SELECT COALESCE(SUM(size), 0) FROM llm_responses").fetchone()[0]
+
+        if self.max_bytes is not None and total > self.max_bytes:
+            # Least recently used entries, up to the first that brings the total under the limit
+            conn.execute("""
+                DELETE FROM llm_responses WHERE key IN (
+                    SELECT key FROM (
+                        SELECT key, size, SUM(size) OVER (ORDER BY last_used, key) AS freed
+                        FROM llm_responses
+                    ) WHERE freed - size < ?
+                )
+            """, (total - self.max_bytes,))
+
+    def stats(self) -> Dict[str, Any]:
+        """Entry count and total response bytes."""
+        with self._lock:
+            count, total = self._connection().execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM llm_responses"
+            ).fetchone()
+        return {'entries': count, 'bytes': total, 'path': str(self.path)}
+
+    def clear(self):
+        """Delete every entry."""
+        with self._lock:
+            conn = self._connection()
+            with conn:
+                conn.execute("DELETE FROM llm_responses")
+
+    def close(self):
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
@@ -0,0 +1,500 @@
+"""Shared asyncio gateway for LLM calls made by the agents.
+
+All requests run on one background event loop per process, so limits hold
+across agents and threads:
+- a semaphore per backend caps requests in flight,
+- every attempt has a timeout and failed attempts are retried with
+  exponential backoff and jitter,
+- backends that accept several prompts in one request get concurrent
+  prompts coalesced into batches over a short window,
+- with a response cache attached, identical requests are answered from
+  disk, and in cache-only mode a miss is an error (offline replay).
+
+Backends are plain blocking clients run in the loop's thread pool. A
+thread cannot be interrupted, so an attempt that times out keeps its
+concurrency slot until the backend call returns; backends should bound
+their own calls with a socket timeout no longer than the gateway's.
+Agents call the synchronous complete()/complete_many(); async code can
+await generate()/generate_many() from any event loop.
+"""
+
+import abc
+import asyncio
+import json
+import logging
+import os
+import random
+import threading
+import urllib.error
+import urllib.request
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from ..utils.error_handling import QuantAlphaError
+from .llm_cache import CACHE_MODES, LLMResponseCache, cache_key
+
+logger = logging.getLogger("quantalpha.llm")
+
+
+class LLMGatewayError(QuantAlphaError):
+    """LLM request failed (after retries, if the error was retryable)."""
+
+    def __init__(self, message: str, retryable: bool = True):
+        super().__init__(message)
+        self.retryable = retryable
+
+
+class LLMBackend(abc.ABC):
+    """Blocking LLM client used by the gateway.
+
+    Subclasses implement complete(); those whose server accepts several
+    prompts per request also override complete_batch() and set
+    max_batch_size above 1.
+    """
+
+    name = "backend"
+    model: Optional[str] = None
+
+    def __init__(self, max_concurrency: int = 2, max_batch_size: int = 1):
+        self.max_concurrency = max_concurrency
+        self.max_batch_size = max_batch_size
+
+    @abc.abstractmethod
+    def complete(
+        self,
+        prompt: str,
+        model: Optional[str],
+        temperature: Optional[float],
+        seed: Optional[int] = None
+    ) -> str:
+        """Complete one prompt."""
+
+    def complete_batch(
+        self,
+        prompts: List[str],
+        model: Optional[str],
+        temperature: Optional[float],
+        seed: Optional[int] = None
+    ) -> List[str]:
+        """Complete several prompts (one request each unless overridden)."""
+        return [self.complete(prompt, model, temperature, seed) for prompt in prompts]
+
+
+class OllamaBackend(LLMBackend):
+    """Ollama HTTP client.
+
+    Single prompts go to the native /api/generate endpoint, which takes one
+    prompt per request. With max_batch_size > 1, batches are sent to an
+    OpenAI-compatible /v1/completions endpoint with a list of prompts, for
+    servers that support it (e.g. llama.cpp or vLLM in front of the models).
+    """
+
+    name = "ollama"
+
+    def __init__(
+        self,
+        base_url: Optional[str] = None,
+        model: str = "deepseek-r1",
+        max_concurrency: int = 2,
+        max_batch_size: int = 1,
+        batch_path: str = "/v1/completions",
+        request_timeout: float = 300.0
+    ):
+        """Initialize the client.
+
+        Args:
+            base_url: Server URL (default: OLLAMA_HOST or http://localhost:11434)
+            model: Model used when a request does not name one
+            max_concurrency: Requests in flight at once
+            max_batch_size: Prompts per batched request (1 disables batching)
+            batch_path: Endpoint for batched requests
+            request_timeout: Socket timeout per request in seconds
+        """
+        super().__init__(max_concurrency=max_concurrency, max_batch_size=max_batch_size)
+        base_url = base_url or os.environ.get("OLLAMA_HOST", "http://localhost:11434")
+        if not base_url.startswith("http"):
+            base_url = f"http://{base_url}"
+        self.base_url = base_url.rstrip("/")
+        self.model = model
+        self.batch_path = batch_path
+        self.request_timeout = request_timeout
+
+    def _post(self, path: str, payload: Dict[str, Any]) -> Dict[str, Any]:
+        request = urllib.request.Request(
+            self.base_url + path,
+            data=json.dumps(payload).encode("utf-8"),
+            headers={"Content-Type": "application/json"},
+            method="POST"
+        )
+        try:
+            with urllib.request.urlopen(request, timeout=self.request_timeout) as response:
+                return json.loads(response.read().decode("utf-8"))
+        except urllib.error.HTTPError as e:
+            # Client errors will not succeed on retry; rate limits and server errors may
+            retryable = e.code >= 500 or e.code == 429
+            raise LLMGatewayError(f"{self.base_url}{path} returned HTTP {e.code}", retryable=retryable)
+
+    def complete(
+        self,
+        prompt: str,
+        model: Optional[str],
+        temperature: Optional[float],
+        seed: Optional[int] = None
+    ) -> str:
+        payload: Dict[str, Any] = {"model": model or self.model, "prompt": prompt, "stream": False}
+        options = {"temperature": temperature, "seed": seed}
+        options = {k: v for k, v in options.items() if v is not None}
+        if options:
+            payload["options"] = options
+        return self._post("/api/generate", payload)["response"]
+
+    def complete_batch(
+        self,
+        prompts: List[str],
+        model: Optional[str],
+        temperature: Optional[float],
+        seed: Optional[int] = None
+    ) -> List[str]:
+        payload: Dict[str, Any] = {"model": model or self.model, "prompt": prompts}
+        if temperature is not None:
+            payload["temperature"] = temperature
+        if seed is not None:
+            payload["seed"] = seed
+        choices = self._post(self.batch_path, payload)["choices"]
+        if len(choices) != len(prompts):
+            raise LLMGatewayError(f"Batch of {len(prompts)} prompts returned {len(choices)} choices")
+        return [choice["text"] for choice in sorted(choices, key=lambda c: c.get("index", 0))]
+
+
+class CallableBackend(LLMBackend):
+    """Backend wrapping a function (prompt, model, temperature) -> text.
+
+    Used for SDK clients such as Gemini, and for tests. The seed is not
+    passed on; it only distinguishes cache entries.
+    """
+
+    def __init__(
+        self,
+        fn: Callable[[str, Optional[str], Optional[float]], str],
+        name: str = "callable",
+        max_concurrency: int = 2
+    ):
+        super().__init__(max_concurrency=max_concurrency)
+        self.fn = fn
+        self.name = name
+
+    def complete(
+        self,
+        prompt: str,
+        model: Optional[str],
+        temperature: Optional[float],
+        seed: Optional[int] = None
+    ) -> str:
+        return self.fn(prompt, model, temperature)
+
+
+class LLMGateway:
+    """Concurrency-limited, retrying, batching front end for LLM backends."""
+
+    def __init__(
+        self,
+        timeout: float = 300.0,
+        max_retries: int = 2,
+        backoff: float = 0.5,
+        max_backoff: float = 30.0,
+        batch_window: float = 0.02,
+        cache: Optional[LLMResponseCache] = None,
+        cache_mode: str = "read_write"
+    ):
+        """Initialize the gateway.
+
+        Args:
+            timeout: Seconds allowed per attempt. A timed-out call keeps its
+                concurrency slot until the backend returns, so backends should
+                use a socket timeout no longer than this
+            max_retries: Retries after the first attempt
+            backoff: Delay before the first retry; doubles on each retry
+            max_backoff: Upper bound on the retry delay
+            batch_window: Seconds to wait for more prompts before sending a batch
+            cache: Response cache (None disables caching)
+            cache_mode: 'read_write', 'cache_only' (misses raise instead of
+                calling the backend) or 'off'
+        """
+        if cache_mode not in CACHE_MODES:
+            raise ValueError(f"Unknown cache mode: {cache_mode}")
+
+        self.timeout = timeout
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.batch_window = batch_window
+        self.cache = cache
+        self.cache_mode = cache_mode
+
+        self.backends: Dict[str, LLMBackend] = {}
+        self.stats = {
+            'requests': 0, 'prompts': 0, 'batches': 0, 'retries': 0, 'failures': 0,
+            'cache_hits': 0, 'cache_misses': 0
+        }
+
+        self._semaphores: Dict[str, asyncio.Semaphore] = {}
+        self._pending: Dict[Tuple, List[Tuple[str, asyncio.Future]]] = {}
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+
+    def register(self, name: str, backend: LLMBackend):
+        """Add or replace a backend."""
+        with self._lock:
+            self.backends[name] = backend
+            self._semaphores.pop(name, None)
+
+    # ------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------
+
+    def complete(
+        self,
+        prompt: str,
+        backend: str = "ollama",
+        model: Optional[str] = None,
+        temperature: Optional[float] = None,
+        seed: Optional[int] = None
+    ) -> str:
+        """Blocking completion of one prompt.
+
+        Args:
+            prompt: Prompt text
+            backend: Registered backend name
+            model: Model name (default: the backend's)
+            temperature: Sampling temperature (default: the backend's)
+            seed: Sampling seed, where the backend supports one
+
+        Returns:
+            Completion text
+
+        Raises:
+            LLMGatewayError: If the request failed after retries
+        """
+        return self._submit(self._request(backend, prompt, model, temperature, seed)).result()
+
+    def complete_many(
+        self,
+        prompts: List[str],
+        backend: str = "ollama",
+        model: Optional[str] = None,
+        temperature: Optional[float] = None,
+        seed: Optional[int] = None
+    ) -> List[str]:
+        """Blocking completion of several prompts, batched where the backend supports it."""
+        return self._submit(self._request_many(backend, prompts, model, temperature, seed)).result()
+
+    async def generate(
+        self,
+        prompt: str,
+        backend: str = "ollama",
+        model: Optional[str] = None,
+        temperature: Optional[float] = None,
+        seed: Optional[int] = None
+    ) -> str:
+        """Async completion of one prompt (see complete)."""
+        return await asyncio.wrap_future(self._submit(self._request(backend, prompt, model, temperature, seed)))
+
+    async def generate_many(
+        self,
+        prompts: List[str],
+        backend: str = "ollama",
+        model: Optional[str] = None,
+        temperature: Optional[float] = None,
+        seed: Optional[int] = None
+    ) -> List[str]:
+        """Async completion of several prompts (see complete_many)."""
+        return await asyncio.wrap_future(
+            self._submit(self._request_many(backend, prompts, model, temperature, seed))
+        )
+
+    def close(self):
+        """Stop the background loop."""
+        with self._lock:
+            loop, thread = self._loop, self._thread
+            self._loop = self._thread = None
+            self._semaphores.clear()
+        if loop is not None:
+            loop.call_soon_threadsafe(loop.stop)
+            thread.join(timeout=5)
+            loop.close()
+
+    # ------------------------------------------------------------------
+    # Event loop plumbing
+    # ------------------------------------------------------------------
+
+    def _submit(self, coro):
+        loop = self._ensure_loop()
+        if threading.current_thread() is self._thread:
+            coro.close()
+            raise RuntimeError("Blocking LLM gateway call from inside the gateway loop")
+        return asyncio.run_coroutine_threadsafe(coro, loop)
+
+    def _ensure_loop(self) -> asyncio.AbstractEventLoop:
+        with self._lock:
+            if self._loop is None:
+                self._loop = asyncio.new_event_loop()
+                self._thread = threading.Thread(
+                    target=self._loop.run_forever, name="llm-gateway", daemon=True
+                )
+                self._thread.start()
+            return self._loop
+
+    def _backend(self, name: str) -> Tuple[LLMBackend, asyncio.Semaphore]:
+        backend = self.backends.get(name)
+        if backend is None:
+            raise LLMGatewayError(f"Unknown LLM backend: {name}", retryable=False)
+        if name not in self._semaphores:
+            self._semaphores[name] = asyncio.Semaphore(backend.max_concurrency)
+        return backend, self._semaphores[name]
+
+    # ------------------------------------------------------------------
+    # Requests (run on the gateway loop)
+    # ------------------------------------------------------------------
+
+    async def _request(self, backend_name: str, prompt: str, model, temperature, seed) -> str:
+        backend, semaphore = self._backend(backend_name)
+        self.stats['prompts'] += 1
+
+        key = None
+        if self.cache is not None and self.cache_mode != "off":
+            key = cache_key(f"{backend_name}:{model or backend.model}", prompt, temperature, seed)
+            cached = self.cache.get(key)
+            if cached is not None:
+                self.stats['cache_hits'] += 1
+                return cached
+            self.stats['cache_misses'] += 1
+            if self.cache_mode == "cache_only":
+                raise LLMGatewayError(
+                    f"{backend_name} response not cached (cache-only mode, key {key[:12]})", retryable=False
+                )
+
+        text = await self._dispatch(backend_name, backend, semaphore, prompt, model, temperature, seed)
+        if key is not None:
+            self.cache.put(key, text, model=model or backend.model)
+        return text
+
+    async def _dispatch(
+        self,
+        backend_name: str,
+        backend: LLMBackend,
+        semaphore: asyncio.Semaphore,
+        prompt: str,
+        model,
+        temperature,
+        seed
+    ) -> str:
+        # Join the pending batch for this backend/model/temperature/seed
+        key = (backend_name, model, temperature, seed)
+        future = asyncio.get_running_loop().create_future()
+        pending = self._pending.setdefault(key, [])
+        pending.append((prompt, future))
+        if len(pending) >= backend.max_batch_size:
+            self._flush(key)
+        elif len(pending) == 1:
+            asyncio.get_running_loop().call_later(self.batch_window, self._flush, key)
+        return await future
+
+    async def _request_many(self, backend_name: str, prompts: List[str], model, temperature, seed) -> List[str]:
+        return list(await asyncio.gather(
+            *(self._request(backend_name, prompt, model, temperature, seed) for prompt in prompts)
+        ))
+
+    def _flush(self, key: Tuple):
+        items = self._pending.pop(key, None)
+        if items:
+            asyncio.get_running_loop().create_task(self._send_batch(key, items))
+
+    async def _send_batch(self, key: Tuple, items: List[Tuple[str, asyncio.Future]]):
+        backend_name, model, temperature, seed = key
+        backend, semaphore = self._backend(backend_name)
+        prompts = [prompt for prompt, _ in items]
+        self.stats['batches'] += 1
+
+        try:
+            if len(prompts) == 1:
+                texts = [await self._call(
+                    backend_name, semaphore, backend.complete, prompts[0], model, temperature, seed
+                )]
+            else:
+                texts = await self._call(
+                    backend_name, semaphore, backend.complete_batch, prompts, model, temperature, seed
+                )
+        except Exception as e:
+            for _, future in items:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        for (_, future), text in zip(items, texts):
+            if not future.done():
+                future.set_result(text)
+
+    async def _call(self, backend_name: str, semaphore: asyncio.Semaphore, fn: Callable, *args) -> Any:
+        """Run a blocking backend call under the semaphore with timeout and retries.
+
+        The semaphore is held until the executor thread finishes, also after a
+        timeout, so no more than max_concurrency calls reach the backend.
+        """
+        loop = asyncio.get_running_loop()
+
+        for attempt in range(self.max_retries + 1):
+            async with semaphore:
+                self.stats['requests'] += 1
+                call = loop.run_in_executor(None, fn, *args)
+                try:
+                    return await asyncio.wait_for(asyncio.shield(call), self.timeout)
+                except asyncio.TimeoutError:
+                    error: Exception = LLMGatewayError(f"{backend_name} request timed out after {self.timeout}s")
+                    # The thread cannot be cancelled; wait for it before giving up the slot
+                    await asyncio.wait([call])
+                    if not call.cancelled():
+                        call.exception()  # the attempt has already failed; mark it retrieved
+                except Exception as e:
+                    error = e
+
+            retryable = getattr(error, 'retryable', True)
+            if not retryable or attempt == self.max_retries:
+                self.stats['failures'] += 1
+                if isinstance(error, LLMGatewayError):
+                    raise error
+                raise LLMGatewayError(f"{backend_name} request failed: {error}", retryable=retryable) from error
+
+            # Back off outside the semaphore so other requests can use the slot
+            delay = min(self.backoff * 2 ** attempt, self.max_backoff) * random.uniform(0.5, 1.0)
+            self.stats['retries'] += 1
+            logger.warning(f"{backend_name} request failed ({error}); retry {attempt + 1} in {delay:.2f}s")
+            await asyncio.sleep(delay)
+
+
+_default_gateway: Optional[LLMGateway] = None
+_default_lock = threading.Lock()
+
+
+def get_llm_gateway() -> LLMGateway:
+    """Process-wide gateway shared by the agents, with an Ollama backend registered.
+
+    The response cache is configured from the environment:
+    QUANTALPHA_LLM_CACHE ('read_write' by default, 'cache_only' for offline
+    replay, 'off') and QUANTALPHA_LLM_CACHE_PATH.
+    """
+    global _default_gateway
+    with _default_lock:
+        if _default_gateway is None:
+            cache_mode = os.environ.get("QUANTALPHA_LLM_CACHE", "read_write")
+            cache = None
+            if cache_mode != "off":
+                cache = LLMResponseCache(
+                    os.environ.get("QUANTALPHA_LLM_CACHE_PATH", "data/cache/llm_responses.sqlite")
+                )
+            _default_gateway = LLMGateway(cache=cache, cache_mode=cache_mode)
+            _default_gateway.register("ollama", OllamaBackend(
+                max_concurrency=int(os.environ.get("OLLAMA_MAX_CONCURRENCY", "2")),
+                max_batch_size=int(os.environ.get("OLLAMA_BATCH_SIZE", "1")),
+                request_timeout=_default_gateway.timeout
+            ))
+        return _default_gateway
@@ -2,6 +2,8 @@
 
 from typing import List, Dict, Any, Optional
 from datetime import datetime
+import os
+import threading
 from pathlib import Path
 import pandas as pd
 
@@ -15,7 +17,16 @@ from .reflector import ReflectorAgent
 from ..memory.store import ExperimentStore
 from ..memory.factor_registry import FactorRegistry
 from ..memory.policy_manager import PolicyManager
-from ..tools.fetch_data import fetch_data, get_universe_tickers
+from ..memory.fingerprint import signal_fingerprint
+from ..backtest.screening import SCREENING_STAGES
+from .candidate_pipeline import CandidatePipeline, evaluate_candidate, init_candidate_worker
+from .checkpoint import LoopCheckpoint, signal_cache_key
+from ..data.calendar import TradingCalendar
+from ..data.market_data import MarketData
+from ..data.market_store import MarketDataStore
+from ..data.panel_snapshot import PanelSnapshot, write_panel_snapshot
+from ..data.universe import UniverseMembership
+from ..tools.fetch_data import fetch_data
 from ..tools.logbook import log_run
 
 
@@ -26,7 +37,8 @@ class Orchestrator:
         self,
         universe: str = "sp500",
         db_path: str = "experiments.db",
-        index_path: str = "./kb.index"
+        index_path: str = "./kb.index",
+        duplicate_threshold: float = 0.95
     ):
         """Initialize orchestrator.
         
@@ -34,8 +46,11 @@ class Orchestrator:
             universe: Universe name
             db_path: Database path
             index_path: RAG index path
+            duplicate_threshold: Fingerprint correlation above which a
+                candidate is skipped as a near-duplicate of a prior factor
         """
         self.universe = universe
+        self.duplicate_threshold = duplicate_threshold
         self.store = ExperimentStore(db_path)
         self.registry = FactorRegistry()
         
@@ -51,6 +66,9 @@ class Orchestrator:
         # Initialize policy manager
         self.policy_manager = PolicyManager()
         
+        # Full-backtest timings, used to estimate time saved by screening
+        self.backtest_seconds: List[float] = []
+        
         # Initialize archive
         from ..archive.success_factors import SuccessFactorArchive
         self.archive = SuccessFactorArchive()
@@ -58,52 +76,176 @@ class Orchestrator:
         # Data cache
         self.prices_df = None
         self.returns_df = None
+        # Panel snapshot directory backing prices_df, shared with worker processes
+        self.panel_snapshot: Optional[str] = None
+        # All OHLCV fields, loaded on first use (custom factor code, VWAP/ADV)
+        self.market_data: Optional[MarketData] = None
+        # Point-in-time constituents; signals are masked to each date's members
+        self.universe_membership: Optional[UniverseMembership] = None
+        # Sessions every panel is aligned to once, at load time
+        self.calendar = TradingCalendar.from_config(universe)
     
-    def initialize_data(self, start_date: Optional[datetime] = None, end_date: Optional[datetime] = None):
+    def initialize_data(
+        self,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+        snapshot_dir: Optional[str] = "data/cache/panels"
+    ):
         """Initialize data for backtesting.
         
         Args:
-            start_date: Start date
-            end_date: End date
+            start_date: Start date (default: 2500 days before end_date)
+            end_date: End date (default: now)
+            snapshot_dir: Directory for panel snapshots, or None to disable.
+                A snapshot of the same universe and dates is memory-mapped
+                instead of fetching and unstacking the data again.
+        
+        Panels are put on the universe's trading calendar here, once, so
+        later stages can align them by position.
         """
-        print("Fetching data...")
-        tickers = get_universe_tickers(self.universe)
+        end_date = end_date or datetime.now()
+        start_date = start_date or end_date - pd.Timedelta(days=2500)
         
-        # Fetch prices
-        data = fetch_data(tickers, start=start_date, end=end_date)
+        # Every name that was a member during the period, not just today's
+        self.universe_membership = UniverseMembership.load(self.universe)
+        tickers = self.universe_membership.members_between(start_date, end_date)
         
-        # Extract prices and returns
-        if 'Close' in data.columns:
-            self.prices_df = data['Close'].unstack(level='Ticker')
+        if snapshot_dir is None:
+            print("Fetching data...")
+            store = MarketDataStore()
+            data = fetch_data(tickers, start=start_date, end=end_date, fields=['Close'], store=store)
+            
+            # Other fields are read from the store only if something asks for
+            # them, and put on the same sessions as the closes
+            last_date = pd.Timestamp(end_date).normalize() - pd.Timedelta(days=1)
+            close = self.calendar.align(data['Close'].unstack(level='Ticker'))
+            self.panel_snapshot = None
+            self.market_data = MarketData.from_store(
+                store, tickers, start_date, last_date,
+                universe=self.universe_membership,
+                dates=close.index,
+                close=close
+            )
         else:
-            self.prices_df = data.iloc[:, 0].unstack(level='Ticker')
+            key = {
+                'universe': self.universe,
+                'tickers': sorted(tickers),
+                'start': str(pd.Timestamp(start_date).date()),
+                'end': str(pd.Timestamp(end_date).date()),
+                'calendar': self.calendar.name
+            }
+            path = str(Path(snapshot_dir) / self.universe)
+            if PanelSnapshot.exists(path) and PanelSnapshot(path).metadata == key:
+                print("Loading data from panel snapshot...")
+            else:
+                print("Fetching data...")
+                data = fetch_data(tickers, start=start_date, end=end_date)
+                write_panel_snapshot(data, path, metadata=key, calendar=self.calendar)
+            
+            self.panel_snapshot = path
+            self.market_data = MarketData.from_snapshot(path, universe=self.universe_membership)
         
-        self.returns_df = self.prices_df.pct_change(1)
+        self.prices_df = self.market_data.close
+        self.returns_df = self.market_data.returns
         
-        print(f"Loaded data: {len(self.prices_df)} dates, {len(self.prices_df.columns)} tickers")
+        print(f"Loaded data: {len(self.prices_df)} dates, {len(self.prices_df.columns)} tickers (data hash {self.data_hash[:12]})")
+    
+    @property
+    def data_hash(self) -> Optional[str]:
+        """Content hash of the loaded data (None if it was set without MarketData)."""
+        return self.market_data.data_hash if self.market_data is not None else None
+    
+    def check_duplicate(
+        self,
+        name: str,
+        signals_df: pd.DataFrame,
+        factor_id: Optional[int] = None
+    ) -> Optional[Dict[str, Any]]:
+        """Check a computed signal against the fingerprint index.
+        
+        Unique signals are added to the index so later candidates are
+        compared against them.
+        
+        Args:
+            name: Factor name
+            signals_df: Computed signal panel
+            factor_id: Factor ID in the experiment store
+        
+        Returns:
+            The most similar prior factor if above the threshold, else None
+        """
+        matches = self.store.add_fingerprint_if_unique(
+            name,
+            signal_fingerprint(signals_df),
+            factor_id=factor_id,
+            threshold=self.duplicate_threshold
+        )
+        return matches[0] if matches else None
     
     def run_iteration(
         self,
         n_candidates: int = 3,
-        focus_topics: Optional[List[str]] = None
+        focus_topics: Optional[List[str]] = None,
+        max_workers: Optional[int] = None,
+        max_concurrent_proposals: int = 2,
+        checkpoint: Optional[LoopCheckpoint] = None
     ) -> Dict[str, Any]:
         """Run one iteration of the factor mining loop.
         
+        The iteration is a pipeline: LLM proposals are requested concurrently
+        and queued, a process pool computes features, screens and backtests
+        them, and each candidate is critiqued and logged as it completes.
+        
         Args:
             n_candidates: Number of factor candidates to generate
             focus_topics: Topics to focus on
+            max_workers: Backtest worker processes (default: min(n_candidates, CPUs))
+            max_concurrent_proposals: LLM proposal requests in flight at once
+            checkpoint: Checkpoint whose 'current' entry holds this iteration's
+                progress (pending proposals and finished candidates). If it is
+                set, proposals still pending are evaluated again without
+                asking the LLM, and finished candidates are not repeated.
         
         Returns:
-            Dictionary with iteration results
+            Dictionary with iteration results, including 'pipeline' timing
+            and utilization statistics
         """
         if self.prices_df is None:
             self.initialize_data()
         
-        results = {
-            'candidates': [],
-            'successful': [],
-            'failed': []
-        }
+        progress = checkpoint.state.get('current') if checkpoint else None
+        if not progress:
+            progress = {
+                'results': {
+                    'candidates': [],
+                    'successful': [],
+                    'failed': [],
+                    'skipped': []
+                },
+                'screening': {
+                    'screened': 0,
+                    'passed': 0,
+                    'rejected': {stage: 0 for stage in SCREENING_STAGES},
+                    'screening_seconds': 0.0
+                },
+                # Proposals not yet finalized: {'factor_yaml', 'factor_id', 'run_id', 'n_trials'}
+                'pending': [],
+                'n_done': 0
+            }
+        elif progress['pending'] or progress['n_done']:
+            print(f"Resuming iteration: {progress['n_done']} candidates done, "
+                  f"{len(progress['pending'])} pending")
+        
+        results = progress['results']
+        screening = progress['screening']
+        pending = progress['pending']
+        replay = list(pending)
+        progress_lock = threading.Lock()
+        
+        def save_progress():
+            # Callers hold progress_lock
+            if checkpoint:
+                checkpoint.update(current=progress)
         
         # Initialize Conversation Context
         from ..memory.schemas import ConversationContext
@@ -113,192 +255,253 @@ class Orchestrator:
             state={"focus_topics": focus_topics}
         )
         
-        # Step 1: Researcher proposes factors
-        print("Step 1: Researcher proposing factors...")
-        # Note: Researcher still returns list of strings (YAMLs) for now, 
-        # but we should ideally wrap this too. For now, we'll wrap the *process* 
-        # of getting proposals if we change researcher to return AgentResult with list.
-        # Current researcher.propose_factors returns List[str] (YAMLs).
-        # Let's assume we haven't changed propose_factors signature to return AgentResult yet
-        # OR we did? I changed propose_factor (singular) in my thought process but 
-        # the file content I wrote to researcher.py had propose_factor returning AgentResult.
-        # Wait, the original researcher had propose_factors (plural).
-        # My rewrite of researcher.py replaced the WHOLE file and only had propose_factor (singular).
-        # I need to adapt the orchestrator to call propose_factor multiple times or 
-        # I should have kept propose_factors.
-        # Let's call propose_factor n times.
-        
-        factor_proposals = []
-        for _ in range(n_candidates):
-            # We use the new singular method
+        from ..factors.context import CandidateContext
+        from ..factors.dsl import DSLParser
+        parser = DSLParser()
+        
+        # Step 1: Researcher proposes factors (LLM, runs concurrently with backtests)
+        def propose() -> Optional[Dict[str, Any]]:
+            with progress_lock:
+                if replay:
+                    return replay.pop(0)
+            
             result = self.researcher.propose_factor(
                 market_regime=ctx.market_regime,
                 existing_factors=[]
             )
             ctx.add_log(result)
             
-            if result.status == "SUCCESS":
-                factor_proposals.append(result.content.data['yaml_content'])
-            else:
-                print(f"  Error proposing factor: {result.content.summary}")
-        
-        for i, factor_yaml in enumerate(factor_proposals):
-            print(f"\nProcessing candidate {i+1}/{len(factor_proposals)}...")
-            
-            try:
-                # Parse factor spec
-                from ..factors.dsl import DSLParser
-                parser = DSLParser()
-                spec = parser.parse(factor_yaml)
-                
-                # Register factor
+            with progress_lock:
+                if result.status != "SUCCESS":
+                    print(f"  Error proposing factor: {result.content.summary}")
+                    progress['n_done'] += 1
+                    save_progress()
+                    return None
+                
+                proposal = {'factor_yaml': result.content.data['yaml_content'], 'factor_id': None}
+                pending.append(proposal)
+                save_progress()
+            return proposal
+        
+        # Parse and validate once, register the factor, and hand both to a worker
+        def prepare(proposal: Dict[str, Any]) -> tuple:
+            context = CandidateContext.from_yaml(proposal['factor_yaml'], parser)
+            if context.parse_error is not None:
+                raise ValueError(f"Failed to parse Factor DSL: {context.parse_error}")
+            if proposal['factor_id'] is None:
                 factor = self.store.create_factor(
-                    name=spec.name,
-                    yaml=factor_yaml,
+                    name=context.spec.name,
+                    yaml=proposal['factor_yaml'],
                     tags=focus_topics or []
                 )
-                
-                # Step 2: Feature agent computes signals
-                print("  Computing features...")
-                feature_result = self.feature_agent.compute_features(
-                    factor_yaml,
-                    self.prices_df,
-                    self.returns_df
-                )
-                ctx.add_log(feature_result)
-                
-                if feature_result.status != "SUCCESS":
-                    print(f"  Failed: {feature_result.content.summary}")
-                    results['failed'].append({
-                        'factor_id': factor.id,
-                        'error': feature_result.content.summary
-                    })
-                    continue
-                
-                signals_df = feature_result.content.data['signals']
-                
-                # Step 3: Backtester runs backtest
-                print("  Running backtest...")
-                backtest_result = self.backtester.run_backtest(
-                    factor_yaml=factor_yaml,
-                    prices_df=self.prices_df,
-                    returns_df=self.returns_df,
-                    run_id=f"run_{factor.id}_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
-                )
-                ctx.add_log(backtest_result)
-                
-                if backtest_result.status != "SUCCESS":
-                    print(f"  Backtest failed: {backtest_result.content.summary}")
-                    results['failed'].append({
-                        'factor_id': factor.id,
-                        'error': backtest_result.content.summary
-                    })
-                    continue
-                
-                metrics = backtest_result.content.data['metrics']
-                # issues = backtest_result.content.data.get('issues', []) # Backtester might not return issues in data yet if I didn't put it there
-                # Checking backtester refactor... I put 'issues' in data only on failure.
-                # On success, I put metrics and output_dir.
-                # I should probably include issues in success too if there are warnings.
-                # For now, let's assume empty issues on success.
-                issues = [] 
-                
-                # Step 4: Log run
-                print("  Logging run...")
-                log_result = log_run(
-                    factor_id=factor.id,
-                    start_date=self.prices_df.index.min(),
-                    end_date=self.prices_df.index.max(),
-                    metrics=metrics,
-                    regime_label=None,
-                    issues=issues,
-                    db_path=self.store.db_path
-                )
-                
-                run_id = log_result['run_id']
-                
-                # Step 5: Critic validates and writes lessons
-                print("  Critic evaluating...")
-                critique_result = self.critic.critique_run(
-                    run_id=run_id,
-                    metrics=metrics,
-                    issues=issues,
-                    factor_yaml=factor_yaml
-                )
-                ctx.add_log(critique_result)
-                
-                passed = critique_result.content.data['passed']
-                
-                if passed:
-                    print(f"  ✓ Passed (Sharpe: {metrics.get('sharpe', 0):.2f})")
-                    results['successful'].append({
-                        'factor_id': factor.id,
-                        'run_id': run_id,
-                        'metrics': metrics
-                    })
-                    
-                    # Check if it meets strict archive criteria
-                    if self.archive.should_archive(metrics):
-                        print("  ★ Meets archive criteria! Archiving...")
-                        
-                        # Prepare data for archive
-                        # We need to reconstruct the agent_outputs dict expected by archive_factor
-                        # OR update archive_factor to take ConversationContext.
-                        # For now, let's map it to the expected dict to avoid breaking archive.
-                        
-                        agent_outputs = {
-                            'researcher': {'proposal': factor_yaml}, # Simplified
-                            'feature': feature_result.content.data,
-                            'backtest': backtest_result.content.data,
-                            'critic': critique_result.content.data
-                        }
-                        
-                        computations = {
-                            'signals': signals_df,
-                            # 'returns': ... # We need returns and equity curve. 
-                            # Backtester refactor saved them to disk but didn't return the DF in data.
-                            # We might need to load them or adjust backtester to return them.
-                            # For now, let's assume we can't easily get them without reading the parquet.
-                            # Wait, I can just pass empty dicts if I don't have them in memory, 
-                            # but archive might need them for plotting.
-                            # Let's skip plotting in archive for now if data is missing.
-                        }
-                        
-                        # Convert ConversationContext logs to list of dicts for archive
-                        conversation_log = [log.dict() for log in ctx.logs]
-                        
-                        archive_path = self.archive.archive_factor(
-                            factor_name=spec.name,
-                            factor_yaml=factor_yaml,
-                            agent_outputs=agent_outputs,
-                            computations=computations,
-                            backtest_results={'metrics': metrics}, # Simplified
-                            conversation_log=conversation_log
-                        )
-                        print(f"  Archived to: {archive_path}")
-                        
-                else:
-                    print(f"  ✗ Failed")
-                    results['failed'].append({
-                        'factor_id': factor.id,
-                        'run_id': run_id,
-                        'issues': issues
-                    })
-                
-                results['candidates'].append({
-                    'factor_id': factor.id,
+                with progress_lock:
+                    proposal.update(
+                        name=context.spec.name,
+                        factor_id=factor.id,
+                        run_id=f"run_{factor.id}_{datetime.now().strftime('%Y%m%d_%H%M%S')}",
+                        n_trials=self.store.count_runs() + 1
+                    )
+                    save_progress()
+            return proposal['factor_yaml'], proposal['factor_id'], proposal['run_id'], proposal['n_trials'], context
+        
+        def mark_done(factor_id: Optional[int]):
+            with progress_lock:
+                for proposal in pending:
+                    if proposal['factor_id'] == factor_id:
+                        pending.remove(proposal)
+                        progress['n_done'] += 1
+                        break
+                save_progress()
+        
+        def finalize(args: tuple, outcome: Dict[str, Any]):
+            try:
+                record_outcome(args, outcome)
+            finally:
+                mark_done(args[1])
+        
+        # Steps 2-3 (features, dedup, screening, backtest) run in evaluate_candidate;
+        # steps 4-5 run here as each candidate completes
+        def record_outcome(args: tuple, outcome: Dict[str, Any]):
+            factor_yaml, factor_id, _, _, context = args
+            name = context.spec.name
+            status = outcome['status']
+            print(f"\nCandidate {name} (factor {factor_id}): {status}")
+            
+            for key in ('feature_result', 'backtest_result'):
+                if key in outcome:
+                    ctx.add_log(outcome[key])
+            
+            if 'screen' in outcome:
+                screen = outcome['screen']
+                screening['screened'] += 1
+                screening['screening_seconds'] += sum(screen['seconds'].values())
+            
+            if status == 'feature_failed':
+                summary = outcome['feature_result'].content.summary
+                print(f"  Failed: {summary}")
+                results['failed'].append({'factor_id': factor_id, 'error': summary})
+                return
+            
+            if status == 'duplicate':
+                duplicate = outcome['duplicate']
+                print(f"  Skipped: near-duplicate of {duplicate['name']} "
+                      f"(corr {duplicate['correlation']:.3f})")
+                results['skipped'].append({
+                    'factor_id': factor_id,
+                    'duplicate_of': duplicate['name'],
+                    'correlation': duplicate['correlation']
+                })
+                return
+            
+            if status == 'screened':
+                stage = screen['rejected_at']
+                screening['rejected'][stage] += 1
+                print(f"  Screened out at stage '{stage}': {screen['stats']}")
+                results['failed'].append({
+                    'factor_id': factor_id,
+                    'error': f"Rejected by screening stage '{stage}'",
+                    'screening': screen['stats']
+                })
+                return
+            
+            screening['passed'] += 1
+            self.backtest_seconds.append(outcome['backtest_seconds'])
+            feature_result = outcome['feature_result']
+            backtest_result = outcome['backtest_result']
+            
+            if status != 'backtested':
+                print(f"  Backtest failed: {backtest_result.content.summary}")
+                results['failed'].append({
+                    'factor_id': factor_id,
+                    'error': backtest_result.content.summary
+                })
+                return
+            
+            metrics = backtest_result.content.data['metrics']
+            # The Backtester only reports issues on failure
+            issues = []
+            
+            # Step 4: Log run
+            print("  Logging run...")
+            log_result = log_run(
+                factor_id=factor_id,
+                start_date=self.prices_df.index.min(),
+                end_date=self.prices_df.index.max(),
+                metrics=metrics,
+                regime_label=None,
+                issues=issues,
+                db_path=self.store.db_path
+            )
+            
+            run_id = log_result['run_id']
+            
+            # Step 5: Critic validates and writes lessons
+            print("  Critic evaluating...")
+            critique_result = self.critic.critique_run(
+                run_id=run_id,
+                metrics=metrics,
+                issues=issues,
+                factor_yaml=factor_yaml
+            )
+            ctx.add_log(critique_result)
+            
+            passed = critique_result.content.data['passed']
+            
+            if passed:
+                print(f"  ✓ Passed (Sharpe: {metrics.get('sharpe', 0):.2f})")
+                results['successful'].append({
+                    'factor_id': factor_id,
                     'run_id': run_id,
-                    'passed': passed
+                    'metrics': metrics
                 })
                 
-            except Exception as e:
-                print(f"  Error: {e}")
-                import traceback
-                traceback.print_exc()
+                # Check if it meets strict archive criteria
+                if self.archive.should_archive(metrics):
+                    print("  ★ Meets archive criteria! Archiving...")
+                    
+                    agent_outputs = {
+                        'researcher': {'proposal': factor_yaml},
+                        'feature': feature_result.content.data,
+                        'backtest': backtest_result.content.data,
+                        'critic': critique_result.content.data
+                    }
+                    
+                    # Returns and equity curve are on disk in the run's output directory
+                    computations = {
+                        'signals': feature_result.content.data['signals']
+                    }
+                    
+                    # Convert ConversationContext logs to list of dicts for archive
+                    conversation_log = [log.dict() for log in ctx.logs]
+                    
+                    archive_path = self.archive.archive_factor(
+                        factor_name=name,
+                        factor_yaml=factor_yaml,
+                        agent_outputs=agent_outputs,
+                        computations=computations,
+                        backtest_results={'metrics': metrics},
+                        conversation_log=conversation_log
+                    )
+                    print(f"  Archived to: {archive_path}")
+                    
+            else:
+                print(f"  ✗ Failed")
                 results['failed'].append({
-                    'error': str(e)
+                    'factor_id': factor_id,
+                    'run_id': run_id,
+                    'issues': issues
                 })
-                continue
+            
+            results['candidates'].append({
+                'factor_id': factor_id,
+                'run_id': run_id,
+                'passed': passed
+            })
+        
+        def on_error(proposal: Dict[str, Any], error: Exception):
+            with progress_lock:
+                results['failed'].append({'factor_id': proposal['factor_id'], 'error': str(error)})
+                if proposal in pending:
+                    pending.remove(proposal)
+                    progress['n_done'] += 1
+                save_progress()
+        
+        n_remaining = max(n_candidates - progress['n_done'], 0)
+        print(f"Proposing and evaluating {n_remaining} candidates...")
+        pipeline = CandidatePipeline(
+            max_workers=max_workers or max(min(n_remaining, os.cpu_count() or 1), 1),
+            max_concurrent_proposals=max_concurrent_proposals,
+            initializer=init_candidate_worker,
+            initargs=(
+                # Workers memory-map the snapshot instead of unpickling their own copy
+                self.panel_snapshot or self.prices_df,
+                None if self.panel_snapshot else self.returns_df,
+                str(self.store.db_path),
+                self.policy_manager.get_screening_thresholds(),
+                self.duplicate_threshold,
+                str(self.backtester.output_base_dir),
+                self.universe_membership
+            )
+        )
+        pipeline_stats = pipeline.run(n_remaining, propose, prepare, evaluate_candidate, finalize, on_error)
+        results['pipeline'] = pipeline_stats
+        
+        print(f"\nPipeline: {pipeline_stats['wall_seconds']:.1f}s wall, "
+              f"worker utilization {pipeline_stats['worker_utilization']:.0%}, "
+              f"LLM utilization {pipeline_stats['llm_utilization']:.0%}")
+        
+        # Rejected candidates would each have cost about one full backtest
+        n_rejected = sum(screening['rejected'].values())
+        if self.backtest_seconds:
+            avg_backtest = sum(self.backtest_seconds) / len(self.backtest_seconds)
+            screening['time_saved_seconds'] = n_rejected * avg_backtest - screening['screening_seconds']
+        else:
+            screening['time_saved_seconds'] = None
+        results['screening'] = screening
+        
+        if screening['screened']:
+            print(f"\nScreening: {screening['passed']}/{screening['screened']} passed, "
+                  f"rejected {screening['rejected']}")
         
         # Step 6: Reporter generates summary
         print("\nGenerating iteration summary...")
@@ -316,14 +519,20 @@ class Orchestrator:
         self,
         n_iterations: int = 3,
         n_candidates_per_iteration: int = 3,
-        focus_topics: Optional[List[str]] = None
+        focus_topics: Optional[List[str]] = None,
+        checkpoint_dir: Optional[str] = None
     ) -> Dict[str, Any]:
         """Run multiple iterations.
         
+        With a checkpoint directory, finished iterations and the progress of
+        the current one are saved as candidates complete, and an interrupted
+        run resumes where it stopped.
+        
         Args:
             n_iterations: Number of iterations
             n_candidates_per_iteration: Candidates per iteration
             focus_topics: Topics to focus on
+            checkpoint_dir: Directory for the loop checkpoint
         
         Returns:
             Dictionary with all iteration results
@@ -331,22 +540,47 @@ class Orchestrator:
         all_results = {
             'iterations': [],
             'total_successful': 0,
-            'total_failed': 0
+            'total_failed': 0,
+            'total_skipped': 0
         }
         
-        for iteration in range(n_iterations):
+        checkpoint = LoopCheckpoint(checkpoint_dir) if checkpoint_dir else None
+        if checkpoint and checkpoint.exists:
+            if checkpoint.state.get('kind') != 'iterations':
+                raise ValueError(f"{checkpoint_dir} is not a multiple-iterations checkpoint")
+            all_results = checkpoint.state['all_results']
+            print(f"Resuming from {checkpoint_dir}: "
+                  f"{len(all_results['iterations'])}/{n_iterations} iterations done")
+        elif checkpoint:
+            checkpoint.update(
+                kind='iterations',
+                config={
+                    'n_iterations': n_iterations,
+                    'n_candidates_per_iteration': n_candidates_per_iteration,
+                    'focus_topics': focus_topics
+                },
+                all_results=all_results,
+                current=None
+            )
+        
+        for iteration in range(len(all_results['iterations']), n_iterations):
             print(f"\n{'='*60}")
             print(f"Iteration {iteration + 1}/{n_iterations}")
             print(f"{'='*60}\n")
             
             iteration_result = self.run_iteration(
                 n_candidates=n_candidates_per_iteration,
-                focus_topics=focus_topics
+                focus_topics=focus_topics,
+                checkpoint=checkpoint
             )
             
             all_results['iterations'].append(iteration_result)
             all_results['total_successful'] += len(iteration_result['successful'])
             all_results['total_failed'] += len(iteration_result['failed'])
+            all_results['total_skipped'] += len(iteration_result['skipped'])
+            
+            if checkpoint:
+                checkpoint.update(all_results=all_results, current=None)
         
         return all_results
     
@@ -356,29 +590,68 @@ class Orchestrator:
         n_candidates: int = 3,
         max_iterations: Optional[int] = None,
         target_sharpe: Optional[float] = None,
-        focus_topics: Optional[List[str]] = None
+        focus_topics: Optional[List[str]] = None,
+        checkpoint_dir: Optional[str] = None
     ) -> Optional[str]:
         """Run iterative alpha discovery loop until target is met.
         
+        With a checkpoint directory, loop state is saved after every stage
+        and an interrupted loop resumes from the last completed stage.
+        
         Args:
             universe: Universe name
             n_candidates: Number of candidates per iteration
             max_iterations: Maximum iterations (default from policy rules)
             target_sharpe: Target Sharpe ratio (default from policy rules)
             focus_topics: Topics to focus on
+            checkpoint_dir: Directory for the loop checkpoint
         
         Returns:
             Alpha ID if successful, None otherwise
         """
-        if self.prices_df is None:
-            self.initialize_data()
-        
         # Get limits from policy rules
         if max_iterations is None:
             max_iterations = 10  # Changed from 15 to 10 as per user request
         if target_sharpe is None:
             target_sharpe = self.policy_manager.rules['global_constraints']['min_sharpe']
         
+        checkpoint = LoopCheckpoint(checkpoint_dir) if checkpoint_dir else None
+        if checkpoint and checkpoint.exists:
+            if checkpoint.state.get('kind') != 'discovery':
+                raise ValueError(f"{checkpoint_dir} is not a discovery loop checkpoint")
+            state = checkpoint.state
+            if state.get('finished'):
+                print(f"Discovery loop in {checkpoint_dir} already finished")
+                return state.get('result')
+            print(f"Resuming discovery loop from {checkpoint_dir} at iteration {state['iteration']}")
+        else:
+            state = {
+                'kind': 'discovery',
+                'config': {
+                    'universe': universe,
+                    'n_candidates': n_candidates,
+                    'max_iterations': max_iterations,
+                    'target_sharpe': target_sharpe,
+                    'focus_topics': focus_topics
+                },
+                'iteration': 1,
+                'current': {},
+                'completed': [],
+                'past_lessons': [],
+                'finished': False,
+                'result': None
+            }
+            if checkpoint:
+                checkpoint.state = state
+                checkpoint.save()
+        
+        def save():
+            if checkpoint:
+                checkpoint.save()
+        
+        if self.prices_df is None:
+            self.initialize_data()
+        
         print(f"\n{'='*70}")
         print(f" ALPHA DISCOVERY LOOP")
         print(f" Universe: {universe}")
@@ -386,169 +659,264 @@ class Orchestrator:
         print(f" Max Iterations: {max_iterations}")
         print(f"{'='*70}\n")
         
-        past_lessons = []
+        past_lessons = state['past_lessons']
         
-        for iteration in range(1, max_iterations + 1):
+        from ..factors.context import CandidateContext
+        from ..factors.dsl import DSLParser
+        parser = DSLParser()
+        
+        for iteration in range(state['iteration'], max_iterations + 1):
             alpha_id = f"alpha_{iteration:03d}"
             
+            # Stage results of this iteration; on resume, completed stages are reused
+            current = state['current']
+            if current.get('iteration') != iteration:
+                current = state['current'] = {'iteration': iteration}
+            
+            def end_iteration(outcome: str, **info):
+                state['completed'].append({'alpha_id': alpha_id, 'outcome': outcome, **info})
+                state['current'] = {}
+                state['iteration'] = iteration + 1
+                save()
+            
             print(f"\n{'='*70}")
             print(f" ITERATION {iteration}: {alpha_id}")
             print(f"{'='*70}\n")
             
             # Step 1: Research (with policy rules and lessons)
             print(f"[1/6] ResearcherAgent proposing factors...")
-            try:
-                result = self.researcher.propose_factor(
-                    market_regime="unknown",
-                    existing_factors=[],
-                    policy_rules=self.policy_manager.rules,  # Pass policy rules
-                    past_lessons=past_lessons                 # Pass past lessons
-                )
-                
-                if result.status != "SUCCESS":
-                    print(f"  ✗ Failed to generate proposal: {result.content.summary}")
+            if 'factor_yaml' in current:
+                print("  ✓ Proposal restored from checkpoint")
+            else:
+                try:
+                    result = self.researcher.propose_factor(
+                        market_regime="unknown",
+                        existing_factors=[],
+                        policy_rules=self.policy_manager.rules,  # Pass policy rules
+                        past_lessons=past_lessons                 # Pass past lessons
+                    )
+                    
+                    if result.status != "SUCCESS":
+                        print(f"  ✗ Failed to generate proposal: {result.content.summary}")
+                        end_iteration('proposal_failed')
+                        continue
+                    
+                    current['factor_yaml'] = result.content.data['yaml_content']
+                    save()
+                    print(f"  ✓ Generated factor proposal")
+                    
+                except Exception as e:
+                    print(f"  ✗ Error: {e}")
+                    end_iteration('proposal_failed')
                     continue
-                
-                factor_yaml = result.content.data['yaml_content']
-                print(f"  ✓ Generated factor proposal")
-                
-            except Exception as e:
-                print(f"  ✗ Error: {e}")
-                continue
             
-            # Parse factor
-            from ..factors.dsl import DSLParser
-            parser = DSLParser()
-            spec = parser.parse(factor_yaml)
+            factor_yaml = current['factor_yaml']
+            
+            # Parse and validate once; signals computed below are cached on the context
+            candidate = CandidateContext.from_yaml(factor_yaml, parser)
+            if candidate.parse_error is not None:
+                print(f"  ✗ DSL parsing failed: {candidate.parse_error}")
+                end_iteration('feature_failed')
+                continue
+            spec = candidate.spec
             
             # Step 2: Feature Engineering
             print(f"[2/6] FeatureAgent computing signals...")
-            try:
-                feature_result = self.feature_agent.compute_features(
-                    factor_yaml,
-                    self.prices_df,
-                    self.returns_df
-                )
-                
-                if feature_result.status != "SUCCESS":
-                    print(f"  ✗ Failed: {feature_result.content.summary}")
+            signals_meta = current.get('signals_meta', {})
+            if current.get('duplicate_checked'):
+                # Reuse the saved panel for the backtest unless the backtest is done too
+                signal_key = signal_cache_key(factor_yaml, self.data_hash)
+                if 'metrics' not in current and checkpoint and current.get('signal_key') == signal_key:
+                    signals_df = checkpoint.load_signals(signal_key)
+                    if signals_df is not None:
+                        candidate.attach_signals(signals_df)
+                if candidate.signals is not None:
+                    print(f"  ✓ Signals restored from checkpoint ({signal_key})")
+                else:
+                    print("  ✓ Duplicate check restored from checkpoint")
+            else:
+                try:
+                    signals_df = None
+                    # Signals saved for different data (another hash) are recomputed
+                    signal_key = signal_cache_key(factor_yaml, self.data_hash)
+                    if checkpoint and current.get('signal_key') == signal_key:
+                        signals_df = checkpoint.load_signals(signal_key)
+                    
+                    if signals_df is not None:
+                        candidate.attach_signals(signals_df)
+                    else:
+                        feature_result = self.feature_agent.compute_features(
+                            factor_yaml,
+                            self.prices_df,
+                            self.returns_df,
+                            context=candidate,
+                            market_data=self.market_data
+                        )
+                        
+                        if feature_result.status != "SUCCESS":
+                            print(f"  ✗ Failed: {feature_result.content.summary}")
+                            end_iteration('feature_failed')
+                            continue
+                        
+                        signals_df = feature_result.content.data['signals']
+                        signals_meta = feature_result.content.data.get('meta', {})
+                        current['signals_meta'] = signals_meta
+                        if checkpoint:
+                            current['signal_key'] = checkpoint.save_signals(
+                                factor_yaml, signals_df, data_hash=self.data_hash
+                            )
+                            save()
+                    print(f"  ✓ Computed signals")
+                    
+                    duplicate = self.check_duplicate(spec.name, signals_df)
+                    if duplicate:
+                        print(f"  ✗ Near-duplicate of {duplicate['name']} "
+                              f"(corr {duplicate['correlation']:.3f}), skipping backtest")
+                        end_iteration('duplicate', duplicate_of=duplicate['name'])
+                        continue
+                    
+                    # The fingerprint is now indexed; checking again would match itself
+                    current['duplicate_checked'] = True
+                    save()
+                    
+                except Exception as e:
+                    print(f"  ✗ Error: {e}")
+                    end_iteration('feature_failed')
                     continue
-                
-                signals_df = feature_result.content.data['signals']
-                signals_meta = feature_result.content.data.get('meta', {})
-                print(f"  ✓ Computed signals")
-                
-            except Exception as e:
-                print(f"  ✗ Error: {e}")
-                continue
             
             # Step 3: Backtest
             print(f"[3/6] BacktesterAgent running backtest...")
-            try:
-                backtest_result = self.backtester.run_backtest(
-                    factor_yaml=factor_yaml,
-                    prices_df=self.prices_df,
-                    returns_df=self.returns_df,
-                    run_id=f"{alpha_id}_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
-                )
-                
-                if backtest_result.status != "SUCCESS":
-                    print(f"  ✗ Backtest failed: {backtest_result.content.summary}")
+            if 'metrics' in current:
+                metrics = current['metrics']
+                output_dir = current['output_dir']
+                print("  ✓ Backtest restored from checkpoint")
+            else:
+                try:
+                    backtest_result = self.backtester.run_backtest(
+                        factor_yaml=factor_yaml,
+                        prices_df=self.prices_df,
+                        returns_df=self.returns_df,
+                        run_id=f"{alpha_id}_{datetime.now().strftime('%Y%m%d_%H%M%S')}",
+                        n_trials=self.store.count_runs() + 1,
+                        context=candidate,
+                        market_data=self.market_data
+                    )
+                    
+                    if backtest_result.status != "SUCCESS":
+                        print(f"  ✗ Backtest failed: {backtest_result.content.summary}")
+                        end_iteration('backtest_failed')
+                        continue
+                    
+                    metrics = backtest_result.content.data['metrics']
+                    output_dir = str(backtest_result.content.data.get('output_dir', ''))
+                    current.update(metrics=metrics, output_dir=output_dir)
+                    save()
+                    
+                    print(f"  ✓ Backtest completed")
+                    
+                except Exception as e:
+                    print(f"  ✗ Error: {e}")
+                    import traceback
+                    traceback.print_exc()
+                    end_iteration('backtest_failed')
                     continue
-                
-                metrics = backtest_result.content.data['metrics']
-                output_dir = backtest_result.content.data.get('output_dir', '')
-                
-                print(f"  ✓ Backtest completed")
-                print(f"    Sharpe: {metrics.get('sharpe', 0):.2f}")
-                print(f"    Annual Return: {metrics.get('ann_ret', 0):.2%}")
-                print(f"    Max Drawdown: {metrics.get('maxdd', 0):.2%}")
-                
-            except Exception as e:
-                print(f"  ✗ Error: {e}")
-                import traceback
-                traceback.print_exc()
-                continue
+            
+            print(f"    Sharpe: {metrics.get('sharpe', 0):.2f}")
+            print(f"    Annual Return: {metrics.get('ann_ret', 0):.2%}")
+            print(f"    Max Drawdown: {metrics.get('maxdd', 0):.2%}")
             
             # Step 4: Critique
             print(f"[4/6] CriticAgent evaluating...")
-            try:
-                # Log run first
-                log_result = log_run(
-                    factor_id=0,  # Temporary
-                    start_date=self.prices_df.index.min(),
-                    end_date=self.prices_df.index.max(),
-                    metrics=metrics,
-                    regime_label=None,
-                    issues=[],
-                    db_path=self.store.db_path
-                )
-                run_id = log_result['run_id']
-                
-                critique_result = self.critic.critique_run(
-                    run_id=run_id,
-                    metrics=metrics,
-                    issues=[],
-                    factor_yaml=factor_yaml
-                )
-                
-                compliance = critique_result.content.data
-                verdict = compliance.get('verdict', 'FAIL')
-                
-                print(f"  ✓ Verdict: {verdict}")
-                if compliance.get('issues'):
-                    print(f"    Issues: {len(compliance['issues'])}")
+            if 'compliance' in current:
+                compliance = current['compliance']
+                print(f"  ✓ Verdict restored from checkpoint: {compliance.get('verdict', 'FAIL')}")
+            else:
+                try:
+                    # Log run first
+                    log_result = log_run(
+                        factor_id=0,  # Temporary
+                        start_date=self.prices_df.index.min(),
+                        end_date=self.prices_df.index.max(),
+                        metrics=metrics,
+                        regime_label=None,
+                        issues=[],
+                        db_path=self.store.db_path
+                    )
+                    run_id = log_result['run_id']
+                    
+                    critique_result = self.critic.critique_run(
+                        run_id=run_id,
+                        metrics=metrics,
+                        issues=[],
+                        factor_yaml=factor_yaml
+                    )
+                    
+                    compliance = critique_result.content.data
+                    verdict = compliance.get('verdict', 'FAIL')
+                    
+                    print(f"  ✓ Verdict: {verdict}")
+                    if compliance.get('issues'):
+                        print(f"    Issues: {len(compliance['issues'])}")
+                    
+                except Exception as e:
+                    print(f"  ✗ Error: {e}")
+                    compliance = {'verdict': 'FAIL', 'issues': []}
                 
-            except Exception as e:
-                print(f"  ✗ Error: {e}")
-                compliance = {'verdict': 'FAIL', 'issues': []}
+                current['compliance'] = compliance
+                save()
             
             # Step 5: Reflect
             print(f"[5/6] ReflectorAgent analyzing...")
-            try:
-                lessons = self.reflector.analyze(
-                    alpha_id=alpha_id,
-                    metrics=metrics,
-                    compliance=compliance,
-                    signals_meta=signals_meta,
-                    factor_yaml=factor_yaml,
-                    past_lessons=past_lessons
-                )
-                
-                past_lessons.append(lessons)
-                
-                # Display detailed reflection results
-                print(f"  ✓ Lessons generated")
-                print(f"\n  📋 Reflection Summary:")
-                print(f"     Verdict: {lessons['verdict']}")
-                print(f"     Root Causes: {len(lessons['root_causes'])}")
-                
-                # Show top 3 root causes
-                for i, cause in enumerate(lessons['root_causes'][:3], 1):
-                    print(f"       {i}. {cause['issue']}: {cause['detail']}")
-                
-                print(f"\n     Improvement Suggestions: {len(lessons['improvement_suggestions'])}")
-                
-                # Show top 3 suggestions
-                for i, imp in enumerate(lessons['improvement_suggestions'][:3], 1):
-                    priority = imp.get('priority', 'normal')
-                    suggestion = imp.get('suggestion', '')
-                    print(f"       {i}. [{priority.upper()}] {suggestion[:80]}...")
-                
-                print(f"    Suggestions: {len(lessons['improvement_suggestions'])}")
-                
-                # Save lessons
-                lessons_path = Path(output_dir) / 'lessons.json' if output_dir else None
-                if lessons_path:
-                    import json
-                    with open(lessons_path, 'w') as f:
-                        json.dump(lessons, f, indent=2)
-                
-            except Exception as e:
-                print(f"  ✗ Error: {e}")
-                import traceback
-                traceback.print_exc()
-                lessons = {'verdict': 'FAIL', 'root_causes': [], 'improvement_suggestions': []}
+            if 'lessons' in current:
+                print("  ✓ Lessons restored from checkpoint")
+            else:
+                try:
+                    lessons = self.reflector.analyze(
+                        alpha_id=alpha_id,
+                        metrics=metrics,
+                        compliance=compliance,
+                        signals_meta=signals_meta,
+                        factor_yaml=factor_yaml,
+                        past_lessons=past_lessons
+                    )
+                    
+                    past_lessons.append(lessons)
+                    
+                    # Display detailed reflection results
+                    print(f"  ✓ Lessons generated")
+                    print(f"\n  📋 Reflection Summary:")
+                    print(f"     Verdict: {lessons['verdict']}")
+                    print(f"     Root Causes: {len(lessons['root_causes'])}")
+                    
+                    # Show top 3 root causes
+                    for i, cause in enumerate(lessons['root_causes'][:3], 1):
+                        print(f"       {i}. {cause['issue']}: {cause['detail']}")
+                    
+                    print(f"\n     Improvement Suggestions: {len(lessons['improvement_suggestions'])}")
+                    
+                    # Show top 3 suggestions
+                    for i, imp in enumerate(lessons['improvement_suggestions'][:3], 1):
+                        priority = imp.get('priority', 'normal')
+                        suggestion = imp.get('suggestion', '')
+                        print(f"       {i}. [{priority.upper()}] {suggestion[:80]}...")
+                    
+                    print(f"    Suggestions: {len(lessons['improvement_suggestions'])}")
+                    
+                    # Save lessons
+                    lessons_path = Path(output_dir) / 'lessons.json' if output_dir else None
+                    if lessons_path:
+                        import json
+                        with open(lessons_path, 'w') as f:
+                            json.dump(lessons, f, indent=2)
+                    
+                except Exception as e:
+                    print(f"  ✗ Error: {e}")
+                    import traceback
+                    traceback.print_exc()
+                    lessons = {'verdict': 'FAIL', 'root_causes': [], 'improvement_suggestions': []}
+                
+                current['lessons'] = lessons
+                save()
             
             # Step 6: Check if target met
             print(f"[6/6] Checking targets...")
@@ -573,6 +941,9 @@ class Orchestrator:
                     
                     print(f"  Archived to: {success_dir}")
                 
+                state['finished'] = True
+                state['result'] = alpha_id
+                end_iteration('success', sharpe=metrics.get('sharpe'))
                 return alpha_id
             
             else:
@@ -580,6 +951,10 @@ class Orchestrator:
                 for violation in violations:
                     print(f"    - {violation}")
                 print(f"\n  Continuing to next iteration...\n")
+                end_iteration('rejected', sharpe=metrics.get('sharpe'), violations=violations)
+        
+        state['finished'] = True
+        save()
         
         print(f"\n{'='*70}")
         print(f" ⚠️ Max iterations ({max_iterations}) reached")
@@ -587,4 +962,25 @@ class Orchestrator:
         print(f"{'='*70}\n")
         
         return None
-
+    
+    def resume_from_checkpoint(self, checkpoint_dir: str) -> Any:
+        """Resume an interrupted loop with the settings it was started with.
+        
+        Args:
+            checkpoint_dir: Checkpoint directory written by run_discovery_loop
+                or run_multiple_iterations
+        
+        Returns:
+            The resumed loop's return value
+        """
+        checkpoint = LoopCheckpoint(checkpoint_dir)
+        if not checkpoint.exists:
+            raise FileNotFoundError(f"No checkpoint found in {checkpoint_dir}")
+        
+        config = checkpoint.state['config']
+        kind = checkpoint.state.get('kind')
+        if kind == 'discovery':
+            return self.run_discovery_loop(**config, checkpoint_dir=checkpoint_dir)
+        if kind == 'iterations':
+            return self.run_multiple_iterations(**config, checkpoint_dir=checkpoint_dir)
+        raise ValueError(f"Unknown checkpoint kind: {kind}")
@@ -14,6 +14,7 @@ except ImportError:
 
 from ..memory.schemas import AgentResult, AgentContent, AgentArtifact
 from ..memory.policy_manager import PolicyManager
+from .llm_gateway import CallableBackend, LLMGateway, get_llm_gateway
 
 
 class ReflectorAgent:
@@ -22,21 +23,29 @@ class ReflectorAgent:
     def __init__(
         self,
         model_name: str = "gemini-1.5-pro",
-        api_key: Optional[str] = None
+        api_key: Optional[str] = None,
+        llm_gateway: Optional[LLMGateway] = None
     ):
         """Initialize reflector agent.
         
         Args:
             model_name: Gemini model name
             api_key: Google API key (or set GOOGLE_API_KEY env var)
+            llm_gateway: Gateway for LLM calls (default: the shared one)
         """
         self.model_name = model_name
         self.policy_manager = PolicyManager()
+        self.llm_gateway = llm_gateway or get_llm_gateway()
         
         if GEMINI_AVAILABLE:
             if api_key:
                 genai.configure(api_key=api_key)
             self.model = genai.GenerativeModel(model_name)
+            self.llm_gateway.register("gemini", CallableBackend(
+                lambda prompt, model, temperature: self.model.generate_content(prompt).text,
+                name="gemini",
+                max_concurrency=4
+            ))
         else:
             self.model = None
     
@@ -304,10 +313,10 @@ class ReflectorAgent:
         if self.model and GEMINI_AVAILABLE:
             try:
                 prompt = self._create_improvement_prompt(root_causes, metrics, past_lessons)
-                response = self.model.generate_content(prompt)
+                response_text = self.llm_gateway.complete(prompt, backend="gemini", model=self.model_name)
                 
                 # Parse Gemini suggestions
-                gemini_suggestions = self._parse_gemini_response(response.text)
+                gemini_suggestions = self._parse_gemini_response(response_text)
                 for sug in gemini_suggestions:
                     suggestions.append({
                         'suggestion': sug,
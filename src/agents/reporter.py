@@ -11,34 +11,32 @@ sys.path.append(str(Path(__file__).parent.parent.parent))
 from src.memory.schemas import AgentResult, AgentContent, AgentArtifact
 
 try:
-    from langchain.llms import Ollama
     from langchain.prompts import PromptTemplate
-    from langchain.chains import LLMChain
 except (ImportError, Exception): # Catch PydanticImportError (which inherits from ImportError or Exception)
     try:
-        from langchain_community.llms import Ollama
         from langchain_core.prompts import PromptTemplate
-        from langchain.chains import LLMChain
     except (ImportError, Exception):
-        # Mock classes
-        class Ollama:
-            def __init__(self, **kwargs): pass
-            def __call__(self, *args, **kwargs): return "Mock response"
+        # Mock PromptTemplate
         class PromptTemplate:
-            def __init__(self, **kwargs): pass
-        class LLMChain:
-            def __init__(self, **kwargs): pass
-            def run(self, **kwargs): return "Mock response"
+            def __init__(self, template: str = "", **kwargs): self.template = template
+            def format(self, **kwargs): return self.template.format(**kwargs)
 
 from ..memory.store import ExperimentStore
+from .llm_gateway import LLMGateway, get_llm_gateway
 
 
 class ReporterAgent:
     """Agent that generates human-readable reports."""
     
-    def __init__(self, model_name: str = "deepseek-r1", db_path: str = "experiments.db"):
+    def __init__(
+        self,
+        model_name: str = "deepseek-r1",
+        db_path: str = "experiments.db",
+        llm_gateway: Optional[LLMGateway] = None
+    ):
         """Initialize reporter agent."""
-        self.llm = Ollama(model=model_name, temperature=0.5)
+        self.model_name = model_name
+        self.llm_gateway = llm_gateway or get_llm_gateway()
         self.store = ExperimentStore(db_path)
         
         self.summary_prompt = PromptTemplate(
@@ -127,12 +125,12 @@ Turnover: {metrics.turnover_monthly:.1f}%
             
             issues_str = "\n".join(issues) if issues else "None"
             
-            chain = LLMChain(llm=self.llm, prompt=self.summary_prompt)
-            summary = chain.run(
+            prompt = self.summary_prompt.format(
                 run_data=run_data,
                 metrics=metrics_str,
                 issues=issues_str
             )
+            summary = self.llm_gateway.complete(prompt, model=self.model_name, temperature=0.5)
             
             return AgentResult(
                 agent="Reporter",
@@ -249,8 +247,8 @@ Provide:
             successful_str = "\n".join([str(f) for f in successful_factors[:5]])
             failed_str = "\n".join([str(f) for f in failed_factors[:5]])
             
-            chain = LLMChain(llm=self.llm, prompt=plan_prompt)
-            plan = chain.run(successful=successful_str, failed=failed_str)
+            prompt = plan_prompt.format(successful=successful_str, failed=failed_str)
+            plan = self.llm_gateway.complete(prompt, model=self.model_name, temperature=0.5)
             
             return AgentResult(
                 agent="Reporter",
@@ -9,17 +9,6 @@ sys.path.append(str(Path(__file__).parent.parent.parent))
 
 from src.memory.schemas import AgentResult, AgentContent, AgentArtifact
 
-try:
-    from langchain_community.llms import Ollama
-except (ImportError, Exception):
-    try:
-        from langchain.llms import Ollama
-    except (ImportError, Exception):
-        # Mock Ollama
-        class Ollama:
-            def __init__(self, **kwargs): pass
-            def __call__(self, *args, **kwargs): return "Mock response"
-
 try:
     from langchain_core.prompts import PromptTemplate
     from langchain.chains import LLMChain
@@ -56,7 +45,7 @@ class ResearcherAgent:
         index_path: str = "./kb.index"
     ):
         """Initialize researcher agent."""
-        self.llm = Ollama(model=model_name, temperature=0.7)
+        self.model_name = model_name
         self.store = ExperimentStore(db_path)
         self.lesson_manager = LessonManager(self.store)
         self.index_path = index_path
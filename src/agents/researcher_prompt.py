@@ -30,7 +30,7 @@ Your factor MUST produce signals that:
 - **Max Drawdown**: Target < -25%
 
 ### 3. Data Requirements
-- Use REAL market data only (prices, returns, volume)
+- Use REAL market data only: `prices` (close), `returns`, `open`, `high`, `low` and `volume` are dates x tickers DataFrames
 - Lookback windows: 5-252 days
 - Avoid lookahead bias (no future data)
 
@@ -1,10 +1,12 @@
 """__init__ file for archive module."""
 
 from .success_factors import SuccessFactorArchive
+from .benchmark_library import BenchmarkLibrary
 from .archive_viewer import ArchiveViewer, print_factor_summary
 
 __all__ = [
     'SuccessFactorArchive',
+    'BenchmarkLibrary',
     'ArchiveViewer',
     'print_factor_summary'
 ]
@@ -0,0 +1,187 @@
+"""Memory-mapped library of archived factor signals for diversity/originality scoring.
+
+Each archived factor is stored as one z-scored float32 row on a fixed
+business-day grid, with a validity mask for dates where the factor has no
+value. Rows are appended to two memory-mapped files, so correlating a new
+signal with every benchmark takes a few matrix-vector products over the
+file instead of a Python loop over benchmark series.
+"""
+
+import json
+from pathlib import Path
+from typing import List, Union
+
+import numpy as np
+import pandas as pd
+
+
+class BenchmarkLibrary:
+    """Append-only matrix of z-scored benchmark signals.
+
+    Correlations use the pairwise-complete overlap of the candidate and each
+    benchmark (same definition as Series.corr). The library assumes a single
+    writer.
+    """
+
+    VALUES_FILE = "values.f32"
+    MASK_FILE = "mask.u8"
+    META_FILE = "library.json"
+
+    def __init__(
+        self,
+        library_dir: Union[str, Path],
+        start: str = "1990-01-01",
+        end: str = "2035-12-31",
+        chunk_rows: int = 1024
+    ):
+        """Open (or create) a benchmark library.
+
+        Args:
+            library_dir: Directory holding the memory-mapped files
+            start: First date of the business-day grid (new libraries only)
+            end: Last date of the business-day grid (new libraries only)
+            chunk_rows: Benchmarks processed per block when correlating
+        """
+        self.library_dir = Path(library_dir)
+        self.library_dir.mkdir(parents=True, exist_ok=True)
+        self.chunk_rows = chunk_rows
+
+        meta_path = self.library_dir / self.META_FILE
+        if meta_path.exists():
+            with open(meta_path, 'r', encoding='utf-8') as f:
+                self.meta = json.load(f)
+        else:
+            self.meta = {'start': start, 'end': end, 'names': []}
+            self._save_meta()
+
+        self.dates = pd.bdate_range(self.meta['start'], self.meta['end'])
+
+    def __len__(self) -> int:
+        return len(self.meta['names'])
+
+    @property
+    def names(self) -> List[str]:
+        """Benchmark names in row order."""
+        return list(self.meta['names'])
+
+    def add(self, name: str, signal: pd.Series) -> int:
+        """Append a benchmark signal.
+
+        Args:
+            name: Benchmark name (e.g. archive directory name)
+            signal: Date-indexed signal series
+
+        Returns:
+            Row index of the new benchmark
+        """
+        values, mask = self._to_grid(signal)
+
+        if mask.sum() >= 2:
+            mean = values[mask].mean()
+            std = values[mask].std()
+            values[mask] = (values[mask] - mean) / (std + 1e-10)
+        values[~mask] = 0.0
+
+        self._append_row(self.VALUES_FILE, values.astype(np.float32))
+        self._append_row(self.MASK_FILE, mask.astype(np.uint8))
+
+        self.meta['names'].append(name)
+        self._save_meta()
+
+        return len(self) - 1
+
+    def get(self, name: str) -> pd.Series:
+        """Load one benchmark (z-scored) as a date-indexed series."""
+        row = self.meta['names'].index(name)
+        values, mask = self._open_matrices()
+        series = pd.Series(np.asarray(values[row], dtype=float), index=self.dates)
+        return series[np.asarray(mask[row], dtype=bool)]
+
+    def correlations(self, signal: pd.Series, min_overlap: int = 10) -> pd.Series:
+        """Pearson correlation of a signal with every benchmark.
+
+        Args:
+            signal: Date-indexed candidate signal
+            min_overlap: Minimum overlapping dates; fewer gives NaN
+
+        Returns:
+            Series of correlations indexed by benchmark name
+        """
+        if len(self) == 0:
+            return pd.Series(dtype=float)
+
+        x, x_mask = self._to_grid(signal)
+        if not x_mask.any():
+            return pd.Series(np.nan, index=self.names)
+
+        # Only the grid columns spanned by the candidate can overlap
+        valid = np.flatnonzero(x_mask)
+        lo, hi = valid[0], valid[-1] + 1
+        x_mask = x_mask[lo:hi]
+
+        # Centering the candidate keeps the sums well conditioned
+        x = np.where(x_mask, x[lo:hi] - x[lo:hi][x_mask].mean(), 0.0)
+        x_mask = x_mask.astype(float)
+        x_sq = x * x
+
+        values, mask = self._open_matrices()
+        result = np.empty(len(self))
+
+        for start in range(0, len(self), self.chunk_rows):
+            block = np.asarray(values[start:start + self.chunk_rows, lo:hi], dtype=float)
+            block_mask = np.asarray(mask[start:start + self.chunk_rows, lo:hi], dtype=float)
+
+            n = block_mask @ x_mask
+            sum_b = block @ x_mask
+            sum_bb = (block * block) @ x_mask
+            sum_x = block_mask @ x
+            sum_xx = block_mask @ x_sq
+            sum_bx = block @ x
+
+            with np.errstate(divide='ignore', invalid='ignore'):
+                cov = sum_bx - sum_b * sum_x / n
+                var_b = sum_bb - sum_b ** 2 / n
+                var_x = sum_xx - sum_x ** 2 / n
+                corr = cov / np.sqrt(var_b * var_x)
+
+            corr[(n < min_overlap) | (var_b <= 1e-12 * n) | (var_x <= 1e-12 * n)] = np.nan
+            result[start:start + len(block)] = np.clip(corr, -1.0, 1.0)
+
+        return pd.Series(result, index=self.names)
+
+    def _to_grid(self, signal: pd.Series):
+        """Project a date-indexed series onto the grid as (values, mask)."""
+        if not isinstance(signal.index, pd.DatetimeIndex):
+            raise ValueError("Benchmark signals must have a DatetimeIndex")
+
+        positions = self.dates.get_indexer(signal.index.normalize())
+        raw = np.asarray(signal, dtype=float)
+        keep = (positions >= 0) & np.isfinite(raw)
+
+        values = np.zeros(len(self.dates))
+        mask = np.zeros(len(self.dates), dtype=bool)
+        values[positions[keep]] = raw[keep]
+        mask[positions[keep]] = True
+
+        return values, mask
+
+    def _append_row(self, filename: str, row: np.ndarray):
+        """Append one row, dropping any partial row left by an interrupted add."""
+        with open(self.library_dir / filename, 'a+b') as f:
+            f.truncate(len(self) * row.nbytes)
+            f.write(row.tobytes())
+
+    def _open_matrices(self):
+        """Memory-map the value and mask matrices (read-only)."""
+        shape = (len(self), len(self.dates))
+        values = np.memmap(self.library_dir / self.VALUES_FILE, dtype=np.float32, mode='r', shape=shape)
+        mask = np.memmap(self.library_dir / self.MASK_FILE, dtype=np.uint8, mode='r', shape=shape)
+        return values, mask
+
+    def _save_meta(self):
+        """Write metadata atomically."""
+        meta_path = self.library_dir / self.META_FILE
+        tmp_path = meta_path.with_suffix('.tmp')
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(self.meta, f)
+        tmp_path.replace(meta_path)
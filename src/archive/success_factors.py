@@ -6,11 +6,16 @@ performance criteria (Sharpe >= 1.8, MaxDD <= -25%, IC >= 0.05).
 
 import json
 import shutil
+import logging
 from pathlib import Path
 from datetime import datetime
 from typing import Dict, Any, List, Optional
 import pandas as pd
 
+from .benchmark_library import BenchmarkLibrary
+
+logger = logging.getLogger("quantalpha.archive")
+
 
 class SuccessFactorArchive:
     """Archive successful factors with complete outputs."""
@@ -23,6 +28,14 @@ class SuccessFactorArchive:
         """
         self.archive_dir = Path(archive_dir)
         self.archive_dir.mkdir(parents=True, exist_ok=True)
+        self._benchmark_library = None
+    
+    @property
+    def benchmark_library(self) -> BenchmarkLibrary:
+        """Memory-mapped library of archived average signals (opened on first use)."""
+        if self._benchmark_library is None:
+            self._benchmark_library = BenchmarkLibrary(self.archive_dir / "benchmark_library")
+        return self._benchmark_library
     
     def should_archive(self, metrics: Dict[str, float]) -> bool:
         """Check if factor meets archival criteria.
@@ -114,6 +127,9 @@ class SuccessFactorArchive:
         # 7. Create README
         self._create_readme(archive_path, factor_name, metadata)
         
+        # 8. Add the average signal to the benchmark library
+        self._add_to_benchmark_library(archive_path.name, computations.get('signals'))
+        
         return str(archive_path)
     
     def list_archived_factors(
@@ -211,6 +227,15 @@ class SuccessFactorArchive:
         
         return data
     
+    def _add_to_benchmark_library(self, name: str, signals: Optional[pd.DataFrame]):
+        """Append the cross-sectional average signal to the benchmark library."""
+        if signals is None or not isinstance(signals.index, pd.DatetimeIndex):
+            logger.info(f"No dated signals for {name}; benchmark library not updated")
+            return
+        
+        avg_signal = signals.mean(axis=1) if isinstance(signals, pd.DataFrame) else signals
+        self.benchmark_library.add(name, avg_signal)
+    
     def _save_json(self, path: Path, data: Any):
         """Save data as JSON."""
         with open(path, 'w', encoding='utf-8') as f:
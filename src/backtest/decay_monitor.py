@@ -3,15 +3,203 @@
 Tracks IC decay over time and implements regularized exploration and complexity control.
 """
 
+import json
 import pandas as pd
 import numpy as np
-from typing import Dict, List, Any, Optional, Tuple
+from pathlib import Path
+from typing import Dict, List, Any, Optional, Tuple, Union
 from datetime import datetime, timedelta
 
-from .metrics import information_coefficient
+from .metrics import rolling_information_coefficient
 from ..memory.store import ExperimentStore
 
 
+class OnlineICTracker:
+    """Rolling Spearman IC and decay estimates, updated one observation at a time.
+    
+    Average ranks of the signal and return windows are maintained
+    incrementally, so each new day costs O(window) instead of re-ranking
+    the whole history. The IC emitted for a new observation covers the
+    previous `window` observations, the same windows as track_ic_decay.
+    
+    Decay is measured online as the change of the trailing mean IC (last
+    `window` ICs) relative to a baseline (mean of the first `baseline_periods`
+    ICs). The half-life comes from a running least-squares fit of log(IC) on
+    time over positive ICs, identical to the batch np.polyfit estimate.
+    """
+    
+    def __init__(self, window: int = 63, baseline_periods: int = 63):
+        """Initialize tracker.
+        
+        Args:
+            window: Rolling window for IC calculation
+            baseline_periods: Number of initial ICs forming the baseline
+        """
+        self.window = window
+        self.baseline_periods = baseline_periods
+        
+        # Observation ring buffer and within-window average ranks
+        self.signals = np.zeros(window)
+        self.returns = np.zeros(window)
+        self.signal_ranks = np.zeros(window)
+        self.return_ranks = np.zeros(window)
+        self.head = 0
+        self.count = 0
+        
+        # Recent ICs for the trailing mean
+        self.recent_ic = np.zeros(window)
+        self.recent_sum = 0.0
+        
+        self.n_ic = 0
+        self.baseline_sum = 0.0
+        self.last_ic = None
+        self.last_date = None
+        
+        # Running sums for log(IC) = a - lambda * t over positive ICs
+        self.fit_n = 0
+        self.fit_t = 0.0
+        self.fit_y = 0.0
+        self.fit_tt = 0.0
+        self.fit_ty = 0.0
+    
+    def update(self, date: Any, signal: float, ret: float) -> Optional[float]:
+        """Add one observation.
+        
+        Args:
+            date: Observation date
+            signal: Factor signal
+            ret: Next period return
+        
+        Returns:
+            IC of the window preceding this observation, or None while filling
+            (or if the observation is missing)
+        """
+        if not (np.isfinite(signal) and np.isfinite(ret)):
+            return None
+        
+        ic = None
+        if self.count == self.window:
+            ic = self._current_ic()
+            self._record_ic(ic)
+            self.last_date = str(date)
+        
+        self._insert(signal, ret)
+        
+        return ic
+    
+    def _insert(self, signal: float, ret: float):
+        """Insert an observation, evicting the oldest when full (O(window))."""
+        if self.count == self.window:
+            slot = self.head
+            others = np.arange(self.window) != slot
+            self._remove_rank(self.signals, self.signal_ranks, others, self.signals[slot])
+            self._remove_rank(self.returns, self.return_ranks, others, self.returns[slot])
+            self.head = (self.head + 1) % self.window
+        else:
+            slot = self.count
+            others = np.arange(self.window) < self.count
+            self.count += 1
+        
+        self.signals[slot] = signal
+        self.returns[slot] = ret
+        self.signal_ranks[slot] = self._add_rank(self.signals, self.signal_ranks, others, signal)
+        self.return_ranks[slot] = self._add_rank(self.returns, self.return_ranks, others, ret)
+    
+    @staticmethod
+    def _remove_rank(values: np.ndarray, ranks: np.ndarray, others: np.ndarray, old: float):
+        """Lower the ranks of values above (or tied with) an evicted value."""
+        ranks[others] -= (values[others] > old) + 0.5 * (values[others] == old)
+    
+    @staticmethod
+    def _add_rank(values: np.ndarray, ranks: np.ndarray, others: np.ndarray, new: float) -> float:
+        """Raise ranks of values above (or tied with) a new value; return its rank."""
+        ranks[others] += (values[others] > new) + 0.5 * (values[others] == new)
+        return 1.0 + (values[others] < new).sum() + 0.5 * (values[others] == new).sum()
+    
+    def _current_ic(self) -> float:
+        """Spearman IC of the full window (Pearson correlation of average ranks)."""
+        x = self.signal_ranks - self.signal_ranks.mean()
+        y = self.return_ranks - self.return_ranks.mean()
+        denominator = np.sqrt((x * x).sum() * (y * y).sum())
+        return float((x * y).sum() / denominator) if denominator > 0 else 0.0
+    
+    def _record_ic(self, ic: float):
+        """Update trailing mean, baseline and half-life sums with a new IC."""
+        t = self.n_ic
+        slot = t % self.window
+        if t >= self.window:
+            self.recent_sum -= self.recent_ic[slot]
+        self.recent_ic[slot] = ic
+        self.recent_sum += ic
+        
+        if t < self.baseline_periods:
+            self.baseline_sum += ic
+        
+        if ic > 0:
+            log_ic = np.log(ic)
+            self.fit_n += 1
+            self.fit_t += t
+            self.fit_y += log_ic
+            self.fit_tt += t * t
+            self.fit_ty += t * log_ic
+        
+        self.n_ic += 1
+        self.last_ic = ic
+    
+    def summary(self) -> Dict[str, Any]:
+        """Current decay estimates (keys as in AlphaDecayMonitor.track_ic_decay)."""
+        if self.n_ic == 0:
+            return {
+                'decay_rate': 0.0,
+                'initial_ic': 0.0,
+                'final_ic': 0.0,
+                'decay_detected': False,
+                'half_life': None,
+                'last_ic': self.last_ic,
+                'last_date': self.last_date,
+                'n_periods': 0
+            }
+        
+        initial_ic = float(self.baseline_sum / min(self.n_ic, self.baseline_periods))
+        final_ic = float(self.recent_sum / min(self.n_ic, self.window))
+        decay_rate = (final_ic - initial_ic) / (abs(initial_ic) + 0.01)
+        
+        half_life = None
+        if decay_rate < -0.1 and self.fit_n > 5:
+            denominator = self.fit_n * self.fit_tt - self.fit_t ** 2
+            if denominator > 0:
+                lambda_param = -(self.fit_n * self.fit_ty - self.fit_t * self.fit_y) / denominator
+                if lambda_param > 0:
+                    half_life = float(np.log(2) / lambda_param)
+        
+        return {
+            'decay_rate': decay_rate,
+            'initial_ic': initial_ic,
+            'final_ic': final_ic,
+            'decay_detected': bool(decay_rate < -0.2),
+            'half_life': half_life,
+            'last_ic': self.last_ic,
+            'last_date': self.last_date,
+            'n_periods': self.n_ic
+        }
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """JSON-serializable tracker state."""
+        state = {}
+        for key, value in self.__dict__.items():
+            state[key] = value.tolist() if isinstance(value, np.ndarray) else value
+        return state
+    
+    @classmethod
+    def from_dict(cls, state: Dict[str, Any]) -> 'OnlineICTracker':
+        """Restore a tracker from to_dict() output."""
+        tracker = cls(window=state['window'], baseline_periods=state['baseline_periods'])
+        for key, value in state.items():
+            current = getattr(tracker, key)
+            setattr(tracker, key, np.array(value, dtype=float) if isinstance(current, np.ndarray) else value)
+        return tracker
+
+
 class AlphaDecayMonitor:
     """Monitor alpha decay and implement mitigation strategies."""
     
@@ -22,6 +210,61 @@ class AlphaDecayMonitor:
             store: Experiment store for retrieving historical runs
         """
         self.store = store
+        self.trackers: Dict[str, OnlineICTracker] = {}
+    
+    def update_live_ic(
+        self,
+        factor_name: str,
+        date: Any,
+        signal: float,
+        ret: float,
+        window: int = 63
+    ) -> Dict[str, Any]:
+        """Feed one new observation of a live factor to its online tracker.
+        
+        Args:
+            factor_name: Factor identifier
+            date: Observation date
+            signal: Factor signal (e.g. cross-sectional average)
+            ret: Next period return
+            window: Rolling window for new trackers
+        
+        Returns:
+            Current decay estimates for the factor
+        """
+        if factor_name not in self.trackers:
+            self.trackers[factor_name] = OnlineICTracker(window=window, baseline_periods=window)
+        
+        tracker = self.trackers[factor_name]
+        tracker.update(date, signal, ret)
+        
+        return tracker.summary()
+    
+    def save_trackers(self, path: Union[str, Path]):
+        """Persist all online trackers to a JSON file (atomic replace)."""
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(path.suffix + '.tmp')
+        
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({name: t.to_dict() for name, t in self.trackers.items()}, f)
+        tmp_path.replace(path)
+    
+    def load_trackers(self, path: Union[str, Path]) -> int:
+        """Load online trackers saved by save_trackers.
+        
+        Returns:
+            Number of trackers loaded
+        """
+        path = Path(path)
+        if not path.exists():
+            return 0
+        
+        with open(path, 'r', encoding='utf-8') as f:
+            states = json.load(f)
+        
+        self.trackers.update({name: OnlineICTracker.from_dict(state) for name, state in states.items()})
+        return len(states)
     
     def track_ic_decay(
         self,
@@ -57,15 +300,8 @@ class AlphaDecayMonitor:
             }
         
         # Calculate rolling IC
-        rolling_ic = []
-        ic_dates = []
-        
-        for i in range(window, len(aligned)):
-            window_signals = aligned['signals'].iloc[i-window:i]
-            window_returns = aligned['returns'].iloc[i-window:i]
-            ic = information_coefficient(window_signals, window_returns)
-            rolling_ic.append(ic)
-            ic_dates.append(aligned.index[i])
+        rolling_ic = rolling_information_coefficient(aligned['signals'], aligned['returns'], window)
+        ic_dates = aligned.index[window:]
         
         if len(rolling_ic) < min_periods:
             return {
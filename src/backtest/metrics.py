@@ -1,5 +1,6 @@
 """Performance metrics calculation: Sharpe, MaxDD, IC, IR, turnover, hit rate."""
 
+import warnings
 import numpy as np
 import pandas as pd
 from typing import Optional, Tuple, Dict, Any
@@ -51,7 +52,8 @@ def max_drawdown(equity_curve: pd.Series) -> float:
 def information_coefficient(
     scores: pd.Series,
     next_period_returns: pd.Series,
-    method: str = "spearman"
+    method: str = "spearman",
+    mask: Optional[pd.Series] = None
 ) -> float:
     """Calculate Information Coefficient (IC).
     
@@ -59,6 +61,8 @@ def information_coefficient(
         scores: Factor scores/predictions
         next_period_returns: Next period returns (aligned with scores)
         method: Correlation method ('spearman' or 'pearson')
+        mask: Boolean Series of observations to include (e.g. universe
+            membership); missing labels are excluded
     
     Returns:
         IC value
@@ -67,7 +71,10 @@ def information_coefficient(
     aligned = pd.DataFrame({
         'scores': scores,
         'returns': next_period_returns
-    }).dropna()
+    })
+    if mask is not None:
+        aligned = aligned[mask.reindex(aligned.index, fill_value=False).to_numpy(dtype=bool)]
+    aligned = aligned.dropna()
     
     if len(aligned) < 2:
         return 0.0
@@ -80,6 +87,123 @@ def information_coefficient(
     return ic if not np.isnan(ic) else 0.0
 
 
+def centered_ranks(windows: np.ndarray) -> np.ndarray:
+    """Average ranks of each row, minus the row mean.
+    
+    Args:
+        windows: 2-D array, one window per row
+    
+    Returns:
+        Array of the same shape with centered ranks
+    """
+    ranks = stats.rankdata(windows, axis=1)
+    return ranks - ranks.mean(axis=1, keepdims=True)
+
+
+def ranked_window_corr(x_ranks: np.ndarray, y_ranks: np.ndarray) -> np.ndarray:
+    """Row-wise correlation of centered ranks (Spearman); constant rows give 0.
+    
+    Args:
+        x_ranks: Centered ranks from centered_ranks()
+        y_ranks: Centered ranks of the same shape
+    
+    Returns:
+        1-D array with one correlation per row
+    """
+    with np.errstate(divide='ignore', invalid='ignore'):
+        corr = (x_ranks * y_ranks).sum(axis=1) / np.sqrt(
+            (x_ranks ** 2).sum(axis=1) * (y_ranks ** 2).sum(axis=1)
+        )
+    return np.nan_to_num(corr, nan=0.0)
+
+
+def rolling_information_coefficient(
+    scores: pd.Series,
+    next_period_returns: pd.Series,
+    window: int
+) -> np.ndarray:
+    """Spearman IC over trailing windows, vectorized.
+    
+    Element k is the IC of positions [k, k + window), for every window that
+    ends before the last observation - the same windows as looping
+    ``for i in range(window, len(scores))`` over ``iloc[i-window:i]``.
+    Windows without missing values are ranked and correlated in one pass;
+    windows containing NaNs fall back to information_coefficient.
+    
+    Args:
+        scores: Factor scores/predictions
+        next_period_returns: Next period returns (same length as scores)
+        window: Window length
+    
+    Returns:
+        Array of len(scores) - window IC values
+    """
+    x = np.asarray(scores, dtype=float)
+    y = np.asarray(next_period_returns, dtype=float)
+    n_windows = len(x) - window
+    
+    if n_windows <= 0:
+        return np.array([])
+    if window < 2:
+        return np.zeros(n_windows)
+    
+    x_windows = np.lib.stride_tricks.sliding_window_view(x, window)[:n_windows]
+    y_windows = np.lib.stride_tricks.sliding_window_view(y, window)[:n_windows]
+    
+    missing = np.isnan(x_windows).any(axis=1) | np.isnan(y_windows).any(axis=1)
+    ic = np.zeros(n_windows)
+    
+    clean = ~missing
+    if clean.any():
+        ic[clean] = ranked_window_corr(
+            centered_ranks(x_windows[clean]),
+            centered_ranks(y_windows[clean])
+        )
+    
+    for k in np.flatnonzero(missing):
+        ic[k] = information_coefficient(
+            pd.Series(x_windows[k]),
+            pd.Series(y_windows[k])
+        )
+    
+    return ic
+
+
+def cross_sectional_ic(
+    scores_df: pd.DataFrame,
+    next_returns_df: pd.DataFrame,
+    mask: Optional[pd.DataFrame] = None
+) -> pd.Series:
+    """Spearman IC across tickers on each date, vectorized.
+    
+    Args:
+        scores_df: Factor scores (rows = dates, columns = tickers)
+        next_returns_df: Next period returns, aligned with scores_df
+        mask: Point-in-time universe membership (dates x tickers); only
+            members are ranked on each date
+    
+    Returns:
+        IC per date (0 where fewer than two tickers have both values)
+    """
+    next_returns_df = next_returns_df.reindex(index=scores_df.index, columns=scores_df.columns)
+    valid = scores_df.notna().to_numpy() & next_returns_df.notna().to_numpy()
+    if mask is not None:
+        valid &= mask.reindex(index=scores_df.index, columns=scores_df.columns, fill_value=False).to_numpy(dtype=bool)
+    
+    x_ranks = scores_df.where(valid).rank(axis=1).to_numpy(dtype=float)
+    y_ranks = next_returns_df.where(valid).rank(axis=1).to_numpy(dtype=float)
+    
+    with warnings.catch_warnings():
+        # Dates without members have all-NaN ranks
+        warnings.simplefilter("ignore", category=RuntimeWarning)
+        x_centered = np.nan_to_num(x_ranks - np.nanmean(x_ranks, axis=1, keepdims=True))
+        y_centered = np.nan_to_num(y_ranks - np.nanmean(y_ranks, axis=1, keepdims=True))
+    
+    ic = ranked_window_corr(x_centered, y_centered)
+    ic[valid.sum(axis=1) < 2] = 0.0
+    return pd.Series(ic, index=scores_df.index)
+
+
 def information_ratio(ic_series: pd.Series) -> float:
     """Calculate Information Ratio (mean IC / std IC).
     
@@ -311,14 +435,7 @@ def calculate_all_metrics(
         
         # Calculate rolling IC if we have enough data
         if len(scores) > 21:
-            rolling_ic = []
-            for i in range(21, len(scores)):
-                window_scores = scores.iloc[i-21:i]
-                window_returns = next_returns.iloc[i-21:i]
-                window_ic = information_coefficient(window_scores, window_returns)
-                rolling_ic.append(window_ic)
-            
-            ic_series = pd.Series(rolling_ic)
+            ic_series = pd.Series(rolling_information_coefficient(scores, next_returns, 21))
             metrics['ic_std'] = ic_series.std()
             metrics['ir'] = information_ratio(ic_series) if ic_series.std() > 0 else 0.0
         else:
@@ -13,25 +13,37 @@ import pandas as pd
 import numpy as np
 from typing import Dict, List, Any, Optional, Tuple
 from scipy import stats
-from scipy.spatial.distance import cosine
 
-from .metrics import information_coefficient, sharpe, information_ratio
+from .metrics import (
+    information_coefficient,
+    sharpe,
+    information_ratio,
+    centered_ranks,
+    ranked_window_corr
+)
 from ..factors.primitives import CORRELATION, TS_RANK
+from ..archive.benchmark_library import BenchmarkLibrary
 
 
 class MultiDimensionalEvaluator:
     """Multi-dimensional factor evaluator."""
     
-    def __init__(self):
-        """Initialize evaluator."""
-        pass
+    def __init__(self, benchmark_library: Optional[BenchmarkLibrary] = None):
+        """Initialize evaluator.
+        
+        Args:
+            benchmark_library: Default archived benchmarks for diversity/originality
+        """
+        self.benchmark_library = benchmark_library
     
     def evaluate(
         self,
         signals: pd.Series,
         returns: pd.Series,
         prices: Optional[pd.Series] = None,
-        benchmark_signals: Optional[List[pd.Series]] = None
+        benchmark_signals: Optional[List[pd.Series]] = None,
+        context: Optional[Dict[str, Any]] = None,
+        benchmark_library: Optional[BenchmarkLibrary] = None
     ) -> Dict[str, Any]:
         """Comprehensive multi-dimensional evaluation.
         
@@ -40,63 +52,49 @@ class MultiDimensionalEvaluator:
             returns: Next period returns
             prices: Price series (for financial logic)
             benchmark_signals: List of benchmark factor signals (for diversity/originality)
+            context: Precomputed evaluation context (see build_context)
+            benchmark_library: Archived benchmarks, used when benchmark_signals is not given
+                (defaults to the evaluator's library)
         
         Returns:
             Dictionary with scores for each dimension
         """
-        results = {}
+        if context is None:
+            context = self.build_context(signals, returns, benchmark_signals, benchmark_library=benchmark_library)
         
-        # Align data
-        aligned = pd.DataFrame({
-            'signals': signals,
-            'returns': returns
-        }).dropna()
-        
-        if len(aligned) < 10:
+        if context is None:
             return self._empty_results()
         
+        results = {}
+        
         # 1. Predictive Power
-        results['predictive_power'] = self._evaluate_predictive_power(
-            aligned['signals'],
-            aligned['returns']
-        )
+        results['predictive_power'] = self._evaluate_predictive_power(context)
         
         # 2. Stability
-        results['stability'] = self._evaluate_stability(
-            aligned['signals'],
-            aligned['returns']
-        )
+        results['stability'] = self._evaluate_stability(context)
         
         # 3. Robustness
-        results['robustness'] = self._evaluate_robustness(
-            aligned['signals'],
-            aligned['returns']
-        )
+        results['robustness'] = self._evaluate_robustness(context)
         
         # 4. Financial Logic
         if prices is not None:
             results['financial_logic'] = self._evaluate_financial_logic(
-                aligned['signals'],
-                prices.loc[aligned.index]
+                context['signals'],
+                prices.loc[context['signals'].index]
             )
         else:
             results['financial_logic'] = {'score': 0.5, 'details': 'Price data not available'}
         
         # 5. Diversity
-        if benchmark_signals:
-            results['diversity'] = self._evaluate_diversity(
-                aligned['signals'],
-                benchmark_signals
-            )
+        n_benchmarks = context['n_benchmarks']
+        if n_benchmarks:
+            results['diversity'] = self._evaluate_diversity(context, n_benchmarks)
         else:
             results['diversity'] = {'score': 0.5, 'details': 'No benchmark signals provided'}
         
         # 6. Originality
-        if benchmark_signals:
-            results['originality'] = self._evaluate_originality(
-                aligned['signals'],
-                benchmark_signals
-            )
+        if n_benchmarks:
+            results['originality'] = self._evaluate_originality(context, n_benchmarks)
         else:
             results['originality'] = {'score': 0.5, 'details': 'No benchmark signals provided'}
         
@@ -121,37 +119,209 @@ class MultiDimensionalEvaluator:
         
         return results
     
-    def _evaluate_predictive_power(
+    def evaluate_batch(
+        self,
+        signals_batch: Dict[str, pd.Series],
+        returns: pd.Series,
+        prices: Optional[pd.Series] = None,
+        benchmark_signals: Optional[List[pd.Series]] = None,
+        benchmark_library: Optional[BenchmarkLibrary] = None
+    ) -> Dict[str, Dict[str, Any]]:
+        """Evaluate several signals against the same returns in one call.
+        
+        Returns-side work (volatility regimes, rolling-window return ranks)
+        and the standardized benchmark matrix are computed once and shared
+        by every signal with the same aligned dates.
+        
+        Args:
+            signals_batch: Mapping of name -> factor signals (or a DataFrame of signals)
+            returns: Next period returns
+            prices: Price series (for financial logic)
+            benchmark_signals: List of benchmark factor signals
+            benchmark_library: Archived benchmarks, used when benchmark_signals is not given
+                (defaults to the evaluator's library)
+        
+        Returns:
+            Mapping of name -> evaluate() results
+        """
+        if isinstance(signals_batch, pd.DataFrame):
+            signals_batch = {name: signals_batch[name] for name in signals_batch.columns}
+        
+        shared = {}
+        results = {}
+        for name, signals in signals_batch.items():
+            context = self.build_context(
+                signals, returns, benchmark_signals, shared=shared, benchmark_library=benchmark_library
+            )
+            results[name] = self.evaluate(
+                signals, returns, prices, benchmark_signals, context=context
+            ) if context is not None else self._empty_results()
+        
+        return results
+    
+    def build_context(
         self,
         signals: pd.Series,
-        returns: pd.Series
-    ) -> Dict[str, Any]:
-        """Evaluate predictive power.
+        returns: pd.Series,
+        benchmark_signals: Optional[List[pd.Series]] = None,
+        shared: Optional[Dict[str, Any]] = None,
+        benchmark_library: Optional[BenchmarkLibrary] = None
+    ) -> Optional[Dict[str, Any]]:
+        """Compute everything the six dimensions share, once.
         
-        Metrics: IC, IR, hit rate, monotonicity
+        Args:
+            signals: Factor signals
+            returns: Next period returns
+            benchmark_signals: List of benchmark factor signals
+            shared: Cache reused across calls with the same returns/benchmarks
+            benchmark_library: Archived benchmarks, used when benchmark_signals is not given.
+                Correlations use each benchmark's pairwise overlap with the signal.
+                Defaults to the evaluator's library.
+        
+        Returns:
+            Context dictionary, or None if fewer than 10 aligned observations
         """
-        # IC
-        ic = information_coefficient(signals, returns)
+        aligned = pd.DataFrame({
+            'signals': signals,
+            'returns': returns
+        }).dropna()
         
-        # Rolling IC for IR
-        rolling_ic = []
+        if len(aligned) < 10:
+            return None
+        
+        if shared is None:
+            shared = {}
+        if benchmark_library is None:
+            benchmark_library = self.benchmark_library
+        
+        signals = aligned['signals']
+        returns = aligned['returns']
         window = min(63, len(signals) // 4)  # ~1 quarter or 1/4 of data
+        
+        returns_state = shared.get('returns')
+        if returns_state is None or not returns_state['index'].equals(aligned.index):
+            returns_state = self._returns_state(returns, window)
+            shared['returns'] = returns_state
+        
+        # Rolling IC: rank the signal windows, reuse the return window ranks
         if window > 5:
-            for i in range(window, len(signals)):
-                window_signals = signals.iloc[i-window:i]
-                window_returns = returns.iloc[i-window:i]
-                window_ic = information_coefficient(window_signals, window_returns)
-                rolling_ic.append(window_ic)
+            x_windows = np.lib.stride_tricks.sliding_window_view(
+                signals.to_numpy(dtype=float), window
+            )[:len(signals) - window]
+            rolling_ic = ranked_window_corr(centered_ranks(x_windows), returns_state['window_ranks'])
+        else:
+            rolling_ic = np.array([])
         
-        ir = information_ratio(pd.Series(rolling_ic)) if rolling_ic else 0.0
+        context = {
+            'signals': signals,
+            'returns': returns,
+            'ic': information_coefficient(signals, returns),
+            'rolling_ic': rolling_ic,
+            'high_vol_mask': returns_state['high_vol_mask'],
+            'low_vol_mask': returns_state['low_vol_mask'],
+            'quintiles': pd.qcut(signals, q=5, duplicates='drop'),
+            'benchmark_corr': None,
+            'n_benchmarks': 0
+        }
+        
+        if benchmark_signals:
+            context['benchmark_corr'] = self._benchmark_correlations(
+                signals, benchmark_signals, shared
+            )
+            context['n_benchmarks'] = len(benchmark_signals)
+        elif benchmark_library is not None and len(benchmark_library) > 0:
+            corr = benchmark_library.correlations(signals).to_numpy()
+            corr = corr[~np.isnan(corr)]  # benchmarks without enough overlap
+            if len(corr):
+                context['benchmark_corr'] = {'pairwise': corr, 'complete': corr}
+            context['n_benchmarks'] = len(benchmark_library)
+        
+        return context
+    
+    def _returns_state(self, returns: pd.Series, window: int) -> Dict[str, Any]:
+        """Returns-only quantities: volatility regimes and rolling-window ranks."""
+        vol = returns.rolling(21).std()
+        high_vol_threshold = vol.quantile(0.75)
+        low_vol_threshold = vol.quantile(0.25)
+        
+        window_ranks = None
+        if window > 5:
+            y_windows = np.lib.stride_tricks.sliding_window_view(
+                returns.to_numpy(dtype=float), window
+            )[:len(returns) - window]
+            window_ranks = centered_ranks(y_windows)
+        
+        return {
+            'index': returns.index,
+            'high_vol_mask': vol > high_vol_threshold,
+            'low_vol_mask': vol < low_vol_threshold,
+            'window_ranks': window_ranks
+        }
+    
+    def _benchmark_correlations(
+        self,
+        signals: pd.Series,
+        benchmark_signals: List[pd.Series],
+        shared: Dict[str, Any]
+    ) -> Optional[Dict[str, Any]]:
+        """Pearson correlations with all benchmarks via one matrix product.
+        
+        Returns:
+            Dictionary with 'pairwise' (NaN-tolerant, for diversity) and
+            'complete' (NaN where a benchmark has gaps, for originality)
+            correlation arrays, or None if the overlap is too short
+        """
+        common_index = signals.index
+        for bench in benchmark_signals:
+            common_index = common_index.intersection(bench.index)
+        
+        if len(common_index) < 10:
+            return None
+        
+        state = shared.get('benchmarks')
+        if state is None or not state['index'].equals(common_index):
+            matrix = np.column_stack([bench.loc[common_index].to_numpy(dtype=float) for bench in benchmark_signals])
+            has_nan = np.isnan(matrix).any(axis=0)
+            centered = np.where(has_nan, 0.0, matrix - matrix.mean(axis=0))
+            state = {
+                'index': common_index,
+                'matrix': matrix,
+                'has_nan': has_nan,
+                'centered': centered,
+                'norms': np.sqrt((centered ** 2).sum(axis=0))
+            }
+            shared['benchmarks'] = state
+        
+        x = signals.loc[common_index].to_numpy(dtype=float)
+        x_centered = x - x.mean()
+        
+        with np.errstate(divide='ignore', invalid='ignore'):
+            complete = (x_centered @ state['centered']) / (np.sqrt((x_centered ** 2).sum()) * state['norms'])
+        complete[state['has_nan']] = np.nan
+        
+        pairwise = complete.copy()
+        for k in np.flatnonzero(state['has_nan']):
+            pairwise[k] = pd.Series(x).corr(pd.Series(state['matrix'][:, k]))
+        
+        return {'pairwise': pairwise, 'complete': complete}
+    
+    def _evaluate_predictive_power(self, context: Dict[str, Any]) -> Dict[str, Any]:
+        """Evaluate predictive power.
+        
+        Metrics: IC, IR, hit rate, monotonicity
+        """
+        signals = context['signals']
+        returns = context['returns']
+        
+        ic = context['ic']
+        rolling_ic = context['rolling_ic']
+        ir = information_ratio(pd.Series(rolling_ic)) if len(rolling_ic) else 0.0
         
         # Hit rate
         hit_rate = (np.sign(signals) == np.sign(returns)).mean()
         
         # Monotonicity: check if higher signals lead to higher returns
-        # Divide into quintiles
-        quintiles = pd.qcut(signals, q=5, duplicates='drop')
-        quintile_returns = returns.groupby(quintiles).mean()
+        quintile_returns = returns.groupby(context['quintiles']).mean()
         monotonicity = 1.0 if quintile_returns.is_monotonic_increasing else 0.0
         
         score = (abs(ic) * 0.4 + min(abs(ir), 2.0) / 2.0 * 0.3 + hit_rate * 0.2 + monotonicity * 0.1)
@@ -166,24 +336,13 @@ class MultiDimensionalEvaluator:
             'details': f"IC={ic:.4f}, IR={ir:.2f}, HitRate={hit_rate:.2%}"
         }
     
-    def _evaluate_stability(
-        self,
-        signals: pd.Series,
-        returns: pd.Series
-    ) -> Dict[str, Any]:
+    def _evaluate_stability(self, context: Dict[str, Any]) -> Dict[str, Any]:
         """Evaluate stability.
         
         Metrics: IC stability over time, signal stability, consistency
         """
-        # IC stability
-        rolling_ic = []
-        window = min(63, len(signals) // 4)
-        if window > 5:
-            for i in range(window, len(signals)):
-                window_signals = signals.iloc[i-window:i]
-                window_returns = returns.iloc[i-window:i]
-                window_ic = information_coefficient(window_signals, window_returns)
-                rolling_ic.append(window_ic)
+        signals = context['signals']
+        rolling_ic = context['rolling_ic']
         
         if len(rolling_ic) > 1:
             ic_std = pd.Series(rolling_ic).std()
@@ -213,27 +372,20 @@ class MultiDimensionalEvaluator:
             'details': f"IC stability={ic_stability:.2f}, Signal stability={signal_stability:.2f}"
         }
     
-    def _evaluate_robustness(
-        self,
-        signals: pd.Series,
-        returns: pd.Series
-    ) -> Dict[str, Any]:
+    def _evaluate_robustness(self, context: Dict[str, Any]) -> Dict[str, Any]:
         """Evaluate robustness.
         
         Metrics: Performance across different market conditions, outlier resistance
         """
-        # Divide into volatility regimes
-        vol = returns.rolling(21).std()
-        high_vol_threshold = vol.quantile(0.75)
-        low_vol_threshold = vol.quantile(0.25)
-        
-        high_vol_mask = vol > high_vol_threshold
-        low_vol_mask = vol < low_vol_threshold
+        signals = context['signals']
+        returns = context['returns']
+        high_vol_mask = context['high_vol_mask']
+        low_vol_mask = context['low_vol_mask']
         
         # IC in different regimes
         ic_high_vol = information_coefficient(signals[high_vol_mask], returns[high_vol_mask]) if high_vol_mask.sum() > 10 else 0.0
         ic_low_vol = information_coefficient(signals[low_vol_mask], returns[low_vol_mask]) if low_vol_mask.sum() > 10 else 0.0
-        ic_overall = information_coefficient(signals, returns)
+        ic_overall = context['ic']
         
         # Robustness: similar IC across regimes
         regime_ic_diff = abs(ic_high_vol - ic_low_vol)
@@ -292,37 +444,19 @@ class MultiDimensionalEvaluator:
             'details': f"Reasonableness={reasonableness:.2f}, Price logic={price_logic:.2f}"
         }
     
-    def _evaluate_diversity(
-        self,
-        signals: pd.Series,
-        benchmark_signals: List[pd.Series]
-    ) -> Dict[str, Any]:
+    def _evaluate_diversity(self, context: Dict[str, Any], n_benchmarks: int) -> Dict[str, Any]:
         """Evaluate diversity.
         
         Measures how different this factor is from benchmark factors.
         """
-        if not benchmark_signals:
-            return {'score': 0.5, 'details': 'No benchmarks'}
-        
-        # Align all signals
-        common_index = signals.index
-        for bench in benchmark_signals:
-            common_index = common_index.intersection(bench.index)
-        
-        if len(common_index) < 10:
+        benchmark_corr = context['benchmark_corr']
+        if benchmark_corr is None:
             return {'score': 0.5, 'details': 'Insufficient overlap'}
         
-        signals_aligned = signals.loc[common_index]
-        
-        # Calculate correlations with benchmarks
-        correlations = []
-        for bench in benchmark_signals:
-            bench_aligned = bench.loc[common_index]
-            corr = signals_aligned.corr(bench_aligned)
-            if not np.isnan(corr):
-                correlations.append(abs(corr))
+        pairwise = benchmark_corr['pairwise']
+        correlations = np.abs(pairwise[~np.isnan(pairwise)])
         
-        if not correlations:
+        if len(correlations) == 0:
             return {'score': 0.5, 'details': 'No valid correlations'}
         
         # Diversity: lower average correlation = higher diversity
@@ -332,48 +466,21 @@ class MultiDimensionalEvaluator:
         return {
             'score': max(0.0, min(1.0, diversity_score)),
             'avg_correlation': avg_correlation,
-            'n_benchmarks': len(benchmark_signals),
+            'n_benchmarks': n_benchmarks,
             'details': f"Avg correlation with benchmarks={avg_correlation:.3f}"
         }
     
-    def _evaluate_originality(
-        self,
-        signals: pd.Series,
-        benchmark_signals: List[pd.Series]
-    ) -> Dict[str, Any]:
+    def _evaluate_originality(self, context: Dict[str, Any], n_benchmarks: int) -> Dict[str, Any]:
         """Evaluate originality.
         
         Measures uniqueness and novelty of the factor.
         """
-        if not benchmark_signals:
-            return {'score': 0.5, 'details': 'No benchmarks'}
-        
-        # Similar to diversity but with cosine distance for pattern matching
-        common_index = signals.index
-        for bench in benchmark_signals:
-            common_index = common_index.intersection(bench.index)
-        
-        if len(common_index) < 10:
+        benchmark_corr = context['benchmark_corr']
+        if benchmark_corr is None:
             return {'score': 0.5, 'details': 'Insufficient overlap'}
         
-        signals_aligned = signals.loc[common_index].values
-        signals_normalized = (signals_aligned - signals_aligned.mean()) / (signals_aligned.std() + 1e-10)
-        
-        # Cosine distances to benchmarks
-        distances = []
-        for bench in benchmark_signals:
-            bench_aligned = bench.loc[common_index].values
-            bench_normalized = (bench_aligned - bench_aligned.mean()) / (bench_aligned.std() + 1e-10)
-            
-            # Cosine distance
-            try:
-                dist = cosine(signals_normalized, bench_normalized)
-                distances.append(dist)
-            except:
-                pass
-        
-        if not distances:
-            return {'score': 0.5, 'details': 'No valid distances'}
+        # Cosine distance between z-scored series equals 1 - Pearson correlation
+        distances = 1.0 - benchmark_corr['complete']
         
         # Originality: higher average distance = higher originality
         avg_distance = np.mean(distances)
@@ -382,7 +489,7 @@ class MultiDimensionalEvaluator:
         return {
             'score': max(0.0, min(1.0, originality_score)),
             'avg_distance': avg_distance,
-            'n_benchmarks': len(benchmark_signals),
+            'n_benchmarks': n_benchmarks,
             'details': f"Avg cosine distance={avg_distance:.3f}"
         }
     
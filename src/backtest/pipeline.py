@@ -9,6 +9,10 @@ import yaml
 
 from .portfolio import construct_portfolio, load_costs_config
 from .metrics import calculate_all_metrics
+from .streaming import StreamingMetrics, iter_frame_chunks, streaming_backtest
+from .validator import build_validation_context
+from ..data.calendar import align_dates, date_slice
+from ..data.universe import apply_universe_mask
 from ..memory.factor_registry import FactorSpec
 
 
@@ -94,14 +98,21 @@ def walkforward_backtest(
         prices_df: DataFrame of prices (columns = tickers, rows = dates)
         returns_df: DataFrame of returns (columns = tickers, rows = dates)
         factor_spec: Factor specification
-        config: Additional configuration (constraints, costs, etc.)
+        config: Additional configuration (constraints, costs, etc.).
+            Set 'streaming': True (and optionally 'chunk_size') to process
+            each split in date chunks with bounded memory. A 'walk_forward'
+            dict overrides the split settings from constraints.yml.
+            A 'universe_mask' (boolean dates x tickers membership matrix)
+            restricts positions and IC to each date's universe members.
     
     Returns:
         Dictionary with:
         - splits: List of split results
         - overall_metrics: Aggregated metrics
         - equity_curves: List of equity curves per split
-        - positions: Final positions DataFrame
+        - positions: Final positions DataFrame (last row only in streaming mode)
+        - turnover: Daily turnover Series across all splits
+        - validation_context: Intermediates for validate_run(context=...)
     """
     if config is None:
         config = {}
@@ -109,13 +120,14 @@ def walkforward_backtest(
     constraints = load_constraints_config()
     costs_config = load_costs_config()
     
-    # Get date range
-    common_dates = signals_df.index.intersection(returns_df.index)
+    # Get date range (frames on the same calendar are used as is)
+    signals_df, returns_df = align_dates(signals_df, returns_df)
+    common_dates = signals_df.index
     start_date = common_dates.min()
     end_date = common_dates.max()
     
-    # Create splits
-    splits_config = constraints.get('walk_forward', {})
+    # Create splits (config['walk_forward'] overrides the constraints file)
+    splits_config = {**constraints.get('walk_forward', {}), **config.get('walk_forward', {})}
     splits = create_walk_forward_splits(
         start_date=start_date,
         end_date=end_date,
@@ -128,21 +140,36 @@ def walkforward_backtest(
     if len(splits) == 0:
         raise ValueError("No valid splits created")
     
+    # Non-members get no signal, hence no position and no weight in IC
+    universe_mask = config.get('universe_mask')
+    signals_df = apply_universe_mask(signals_df, universe_mask)
+    
+    # Cross-sectional averages are shared by split IC metrics and validation
+    avg_signals = signals_df.mean(axis=1)
+    avg_returns = apply_universe_mask(returns_df, universe_mask).mean(axis=1)
+    
+    if config.get('streaming'):
+        return _streaming_walkforward(
+            signals_df, prices_df, returns_df, factor_spec, splits, common_dates,
+            costs_config, config, avg_signals, avg_returns
+        )
+    
     # Run backtest for each split
     split_results = []
     all_equity_curves = []
     all_positions = []
+    all_turnover = []
     
     for split in splits:
         # Extract test period data
-        test_mask = (common_dates >= split['test_start']) & (common_dates <= split['test_end'])
-        test_dates = common_dates[test_mask]
+        rows = date_slice(common_dates, split['test_start'], split['test_end'])
+        test_dates = common_dates[rows]
         
         if len(test_dates) == 0:
             continue
         
-        test_signals = signals_df.loc[test_dates]
-        test_returns = returns_df.loc[test_dates]
+        test_signals = signals_df.iloc[rows]
+        test_returns = returns_df.iloc[rows]
         
         # Construct portfolio
         positions, portfolio_returns = construct_portfolio(
@@ -158,14 +185,15 @@ def walkforward_backtest(
         
         # Calculate equity curve
         equity_curve = (1 + portfolio_returns).cumprod()
+        daily_turnover = positions.diff().abs().sum(axis=1)
         
         # Calculate metrics
         metrics = calculate_all_metrics(
             returns=portfolio_returns,
             equity_curve=equity_curve,
             positions=positions,
-            scores=test_signals.mean(axis=1),  # Average signal across tickers
-            next_returns=test_returns.mean(axis=1).shift(-1)  # Next period average return
+            scores=avg_signals.iloc[rows],  # Average signal across tickers
+            next_returns=avg_returns.iloc[rows].shift(-1)  # Next period average return
         )
         
         split_result = {
@@ -179,6 +207,7 @@ def walkforward_backtest(
         split_results.append(split_result)
         all_equity_curves.append(equity_curve)
         all_positions.append(positions)
+        all_turnover.append(daily_turnover)
     
     # Aggregate metrics across splits
     all_returns = pd.concat([sr['returns'] for sr in split_results])
@@ -202,6 +231,16 @@ def walkforward_backtest(
     overall_metrics['split_ic_mean'] = np.mean(split_ics)
     overall_metrics['split_ic_std'] = np.std(split_ics)
     
+    validation_context = build_validation_context(
+        signals_df,
+        returns_df,
+        prices_df=prices_df,
+        portfolio_returns=all_returns,
+        daily_turnover=all_turnover[-1] if all_turnover else None,
+        avg_signals=avg_signals,
+        avg_returns=avg_returns
+    )
+    
     return {
         'splits': split_results,
         'overall_metrics': overall_metrics,
@@ -209,11 +248,103 @@ def walkforward_backtest(
         'positions': final_positions,
         'returns': all_returns,
         'equity_curve': overall_equity,
+        'turnover': pd.concat(all_turnover),
+        'validation_context': validation_context,
         'start_date': start_date,
         'end_date': end_date
     }
 
 
+def _streaming_walkforward(
+    signals_df: pd.DataFrame,
+    prices_df: Optional[pd.DataFrame],
+    returns_df: pd.DataFrame,
+    factor_spec: FactorSpec,
+    splits: List[Dict[str, datetime]],
+    common_dates: pd.DatetimeIndex,
+    costs_config: Dict,
+    config: Dict[str, Any],
+    avg_signals: pd.Series,
+    avg_returns: pd.Series
+) -> Dict[str, Any]:
+    """Walk-forward backtest with chunked portfolio construction per split."""
+    chunk_size = config.get('chunk_size', 252)
+    overall = StreamingMetrics()
+    split_results = []
+    all_equity_curves = []
+    overall_returns = []
+    overall_equity = []
+    all_turnover = []
+    
+    for split in splits:
+        rows = date_slice(common_dates, split['test_start'], split['test_end'])
+        
+        if rows.stop <= rows.start:
+            continue
+        
+        result = streaming_backtest(
+            iter_frame_chunks(signals_df.iloc[rows], returns_df.iloc[rows], chunk_size),
+            factor_spec,
+            costs_config=costs_config,
+            max_leverage=config.get('max_leverage', 2.0),
+            max_single_position=config.get('max_single_position', 0.1)
+        )
+        
+        # Overall equity continues across splits, as with concatenated returns
+        equity = overall.update(result['returns'].to_numpy(), result['returns'].index)
+        overall_returns.append(result['returns'])
+        overall_equity.append(pd.Series(equity, index=result['returns'].index))
+        all_turnover.append(result['turnover'].fillna(0.0))
+        
+        split_results.append({
+            'split': split,
+            'metrics': result['metrics'],
+            'equity_curve': result['equity_curve'],
+            'positions': result['positions'],
+            'returns': result['returns']
+        })
+        all_equity_curves.append(result['equity_curve'])
+    
+    overall_metrics = overall.result()
+    
+    # Turnover is reported for the last split, as in the in-memory path
+    if split_results:
+        overall_metrics['turnover'] = split_results[-1]['metrics']['turnover']
+        overall_metrics['turnover_monthly'] = split_results[-1]['metrics']['turnover_monthly']
+    
+    split_sharpes = [sr['metrics']['sharpe'] for sr in split_results]
+    split_ics = [sr['metrics']['avg_ic'] for sr in split_results]
+    
+    overall_metrics['split_sharpe_mean'] = np.mean(split_sharpes)
+    overall_metrics['split_sharpe_std'] = np.std(split_sharpes)
+    overall_metrics['split_ic_mean'] = np.mean(split_ics)
+    overall_metrics['split_ic_std'] = np.std(split_ics)
+    
+    all_returns = pd.concat(overall_returns)
+    validation_context = build_validation_context(
+        signals_df,
+        returns_df,
+        prices_df=prices_df,
+        portfolio_returns=all_returns,
+        daily_turnover=all_turnover[-1] if all_turnover else None,
+        avg_signals=avg_signals,
+        avg_returns=avg_returns
+    )
+    
+    return {
+        'splits': split_results,
+        'overall_metrics': overall_metrics,
+        'equity_curves': all_equity_curves,
+        'positions': split_results[-1]['positions'] if split_results else pd.DataFrame(),
+        'returns': all_returns,
+        'equity_curve': pd.concat(overall_equity),
+        'turnover': pd.concat(all_turnover),
+        'validation_context': validation_context,
+        'start_date': common_dates.min(),
+        'end_date': common_dates.max()
+    }
+
+
 def oos_evaluation(
     signals_df: pd.DataFrame,
     returns_df: pd.DataFrame,
@@ -243,6 +374,7 @@ def oos_evaluation(
         config = {}
     
     costs_config = load_costs_config()
+    signals_df, returns_df = align_dates(signals_df, returns_df)
     
     # In-sample period
     is_mask = (signals_df.index >= in_sample_start) & (signals_df.index <= in_sample_end)
@@ -1,11 +1,15 @@
 """Portfolio construction: long-short deciles, weighting, costs, borrow limits."""
 
+import warnings
 import numpy as np
 import pandas as pd
 from typing import Dict, Optional, Tuple
 import yaml
 from pathlib import Path
 
+from ..data.calendar import align_dates
+from ..data.universe import apply_universe_mask
+
 
 def load_costs_config(config_path: Optional[Path] = None) -> Dict:
     """Load costs configuration."""
@@ -80,6 +84,86 @@ def long_short_deciles(
     return positions
 
 
+def long_short_weights(
+    scores: np.ndarray,
+    scheme: str = "long_short_deciles",
+    weight: str = "equal",
+    notional: float = 1.0,
+    long_pct: float = 0.1,
+    short_pct: float = 0.1,
+    mask: Optional[np.ndarray] = None
+) -> np.ndarray:
+    """Vectorized long_short_deciles over every row of a score matrix.
+    
+    Produces the same weights as calling long_short_deciles date by date.
+    
+    Args:
+        scores: Score matrix (rows = dates, columns = tickers)
+        scheme: Portfolio scheme (currently only "long_short_deciles")
+        weight: Weighting scheme ("equal" or "score_weighted")
+        notional: Total notional
+        long_pct: Top percentile to go long
+        short_pct: Bottom percentile to go short
+        mask: Boolean matrix of tradable cells (e.g. universe membership);
+            other cells get no position and do not affect the deciles
+    
+    Returns:
+        Weight matrix with the same shape as scores
+    """
+    if scheme != "long_short_deciles":
+        raise ValueError(f"Unknown scheme: {scheme}")
+    if weight not in ("equal", "score_weighted"):
+        raise ValueError(f"Unknown weight scheme: {weight}")
+    
+    scores = np.asarray(scores, dtype=float)
+    if mask is not None:
+        scores = np.where(mask, scores, np.nan)
+    
+    with warnings.catch_warnings():
+        # All-NaN rows produce NaN thresholds and therefore no positions
+        warnings.simplefilter("ignore", category=RuntimeWarning)
+        long_threshold = np.nanquantile(scores, 1 - long_pct, axis=1)
+        short_threshold = np.nanquantile(scores, short_pct, axis=1)
+    
+    long_mask = scores >= long_threshold[:, None]
+    short_mask = scores <= short_threshold[:, None]
+    
+    weights = np.zeros_like(scores)
+    half = notional / 2
+    
+    with np.errstate(divide='ignore', invalid='ignore'):
+        if weight == "equal":
+            n_long = long_mask.sum(axis=1, keepdims=True)
+            n_short = short_mask.sum(axis=1, keepdims=True)
+            weights = np.where(long_mask, half / n_long, weights)
+            # Short leg is assigned last, as in long_short_deciles
+            weights = np.where(short_mask, -half / n_short, weights)
+        else:
+            for mask, sign in ((long_mask, 1.0), (short_mask, -1.0)):
+                leg_min = np.where(mask, scores, np.inf).min(axis=1, keepdims=True)
+                leg_max = np.where(mask, scores, -np.inf).max(axis=1, keepdims=True)
+                norm = np.where(mask, (scores - leg_min) / (leg_max - leg_min + 1e-10), 0.0)
+                leg_weights = sign * half * norm / norm.sum(axis=1, keepdims=True)
+                weights = np.where(mask, leg_weights, weights)
+    
+    return weights
+
+
+def enforce_limits_array(
+    positions: np.ndarray,
+    max_leverage: float = 2.0,
+    max_single_position: float = 0.1
+) -> np.ndarray:
+    """Array version of enforce_borrow_limits (row-wise, no cross-date state)."""
+    positions = np.clip(positions, -max_single_position, max_single_position)
+    
+    total_exposure = np.nansum(np.abs(positions), axis=1, keepdims=True)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        scale_factor = np.clip(max_leverage / total_exposure, 0, 1)
+    
+    return positions * scale_factor
+
+
 def apply_costs(
     positions: pd.DataFrame,
     returns: pd.DataFrame,
@@ -189,7 +273,8 @@ def construct_portfolio(
     notional: float = 1.0,
     costs_config: Optional[Dict] = None,
     max_leverage: float = 2.0,
-    max_single_position: float = 0.1
+    max_single_position: float = 0.1,
+    universe_mask: Optional[pd.DataFrame] = None
 ) -> Tuple[pd.DataFrame, pd.Series]:
     """Construct portfolio from factor scores.
     
@@ -202,29 +287,27 @@ def construct_portfolio(
         costs_config: Costs configuration
         max_leverage: Maximum leverage
         max_single_position: Maximum single position size
+        universe_mask: Point-in-time membership matrix (dates x tickers);
+            only members are ranked and held on each date
     
     Returns:
         (positions DataFrame, portfolio returns Series)
     """
-    # Align dates
-    common_dates = scores_df.index.intersection(returns_df.index)
-    scores_df = scores_df.loc[common_dates]
-    returns_df = returns_df.loc[common_dates]
-    
-    # Construct positions for each date
-    positions_list = []
-    
-    for date in scores_df.index:
-        scores = scores_df.loc[date]
-        positions = long_short_deciles(
-            scores,
+    # Align dates (no-op for frames already on the same calendar)
+    scores_df, returns_df = align_dates(scores_df, returns_df)
+    scores_df = apply_universe_mask(scores_df, universe_mask)
+    
+    # Construct positions for all dates at once
+    positions_df = pd.DataFrame(
+        long_short_weights(
+            scores_df.to_numpy(dtype=float),
             scheme=scheme,
             weight=weight,
             notional=notional
-        )
-        positions_list.append(positions)
-    
-    positions_df = pd.DataFrame(positions_list, index=scores_df.index)
+        ),
+        index=scores_df.index,
+        columns=scores_df.columns
+    )
     
     # Enforce limits
     positions_df = enforce_borrow_limits(
@@ -0,0 +1,226 @@
+"""Cheap-to-expensive screening cascade run before the full walk-forward backtest.
+
+Stages, in order of cost:
+1. sanity: signal coverage and cross-sectional / time-series variation
+2. ic: cross-sectional rank IC on a subsample of dates and tickers
+3. single_split: one portfolio backtest over the most recent window
+
+A candidate is rejected at the first stage it fails, so only survivors pay
+for the full walk-forward backtest, validation and artifacts.
+
+compute_factor broadcasts DSL and single-series signals to every ticker.
+Such panels have no cross-sectional spread, so for them sanity checks the
+variation of the series over time, and the cross-sectional stages (ic,
+single_split) are skipped; the full backtest judges them as before.
+"""
+
+import time
+from typing import Any, Dict, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from ..data.calendar import align_dates
+from .metrics import sharpe
+from .portfolio import construct_portfolio, load_costs_config
+
+DEFAULT_SCREENING_THRESHOLDS = {
+    # Stage 1: sanity
+    'min_coverage': 0.3,         # Fraction of finite signal cells
+    'min_cross_std': 0.1,        # Median cross-sectional std of percentile ranks
+    'min_time_std': 0.01,        # Median per-ticker time-series std of percentile ranks
+    # Stage 2: subsampled IC
+    'ic_date_stride': 5,         # Use every n-th date
+    'ic_max_tickers': 200,       # Random ticker subsample
+    'min_ic': 0.0,               # Minimum mean next-day rank IC
+    # Stage 3: single split
+    'single_split_days': 252,    # Most recent dates used for the backtest
+    'min_single_split_sharpe': 0.0
+}
+
+SCREENING_STAGES = ('sanity', 'ic', 'single_split')
+
+
+def is_broadcast(signals_df: pd.DataFrame) -> bool:
+    """Whether every ticker carries the same series (missing cells aside)."""
+    values = signals_df.to_numpy(dtype=float)
+    if values.ndim != 2 or values.shape[1] < 2:
+        return False
+    return bool(((values == values[:, :1]) | np.isnan(values)).all())
+
+
+class ScreeningCascade:
+    """Staged pre-backtest filter for factor candidates."""
+
+    def __init__(
+        self,
+        thresholds: Optional[Dict[str, Any]] = None,
+        costs_config: Optional[Dict] = None,
+        seed: int = 0
+    ):
+        """Initialize the cascade.
+
+        Args:
+            thresholds: Overrides for DEFAULT_SCREENING_THRESHOLDS
+            costs_config: Costs configuration for the single-split backtest
+            seed: Seed for the ticker subsample in the IC stage
+        """
+        self.thresholds = {**DEFAULT_SCREENING_THRESHOLDS, **(thresholds or {})}
+        self.costs_config = costs_config
+        self.seed = seed
+
+    def check_sanity(self, signals_df: pd.DataFrame) -> Tuple[bool, Dict[str, float]]:
+        """Stage 1: coverage and variation of the signal panel.
+
+        Args:
+            signals_df: Signal panel (columns = tickers, rows = dates)
+
+        Returns:
+            (passed, stats)
+        """
+        values = signals_df.to_numpy(dtype=float)
+        coverage = float(np.isfinite(values).mean()) if values.size else 0.0
+        broadcast = is_broadcast(signals_df)
+
+        if broadcast:
+            # One series for all tickers: only its variation over time can be checked
+            cross_std = np.nan
+            time_std = signals_df.iloc[:, 0].rank(pct=True).std()
+        else:
+            ranks = signals_df.rank(axis=1, pct=True)
+            cross_std = ranks.std(axis=1).median()
+            time_std = ranks.std(axis=0).median()
+
+        stats = {
+            'coverage': coverage,
+            'cross_std': float(cross_std) if pd.notna(cross_std) else 0.0,
+            'time_std': float(time_std) if pd.notna(time_std) else 0.0,
+            'broadcast': broadcast
+        }
+        passed = (
+            stats['coverage'] >= self.thresholds['min_coverage']
+            and (broadcast or stats['cross_std'] >= self.thresholds['min_cross_std'])
+            and stats['time_std'] >= self.thresholds['min_time_std']
+        )
+        return passed, stats
+
+    def check_ic(
+        self,
+        signals_df: pd.DataFrame,
+        returns_df: pd.DataFrame
+    ) -> Tuple[bool, Dict[str, float]]:
+        """Stage 2: mean cross-sectional rank IC on a subsample.
+
+        Args:
+            signals_df: Signal panel
+            returns_df: Returns panel
+
+        Returns:
+            (passed, stats)
+        """
+        tickers = signals_df.columns.intersection(returns_df.columns)
+        max_tickers = self.thresholds['ic_max_tickers']
+        if len(tickers) > max_tickers:
+            rng = np.random.default_rng(self.seed)
+            tickers = tickers[np.sort(rng.choice(len(tickers), max_tickers, replace=False))]
+
+        signals, future = align_dates(signals_df[tickers], returns_df[tickers].shift(-1))
+        stride = self.thresholds['ic_date_stride']
+        signals = signals.iloc[::stride]
+        future = future.iloc[::stride]
+        valid = signals.notna() & future.notna()
+
+        # Row-wise Spearman: Pearson correlation of ranks over jointly valid cells
+        x = signals.where(valid).rank(axis=1).to_numpy()
+        y = future.where(valid).rank(axis=1).to_numpy()
+        x = x - np.nanmean(x, axis=1, keepdims=True)
+        y = y - np.nanmean(y, axis=1, keepdims=True)
+        with np.errstate(invalid='ignore', divide='ignore'):
+            ic = np.nansum(x * y, axis=1) / np.sqrt(np.nansum(x * x, axis=1) * np.nansum(y * y, axis=1))
+        ic = ic[valid.sum(axis=1).to_numpy() >= 10]
+        ic = ic[np.isfinite(ic)]
+
+        stats = {
+            'ic_mean': float(ic.mean()) if len(ic) else 0.0,
+            'ic_dates': int(len(ic))
+        }
+        passed = len(ic) > 0 and stats['ic_mean'] >= self.thresholds['min_ic']
+        return passed, stats
+
+    def check_single_split(
+        self,
+        signals_df: pd.DataFrame,
+        returns_df: pd.DataFrame,
+        factor_spec: Any
+    ) -> Tuple[bool, Dict[str, float]]:
+        """Stage 3: one portfolio backtest over the most recent window.
+
+        Args:
+            signals_df: Signal panel
+            returns_df: Returns panel
+            factor_spec: Factor specification (portfolio settings)
+
+        Returns:
+            (passed, stats)
+        """
+        if self.costs_config is None:
+            self.costs_config = load_costs_config()
+
+        signals_df, returns_df = align_dates(signals_df, returns_df)
+        window = slice(-self.thresholds['single_split_days'], None)
+
+        _, portfolio_returns = construct_portfolio(
+            scores_df=signals_df.iloc[window],
+            returns_df=returns_df.iloc[window],
+            scheme=factor_spec.portfolio.scheme,
+            weight=factor_spec.portfolio.weight,
+            notional=factor_spec.portfolio.notional,
+            costs_config=self.costs_config
+        )
+
+        stats = {'single_split_sharpe': float(sharpe(portfolio_returns))}
+        passed = stats['single_split_sharpe'] >= self.thresholds['min_single_split_sharpe']
+        return passed, stats
+
+    def screen(
+        self,
+        signals_df: pd.DataFrame,
+        returns_df: pd.DataFrame,
+        factor_spec: Any
+    ) -> Dict[str, Any]:
+        """Run the stages in order, stopping at the first failure.
+
+        Args:
+            signals_df: Signal panel
+            returns_df: Returns panel
+            factor_spec: Factor specification
+
+        Returns:
+            Dictionary with:
+            - passed: Whether the candidate survived every stage
+            - rejected_at: Name of the failing stage, or None
+            - stats: Statistics computed by the stages that ran
+            - seconds: Wall time per stage that ran
+        """
+        checks = {
+            'sanity': lambda: self.check_sanity(signals_df),
+            'ic': lambda: self.check_ic(signals_df, returns_df),
+            'single_split': lambda: self.check_single_split(signals_df, returns_df, factor_spec)
+        }
+
+        stats: Dict[str, Any] = {}
+        seconds: Dict[str, float] = {}
+
+        for stage in SCREENING_STAGES:
+            start = time.perf_counter()
+            passed, stage_stats = checks[stage]()
+            seconds[stage] = time.perf_counter() - start
+            stats.update(stage_stats)
+
+            if not passed:
+                return {'passed': False, 'rejected_at': stage, 'stats': stats, 'seconds': seconds}
+            if stats.get('broadcast'):
+                # The later stages rank across tickers, which a broadcast panel cannot
+                break
+
+        return {'passed': True, 'rejected_at': None, 'stats': stats, 'seconds': seconds}
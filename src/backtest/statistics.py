@@ -0,0 +1,282 @@
+"""Statistical significance of backtest results: PSR, DSR and bootstrap confidence intervals.
+
+References:
+- Bailey & Lopez de Prado (2012): The Sharpe Ratio Efficient Frontier (PSR)
+- Bailey & Lopez de Prado (2014): The Deflated Sharpe Ratio
+- Politis & Romano (1994): The Stationary Bootstrap
+"""
+
+import numpy as np
+import pandas as pd
+from typing import Dict, Any, Optional, Tuple, Union
+from scipy import stats
+
+EULER_GAMMA = 0.5772156649015329
+
+
+def _as_array(returns: Union[pd.Series, np.ndarray]) -> np.ndarray:
+    """Convert returns to a float array without NaNs."""
+    values = np.asarray(returns, dtype=float)
+    return values[np.isfinite(values)]
+
+
+def _sharpe_moments(values: np.ndarray) -> Tuple[float, float, float]:
+    """Per-period Sharpe ratio, skewness and (non-excess) kurtosis."""
+    std = values.std(ddof=1)
+    if len(values) < 3 or np.isclose(std, 0, atol=1e-10):
+        return 0.0, 0.0, 3.0
+
+    sr = values.mean() / std
+    skew = stats.skew(values)
+    kurt = stats.kurtosis(values, fisher=False)
+    return sr, skew, kurt
+
+
+def sharpe_ratio_variance(
+    sharpe_per_period: float,
+    skew: float,
+    kurt: float,
+    n_obs: int
+) -> float:
+    """Variance of the Sharpe ratio estimator under non-normal returns.
+
+    Args:
+        sharpe_per_period: Non-annualized Sharpe ratio
+        skew: Skewness of returns
+        kurt: Kurtosis of returns (normal = 3)
+        n_obs: Number of observations
+
+    Returns:
+        Estimator variance (per-period units)
+    """
+    if n_obs < 2:
+        return np.inf
+
+    numerator = 1 - skew * sharpe_per_period + (kurt - 1) / 4 * sharpe_per_period ** 2
+    return max(numerator, 1e-12) / (n_obs - 1)
+
+
+def probabilistic_sharpe_ratio(
+    returns: Union[pd.Series, np.ndarray],
+    benchmark_sharpe: float = 0.0
+) -> float:
+    """Probability that the true Sharpe ratio exceeds a benchmark.
+
+    Args:
+        returns: Return series
+        benchmark_sharpe: Benchmark Sharpe ratio (per-period, non-annualized)
+
+    Returns:
+        PSR in [0, 1]
+    """
+    values = _as_array(returns)
+    if len(values) < 3:
+        return 0.0
+
+    sr, skew, kurt = _sharpe_moments(values)
+    variance = sharpe_ratio_variance(sr, skew, kurt, len(values))
+
+    return float(stats.norm.cdf((sr - benchmark_sharpe) / np.sqrt(variance)))
+
+
+def expected_max_sharpe(n_trials: int, sharpe_variance: float) -> float:
+    """Expected maximum Sharpe ratio among n_trials independent unskilled candidates.
+
+    Args:
+        n_trials: Number of candidates tried
+        sharpe_variance: Variance of Sharpe ratios across trials (per-period units)
+
+    Returns:
+        Expected maximum Sharpe ratio (per-period, non-annualized)
+    """
+    if n_trials <= 1 or sharpe_variance <= 0:
+        return 0.0
+
+    z1 = stats.norm.ppf(1 - 1.0 / n_trials)
+    z2 = stats.norm.ppf(1 - 1.0 / (n_trials * np.e))
+
+    return float(np.sqrt(sharpe_variance) * ((1 - EULER_GAMMA) * z1 + EULER_GAMMA * z2))
+
+
+def deflated_sharpe_ratio(
+    returns: Union[pd.Series, np.ndarray],
+    n_trials: int,
+    sharpe_variance: Optional[float] = None
+) -> float:
+    """PSR against the Sharpe ratio expected from the best of n_trials unskilled candidates.
+
+    Args:
+        returns: Return series
+        n_trials: Number of candidates tried (e.g. ExperimentStore run count)
+        sharpe_variance: Cross-trial variance of per-period Sharpe ratios.
+            Defaults to the estimator variance of this run's Sharpe ratio.
+
+    Returns:
+        DSR in [0, 1]
+    """
+    values = _as_array(returns)
+    if len(values) < 3:
+        return 0.0
+
+    if sharpe_variance is None:
+        sr, skew, kurt = _sharpe_moments(values)
+        sharpe_variance = sharpe_ratio_variance(sr, skew, kurt, len(values))
+
+    benchmark = expected_max_sharpe(n_trials, sharpe_variance)
+    return probabilistic_sharpe_ratio(values, benchmark_sharpe=benchmark)
+
+
+def stationary_bootstrap_indices(
+    n_obs: int,
+    n_resamples: int,
+    mean_block_length: float,
+    seed: Optional[int] = None
+) -> np.ndarray:
+    """Generate stationary block-bootstrap indices as one matrix.
+
+    Each row is one resample. A new block starts with probability
+    1 / mean_block_length; otherwise the index advances by one (wrapping).
+
+    Args:
+        n_obs: Length of the original series
+        n_resamples: Number of resamples
+        mean_block_length: Expected block length
+        seed: Random seed
+
+    Returns:
+        Integer array of shape (n_resamples, n_obs)
+    """
+    rng = np.random.default_rng(seed)
+    p = 1.0 / max(mean_block_length, 1.0)
+
+    new_block = rng.random((n_resamples, n_obs)) < p
+    new_block[:, 0] = True
+    starts = rng.integers(0, n_obs, size=(n_resamples, n_obs))
+
+    # Position of the most recent block start for every cell
+    steps = np.arange(n_obs)
+    block_start = np.maximum.accumulate(np.where(new_block, steps, 0), axis=1)
+
+    offsets = steps - block_start
+    start_values = np.take_along_axis(starts, block_start, axis=1)
+
+    return (start_values + offsets) % n_obs
+
+
+def bootstrap_sharpe_distribution(
+    returns: Union[pd.Series, np.ndarray],
+    n_resamples: int = 2000,
+    mean_block_length: Optional[float] = None,
+    periods_per_year: int = 252,
+    seed: Optional[int] = 42
+) -> np.ndarray:
+    """Annualized Sharpe ratios of stationary bootstrap resamples.
+
+    All resamples are evaluated in a single vectorized pass.
+
+    Args:
+        returns: Return series
+        n_resamples: Number of resamples
+        mean_block_length: Expected block length (default: n^(1/3))
+        periods_per_year: Periods per year
+        seed: Random seed
+
+    Returns:
+        Array of n_resamples Sharpe ratios
+    """
+    values = _as_array(returns)
+    n_obs = len(values)
+    if n_obs < 3:
+        return np.zeros(n_resamples)
+
+    if mean_block_length is None:
+        mean_block_length = max(1.0, n_obs ** (1.0 / 3.0))
+
+    idx = stationary_bootstrap_indices(n_obs, n_resamples, mean_block_length, seed)
+    samples = values[idx]
+
+    means = samples.mean(axis=1)
+    stds = samples.std(axis=1, ddof=1)
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        sharpes = np.where(stds > 1e-10, means / stds, 0.0) * np.sqrt(periods_per_year)
+
+    return sharpes
+
+
+def bootstrap_sharpe_ci(
+    returns: Union[pd.Series, np.ndarray],
+    confidence: float = 0.95,
+    n_resamples: int = 2000,
+    mean_block_length: Optional[float] = None,
+    periods_per_year: int = 252,
+    seed: Optional[int] = 42
+) -> Tuple[float, float]:
+    """Percentile confidence interval of the annualized Sharpe ratio.
+
+    Args:
+        returns: Return series
+        confidence: Confidence level (e.g., 0.95)
+        n_resamples: Number of resamples
+        mean_block_length: Expected block length (default: n^(1/3))
+        periods_per_year: Periods per year
+        seed: Random seed
+
+    Returns:
+        (lower, upper) bounds
+    """
+    sharpes = bootstrap_sharpe_distribution(
+        returns,
+        n_resamples=n_resamples,
+        mean_block_length=mean_block_length,
+        periods_per_year=periods_per_year,
+        seed=seed
+    )
+
+    alpha = (1 - confidence) / 2
+    lower, upper = np.quantile(sharpes, [alpha, 1 - alpha])
+
+    return float(lower), float(upper)
+
+
+def significance_metrics(
+    returns: Union[pd.Series, np.ndarray],
+    n_trials: int = 1,
+    confidence: float = 0.95,
+    n_resamples: int = 2000,
+    sharpe_variance: Optional[float] = None,
+    periods_per_year: int = 252,
+    seed: Optional[int] = 42
+) -> Dict[str, Any]:
+    """Calculate all significance metrics for a return series.
+
+    Args:
+        returns: Portfolio return series
+        n_trials: Number of candidates tried so far (including this one)
+        confidence: Confidence level for the bootstrap interval
+        n_resamples: Number of bootstrap resamples
+        sharpe_variance: Cross-trial variance of per-period Sharpe ratios
+        periods_per_year: Periods per year
+        seed: Random seed
+
+    Returns:
+        Dictionary with psr, dsr, sharpe_ci_low, sharpe_ci_high, n_trials
+    """
+    values = _as_array(returns)
+    n_trials = max(int(n_trials), 1)
+
+    ci_low, ci_high = bootstrap_sharpe_ci(
+        values,
+        confidence=confidence,
+        n_resamples=n_resamples,
+        periods_per_year=periods_per_year,
+        seed=seed
+    )
+
+    return {
+        'psr': probabilistic_sharpe_ratio(values),
+        'dsr': deflated_sharpe_ratio(values, n_trials, sharpe_variance=sharpe_variance),
+        'sharpe_ci_low': ci_low,
+        'sharpe_ci_high': ci_high,
+        'n_trials': n_trials
+    }
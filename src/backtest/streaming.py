@@ -0,0 +1,446 @@
+"""Chunked, memory-bounded backtest for large universes and long histories.
+
+Signals and returns are processed in date chunks. Only the last row of
+positions is carried between chunks, and metrics are accumulated with
+online estimators, so peak memory is bounded by the chunk size rather than
+by the length of the history.
+"""
+
+import warnings
+import numpy as np
+import pandas as pd
+from pathlib import Path
+from typing import Dict, Any, Iterable, Iterator, Optional, Tuple
+
+from .portfolio import long_short_weights, enforce_limits_array, load_costs_config
+from .metrics import information_coefficient, information_ratio, rolling_information_coefficient
+from ..data.calendar import align_dates
+from ..memory.factor_registry import FactorSpec
+
+
+class OnlineMoments:
+    """Mergeable mean/variance/skew/kurtosis accumulator (Chan et al., Pebay).
+
+    Matches pandas Series.std/skew/kurt (bias-adjusted) on the full series.
+    """
+
+    def __init__(self):
+        self.n = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.m3 = 0.0
+        self.m4 = 0.0
+        self.n_positive = 0
+
+    def update(self, values: np.ndarray):
+        """Merge a batch of observations."""
+        values = np.asarray(values, dtype=float)
+        values = values[~np.isnan(values)]
+        nb = len(values)
+        if nb == 0:
+            return
+
+        mean_b = values.mean()
+        dev = values - mean_b
+        m2_b = (dev ** 2).sum()
+        m3_b = (dev ** 3).sum()
+        m4_b = (dev ** 4).sum()
+
+        na = self.n
+        n = na + nb
+        delta = mean_b - self.mean
+
+        m4 = (
+            self.m4 + m4_b
+            + delta ** 4 * na * nb * (na * na - na * nb + nb * nb) / n ** 3
+            + 6 * delta ** 2 * (na * na * m2_b + nb * nb * self.m2) / n ** 2
+            + 4 * delta * (na * m3_b - nb * self.m3) / n
+        )
+        m3 = (
+            self.m3 + m3_b
+            + delta ** 3 * na * nb * (na - nb) / n ** 2
+            + 3 * delta * (na * m2_b - nb * self.m2) / n
+        )
+        m2 = self.m2 + m2_b + delta ** 2 * na * nb / n
+
+        self.mean = self.mean + delta * nb / n
+        self.m2, self.m3, self.m4 = m2, m3, m4
+        self.n = n
+        self.n_positive += int((values > 0).sum())
+
+    @property
+    def std(self) -> float:
+        """Sample standard deviation (ddof=1)."""
+        if self.n < 2:
+            return np.nan
+        return float(np.sqrt(self.m2 / (self.n - 1)))
+
+    @property
+    def skew(self) -> float:
+        """Bias-adjusted skewness (pandas convention)."""
+        n = self.n
+        if n < 3:
+            return 0.0
+        m2 = self.m2 / n
+        if np.isclose(m2, 0, atol=1e-14):
+            return 0.0
+        return float(np.sqrt(n * (n - 1)) / (n - 2) * (self.m3 / n) / m2 ** 1.5)
+
+    @property
+    def kurt(self) -> float:
+        """Bias-adjusted excess kurtosis (pandas convention)."""
+        n = self.n
+        if n < 4:
+            return 0.0
+        denominator = (n - 2) * (n - 3) * self.m2 ** 2
+        if np.isclose(denominator, 0, atol=1e-14):
+            return 0.0
+        adj = 3 * (n - 1) ** 2 / ((n - 2) * (n - 3))
+        return float(n * (n + 1) * (n - 1) * self.m4 / denominator - adj)
+
+
+class OnlineDrawdown:
+    """Running equity, peak and drawdown profile over sequential chunks."""
+
+    def __init__(self):
+        self.equity = 1.0
+        self.peak = -np.inf
+        self.max_dd = 0.0
+        self.dd_sum = 0.0
+        self.dd_count = 0
+        self.in_drawdown = False
+        self.dd_start = None
+        self.last_date = None
+        self.durations = []
+        self.recoveries = []
+
+    def update(self, returns: np.ndarray, dates: pd.Index) -> np.ndarray:
+        """Advance the equity curve by one chunk.
+
+        Args:
+            returns: Portfolio returns for the chunk
+            dates: Dates of the chunk
+
+        Returns:
+            Equity curve values for the chunk
+        """
+        if len(returns) == 0:
+            return np.array([])
+
+        equity = self.equity * np.cumprod(1 + returns)
+        peak = np.maximum(self.peak, np.maximum.accumulate(equity))
+        drawdown = (equity - peak) / peak
+
+        self.max_dd = min(self.max_dd, float(drawdown.min()))
+        negative = drawdown[drawdown < 0]
+        self.dd_sum += float(negative.sum())
+        self.dd_count += len(negative)
+
+        # Walk only the state transitions, not every date
+        flags = np.concatenate([[self.in_drawdown], drawdown < 0])
+        for i in np.flatnonzero(np.diff(flags)):
+            if flags[i + 1]:
+                self.dd_start = dates[i]
+            else:
+                duration = (dates[i] - self.dd_start).days
+                self.durations.append(duration)
+                self.recoveries.append(duration)
+                self.dd_start = None
+
+        self.in_drawdown = bool(flags[-1])
+        self.equity = float(equity[-1])
+        self.peak = float(peak[-1])
+        self.last_date = dates[-1]
+
+        return equity
+
+    def result(self) -> Dict[str, float]:
+        """Drawdown profile in the format of metrics.drawdown_profile."""
+        durations = list(self.durations)
+        if self.in_drawdown and self.dd_start is not None:
+            durations.append((self.last_date - self.dd_start).days)
+
+        return {
+            'max_dd': self.max_dd,
+            'avg_dd': self.dd_sum / self.dd_count if self.dd_count else 0.0,
+            'dd_duration': np.mean(durations) if durations else 0.0,
+            'recovery_time': np.mean(self.recoveries) if self.recoveries else 0.0
+        }
+
+
+class StreamingMetrics:
+    """Online equivalent of calculate_all_metrics.
+
+    Return, drawdown and turnover metrics are accumulated online. IC needs
+    one average signal and one average return per date (two floats per date,
+    independent of the universe size), which are kept to compute the same
+    Spearman IC as the in-memory path.
+    """
+
+    def __init__(self, periods_per_year: int = 252):
+        self.periods_per_year = periods_per_year
+        self.moments = OnlineMoments()
+        self.drawdown = OnlineDrawdown()
+        self.turnover_sum = 0.0
+        self.turnover_count = 0
+        self._avg_scores = []
+        self._avg_returns = []
+
+    def update(
+        self,
+        returns: np.ndarray,
+        dates: pd.Index,
+        turnover: Optional[np.ndarray] = None,
+        avg_scores: Optional[np.ndarray] = None,
+        avg_returns: Optional[np.ndarray] = None
+    ) -> np.ndarray:
+        """Accumulate one chunk.
+
+        Args:
+            returns: Portfolio returns for the chunk
+            dates: Dates of the chunk
+            turnover: Daily turnover for the chunk (NaN where undefined)
+            avg_scores: Cross-sectional average signal per date
+            avg_returns: Cross-sectional average return per date
+
+        Returns:
+            Equity curve values for the chunk
+        """
+        returns = np.asarray(returns, dtype=float)
+        self.moments.update(returns)
+        equity = self.drawdown.update(returns, dates)
+
+        if turnover is not None:
+            valid = turnover[~np.isnan(turnover)]
+            self.turnover_sum += float(valid.sum())
+            self.turnover_count += len(valid)
+
+        if avg_scores is not None and avg_returns is not None:
+            self._avg_scores.append(pd.Series(avg_scores, index=dates))
+            self._avg_returns.append(pd.Series(avg_returns, index=dates))
+
+        return equity
+
+    def result(self) -> Dict[str, Any]:
+        """Metrics dictionary with the keys of calculate_all_metrics."""
+        n = self.moments.n
+        ppy = self.periods_per_year
+        std = self.moments.std
+        metrics = {}
+
+        metrics['ann_ret'] = self.moments.mean * ppy if n else 0.0
+        metrics['ann_vol'] = std * np.sqrt(ppy) if n >= 2 else 0.0
+        if n == 0 or np.isnan(std) or np.isclose(std, 0, atol=1e-10):
+            metrics['sharpe'] = 0.0
+        else:
+            metrics['sharpe'] = metrics['ann_ret'] / metrics['ann_vol']
+        metrics['skew'] = self.moments.skew
+        metrics['kurt'] = self.moments.kurt
+        metrics['hit_rate'] = self.moments.n_positive / n if n else 0.0
+
+        metrics['maxdd'] = self.drawdown.max_dd
+        metrics.update(self.drawdown.result())
+
+        avg_turnover = self.turnover_sum / self.turnover_count if self.turnover_count else 0.0
+        metrics['turnover'] = avg_turnover
+        metrics['turnover_monthly'] = avg_turnover * 21 * 100
+
+        metrics['avg_ic'] = 0.0
+        metrics['ic_std'] = 0.0
+        metrics['ir'] = 0.0
+        if self._avg_scores:
+            scores = pd.concat(self._avg_scores)
+            next_returns = pd.concat(self._avg_returns).shift(-1)
+            metrics['avg_ic'] = information_coefficient(scores, next_returns)
+
+            if len(scores) > 21:
+                rolling_ic = pd.Series(rolling_information_coefficient(scores, next_returns, 21))
+                metrics['ic_std'] = rolling_ic.std()
+                metrics['ir'] = information_ratio(rolling_ic) if rolling_ic.std() > 0 else 0.0
+
+        return metrics
+
+
+def iter_frame_chunks(
+    signals_df: pd.DataFrame,
+    returns_df: pd.DataFrame,
+    chunk_size: int = 252
+) -> Iterator[Tuple[pd.DataFrame, pd.DataFrame]]:
+    """Yield aligned (signals, returns) date chunks from in-memory frames.
+
+    Args:
+        signals_df: Factor signals (columns = tickers, rows = dates)
+        returns_df: Returns (columns = tickers, rows = dates)
+        chunk_size: Number of dates per chunk
+
+    Yields:
+        (signals chunk, returns chunk) with identical index and columns
+    """
+    signals_df, returns_df = align_dates(signals_df, returns_df)
+    if not returns_df.columns.equals(signals_df.columns):
+        returns_df = returns_df.reindex(columns=signals_df.columns)
+
+    for start in range(0, len(signals_df), chunk_size):
+        rows = slice(start, start + chunk_size)
+        yield signals_df.iloc[rows], returns_df.iloc[rows]
+
+
+def iter_parquet_chunks(
+    signals_path: Path,
+    returns_path: Path,
+    chunk_size: int = 252
+) -> Iterator[Tuple[pd.DataFrame, pd.DataFrame]]:
+    """Yield aligned date chunks from two date-indexed parquet panels on disk.
+
+    Both files must contain the same dates in the same order (e.g. written
+    from frames sharing one index). Only one chunk of each is in memory.
+
+    Args:
+        signals_path: Parquet file of signals
+        returns_path: Parquet file of returns
+        chunk_size: Number of dates per chunk
+
+    Yields:
+        (signals chunk, returns chunk)
+    """
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    signals_file = pq.ParquetFile(signals_path)
+    returns_file = pq.ParquetFile(returns_path)
+
+    batches = zip(
+        signals_file.iter_batches(batch_size=chunk_size),
+        returns_file.iter_batches(batch_size=chunk_size)
+    )
+    for signals_batch, returns_batch in batches:
+        signals_chunk = pa.Table.from_batches([signals_batch]).to_pandas()
+        returns_chunk = pa.Table.from_batches([returns_batch]).to_pandas()
+
+        if not signals_chunk.index.equals(returns_chunk.index):
+            raise ValueError("Signals and returns parquet files are not date-aligned")
+
+        yield signals_chunk, returns_chunk.reindex(columns=signals_chunk.columns)
+
+
+def streaming_backtest(
+    chunks: Iterable[Tuple[pd.DataFrame, pd.DataFrame]],
+    factor_spec: FactorSpec,
+    costs_config: Optional[Dict] = None,
+    max_leverage: float = 2.0,
+    max_single_position: float = 0.1,
+    keep_returns: bool = True,
+    dtype: type = np.float64
+) -> Dict[str, Any]:
+    """Run a long-short backtest over date chunks with bounded memory.
+
+    Produces the same returns and metrics as construct_portfolio followed by
+    calculate_all_metrics on the concatenated history.
+
+    Args:
+        chunks: Iterable of (signals chunk, returns chunk), in date order
+        factor_spec: Factor specification (portfolio scheme/weight/notional)
+        costs_config: Costs configuration
+        max_leverage: Maximum leverage
+        max_single_position: Maximum single position size
+        keep_returns: Keep the daily return and equity series (one float per date)
+        dtype: Float dtype for chunk arrays (np.float32 halves chunk memory)
+
+    Returns:
+        Dictionary with:
+        - metrics: Metrics in the format of calculate_all_metrics
+        - returns: Portfolio returns Series (if keep_returns)
+        - equity_curve: Equity curve Series (if keep_returns)
+        - turnover: Daily turnover Series, NaN on the first date (if keep_returns)
+        - positions: Last row of positions (1-row DataFrame)
+        - n_chunks: Number of chunks processed
+        - peak_chunk_bytes: Largest chunk working set in bytes
+    """
+    if costs_config is None:
+        costs_config = load_costs_config()
+
+    cost_per_dollar = (
+        costs_config['slippage']['bps_per_trade'] / 10000
+        + costs_config['fees']['commission_per_trade'] / 10000
+    )
+    borrow_bps_daily = costs_config['borrow']['bps_annual'] / 252 / 10000
+
+    stream_metrics = StreamingMetrics()
+    prev_positions = None
+    last_positions = pd.DataFrame()
+    returns_parts = []
+    equity_parts = []
+    turnover_parts = []
+    n_chunks = 0
+    peak_chunk_bytes = 0
+
+    for signals_chunk, returns_chunk in chunks:
+        if len(signals_chunk) == 0:
+            continue
+
+        dates = signals_chunk.index
+        scores = signals_chunk.to_numpy(dtype=dtype)
+        asset_returns = returns_chunk.to_numpy(dtype=dtype)
+
+        positions = long_short_weights(
+            scores,
+            scheme=factor_spec.portfolio.scheme,
+            weight=factor_spec.portfolio.weight,
+            notional=factor_spec.portfolio.notional
+        ).astype(dtype, copy=False)
+        positions = enforce_limits_array(positions, max_leverage, max_single_position)
+
+        # Previous-row positions: carried from the last chunk, NaN at the very start
+        if prev_positions is None:
+            prev_positions = np.full((1, positions.shape[1]), np.nan, dtype=dtype)
+        shifted = np.vstack([prev_positions, positions[:-1]])
+
+        gross = np.nansum(shifted * asset_returns, axis=1)
+        changes = np.abs(positions - shifted)
+        daily_turnover = np.nansum(changes, axis=1)
+        trading_costs = daily_turnover * cost_per_dollar
+        if n_chunks == 0:
+            # No trade is defined for the first date of the history
+            daily_turnover[0] = np.nan
+        borrow_costs = np.nansum(np.where(positions < 0, -positions, 0), axis=1) * borrow_bps_daily
+        net_returns = (gross - trading_costs - borrow_costs).astype(float)
+
+        with warnings.catch_warnings():
+            # Dates without any valid ticker average to NaN
+            warnings.simplefilter("ignore", category=RuntimeWarning)
+            avg_scores = np.nanmean(scores, axis=1)
+            avg_returns = np.nanmean(asset_returns, axis=1)
+
+        equity = stream_metrics.update(
+            net_returns,
+            dates,
+            turnover=daily_turnover,
+            avg_scores=avg_scores,
+            avg_returns=avg_returns
+        )
+
+        if keep_returns:
+            returns_parts.append(pd.Series(net_returns, index=dates))
+            equity_parts.append(pd.Series(equity, index=dates))
+            turnover_parts.append(pd.Series(daily_turnover, index=dates))
+
+        chunk_bytes = sum(a.nbytes for a in (scores, asset_returns, positions, shifted, changes))
+        peak_chunk_bytes = max(peak_chunk_bytes, chunk_bytes)
+
+        prev_positions = positions[-1:].copy()
+        last_positions = pd.DataFrame(prev_positions, index=dates[-1:], columns=signals_chunk.columns)
+        n_chunks += 1
+
+    result = {
+        'metrics': stream_metrics.result(),
+        'positions': last_positions,
+        'n_chunks': n_chunks,
+        'peak_chunk_bytes': peak_chunk_bytes
+    }
+
+    if keep_returns:
+        result['returns'] = pd.concat(returns_parts) if returns_parts else pd.Series(dtype=float)
+        result['equity_curve'] = pd.concat(equity_parts) if equity_parts else pd.Series(dtype=float)
+        result['turnover'] = pd.concat(turnover_parts) if turnover_parts else pd.Series(dtype=float)
+
+    return result
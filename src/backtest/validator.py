@@ -1,5 +1,6 @@
 """Validation: leakage detection, sample size checks, stability tests, regime robustness."""
 
+import warnings
 import pandas as pd
 import numpy as np
 from typing import Dict, List, Tuple, Optional, Any
@@ -91,6 +92,23 @@ def check_sample_size(
     return len(issues) == 0, issues
 
 
+def _window_sharpes(windows: np.ndarray, periods_per_year: int = 252) -> np.ndarray:
+    """Annualized Sharpe ratio of each row (same conventions as metrics.sharpe)."""
+    if windows.size == 0:
+        return np.array([])
+    
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", category=RuntimeWarning)
+        means = np.nanmean(windows, axis=1)
+        stds = np.nanstd(windows, axis=1, ddof=1)
+    
+    flat = np.isnan(stds) | np.isclose(stds, 0, atol=1e-10)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        sharpes = means * periods_per_year / (stds * np.sqrt(periods_per_year))
+    
+    return np.where(flat, 0.0, sharpes)
+
+
 def check_stability(
     returns: pd.Series,
     rolling_period: int = 252,
@@ -114,12 +132,10 @@ def check_stability(
         issues.append(f"Insufficient data for stability check: {len(returns)} < {rolling_period * min_periods}")
         return False, issues
     
-    # Calculate rolling Sharpe
-    rolling_sharpes = []
-    for i in range(rolling_period, len(returns), rolling_period):
-        window_returns = returns.iloc[i-rolling_period:i]
-        window_sharpe = sharpe(window_returns)
-        rolling_sharpes.append(window_sharpe)
+    # Rolling Sharpe over non-overlapping windows, all windows at once
+    n_windows = (len(returns) - 1) // rolling_period
+    windows = np.asarray(returns, dtype=float)[:n_windows * rolling_period].reshape(n_windows, rolling_period)
+    rolling_sharpes = _window_sharpes(windows)
     
     if len(rolling_sharpes) < min_periods:
         issues.append(f"Insufficient rolling periods: {len(rolling_sharpes)} < {min_periods}")
@@ -176,7 +192,9 @@ def check_regime_robustness(
     prices: pd.Series,
     required_regimes: List[str] = None,
     min_regime_samples: int = 63,
-    min_regime_sharpe: float = 0.5
+    min_regime_sharpe: float = 0.5,
+    vol_regimes: Optional[pd.Series] = None,
+    trend_regimes: Optional[pd.Series] = None
 ) -> Tuple[bool, List[str]]:
     """Check performance across different regimes.
     
@@ -186,6 +204,8 @@ def check_regime_robustness(
         required_regimes: List of required regimes
         min_regime_samples: Minimum samples per regime
         min_regime_sharpe: Minimum Sharpe per regime
+        vol_regimes: Precomputed volatility regime labels (skips classification)
+        trend_regimes: Precomputed trend regime labels (skips classification)
     
     Returns:
         (is_valid, list_of_issues)
@@ -196,13 +216,12 @@ def check_regime_robustness(
     issues = []
     
     # Classify volatility regimes
-    vol_regimes = REGIME_VOLATILITY(returns, window=21)
+    if vol_regimes is None:
+        vol_regimes = REGIME_VOLATILITY(returns, window=21)
     
     # Classify trend regimes
-    trend_regimes = REGIME_TREND(prices, short_window=21, long_window=63)
-    
-    # Combine regimes
-    combined_regimes = vol_regimes + "_" + trend_regimes
+    if trend_regimes is None:
+        trend_regimes = REGIME_TREND(prices, short_window=21, long_window=63)
     
     # Check each required regime
     for regime in required_regimes:
@@ -236,27 +255,31 @@ def check_regime_robustness(
 
 
 def check_turnover(
-    positions: pd.DataFrame,
-    max_monthly_turnover_pct: float = 250.0
+    positions: Optional[pd.DataFrame],
+    max_monthly_turnover_pct: float = 250.0,
+    daily_turnover: Optional[pd.Series] = None
 ) -> Tuple[bool, List[str]]:
     """Check turnover constraints.
     
     Args:
         positions: Position weights DataFrame
         max_monthly_turnover_pct: Maximum monthly turnover percentage
+        daily_turnover: Precomputed daily turnover of positions (skips the diff)
     
     Returns:
         (is_valid, list_of_issues)
     """
     issues = []
     
-    if len(positions) < 2:
+    if daily_turnover is None:
+        if positions is None or len(positions) < 2:
+            return True, []
+        
+        # Calculate daily turnover
+        daily_turnover = positions.diff().abs().sum(axis=1)
+    elif len(daily_turnover) < 2:
         return True, []
     
-    # Calculate daily turnover
-    position_changes = positions.diff().abs()
-    daily_turnover = position_changes.sum(axis=1)
-    
     # Monthly turnover (approximate: 21 trading days)
     monthly_turnover_pct = daily_turnover.mean() * 21 * 100
     
@@ -268,13 +291,66 @@ def check_turnover(
     return len(issues) == 0, issues
 
 
+def build_validation_context(
+    signals_df: pd.DataFrame,
+    returns_df: pd.DataFrame,
+    prices_df: Optional[pd.DataFrame] = None,
+    positions_df: Optional[pd.DataFrame] = None,
+    portfolio_returns: Optional[pd.Series] = None,
+    daily_turnover: Optional[pd.Series] = None,
+    avg_signals: Optional[pd.Series] = None,
+    avg_returns: Optional[pd.Series] = None
+) -> Dict[str, Any]:
+    """Collect the intermediate series validate_run needs, computing each once.
+    
+    The backtest pipeline passes series it already has (averages, turnover,
+    portfolio returns); anything missing is computed here.
+    
+    Args:
+        signals_df: Factor signals DataFrame
+        returns_df: Returns DataFrame
+        prices_df: Prices DataFrame (for regime labels)
+        positions_df: Positions DataFrame (for turnover)
+        portfolio_returns: Backtest return series (for the stability check)
+        daily_turnover: Daily turnover of positions_df
+        avg_signals: Cross-sectional average signal per date
+        avg_returns: Cross-sectional average return per date
+    
+    Returns:
+        Dictionary with avg_signals, avg_returns, daily_turnover, returns,
+        vol_regimes and trend_regimes (None where unavailable)
+    """
+    if avg_signals is None:
+        avg_signals = signals_df.mean(axis=1)
+    if avg_returns is None:
+        avg_returns = returns_df.mean(axis=1)
+    if daily_turnover is None and positions_df is not None and len(positions_df) >= 2:
+        daily_turnover = positions_df.diff().abs().sum(axis=1)
+    
+    vol_regimes = None
+    trend_regimes = None
+    if prices_df is not None and len(prices_df) > 0:
+        vol_regimes = REGIME_VOLATILITY(avg_returns, window=21)
+        trend_regimes = REGIME_TREND(prices_df.mean(axis=1), short_window=21, long_window=63)
+    
+    return {
+        'avg_signals': avg_signals,
+        'avg_returns': avg_returns,
+        'daily_turnover': daily_turnover,
+        'returns': portfolio_returns,
+        'vol_regimes': vol_regimes,
+        'trend_regimes': trend_regimes
+    }
+
+
 def validate_run(
     signals_df: pd.DataFrame,
     returns_df: pd.DataFrame,
     prices_df: pd.DataFrame,
     positions_df: pd.DataFrame,
     metrics: Dict[str, Any],
-    constraints_config: Optional[Dict] = None
+    constraints_config: Optional[Dict] = None,
+    context: Optional[Dict[str, Any]] = None
 ) -> Tuple[bool, List[Dict[str, Any]]]:
     """Comprehensive validation of a backtest run.
     
@@ -285,6 +361,8 @@ def validate_run(
         positions_df: Positions DataFrame
         metrics: Calculated metrics
         constraints_config: Constraints configuration
+        context: Precomputed intermediates from build_validation_context
+            (e.g. returned by walkforward_backtest as 'validation_context')
     
     Returns:
         (is_valid, list_of_issues)
@@ -293,6 +371,9 @@ def validate_run(
     if constraints_config is None:
         constraints_config = load_constraints_config()
     
+    if context is None:
+        context = build_validation_context(signals_df, returns_df, prices_df, positions_df)
+    
     issues = []
     
     # Sample size check
@@ -314,10 +395,9 @@ def validate_run(
     if leakage_config.get('enabled', True):
         # Check correlation with future returns
         if len(signals_df) > 10:
-            avg_signals = signals_df.mean(axis=1)
-            future_returns = returns_df.mean(axis=1).shift(-1)
+            future_returns = context['avg_returns'].shift(-1)
             is_valid, leakage_issues = check_leakage(
-                avg_signals,
+                context['avg_signals'],
                 future_returns,
                 threshold=leakage_config.get('max_future_correlation', 0.1)
             )
@@ -329,31 +409,33 @@ def validate_run(
                 })
     
     # Stability check
-    if 'returns' in metrics or hasattr(metrics, 'returns'):
+    returns = context.get('returns')
+    if returns is None and ('returns' in metrics or hasattr(metrics, 'returns')):
         returns = metrics.get('returns') if isinstance(metrics, dict) else None
         if returns is None and hasattr(metrics, 'returns'):
             returns = metrics.returns
-        
-        if returns is not None and len(returns) > 0:
-            stability_config = constraints_config.get('stability', {})
-            is_valid, stability_issues = check_stability(
-                returns,
-                rolling_period=stability_config.get('rolling_period_days', 252),
-                min_periods=stability_config.get('min_rolling_sharpe_periods', 4),
-                max_sharpe_drawdown_pct=stability_config.get('max_sharpe_drawdown_pct', 50)
-            )
-            for issue in stability_issues:
-                issues.append({
-                    'type': 'unstable_performance',
-                    'severity': 'warning',
-                    'detail': issue
-                })
+    
+    if returns is not None and len(returns) > 0:
+        stability_config = constraints_config.get('stability', {})
+        is_valid, stability_issues = check_stability(
+            returns,
+            rolling_period=stability_config.get('rolling_period_days', 252),
+            min_periods=stability_config.get('min_rolling_sharpe_periods', 4),
+            max_sharpe_drawdown_pct=stability_config.get('max_sharpe_drawdown_pct', 50)
+        )
+        for issue in stability_issues:
+            issues.append({
+                'type': 'unstable_performance',
+                'severity': 'warning',
+                'detail': issue
+            })
     
     # Turnover check
     turnover_config = constraints_config.get('turnover', {})
     is_valid, turnover_issues = check_turnover(
         positions_df,
-        max_monthly_turnover_pct=turnover_config.get('max_monthly_turnover_pct', 250.0)
+        max_monthly_turnover_pct=turnover_config.get('max_monthly_turnover_pct', 250.0),
+        daily_turnover=context.get('daily_turnover')
     )
     for issue in turnover_issues:
         issues.append({
@@ -366,14 +448,14 @@ def validate_run(
     if prices_df is not None and len(prices_df) > 0:
         regime_config = constraints_config.get('regime_robustness', {})
         if regime_config.get('enabled', True):
-            avg_prices = prices_df.mean(axis=1)
-            avg_returns = returns_df.mean(axis=1)
             is_valid, regime_issues = check_regime_robustness(
-                avg_returns,
-                avg_prices,
+                context['avg_returns'],
+                prices_df.mean(axis=1) if context.get('trend_regimes') is None else None,
                 required_regimes=regime_config.get('required_regimes', ["high_vol", "low_vol", "bull", "bear"]),
                 min_regime_samples=regime_config.get('min_regime_samples', 63),
-                min_regime_sharpe=regime_config.get('min_regime_sharpe', 0.5)
+                min_regime_sharpe=regime_config.get('min_regime_sharpe', 0.5),
+                vol_regimes=context.get('vol_regimes'),
+                trend_regimes=context.get('trend_regimes')
             )
             for issue in regime_issues:
                 issues.append({
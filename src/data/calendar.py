@@ -0,0 +1,202 @@
+"""Trading calendars and date alignment by integer position.
+
+TradingCalendar holds the sessions of an exchange (NYSE by default, as
+set in configs/universe.yml). Panels are reindexed onto it once, when
+they are loaded; after that every stage sees the same date index and
+align_dates returns the frames untouched instead of intersecting labels
+and copying with .loc. Frames on a different index are cut down to the
+common dates by integer take.
+"""
+
+from functools import lru_cache
+from pathlib import Path
+from typing import Optional, Tuple
+
+import numpy as np
+import pandas as pd
+import yaml
+from pandas.tseries.holiday import (
+    AbstractHolidayCalendar,
+    GoodFriday,
+    Holiday,
+    USLaborDay,
+    USMartinLutherKingJr,
+    USMemorialDay,
+    USPresidentsDay,
+    USThanksgivingDay,
+    nearest_workday,
+    sunday_to_monday
+)
+from pandas.tseries.offsets import CustomBusinessDay
+
+from .market_store import normalize_date, normalize_dates
+
+
+class NYSEHolidayCalendar(AbstractHolidayCalendar):
+    """Regular NYSE holidays (NASDAQ observes the same days)."""
+
+    rules = [
+        # A Saturday New Year's Day is not observed on the Friday before
+        Holiday('New Years Day', month=1, day=1, observance=sunday_to_monday),
+        Holiday('Martin Luther King Jr. Day', month=1, day=1, offset=USMartinLutherKingJr.offset,
+                start_date='1998-01-01'),
+        USPresidentsDay,
+        GoodFriday,
+        USMemorialDay,
+        Holiday('Juneteenth', month=6, day=19, observance=nearest_workday, start_date='2022-01-01'),
+        Holiday('Independence Day', month=7, day=4, observance=nearest_workday),
+        USLaborDay,
+        USThanksgivingDay,
+        Holiday('Christmas Day', month=12, day=25, observance=nearest_workday)
+    ]
+
+
+# Unscheduled full-day closures
+NYSE_SPECIAL_CLOSURES = [
+    '2001-09-11', '2001-09-12', '2001-09-13', '2001-09-14',  # September 11
+    '2004-06-11',  # President Reagan's funeral
+    '2007-01-02',  # President Ford's funeral
+    '2012-10-29', '2012-10-30',  # Hurricane Sandy
+    '2018-12-05',  # President George H.W. Bush's funeral
+    '2025-01-09'   # President Carter's funeral
+]
+
+# Holiday set names used in configs/universe.yml
+HOLIDAY_CALENDARS = {
+    'NYSE_holidays': (NYSEHolidayCalendar, NYSE_SPECIAL_CLOSURES),
+    'NASDAQ_holidays': (NYSEHolidayCalendar, NYSE_SPECIAL_CLOSURES)
+}
+
+
+@lru_cache(maxsize=8)
+def _sessions(holidays: str, start: pd.Timestamp, end: pd.Timestamp) -> pd.DatetimeIndex:
+    """Sessions of a holiday set (generating the holidays is slow, so cached)."""
+    holiday_calendar, special_closures = HOLIDAY_CALENDARS[holidays]
+    closed = holiday_calendar().holidays(start, end).union(pd.DatetimeIndex(special_closures))
+    return pd.date_range(start, end, freq=CustomBusinessDay(holidays=closed), name='Date')
+
+
+class TradingCalendar:
+    """Sessions of one exchange over a date range."""
+
+    def __init__(
+        self,
+        name: str = "NYSE",
+        start='1990-01-01',
+        end='2035-12-31',
+        holidays: str = "NYSE_holidays"
+    ):
+        """Build the calendar.
+
+        Args:
+            name: Calendar name (e.g. 'NYSE')
+            start: First date covered
+            end: Last date covered
+            holidays: Holiday set (a key of HOLIDAY_CALENDARS)
+        """
+        if holidays not in HOLIDAY_CALENDARS:
+            raise ValueError(f"Unknown holiday calendar: {holidays}")
+
+        self.name = name
+        self.sessions = _sessions(holidays, normalize_date(start), normalize_date(end))
+
+    @classmethod
+    def from_config(
+        cls,
+        universe: Optional[str] = None,
+        config_path: Optional[Path] = None,
+        **kwargs
+    ) -> 'TradingCalendar':
+        """Calendar configured for a universe in configs/universe.yml.
+
+        Args:
+            universe: Universe name (default: the config's default_universe)
+            config_path: Universe config path
+            **kwargs: start / end overrides
+
+        Returns:
+            TradingCalendar (NYSE if the universe names no calendar)
+        """
+        with open(config_path or Path("configs/universe.yml")) as f:
+            config = yaml.safe_load(f)
+
+        universe = universe or config.get('default_universe')
+        name = config.get('universes', {}).get(universe, {}).get('trading_calendar', 'NYSE')
+        settings = config.get('trading_calendar', {}).get(name, {})
+        return cls(name=name, holidays=settings.get('holidays', 'NYSE_holidays'), **kwargs)
+
+    def sessions_between(self, start, end) -> pd.DatetimeIndex:
+        """Sessions in [start, end] (inclusive)."""
+        first = self.sessions.searchsorted(normalize_date(start), side='left')
+        last = self.sessions.searchsorted(normalize_date(end), side='right')
+        return self.sessions[first:last]
+
+    def is_session(self, dates) -> np.ndarray:
+        """Boolean array: which dates are sessions."""
+        return self.sessions.get_indexer(normalize_dates(dates)) >= 0
+
+    def align(self, frame: pd.DataFrame) -> pd.DataFrame:
+        """Put a frame on the calendar: one row per session between its first
+        and last date, dropping non-session rows.
+
+        This is the single reindex done when data is loaded; frames that
+        are already on the calendar are returned as is.
+
+        Args:
+            frame: Date-indexed DataFrame
+
+        Returns:
+            Frame indexed by sessions
+        """
+        if len(frame) == 0:
+            return frame
+        dates = normalize_dates(frame.index)
+        sessions = self.sessions_between(dates[0], dates[-1])
+        if dates.equals(sessions):
+            return frame
+
+        rows = pd.Index(dates).get_indexer(sessions)
+        if (rows >= 0).all():
+            aligned = frame.take(rows)
+        else:
+            aligned = frame.set_axis(dates, axis=0).reindex(sessions)
+        aligned.index = sessions
+        return aligned
+
+    def __repr__(self) -> str:
+        return f"TradingCalendar({self.name!r}, {self.sessions[0].date()} to {self.sessions[-1].date()})"
+
+
+def align_dates(*frames: pd.DataFrame) -> Tuple[pd.DataFrame, ...]:
+    """Restrict frames to their common dates.
+
+    Frames already on the same index (the usual case once data is on the
+    calendar) are returned unchanged, without copying. Otherwise each is
+    cut down by integer take on the common dates.
+
+    Args:
+        *frames: Date-indexed DataFrames or Series
+
+    Returns:
+        Tuple of frames sharing one index
+    """
+    index = frames[0].index
+    if all(frame.index is index or frame.index.equals(index) for frame in frames[1:]):
+        return frames
+
+    common = index
+    for frame in frames[1:]:
+        common = common.intersection(frame.index)
+    return tuple(
+        frame if frame.index.equals(common) else frame.take(frame.index.get_indexer(common))
+        for frame in frames
+    )
+
+
+def date_slice(index: pd.DatetimeIndex, start, end) -> slice:
+    """Positional slice of a sorted date index covering [start, end].
+
+    Used with .iloc, it selects the same rows as a boolean date mask
+    but returns a view instead of a copy.
+    """
+    return slice(index.searchsorted(start, side='left'), index.searchsorted(end, side='right'))
@@ -0,0 +1,193 @@
+"""Lazily materialized OHLCV panels.
+
+MarketData exposes dates x tickers panels (close, open, high, low,
+volume and the derived returns) but builds each one only when it is
+first accessed, then caches it. Code that needs only closes never pays
+for the other fields, while primitives like VWAP and ADV and custom
+factor code can still reach volume and the intraday range. Given a UniverseMembership, it also
+provides the point-in-time membership mask aligned with the panels.
+"""
+
+import threading
+from typing import Callable, Dict, List, Optional
+
+import pandas as pd
+
+from .market_store import MarketDataStore
+from .panel_snapshot import PanelSnapshot
+from .quality import panel_hash
+from .universe import UniverseMembership
+
+# Attribute / variable name -> stored field name
+FIELD_NAMES = {
+    'open': 'Open',
+    'high': 'High',
+    'low': 'Low',
+    'close': 'Close',
+    'volume': 'Volume'
+}
+
+
+class MarketData:
+    """Container of OHLCV panels that loads each field on first access."""
+
+    def __init__(
+        self,
+        loaders: Dict[str, Callable[[], pd.DataFrame]],
+        universe: Optional[UniverseMembership] = None,
+        **panels: pd.DataFrame
+    ):
+        """Initialize from per-field loaders.
+
+        Args:
+            loaders: Field name (e.g. 'Close') -> callable returning the panel
+            universe: Point-in-time membership of the universe the panels cover
+            **panels: Panels already in memory (e.g. close=prices_df)
+        """
+        self._loaders = dict(loaders)
+        self._panels: Dict[str, pd.DataFrame] = {
+            FIELD_NAMES.get(name, name): panel for name, panel in panels.items() if panel is not None
+        }
+        self._lock = threading.RLock()
+        self._data_hash: Optional[str] = None
+        self.universe = universe
+        if universe is not None:
+            self._loaders['universe_mask'] = lambda: universe.mask(self.close.index, self.close.columns)
+
+    @classmethod
+    def from_frames(cls, universe: Optional[UniverseMembership] = None, **panels: pd.DataFrame) -> 'MarketData':
+        """Wrap panels that are already in memory (e.g. close=prices_df)."""
+        return cls({}, universe=universe, **panels)
+
+    @classmethod
+    def from_snapshot(
+        cls,
+        snapshot,
+        universe: Optional[UniverseMembership] = None,
+        **panels: pd.DataFrame
+    ) -> 'MarketData':
+        """Memory-map fields from a panel snapshot (object or directory)."""
+        if not isinstance(snapshot, PanelSnapshot):
+            snapshot = PanelSnapshot(snapshot)
+        loaders = {field: (lambda field=field: snapshot.field(field)) for field in snapshot.fields}
+        return cls(loaders, universe=universe, **panels)
+
+    @classmethod
+    def from_store(
+        cls,
+        store: MarketDataStore,
+        tickers: List[str],
+        start=None,
+        end=None,
+        universe: Optional[UniverseMembership] = None,
+        dates: Optional[pd.DatetimeIndex] = None,
+        **panels: pd.DataFrame
+    ) -> 'MarketData':
+        """Read each field from a MarketDataStore when it is first needed.
+
+        If dates is given (e.g. trading calendar sessions), each field is
+        reindexed onto it once, as it is loaded.
+        """
+        def load(field: str) -> pd.DataFrame:
+            panel = store.read(tickers, start=start, end=end, fields=[field])[field].unstack(level='Ticker')
+            return panel if dates is None else panel.reindex(dates)
+
+        loaders = {field: (lambda field=field: load(field)) for field in FIELD_NAMES.values()}
+        return cls(loaders, universe=universe, **panels)
+
+    @property
+    def fields(self) -> List[str]:
+        """Fields that can be accessed."""
+        return sorted(set(self._loaders) | set(self._panels))
+
+    @property
+    def loaded_fields(self) -> List[str]:
+        """Fields materialized so far."""
+        return sorted(self._panels)
+
+    def field(self, name: str) -> pd.DataFrame:
+        """Panel of one field, materialized and cached on first access.
+
+        Args:
+            name: Field name ('Close' or 'close', 'Volume' or 'volume', ...)
+
+        Returns:
+            Dates x tickers DataFrame
+        """
+        name = FIELD_NAMES.get(name, name)
+        panel = self._panels.get(name)
+        if panel is not None:
+            return panel
+
+        with self._lock:
+            if name not in self._panels:
+                if name not in self._loaders:
+                    raise KeyError(f"Field {name!r} not available (has {self.fields})")
+                self._panels[name] = self._loaders[name]()
+            return self._panels[name]
+
+    def __contains__(self, name: str) -> bool:
+        return FIELD_NAMES.get(name, name) in self.fields
+
+    @property
+    def close(self) -> pd.DataFrame:
+        return self.field('Close')
+
+    @property
+    def open(self) -> pd.DataFrame:
+        return self.field('Open')
+
+    @property
+    def high(self) -> pd.DataFrame:
+        return self.field('High')
+
+    @property
+    def low(self) -> pd.DataFrame:
+        return self.field('Low')
+
+    @property
+    def volume(self) -> pd.DataFrame:
+        return self.field('Volume')
+
+    @property
+    def returns(self) -> pd.DataFrame:
+        """Daily close-to-close returns."""
+        if 'returns' not in self._loaders and 'returns' not in self._panels:
+            self._loaders['returns'] = lambda: self.close.pct_change(1)
+        return self.field('returns')
+
+    @property
+    def universe_mask(self) -> Optional[pd.DataFrame]:
+        """Boolean dates x tickers membership matrix aligned with close
+        (None if no universe membership was given)."""
+        if self.universe is None:
+            return None
+        return self.field('universe_mask')
+
+    @property
+    def data_hash(self) -> str:
+        """Content hash of the closes (and universe mask, if any).
+
+        Computed once; keys signal caches and is recorded in run manifests.
+        """
+        with self._lock:
+            if self._data_hash is None:
+                panels = {'Close': self.close}
+                if self.universe is not None:
+                    panels['universe_mask'] = self.universe_mask
+                self._data_hash = panel_hash(panels)
+            return self._data_hash
+
+    def memory_usage(self) -> Dict[str, int]:
+        """Bytes held by each materialized field, plus 'total'.
+
+        Snapshot-backed fields are memory-mapped; their pages are shared
+        with other processes using the same snapshot.
+        """
+        usage = {name: int(panel.memory_usage(index=False).sum()) for name, panel in self._panels.items()}
+        usage['total'] = sum(usage.values())
+        return usage
+
+    def __repr__(self) -> str:
+        loaded = ', '.join(f"{name}={size / 1e6:.1f}MB" for name, size in self.memory_usage().items() if name != 'total')
+        return f"MarketData(fields={self.fields}, loaded=[{loaded}])"
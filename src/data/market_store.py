@@ -0,0 +1,287 @@
+"""Persistent OHLCV store partitioned by ticker and year.
+
+Bars are kept as Parquet files in a Hive layout::
+
+    <root>/ohlcv/ticker=AAPL/year=2020/part.parquet
+
+and a JSON index records, per ticker, which date ranges have been fetched
+(ranges with no bars, such as holidays, count as fetched). A ticker's
+range is recorded only after its bars are on disk, and writers hold a
+file lock, so concurrent or interrupted refreshes never leave the index
+claiming bars that are missing. Reads build
+the file list straight from the requested tickers and years, then let
+pyarrow project the requested columns and skip row groups outside the
+date range, so any universe and date slice is served without touching
+the rest of the store.
+"""
+
+import json
+import os
+import tempfile
+import threading
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import quote
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.dataset as ds
+import pyarrow.parquet as pq
+
+try:
+    import fcntl
+except ImportError:  # Windows: writers are only serialized within a process
+    fcntl = None
+
+FIELDS = ['Open', 'High', 'Low', 'Close', 'Volume']
+
+PARTITIONING = ds.partitioning(
+    pa.schema([('ticker', pa.string()), ('year', pa.int16())]),
+    flavor='hive'
+)
+
+DateRange = Tuple[pd.Timestamp, pd.Timestamp]
+
+
+def normalize_date(value) -> pd.Timestamp:
+    """Normalize a date-like value to a tz-naive midnight Timestamp."""
+    ts = pd.Timestamp(value)
+    if ts.tzinfo is not None:
+        ts = ts.tz_localize(None)
+    return ts.normalize()
+
+
+def normalize_dates(index) -> pd.DatetimeIndex:
+    """Normalize a date index to tz-naive midnight timestamps."""
+    dates = pd.DatetimeIndex(index)
+    if dates.tz is not None:
+        dates = dates.tz_localize(None)
+    return dates.normalize()
+
+
+def merge_ranges(ranges: List[DateRange]) -> List[DateRange]:
+    """Merge overlapping ranges, and ranges separated only by non-business days.
+
+    Args:
+        ranges: Inclusive (start, end) date ranges
+
+    Returns:
+        Sorted, non-overlapping ranges
+    """
+    merged: List[DateRange] = []
+    for start, end in sorted(ranges):
+        if merged:
+            last_start, last_end = merged[-1]
+            gap = np.busday_count((last_end + pd.Timedelta(days=1)).date(), start.date()) if start > last_end else 0
+            if gap <= 0:
+                merged[-1] = (last_start, max(last_end, end))
+                continue
+        merged.append((start, end))
+    return merged
+
+
+class MarketDataStore:
+    """Ticker/year partitioned OHLCV bars with an index of fetched ranges."""
+
+    def __init__(self, root: str = "data/cache"):
+        """Open (or create) a store.
+
+        Args:
+            root: Store directory; bars go under <root>/ohlcv
+        """
+        self.root = Path(root)
+        self.data_dir = self.root / 'ohlcv'
+        self.index_path = self.root / 'ohlcv_index.json'
+        self._lock = threading.RLock()
+
+        self.index: Dict[str, Dict] = {'tickers': {}}
+        self._load_index()
+
+    def _load_index(self):
+        if self.index_path.exists():
+            with open(self.index_path) as f:
+                self.index = json.load(f)
+
+    @contextmanager
+    def _write_lock(self):
+        """Serialize writers across threads and processes."""
+        with self._lock:
+            if fcntl is None:
+                yield
+                return
+            self.root.mkdir(parents=True, exist_ok=True)
+            with open(self.root / '.ohlcv.lock', 'w') as lock_file:
+                fcntl.flock(lock_file, fcntl.LOCK_EX)
+                try:
+                    yield
+                finally:
+                    fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+    def _partition_path(self, ticker: str, year: int) -> Path:
+        # Hive partition values are URI-decoded on read (e.g. ^GSPC)
+        return self.data_dir / f"ticker={quote(ticker, safe='')}" / f"year={year}" / 'part.parquet'
+
+    def _save_index(self):
+        self.root.mkdir(parents=True, exist_ok=True)
+        self.index['updated_at'] = datetime.now().isoformat()
+        fd, tmp_path = tempfile.mkstemp(dir=self.root, prefix='.index.', suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'w') as f:
+                json.dump(self.index, f, indent=1)
+            os.replace(tmp_path, self.index_path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.unlink(tmp_path)
+            raise
+
+    def tickers(self) -> List[str]:
+        """Tickers with any fetched range."""
+        return sorted(self.index['tickers'])
+
+    def coverage(self, ticker: str) -> List[DateRange]:
+        """Fetched date ranges of a ticker (inclusive, merged)."""
+        entry = self.index['tickers'].get(ticker, {})
+        return [(pd.Timestamp(start), pd.Timestamp(end)) for start, end in entry.get('ranges', [])]
+
+    def covers(self, ticker: str, start, end) -> bool:
+        """Whether [start, end] (inclusive) lies within one fetched range."""
+        start, end = normalize_date(start), normalize_date(end)
+        return any(s <= start and end <= e for s, e in self.coverage(ticker))
+
+    def missing_ranges(self, ticker: str, start, end) -> List[DateRange]:
+        """Parts of [start, end] not yet fetched for a ticker.
+
+        Gaps without business days (weekends) are left out.
+
+        Args:
+            ticker: Ticker symbol
+            start: First date (inclusive)
+            end: Last date (inclusive)
+
+        Returns:
+            Inclusive (start, end) ranges to fetch, in date order
+        """
+        start, end = normalize_date(start), normalize_date(end)
+        missing = []
+        cursor = start
+        for covered_start, covered_end in self.coverage(ticker):
+            if covered_end < cursor:
+                continue
+            if covered_start > end:
+                break
+            if covered_start > cursor:
+                missing.append((cursor, covered_start - pd.Timedelta(days=1)))
+            cursor = covered_end + pd.Timedelta(days=1)
+        if cursor <= end:
+            missing.append((cursor, end))
+
+        return [
+            (s, e) for s, e in missing
+            if np.busday_count(s.date(), (e + pd.Timedelta(days=1)).date()) > 0
+        ]
+
+    def write(self, ticker: str, bars: pd.DataFrame, start=None, end=None) -> int:
+        """Merge a ticker's bars into the store and record the fetched range.
+
+        Rows for dates already stored are replaced. Each year file is
+        rewritten atomically, and the range is added to the index only
+        after all of them are in place.
+
+        Args:
+            ticker: Ticker symbol
+            bars: DataFrame indexed by date with OHLCV columns (may be empty)
+            start: First date that was fetched (default: first bar)
+            end: Last date that was fetched, inclusive (default: last bar)
+
+        Returns:
+            Number of bars written
+        """
+        bars = bars.reindex(columns=FIELDS).astype('float64')
+        bars.index = normalize_dates(bars.index).rename('Date')
+        bars = bars[~bars.index.duplicated(keep='last')].sort_index()
+
+        with self._write_lock():
+            for year, year_bars in bars.groupby(bars.index.year):
+                path = self._partition_path(ticker, int(year))
+                if path.exists():
+                    existing = pd.read_parquet(path).set_index('Date')
+                    year_bars = pd.concat([existing[~existing.index.isin(year_bars.index)], year_bars]).sort_index()
+
+                path.parent.mkdir(parents=True, exist_ok=True)
+                tmp_path = path.with_suffix('.parquet.tmp')
+                pq.write_table(pa.Table.from_pandas(year_bars.reset_index(), preserve_index=False), tmp_path)
+                os.replace(tmp_path, path)
+
+            if start is None and end is None and bars.empty:
+                return 0
+            start = normalize_date(start if start is not None else bars.index.min())
+            end = normalize_date(end if end is not None else bars.index.max())
+            # Another process may have recorded ranges since this one loaded the index
+            self._load_index()
+            ranges = merge_ranges(self.coverage(ticker) + [(start, end)])
+            self.index['tickers'][ticker] = {
+                'ranges': [[s.strftime('%Y-%m-%d'), e.strftime('%Y-%m-%d')] for s, e in ranges]
+            }
+            self._save_index()
+
+        return len(bars)
+
+    def read(
+        self,
+        tickers: List[str],
+        start=None,
+        end=None,
+        fields: Optional[List[str]] = None
+    ) -> pd.DataFrame:
+        """Read bars for a universe and date slice.
+
+        Only the partitions of the requested tickers and years are opened,
+        only the requested fields are read, and row groups outside
+        [start, end] are skipped.
+
+        Args:
+            tickers: Ticker symbols
+            start: First date (inclusive, default: earliest stored)
+            end: Last date (inclusive, default: latest stored)
+            fields: OHLCV fields (default: all)
+
+        Returns:
+            DataFrame with MultiIndex (Date, Ticker) and one column per field
+        """
+        fields = list(fields or FIELDS)
+        start = normalize_date(start) if start is not None else None
+        end = normalize_date(end) if end is not None else None
+
+        paths = []
+        for ticker in tickers:
+            ticker_dir = self.data_dir / f"ticker={quote(ticker, safe='')}"
+            if not ticker_dir.exists():
+                continue
+            for year_dir in ticker_dir.iterdir():
+                year = int(year_dir.name.split('=', 1)[1])
+                if (start is None or year >= start.year) and (end is None or year <= end.year):
+                    paths.append(str(year_dir / 'part.parquet'))
+
+        if not paths:
+            empty_index = pd.MultiIndex.from_arrays([pd.DatetimeIndex([]), []], names=['Date', 'Ticker'])
+            return pd.DataFrame(columns=fields, index=empty_index, dtype='float64')
+
+        dataset = ds.dataset(
+            paths,
+            format='parquet',
+            partitioning=PARTITIONING,
+            partition_base_dir=str(self.data_dir)
+        )
+        condition = None
+        if start is not None:
+            condition = ds.field('Date') >= pa.scalar(start.to_pydatetime())
+        if end is not None:
+            upper = ds.field('Date') <= pa.scalar(end.to_pydatetime())
+            condition = upper if condition is None else condition & upper
+
+        table = dataset.to_table(columns=['Date', 'ticker'] + fields, filter=condition)
+        data = table.to_pandas().rename(columns={'ticker': 'Ticker'})
+        return data.set_index(['Date', 'Ticker']).sort_index()
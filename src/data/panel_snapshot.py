@@ -0,0 +1,154 @@
+"""Memory-mapped dense panel snapshots.
+
+A snapshot is a directory holding one raw float32 array per field plus
+the date and ticker index::
+
+    <dir>/meta.json        fields, shape and caller metadata
+    <dir>/dates.npy        int64 nanosecond timestamps
+    <dir>/tickers.json     column labels
+    <dir>/Close.f32 ...    one array per field
+
+Arrays are ticker-major (each ticker's series is contiguous, the layout
+pandas uses internally for a float block), so PanelSnapshot.field wraps
+the memory map in a DataFrame without copying. Every process opening
+the same snapshot shares the OS page cache instead of re-reading Parquet
+and unstacking its own copy.
+"""
+
+import json
+import os
+import shutil
+import tempfile
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+
+from .calendar import TradingCalendar
+
+
+def write_panel_snapshot(
+    data: pd.DataFrame,
+    directory: str,
+    fields: Optional[List[str]] = None,
+    metadata: Optional[Dict[str, Any]] = None,
+    calendar: Optional[TradingCalendar] = None
+) -> Path:
+    """Write a long (Date, Ticker) frame as a panel snapshot.
+
+    The snapshot is built next to the target and swapped in, so readers
+    never see a partial one.
+
+    Args:
+        data: DataFrame with MultiIndex (Date, Ticker) and one column per field
+        directory: Snapshot directory (replaced if it exists)
+        fields: Fields to include (default: all columns)
+        metadata: Extra JSON-serializable values stored in meta.json
+        calendar: Trading calendar the dates are aligned to (one row per
+            session), so readers never need to realign
+
+    Returns:
+        Snapshot directory
+    """
+    directory = Path(directory)
+    fields = list(fields or data.columns)
+    wide = data[fields].unstack(level='Ticker').sort_index()
+    if calendar is not None:
+        wide = calendar.align(wide)
+    dates = pd.DatetimeIndex(wide.index)
+    tickers = sorted(wide.columns.get_level_values('Ticker').unique())
+
+    directory.parent.mkdir(parents=True, exist_ok=True)
+    tmp_dir = Path(tempfile.mkdtemp(dir=directory.parent, prefix=f".{directory.name}."))
+    try:
+        for field in fields:
+            panel = wide[field].reindex(columns=tickers).to_numpy(dtype=np.float32)
+            array = np.memmap(tmp_dir / f"{field}.f32", dtype=np.float32, mode='w+', shape=(len(tickers), len(dates)))
+            array[:] = panel.T
+            array.flush()
+            del array
+
+        np.save(tmp_dir / 'dates.npy', dates.asi8)
+        with open(tmp_dir / 'tickers.json', 'w') as f:
+            json.dump(tickers, f)
+        with open(tmp_dir / 'meta.json', 'w') as f:
+            json.dump({
+                'fields': fields,
+                'n_dates': len(dates),
+                'n_tickers': len(tickers),
+                'dtype': 'float32',
+                'created_at': datetime.now().isoformat(),
+                'metadata': metadata or {}
+            }, f, indent=2)
+
+        if directory.exists():
+            old_dir = directory.with_name(f".{directory.name}.old.{os.getpid()}")
+            os.replace(directory, old_dir)
+            os.replace(tmp_dir, directory)
+            shutil.rmtree(old_dir, ignore_errors=True)
+        else:
+            os.replace(tmp_dir, directory)
+    except BaseException:
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+        raise
+
+    return directory
+
+
+class PanelSnapshot:
+    """Read-side view of a panel snapshot."""
+
+    def __init__(self, directory: str):
+        """Open a snapshot.
+
+        Args:
+            directory: Snapshot directory written by write_panel_snapshot
+        """
+        self.directory = Path(directory)
+        with open(self.directory / 'meta.json') as f:
+            self.meta = json.load(f)
+        with open(self.directory / 'tickers.json') as f:
+            self.tickers = pd.Index(json.load(f), name='Ticker')
+        self.dates = pd.DatetimeIndex(np.load(self.directory / 'dates.npy'), name='Date')
+        self._frames: Dict[str, pd.DataFrame] = {}
+
+    @staticmethod
+    def exists(directory: str) -> bool:
+        """Whether a complete snapshot is at directory."""
+        return (Path(directory) / 'meta.json').exists()
+
+    @property
+    def fields(self) -> List[str]:
+        """Fields in the snapshot."""
+        return self.meta['fields']
+
+    @property
+    def metadata(self) -> Dict[str, Any]:
+        """Caller metadata stored with the snapshot."""
+        return self.meta.get('metadata', {})
+
+    def field(self, name: str) -> pd.DataFrame:
+        """Dates x tickers DataFrame backed by the memory-mapped array.
+
+        The map is copy-on-write: in-place edits stay private to the
+        process and never reach the file.
+
+        Args:
+            name: Field name (e.g. 'Close')
+
+        Returns:
+            float32 DataFrame sharing memory with the snapshot file
+        """
+        if name not in self._frames:
+            if name not in self.fields:
+                raise KeyError(f"Field {name!r} not in snapshot (has {self.fields})")
+            array = np.memmap(
+                self.directory / f"{name}.f32",
+                dtype=np.float32,
+                mode='c',
+                shape=(len(self.tickers), len(self.dates))
+            )
+            self._frames[name] = pd.DataFrame(array.T, index=self.dates, columns=self.tickers, copy=False)
+        return self._frames[name]
@@ -0,0 +1,83 @@
+"""Market data providers used to fill the MarketDataStore.
+
+A provider returns a ticker's daily OHLCV bars for an inclusive date
+range. YFinanceProvider downloads them; LocalFileProvider serves them
+from a directory of per-ticker files, as an offline stand-in for tests
+and air-gapped runs.
+"""
+
+import time
+from pathlib import Path
+
+import pandas as pd
+import yfinance as yf
+
+
+class MarketDataProvider:
+    """Source of daily OHLCV bars."""
+
+    name = "provider"
+    # Errors not worth retrying
+    permanent_errors: tuple = ()
+
+    def fetch(self, ticker: str, start: pd.Timestamp, end: pd.Timestamp) -> pd.DataFrame:
+        """Fetch bars for one ticker.
+
+        Args:
+            ticker: Ticker symbol
+            start: First date (inclusive)
+            end: Last date (inclusive)
+
+        Returns:
+            DataFrame indexed by date with OHLCV columns (empty if there are
+            no bars in the range)
+        """
+        raise NotImplementedError
+
+
+class YFinanceProvider(MarketDataProvider):
+    """Bars from Yahoo Finance."""
+
+    name = "yfinance"
+
+    def fetch(self, ticker: str, start: pd.Timestamp, end: pd.Timestamp) -> pd.DataFrame:
+        # yfinance treats the end date as exclusive, and without raise_errors
+        # it answers rate limits and request errors with an empty frame
+        return yf.Ticker(ticker).history(start=start, end=end + pd.Timedelta(days=1), raise_errors=True)
+
+
+class LocalFileProvider(MarketDataProvider):
+    """Bars from <directory>/<ticker>.parquet or <directory>/<ticker>.csv.
+
+    Files have a Date column (or index) and OHLCV columns.
+    """
+
+    name = "local"
+    permanent_errors = (FileNotFoundError,)
+
+    def __init__(self, directory: str, latency: float = 0.0):
+        """Initialize the provider.
+
+        Args:
+            directory: Directory with one file per ticker
+            latency: Seconds to wait per request, to simulate a remote source
+        """
+        self.directory = Path(directory)
+        self.latency = latency
+
+    def fetch(self, ticker: str, start: pd.Timestamp, end: pd.Timestamp) -> pd.DataFrame:
+        if self.latency:
+            time.sleep(self.latency)
+        parquet_path = self.directory / f"{ticker}.parquet"
+        csv_path = self.directory / f"{ticker}.csv"
+        if parquet_path.exists():
+            bars = pd.read_parquet(parquet_path)
+        elif csv_path.exists():
+            bars = pd.read_csv(csv_path)
+        else:
+            raise FileNotFoundError(f"No data file for {ticker} in {self.directory}")
+
+        if 'Date' in bars.columns:
+            bars = bars.set_index('Date')
+        bars.index = pd.to_datetime(bars.index)
+        return bars[(bars.index >= start) & (bars.index <= end)]
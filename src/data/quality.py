@@ -0,0 +1,162 @@
+"""Data-quality cleaning and content-hash versioning of price panels.
+
+clean_panels applies the cleaning steps every loader needs (coverage
+filter, bounded forward fill, incomplete-date removal, extreme-move
+removal) to all OHLCV panels at once, with whole-frame operations only,
+and returns a compact report of what it changed.
+
+panel_hash fingerprints the final panels (values, dates and tickers) so
+a result can be traced back to the exact data it was computed on; the
+same hash keys signal caches, so a change in the data never reuses
+signals computed on an older version.
+"""
+
+import hashlib
+import json
+import logging
+from typing import Any, Dict, Union
+
+import numpy as np
+import pandas as pd
+
+logger = logging.getLogger("quantalpha.data")
+
+Panels = Dict[str, pd.DataFrame]
+
+
+def panel_hash(panels: Union[pd.DataFrame, Panels]) -> str:
+    """Stable content hash of one panel or a dict of panels.
+
+    The hash covers field names, tickers, dates and values (as float64,
+    with every NaN treated alike). It does not depend on the dtype width
+    or memory layout, only on the values.
+
+    Args:
+        panels: Dates x tickers DataFrame, or field name -> DataFrame
+
+    Returns:
+        SHA256 hex digest
+    """
+    if isinstance(panels, pd.DataFrame):
+        panels = {'': panels}
+
+    sha256 = hashlib.sha256()
+    for name in sorted(panels):
+        frame = panels[name]
+        header = {
+            'field': name,
+            'columns': [str(column) for column in frame.columns],
+            'shape': list(frame.shape)
+        }
+        sha256.update(json.dumps(header).encode('utf-8'))
+
+        if isinstance(frame.index, pd.DatetimeIndex):
+            sha256.update(frame.index.asi8.tobytes())
+        else:
+            sha256.update(pd.util.hash_pandas_object(frame.index, index=False).to_numpy().tobytes())
+
+        values = np.ascontiguousarray(frame.to_numpy(dtype=np.float64, na_value=np.nan))
+        values[np.isnan(values)] = np.nan
+        sha256.update(values.tobytes())
+
+    return sha256.hexdigest()
+
+
+def clean_panels(
+    panels: Panels,
+    price_field: str = 'Close',
+    min_coverage: float = 0.5,
+    ffill_limit: int = 5,
+    drop_incomplete_dates: bool = True,
+    max_abs_return: float = 0.5
+) -> Dict[str, Any]:
+    """Clean OHLCV panels and report what was changed.
+
+    Steps, all applied to every field:
+    1. Drop tickers whose price coverage is at most min_coverage
+    2. Forward fill gaps of up to ffill_limit dates
+    3. Drop dates where any ticker still has no price (optional; turn
+       off for point-in-time universes, where non-members have no data)
+    4. Drop dates with a daily price move above max_abs_return for any
+       ticker (likely bad ticks)
+
+    Args:
+        panels: Field name -> dates x tickers DataFrame (must contain price_field)
+        price_field: Field used for coverage, completeness and returns
+        min_coverage: Minimum fraction of dates with a price
+        ffill_limit: Maximum consecutive dates to forward fill
+        drop_incomplete_dates: Whether to drop dates with missing prices
+        max_abs_return: Daily absolute return treated as a data error
+
+    Returns:
+        Dictionary with:
+        - panels: Cleaned panels, aligned to the same dates and tickers
+        - returns: Daily returns of price_field (first date dropped;
+          returns across removed extreme-move dates are not recomputed)
+        - report: Compact quality report (counts, dropped tickers, data_hash)
+        - data_hash: panel_hash of the cleaned panels
+    """
+    if price_field not in panels:
+        raise ValueError(f"No {price_field} panel to clean (have {sorted(panels)})")
+
+    prices = panels[price_field]
+    n_dates, n_tickers = prices.shape
+
+    # 1. Coverage filter
+    coverage = prices.notna().mean()
+    keep = coverage.index[coverage > min_coverage]
+    dropped_tickers = [str(ticker) for ticker in coverage.index[coverage <= min_coverage]]
+    panels = {field: panel.reindex(columns=keep) for field, panel in panels.items()}
+
+    # 2. Bounded forward fill
+    missing_before = {field: int(panel.isna().to_numpy().sum()) for field, panel in panels.items()}
+    panels = {field: panel.ffill(limit=ffill_limit) for field, panel in panels.items()}
+    filled_cells = {
+        field: missing_before[field] - int(panel.isna().to_numpy().sum()) for field, panel in panels.items()
+    }
+
+    # 3. Incomplete dates
+    prices = panels[price_field]
+    n_incomplete = 0
+    if drop_incomplete_dates:
+        complete = prices.notna().to_numpy().all(axis=1)
+        n_incomplete = int((~complete).sum())
+        prices = prices[complete]
+
+    # 4. Extreme moves
+    returns = prices.pct_change(fill_method=None).iloc[1:]
+    extreme = (returns.abs().to_numpy() > max_abs_return).any(axis=1)
+    extreme_dates = returns.index[extreme]
+    returns = returns[~extreme]
+
+    dates = prices.index.difference(extreme_dates)
+    panels = {field: panel.reindex(index=dates) for field, panel in panels.items()}
+    data_hash = panel_hash(panels)
+
+    n_cells = panels[price_field].size
+    report = {
+        'input': {'dates': n_dates, 'tickers': n_tickers},
+        'output': {'dates': len(dates), 'tickers': len(keep)},
+        'dropped_tickers': dropped_tickers,
+        'filled_cells': filled_cells,
+        'dropped_incomplete_dates': n_incomplete,
+        'dropped_extreme_dates': [str(date.date()) for date in extreme_dates],
+        'missing_rate': float(panels[price_field].isna().to_numpy().sum() / n_cells) if n_cells else 0.0,
+        'data_hash': data_hash
+    }
+
+    logger.info(
+        "Cleaned %s: %d/%d tickers, %d/%d dates kept (%d incomplete, %d extreme), hash %s",
+        price_field, len(keep), n_tickers, len(dates), n_dates,
+        n_incomplete, len(extreme_dates), data_hash[:12]
+    )
+    if dropped_tickers:
+        logger.warning("Dropped %d tickers with <=%.0f%% coverage: %s",
+                       len(dropped_tickers), min_coverage * 100, ', '.join(dropped_tickers))
+
+    return {
+        'panels': panels,
+        'returns': returns,
+        'report': report,
+        'data_hash': data_hash
+    }
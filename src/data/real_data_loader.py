@@ -4,6 +4,8 @@ import yfinance as yf
 from datetime import datetime
 import numpy as np
 
+from .quality import clean_panels
+
 def load_real_data(universe="sp500", start_date="2004-01-01", end_date="2024-12-31", num_tickers=20):
     """Load real market data from Yahoo Finance with full OHLCV data.
     
@@ -61,51 +63,22 @@ def load_real_data(universe="sp500", start_date="2004-01-01", end_date="2024-12-
     else:
         raise ValueError("No Close data available")
     
-    # Data quality filtering
-    print("\n📊 Data Quality Check:")
-    initial_tickers = len(prices.columns)
-    
-    # Remove tickers with insufficient data
-    coverage = prices.notna().sum() / len(prices)
-    valid_tickers = coverage[coverage > 0.5].index.tolist()
-    
-    # Filter all OHLCV data to valid tickers
-    prices = prices[valid_tickers]
-    for field in list(ohlcv.keys()):
-        ohlcv[field] = ohlcv[field][valid_tickers]
-    
-    if len(valid_tickers) < initial_tickers:
-        dropped = initial_tickers - len(valid_tickers)
-        print(f"   ⚠️  Dropped {dropped} tickers with <50% data coverage")
-    
-    # Forward fill missing values (max 5 days)
-    prices = prices.ffill(limit=5)
-    for field in ohlcv:
-        ohlcv[field] = ohlcv[field].ffill(limit=5)
+    # Data quality cleaning (coverage, ffill, incomplete dates, extreme moves)
+    cleaned = clean_panels(ohlcv, price_field='Close', min_coverage=0.5, ffill_limit=5, max_abs_return=0.5)
+    ohlcv = cleaned['panels']
+    prices = ohlcv['Close']
+    returns = cleaned['returns']
+    quality = cleaned['report']
+    valid_tickers = prices.columns.tolist()
     
-    # Drop any remaining rows with NaN
-    initial_rows = len(prices)
-    prices = prices.dropna()
-    
-    # Align all OHLCV data to same index
-    common_index = prices.index
-    for field in ohlcv:
-        ohlcv[field] = ohlcv[field].loc[common_index]
-    
-    if len(prices) < initial_rows:
-        print(f"   ⚠️  Dropped {initial_rows - len(prices)} days with missing data")
-    
-    # Calculate returns
-    returns = prices.pct_change().iloc[1:].copy()  # Drop first row of NaN
-    
-    # Remove any extreme outliers (>50% daily move, likely data errors)
-    extreme_moves = (returns.abs() > 0.5).any(axis=1)
-    if extreme_moves.sum() > 0:
-        print(f"   ⚠️  Found {extreme_moves.sum()} days with extreme moves (>50%), removing...")
-        returns = returns[~extreme_moves]
-        prices = prices.loc[returns.index]
-        for field in ohlcv:
-            ohlcv[field] = ohlcv[field].loc[returns.index]
+    print("\n📊 Data Quality Check:")
+    if quality['dropped_tickers']:
+        print(f"   ⚠️  Dropped {len(quality['dropped_tickers'])} tickers with <50% data coverage")
+    if quality['dropped_incomplete_dates']:
+        print(f"   ⚠️  Dropped {quality['dropped_incomplete_dates']} days with missing data")
+    if quality['dropped_extreme_dates']:
+        print(f"   ⚠️  Removed {len(quality['dropped_extreme_dates'])} days with extreme moves (>50%)")
+    print(f"   • Data hash: {cleaned['data_hash'][:16]}")
     
     print(f"\n✅ Successfully loaded:")
     print(f"   • Tickers: {len(valid_tickers)}")
@@ -140,7 +113,9 @@ def load_real_data(universe="sp500", start_date="2004-01-01", end_date="2024-12-
             "download_timestamp": datetime.now().isoformat(),
             "start_date": str(prices.index[0].date()),
             "end_date": str(prices.index[-1].date()),
-            "fields_available": list(ohlcv.keys())
+            "fields_available": list(ohlcv.keys()),
+            "data_hash": cleaned['data_hash'],
+            "data_quality": quality
         }
     }
 
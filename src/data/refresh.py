@@ -0,0 +1,158 @@
+"""Incremental, concurrent refresh of the MarketDataStore.
+
+Only the date ranges a ticker is missing are requested from the
+provider; for a store refreshed daily that is the last few days.
+Tickers are fetched from a thread pool (provider calls are I/O bound),
+throttled by a token bucket and retried with exponential backoff, and
+each ticker's bars are written to the store as soon as they arrive.
+
+A settled range is recorded as fetched even without bars only when the
+trading calendar has no sessions in it; an empty answer for a range
+with sessions is treated as a failed request, so it is asked for again.
+"""
+
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+import pandas as pd
+
+from .calendar import TradingCalendar
+from .market_store import MarketDataStore, normalize_date, normalize_dates
+from .providers import MarketDataProvider
+
+
+class EmptyResponseError(RuntimeError):
+    """The provider returned no bars for a range with trading sessions."""
+
+
+class TokenBucket:
+    """Thread-safe token bucket limiting the request rate."""
+
+    def __init__(self, rate: float, capacity: Optional[float] = None):
+        """Initialize the bucket (full).
+
+        Args:
+            rate: Tokens added per second
+            capacity: Maximum burst (default: one second's worth, at least 1)
+        """
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else max(1.0, rate)
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        """Take one token, waiting until one is available."""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self.rate
+            time.sleep(wait)
+
+
+def refresh_store(
+    store: MarketDataStore,
+    provider: MarketDataProvider,
+    tickers: List[str],
+    start,
+    end,
+    settle_days: int = 3,
+    max_workers: int = 1,
+    rate_limit: Optional[float] = None,
+    max_retries: int = 2,
+    backoff: float = 0.5,
+    calendar: Optional[TradingCalendar] = None
+) -> Dict[str, Any]:
+    """Fetch the missing parts of [start, end] for each ticker.
+
+    Ranges ending within settle_days of today are recorded as fetched only
+    up to their last bar, since the provider may not have published the
+    latest bars yet; the rest is asked for again on the next refresh. An
+    empty response for settled days that include sessions is retried and
+    then reported as failed, and its range stays missing.
+
+    Args:
+        store: Market data store to fill
+        provider: Source of bars
+        tickers: Ticker symbols
+        start: First date (inclusive)
+        end: Last date (inclusive)
+        settle_days: Calendar days before today treated as not yet final
+        max_workers: Maximum provider requests in flight
+        rate_limit: Maximum provider requests per second (None: unlimited)
+        max_retries: Retries per request after a failure
+        backoff: Delay before the first retry; doubles on each retry
+        calendar: Trading calendar deciding whether a range should have
+            bars (default: NYSE)
+
+    Returns:
+        Dictionary with 'ranges' (ranges fetched), 'bars' (bars written),
+        'retries' and 'failed' (ticker -> error message)
+    """
+    settled = normalize_date(datetime.now()) - pd.Timedelta(days=settle_days)
+    calendar = calendar or TradingCalendar()
+    bucket = TokenBucket(rate_limit) if rate_limit else None
+    stats = {'ranges': 0, 'bars': 0, 'retries': 0, 'failed': {}}
+    stats_lock = threading.Lock()
+
+    def fetch(ticker: str, gap_start: pd.Timestamp, gap_end: pd.Timestamp) -> pd.DataFrame:
+        for attempt in range(max_retries + 1):
+            if bucket:
+                bucket.acquire()
+            try:
+                bars = provider.fetch(ticker, gap_start, gap_end)
+                if len(bars) == 0 and len(calendar.sessions_between(gap_start, min(gap_end, settled))):
+                    raise EmptyResponseError(
+                        f"No bars for {ticker} from {gap_start.date()} to {gap_end.date()}"
+                    )
+                return bars
+            except provider.permanent_errors:
+                raise
+            except Exception:
+                if attempt == max_retries:
+                    raise
+                with stats_lock:
+                    stats['retries'] += 1
+                time.sleep(backoff * 2 ** attempt * random.uniform(0.5, 1.0))
+
+    def refresh_ticker(ticker: str):
+        for gap_start, gap_end in store.missing_ranges(ticker, start, end):
+            try:
+                bars = fetch(ticker, gap_start, gap_end)
+            except Exception as e:
+                with stats_lock:
+                    stats['failed'][ticker] = str(e)
+                return
+
+            dates = normalize_dates(bars.index)
+            bars = bars[(dates >= gap_start) & (dates <= gap_end)]
+
+            recorded_end = gap_end
+            if gap_end > settled:
+                if len(bars) == 0:
+                    continue
+                recorded_end = min(gap_end, normalize_date(bars.index.max()))
+
+            # Written as soon as it arrives, so an interrupted refresh keeps finished tickers
+            n_bars = store.write(ticker, bars, start=gap_start, end=recorded_end)
+            with stats_lock:
+                stats['bars'] += n_bars
+                stats['ranges'] += 1
+
+    if max_workers <= 1:
+        for ticker in tickers:
+            refresh_ticker(ticker)
+    else:
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            list(executor.map(refresh_ticker, tickers))
+
+    return stats
@@ -0,0 +1,164 @@
+"""Point-in-time universe membership.
+
+Index constituents change over time; backtesting on today's members only
+is survivorship bias. Membership is read from a constituent file per
+universe::
+
+    configs/universes/<universe>.csv
+
+with one row per membership spell::
+
+    ticker,start_date,end_date
+    AAPL,1982-11-30,
+    XYZ,2005-03-01,2012-06-15
+
+An empty start_date means "since before the data begins" and an empty
+end_date means "still a member". A ticker that leaves and re-joins has
+one row per spell.
+
+UniverseMembership.mask turns the spells into a boolean dates x tickers
+matrix with a single cumulative sum, and apply_universe_mask blanks out
+non-members so cross-sectional code (ranks, deciles, IC) only sees the
+names that were in the index on each date.
+"""
+
+from pathlib import Path
+from typing import List, Optional
+
+import numpy as np
+import pandas as pd
+
+from .market_store import normalize_date, normalize_dates
+
+UNIVERSES_DIR = Path("configs/universes")
+
+
+class UniverseMembership:
+    """Membership spells of one universe."""
+
+    def __init__(self, name: str, spells: pd.DataFrame):
+        """Initialize from membership spells.
+
+        Args:
+            name: Universe name (e.g. 'sp500')
+            spells: DataFrame with 'ticker', 'start_date' and 'end_date'
+                columns; missing dates mean an open-ended spell
+        """
+        self.name = name
+        spells = spells[['ticker', 'start_date', 'end_date']].copy()
+        spells['ticker'] = spells['ticker'].astype(str).str.strip()
+        for column in ('start_date', 'end_date'):
+            dates = pd.to_datetime(spells[column])
+            if dates.dt.tz is not None:
+                dates = dates.dt.tz_localize(None)
+            spells[column] = dates.dt.normalize()
+        self.spells = spells.sort_values(['ticker', 'start_date'], na_position='first').reset_index(drop=True)
+
+    @classmethod
+    def load(cls, name: str, directory: Optional[str] = None) -> 'UniverseMembership':
+        """Load a universe from its constituent file.
+
+        Args:
+            name: Universe name (sp500, nasdaq100, russell1000, ...)
+            directory: Directory of constituent files (default: configs/universes)
+
+        Returns:
+            UniverseMembership
+
+        Raises:
+            ValueError: If there is no constituent file for the universe
+        """
+        path = Path(directory or UNIVERSES_DIR) / f"{name}.csv"
+        if not path.exists():
+            raise ValueError(f"Unknown universe: {name} (no constituent file at {path})")
+        return cls(name, pd.read_csv(path, comment='#', dtype={'ticker': str}))
+
+    @property
+    def tickers(self) -> List[str]:
+        """Every ticker that was ever a member."""
+        return sorted(self.spells['ticker'].unique())
+
+    def _active(self, start: Optional[pd.Timestamp], end: Optional[pd.Timestamp]) -> pd.Series:
+        """Spells overlapping [start, end] (None: unbounded)."""
+        active = pd.Series(True, index=self.spells.index)
+        if end is not None:
+            active &= self.spells['start_date'].isna() | (self.spells['start_date'] <= end)
+        if start is not None:
+            active &= self.spells['end_date'].isna() | (self.spells['end_date'] >= start)
+        return active
+
+    def members(self, as_of) -> List[str]:
+        """Tickers in the universe on a date."""
+        as_of = normalize_date(as_of)
+        return sorted(self.spells.loc[self._active(as_of, as_of), 'ticker'].unique())
+
+    def members_between(self, start=None, end=None) -> List[str]:
+        """Tickers that were members at any point in [start, end].
+
+        This is the survivorship-free set of names to load for a backtest
+        over the period.
+        """
+        start = normalize_date(start) if start is not None else None
+        end = normalize_date(end) if end is not None else None
+        return sorted(self.spells.loc[self._active(start, end), 'ticker'].unique())
+
+    def mask(self, dates, tickers: Optional[List[str]] = None) -> pd.DataFrame:
+        """Boolean membership matrix.
+
+        Each spell adds +1 at its first date and -1 after its last one; a
+        cumulative sum down the dates then marks every member cell.
+
+        Args:
+            dates: Dates (rows), e.g. the price panel's index
+            tickers: Tickers (columns, default: self.tickers); tickers that
+                were never members are all False
+
+        Returns:
+            Dates x tickers DataFrame of bool
+        """
+        index = pd.DatetimeIndex(dates)
+        lookup = normalize_dates(index)
+        tickers = pd.Index(self.tickers if tickers is None else tickers)
+
+        spells = self.spells
+        columns = tickers.get_indexer(spells['ticker'])
+        spells = spells[columns >= 0]
+        columns = columns[columns >= 0]
+
+        first = np.where(
+            spells['start_date'].isna(), 0,
+            lookup.searchsorted(spells['start_date'].fillna(pd.Timestamp.min), side='left')
+        )
+        last = np.where(
+            spells['end_date'].isna(), len(lookup),
+            lookup.searchsorted(spells['end_date'].fillna(pd.Timestamp.max), side='right')
+        )
+
+        events = np.zeros((len(lookup) + 1, len(tickers)), dtype=np.int32)
+        np.add.at(events, (first, columns), 1)
+        np.add.at(events, (last, columns), -1)
+        membership = np.cumsum(events[:-1], axis=0) > 0
+
+        return pd.DataFrame(membership, index=index, columns=tickers)
+
+    def __repr__(self) -> str:
+        return f"UniverseMembership({self.name!r}, tickers={len(self.tickers)}, spells={len(self.spells)})"
+
+
+def apply_universe_mask(frame: pd.DataFrame, mask: Optional[pd.DataFrame]) -> pd.DataFrame:
+    """Set cells outside the universe to NaN.
+
+    Dates or tickers missing from the mask count as non-members.
+
+    Args:
+        frame: Dates x tickers DataFrame
+        mask: Boolean membership matrix (None: frame is returned unchanged)
+
+    Returns:
+        Masked DataFrame
+    """
+    if mask is None:
+        return frame
+    if not (mask.index.equals(frame.index) and mask.columns.equals(frame.columns)):
+        mask = mask.reindex(index=frame.index, columns=frame.columns, fill_value=False)
+    return frame.where(mask.to_numpy(dtype=bool))
@@ -0,0 +1,70 @@
+"""Per-candidate state shared by the feature, screening and backtest steps.
+
+A CandidateContext parses and lookahead-validates a factor YAML once, and
+compute_factor caches its result on the context, so the agents and tools
+handling the same candidate do not repeat that work. A context belongs to
+one candidate on one prices panel.
+"""
+
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional
+
+import pandas as pd
+
+from ..memory.factor_registry import FactorSpec
+from .dsl import DSLParser
+
+
+@dataclass
+class CandidateContext:
+    """Parsed spec, validation result and computed signals for one candidate."""
+
+    factor_yaml: str
+    spec: Optional[FactorSpec] = None
+    parse_error: Optional[str] = None
+    is_valid: bool = False
+    warnings: List[str] = field(default_factory=list)
+    # compute_factor result, set on first computation
+    result: Optional[Dict[str, Any]] = None
+
+    @classmethod
+    def from_yaml(cls, factor_yaml: str, parser: Optional[DSLParser] = None) -> 'CandidateContext':
+        """Parse and lookahead-validate a factor YAML.
+
+        Parse errors are recorded in parse_error rather than raised.
+
+        Args:
+            factor_yaml: Factor DSL YAML
+            parser: Parser to reuse
+
+        Returns:
+            CandidateContext with spec, is_valid and warnings set
+        """
+        parser = parser or DSLParser()
+        context = cls(factor_yaml=factor_yaml)
+        try:
+            context.spec = parser.parse(factor_yaml)
+        except Exception as e:
+            context.parse_error = str(e)
+            return context
+
+        context.is_valid, context.warnings = parser.validate_no_lookahead(context.spec)
+        return context
+
+    @property
+    def signals(self) -> Optional[pd.DataFrame]:
+        """Computed signal panel, or None if not computed (or computation failed)."""
+        return self.result['signals'] if self.result else None
+
+    def attach_signals(self, signals_df: pd.DataFrame):
+        """Use signals computed elsewhere (e.g. restored from a checkpoint).
+
+        Args:
+            signals_df: Signal panel for this candidate
+        """
+        self.result = {
+            'signals': signals_df,
+            'schema': None,
+            'warnings': list(self.warnings),
+            'error': None
+        }
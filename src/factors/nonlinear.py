@@ -4,13 +4,25 @@ This module executes custom Python code to generate factor signals,
 with security validation and sandboxed execution.
 """
 
+import ast
 import pandas as pd
 import numpy as np
-from typing import Dict, Any, Optional, Tuple, List
+from typing import Dict, Any, Optional, Tuple, List, Set
 from pathlib import Path
 
 from .code_validator import CodeValidator
 from .sandbox import SandboxExecutor
+from ..data.market_data import FIELD_NAMES, MarketData
+
+
+def referenced_fields(code: str) -> Set[str]:
+    """OHLCV variable names (open, high, low, close, volume) used by code."""
+    try:
+        tree = ast.parse(code)
+    except SyntaxError:
+        return set()
+    names = {node.id for node in ast.walk(tree) if isinstance(node, ast.Name)}
+    return names & set(FIELD_NAMES)
 
 
 class NonlinearFactorExecutor:
@@ -37,14 +49,20 @@ class NonlinearFactorExecutor:
         code: str,
         prices: pd.DataFrame,
         returns: pd.DataFrame,
+        market_data: Optional[MarketData] = None,
         **kwargs
     ) -> Dict[str, Any]:
         """Execute custom Python code to generate factor signals.
         
+        Besides prices and returns, the code sees `data` (the MarketData)
+        and, for each of open/high/low/close/volume it mentions, that
+        panel; fields the code does not use are never materialized.
+        
         Args:
             code: Python code to execute
             prices: Price DataFrame (dates x tickers)
             returns: Returns DataFrame (dates x tickers)
+            market_data: OHLCV panels (default: just prices and returns)
             **kwargs: Additional variables to pass to code
             
         Returns:
@@ -72,13 +90,19 @@ class NonlinearFactorExecutor:
                 }
         
         # 2. Prepare execution environment
+        if market_data is None:
+            market_data = MarketData.from_frames(close=prices, returns=returns)
         global_vars = {
             'prices': prices,
             'returns': returns,
+            'data': market_data,
             'pd': pd,
-            'np': np,
-            **kwargs
+            'np': np
         }
+        for name in referenced_fields(code):
+            if name in market_data:
+                global_vars[name] = market_data.field(name)
+        global_vars.update(kwargs)
         
         # 3. Execute code in sandbox
         result = self.sandbox.execute(code, global_vars=global_vars)
@@ -191,6 +215,7 @@ def execute_nonlinear_factor(
     prices: pd.DataFrame,
     returns: pd.DataFrame,
     timeout: int = 60,
+    market_data: Optional[MarketData] = None,
     **kwargs
 ) -> Dict[str, Any]:
     """Convenience function to execute nonlinear factor code.
@@ -200,10 +225,11 @@ def execute_nonlinear_factor(
         prices: Price DataFrame
         returns: Returns DataFrame
         timeout: Timeout in seconds
+        market_data: OHLCV panels available to the code
         **kwargs: Additional variables
         
     Returns:
         Execution result dictionary
     """
     executor = NonlinearFactorExecutor(timeout=timeout)
-    return executor.execute_custom_code(code, prices, returns, **kwargs)
+    return executor.execute_custom_code(code, prices, returns, market_data=market_data, **kwargs)
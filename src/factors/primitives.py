@@ -4,6 +4,8 @@ import numpy as np
 import pandas as pd
 from typing import Union, Optional, Tuple
 
+from ..data.universe import apply_universe_mask
+
 
 def RET_LAG(lag: int, period: int, prices: pd.Series) -> pd.Series:
     """Calculate lagged return over a period.
@@ -169,8 +171,14 @@ def KURTOSIS(series: pd.Series, window: int) -> pd.Series:
     return series.rolling(window=window).kurt()
 
 
-def RANK(series: pd.Series) -> pd.Series:
-    """Cross-sectional rank (0 to 1)."""
+def RANK(series: pd.Series, mask: Optional[pd.DataFrame] = None) -> pd.Series:
+    """Cross-sectional rank (0 to 1).
+    
+    A universe membership mask (dates x tickers) leaves non-members
+    unranked (NaN) when series is a DataFrame.
+    """
+    if mask is not None and isinstance(series, pd.DataFrame):
+        series = apply_universe_mask(series, mask)
     return series.rank(pct=True)
 
 
@@ -391,7 +399,8 @@ def ADV(volume: pd.Series, window: int = 20) -> pd.Series:
 def INDNEUTRALIZE(
     series: pd.Series,
     industry_map: Optional[pd.Series] = None,
-    method: str = "demean"
+    method: str = "demean",
+    mask: Optional[pd.DataFrame] = None
 ) -> pd.Series:
     """Industry neutralization.
     
@@ -401,11 +410,14 @@ def INDNEUTRALIZE(
         series: Input series (can be DataFrame for cross-sectional)
         industry_map: Series mapping tickers to industries (if None, uses simple demean)
         method: Neutralization method ('demean' or 'zscore')
+        mask: Universe membership (dates x tickers); for a DataFrame,
+            means are taken over members only and non-members become NaN
     
     Returns:
         Industry-neutralized series
     """
     if isinstance(series, pd.DataFrame):
+        series = apply_universe_mask(series, mask)
         # Cross-sectional neutralization
         if industry_map is None:
             # Simple cross-sectional demean
@@ -447,7 +459,8 @@ def SCALE(series: pd.Series, scale: float = 1.0) -> pd.Series:
 def INDCLASS_NEUTRALIZE(
     series: pd.DataFrame,
     indclass: pd.Series,
-    method: str = "demean"
+    method: str = "demean",
+    mask: Optional[pd.DataFrame] = None
 ) -> pd.DataFrame:
     """Industry class neutralization (wrapper for INDNEUTRALIZE).
     
@@ -455,11 +468,12 @@ def INDCLASS_NEUTRALIZE(
         series: Cross-sectional data (DataFrame)
         indclass: Industry classification series
         method: Neutralization method
+        mask: Universe membership (dates x tickers)
     
     Returns:
         Industry-neutralized DataFrame
     """
-    return INDNEUTRALIZE(series, industry_map=indclass, method=method)
+    return INDNEUTRALIZE(series, industry_map=indclass, method=method, mask=mask)
 
 
 def SUM(series: pd.Series, window: int) -> pd.Series:
@@ -0,0 +1,68 @@
+"""Compact sketches of signal panels for near-duplicate factor detection.
+
+A signal panel (dates x tickers) is z-scored and folded into a fixed-length
+vector with a count sketch: every (date, ticker) cell is hashed to one
+bucket and a random sign. The hash depends only on the date
+and ticker, so panels over different date ranges or universes share a
+grid, and the dot product of two unit-norm sketches approximates the
+correlation of the panels over their common cells.
+"""
+
+import zlib
+
+import numpy as np
+import pandas as pd
+
+# Sketch length; the correlation estimate has an error of roughly 1/sqrt(dim)
+FINGERPRINT_DIM = 1024
+
+_MIX_1 = np.uint64(0xBF58476D1CE4E5B9)
+_MIX_2 = np.uint64(0x94D049BB133111EB)
+
+
+def _mix64(keys: np.ndarray) -> np.ndarray:
+    """splitmix64 finalizer: spreads integer keys over 64 bits."""
+    with np.errstate(over='ignore'):
+        keys = (keys ^ (keys >> np.uint64(30))) * _MIX_1
+        keys = (keys ^ (keys >> np.uint64(27))) * _MIX_2
+        return keys ^ (keys >> np.uint64(31))
+
+
+def signal_fingerprint(signals_df: pd.DataFrame, dim: int = FINGERPRINT_DIM) -> np.ndarray:
+    """Sketch a signal panel into a unit-norm float32 vector.
+
+    Args:
+        signals_df: Date-indexed signal panel with ticker columns
+        dim: Sketch length
+
+    Returns:
+        Array of shape (dim,); all zeros if the panel has no usable values
+    """
+    values = signals_df.to_numpy(dtype=float)
+    valid = np.isfinite(values)
+
+    # Z-score over the whole panel, so signals broadcast to every ticker
+    # (time-series only) are compared as well as cross-sectional ones
+    z = np.zeros_like(values)
+    if valid.sum() > 1:
+        std = values[valid].std()
+        if std > 1e-12:
+            z[valid] = (values[valid] - values[valid].mean()) / std
+
+    date_keys = pd.DatetimeIndex(signals_df.index).normalize().asi8.astype(np.uint64)
+    ticker_keys = np.array(
+        [zlib.crc32(str(ticker).encode('utf-8')) for ticker in signals_df.columns],
+        dtype=np.uint64
+    )
+    with np.errstate(over='ignore'):
+        cell_keys = _mix64(_mix64(date_keys)[:, None] + ticker_keys[None, :])
+
+    buckets = (cell_keys % np.uint64(dim)).astype(np.intp)
+    signs = np.where((cell_keys >> np.uint64(63)) == 1, -1.0, 1.0)
+
+    sketch = np.bincount(buckets.ravel(), weights=(signs * z).ravel(), minlength=dim)
+    norm = np.linalg.norm(sketch)
+    if norm > 0:
+        sketch = sketch / norm
+
+    return sketch.astype(np.float32)
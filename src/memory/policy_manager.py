@@ -39,7 +39,8 @@ class PolicyManager:
                 "iteration_limits": {
                     "max_iterations": 10,
                     "early_stop_sharpe": 2.0
-                }
+                },
+                "screening": {}
             }
         
         with open(self.rules_path, 'r') as f:
@@ -217,3 +218,11 @@ class PolicyManager:
             Early stop Sharpe threshold
         """
         return self.rules['iteration_limits']['early_stop_sharpe']
+    
+    def get_screening_thresholds(self) -> Dict[str, Any]:
+        """Get thresholds for the pre-backtest screening cascade.
+        
+        Returns:
+            Screening thresholds (missing keys fall back to the cascade defaults)
+        """
+        return dict(self.rules.get('screening', {}))
@@ -1,14 +1,43 @@
-"""SQLite database schema for storing experiments, runs, metrics, issues, and lessons."""
+"""SQLite database schema for storing experiments, runs, metrics, issues, and lessons.
 
+The database is shared by several processes (orchestrator, queue workers,
+dashboard, daily workflow). Connections run in WAL mode, so readers do not
+wait for writers, with a busy timeout instead of failing on a locked file.
+Each process keeps one pooled engine per database file, and RunWriter lets
+many workers funnel their runs through a single batched writer.
+"""
+
+import logging
+import multiprocessing
+import os
+import queue
 import sqlite3
+import threading
+import time
 from datetime import datetime
 from pathlib import Path
-from typing import Optional, Dict, List, Any
+from typing import Optional, Dict, List, Any, Tuple
 import json
 
-from sqlalchemy import create_engine, Column, Integer, String, Float, DateTime, Text, ForeignKey, JSON
+import numpy as np
+from sqlalchemy import event, create_engine, Column, Integer, String, Float, DateTime, Text, ForeignKey, JSON, LargeBinary, func
+from sqlalchemy.engine import Engine
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker, relationship, Session
+from sqlalchemy.pool import QueuePool
+
+logger = logging.getLogger("quantalpha.memory")
+
+# Seconds a connection waits for another process's write lock
+SQLITE_BUSY_TIMEOUT = 30.0
+
+SQLITE_PRAGMAS = (
+    f"PRAGMA busy_timeout={int(SQLITE_BUSY_TIMEOUT * 1000)}",
+    # Readers see the last commit while a write is in progress
+    "PRAGMA journal_mode=WAL",
+    # In WAL mode a crash can lose the last commits but never corrupts the file
+    "PRAGMA synchronous=NORMAL"
+)
 
 Base = declarative_base()
 
@@ -116,15 +145,119 @@ class Lesson(Base):
     # Additional metadata
     meta_data = Column(JSON)
 
+
+class SignalFingerprint(Base):
+    """Count-sketch fingerprints of computed signal panels."""
+    __tablename__ = "signal_fingerprints"
+    
+    id = Column(Integer, primary_key=True)
+    factor_id = Column(Integer, ForeignKey("factors.id"), nullable=True, index=True)
+    name = Column(String, nullable=False)
+    dim = Column(Integer, nullable=False)
+    sketch = Column(LargeBinary, nullable=False)  # float32 bytes, unit norm
+    created_at = Column(DateTime, default=datetime.utcnow)
+
+
+class SchedulerDecision(Base):
+    """Successive-halving scheduler decisions and CPU budget usage."""
+    __tablename__ = "scheduler_decisions"
+    
+    id = Column(Integer, primary_key=True)
+    cycle_id = Column(String, nullable=False, index=True)
+    day = Column(String, nullable=False, index=True)  # YYYY-MM-DD the budget applies to
+    candidate = Column(String, nullable=False)
+    rung = Column(Integer, nullable=False)
+    history_days = Column(Integer)  # None = full history
+    n_splits = Column(Integer)
+    score = Column(Float)
+    cpu_seconds = Column(Float, default=0.0)
+    decision = Column(String, nullable=False)  # promoted, eliminated, completed, budget_exhausted
+    budget_seconds = Column(Float)
+    created_at = Column(DateTime, default=datetime.utcnow)
+
+
+# One engine per (process, database file); engines must not cross a fork
+_ENGINES: Dict[Tuple[int, str], Engine] = {}
+
+
+def _set_sqlite_pragmas(dbapi_connection, connection_record):
+    """Configure each new SQLite connection for concurrent access."""
+    cursor = dbapi_connection.cursor()
+    try:
+        for pragma in SQLITE_PRAGMAS:
+            cursor.execute(pragma)
+    finally:
+        cursor.close()
+
+
+def get_engine(db_path: str = "experiments.db", pool_size: int = 5) -> Engine:
+    """Get the process-wide engine for a database, creating the schema once.
+    
+    Connections are pooled and may be used from any thread; each one is
+    set up with SQLITE_PRAGMAS when it is opened. WAL needs shared memory,
+    so the database must be on a local filesystem.
+    
+    Args:
+        db_path: SQLite database path
+        pool_size: Connections kept open (threads beyond it get temporary ones)
+    
+    Returns:
+        Engine shared by every ExperimentStore on db_path in this process
+    """
+    path = Path(db_path)
+    key = (os.getpid(), str(path.resolve()))
+    engine = _ENGINES.get(key)
+    # A deleted file would be recreated empty by the cached engine
+    if engine is None or not path.exists():
+        if engine is not None:
+            engine.dispose()
+        engine = create_engine(
+            f"sqlite:///{path}",
+            echo=False,
+            poolclass=QueuePool,
+            pool_size=pool_size,
+            max_overflow=2 * pool_size,
+            connect_args={'timeout': SQLITE_BUSY_TIMEOUT, 'check_same_thread': False}
+        )
+        event.listen(engine, "connect", _set_sqlite_pragmas)
+        Base.metadata.create_all(engine)
+        _ENGINES[key] = engine
+    return engine
+
+
+def _metric_from_dict(metrics_dict: Dict[str, Any], **kwargs) -> Metric:
+    """Build a Metric row from a backtest metrics dictionary."""
+    return Metric(
+        ann_ret=metrics_dict.get("ann_ret"),
+        ann_vol=metrics_dict.get("ann_vol"),
+        sharpe=metrics_dict.get("sharpe"),
+        maxdd=metrics_dict.get("maxdd"),
+        avg_ic=metrics_dict.get("avg_ic"),
+        ic_std=metrics_dict.get("ic_std"),
+        ir=metrics_dict.get("ir"),
+        turnover=metrics_dict.get("turnover"),
+        turnover_monthly=metrics_dict.get("turnover_monthly"),
+        hit_rate=metrics_dict.get("hit_rate"),
+        skew=metrics_dict.get("skew"),
+        kurt=metrics_dict.get("kurt"),
+        additional_metrics=metrics_dict.get("additional_metrics", {}),
+        **kwargs
+    )
+
+
 class ExperimentStore:
     """Interface for interacting with the experiment database."""
     
     def __init__(self, db_path: str = "experiments.db"):
         """Initialize the store with a SQLite database."""
         self.db_path = Path(db_path)
-        self.engine = create_engine(f"sqlite:///{self.db_path}", echo=False)
-        Base.metadata.create_all(self.engine)
+        self.engine = get_engine(db_path)
         self.SessionLocal = sessionmaker(bind=self.engine)
+        
+        # In-memory copy of the fingerprint table, extended incrementally
+        self._fingerprint_ids: List[int] = []
+        self._fingerprint_meta: List[Dict[str, Any]] = []
+        self._fingerprint_matrix: Optional[np.ndarray] = None
     
     def get_session(self) -> Session:
         """Get a database session."""
@@ -208,23 +341,7 @@ class ExperimentStore:
         """Create metrics for a run."""
         session = self.get_session()
         try:
-            # Extract standard metrics
-            metric = Metric(
-                run_id=run_id,
-                ann_ret=metrics_dict.get("ann_ret"),
-                ann_vol=metrics_dict.get("ann_vol"),
-                sharpe=metrics_dict.get("sharpe"),
-                maxdd=metrics_dict.get("maxdd"),
-                avg_ic=metrics_dict.get("avg_ic"),
-                ic_std=metrics_dict.get("ic_std"),
-                ir=metrics_dict.get("ir"),
-                turnover=metrics_dict.get("turnover"),
-                turnover_monthly=metrics_dict.get("turnover_monthly"),
-                hit_rate=metrics_dict.get("hit_rate"),
-                skew=metrics_dict.get("skew"),
-                kurt=metrics_dict.get("kurt"),
-                additional_metrics=metrics_dict.get("additional_metrics", {})
-            )
+            metric = _metric_from_dict(metrics_dict, run_id=run_id)
             session.add(metric)
             session.commit()
             session.refresh(metric)
@@ -282,6 +399,288 @@ class ExperimentStore:
         finally:
             session.close()
     
+    def log_run(
+        self,
+        factor_id: int,
+        start_date: datetime,
+        end_date: datetime,
+        metrics: Dict[str, Any],
+        issues: Optional[List[Dict[str, Any]]] = None,
+        lessons: Optional[List[Dict[str, Any]]] = None,
+        status: str = "completed",
+        **run_fields
+    ) -> Run:
+        """Record a run with its metrics, issues and lessons in one transaction.
+        
+        Args:
+            factor_id: Factor ID
+            start_date: Start date
+            end_date: End date
+            metrics: Metrics dictionary (keys as in create_metrics)
+            issues: Issue dicts with type, detail and severity
+            lessons: Lesson dicts with the create_lesson arguments; their
+                source_run_id is set to the new run
+            status: Run status
+            **run_fields: Other Run columns (in_sample_start, seed, regime_label, ...)
+        
+        Returns:
+            The Run, with its metrics and issues loaded
+        """
+        return self.log_runs([{
+            'factor_id': factor_id,
+            'start_date': start_date,
+            'end_date': end_date,
+            'metrics': metrics,
+            'issues': issues,
+            'lessons': lessons,
+            'status': status,
+            **run_fields
+        }])[0]
+    
+    def log_runs(self, records: List[Dict[str, Any]]) -> List[Run]:
+        """Record a batch of runs in one transaction.
+        
+        Workers can return run records instead of writing them, so that
+        hundreds of runs are committed at once by a single writer.
+        
+        Args:
+            records: Dicts with the log_run arguments (factor_id, start_date,
+                end_date, metrics, and optionally issues, lessons, status
+                and other Run columns)
+        
+        Returns:
+            The Runs in the order of records, with metrics and issues loaded
+        """
+        session = self.get_session()
+        session.expire_on_commit = False
+        try:
+            runs = []
+            lessons = []
+            for record in records:
+                fields = dict(record)
+                metrics = fields.pop('metrics', None)
+                issues = fields.pop('issues', None) or []
+                lessons.append(fields.pop('lessons', None) or [])
+                fields.setdefault('status', "completed")
+                run = Run(**fields)
+                run.metrics = [_metric_from_dict(metrics)] if metrics is not None else []
+                run.issues = [
+                    Issue(
+                        type=issue.get('type', 'unknown'),
+                        detail=issue.get('detail', ''),
+                        severity=issue.get('severity', 'warning')
+                    )
+                    for issue in issues
+                ]
+                runs.append(run)
+            session.add_all(runs)
+            
+            if any(lessons):
+                # Lessons reference their run by id only, so ids are needed first
+                session.flush()
+                session.add_all([
+                    Lesson(
+                        title=lesson['title'],
+                        body=lesson['body'],
+                        tags=lesson.get('tags') or [],
+                        source_run_id=run.id,
+                        lesson_type=lesson.get('lesson_type', "general"),
+                        meta_data=lesson.get('metadata') or {}
+                    )
+                    for run, run_lessons in zip(runs, lessons)
+                    for lesson in run_lessons
+                ])
+            session.commit()
+            return runs
+        except Exception:
+            session.rollback()
+            raise
+        finally:
+            session.close()
+    
+    def count_runs(self) -> int:
+        """Count all logged runs (number of candidates tried so far)."""
+        session = self.get_session()
+        try:
+            return session.query(Run).count()
+        finally:
+            session.close()
+    
+    def add_fingerprint(
+        self,
+        name: str,
+        sketch: np.ndarray,
+        factor_id: Optional[int] = None
+    ) -> SignalFingerprint:
+        """Store the fingerprint of a computed signal panel."""
+        session = self.get_session()
+        try:
+            fingerprint = SignalFingerprint(
+                factor_id=factor_id,
+                name=name,
+                dim=len(sketch),
+                sketch=np.asarray(sketch, dtype=np.float32).tobytes()
+            )
+            session.add(fingerprint)
+            session.commit()
+            session.refresh(fingerprint)
+            return fingerprint
+        finally:
+            session.close()
+    
+    def find_similar_fingerprints(
+        self,
+        sketch: np.ndarray,
+        threshold: float = 0.95
+    ) -> List[Dict[str, Any]]:
+        """Find stored signals whose fingerprint correlation exceeds a threshold.
+        
+        Args:
+            sketch: Unit-norm fingerprint of the candidate signal
+            threshold: Minimum (signed) correlation to report
+        
+        Returns:
+            List of dicts with name, factor_id and correlation, most similar first
+        """
+        self._refresh_fingerprints()
+        return self._match_fingerprints(sketch, threshold)
+    
+    def add_fingerprint_if_unique(
+        self,
+        name: str,
+        sketch: np.ndarray,
+        factor_id: Optional[int] = None,
+        threshold: float = 0.95
+    ) -> List[Dict[str, Any]]:
+        """Index a fingerprint unless a near-duplicate is already indexed.
+        
+        The check and the insert run in one write transaction, so workers
+        evaluating near-identical candidates at the same time cannot all
+        pass the check. Fingerprints of the same factor_id (a retried or
+        resumed candidate) are not counted as duplicates.
+        
+        Args:
+            name: Factor name
+            sketch: Unit-norm fingerprint of the candidate signal
+            factor_id: Factor ID in the experiment store
+            threshold: Minimum (signed) correlation treated as a duplicate
+        
+        Returns:
+            Matches as in find_similar_fingerprints; empty if the fingerprint was added
+        """
+        session = self.get_session()
+        try:
+            # Take the write lock before reading, so no other writer can index in between
+            session.connection().exec_driver_sql("BEGIN IMMEDIATE")
+            self._refresh_fingerprints(session)
+            matches = [
+                match for match in self._match_fingerprints(sketch, threshold)
+                if match['factor_id'] is None or match['factor_id'] != factor_id
+            ]
+            if matches:
+                session.rollback()
+                return matches
+            
+            session.add(SignalFingerprint(
+                factor_id=factor_id,
+                name=name,
+                dim=len(sketch),
+                sketch=np.asarray(sketch, dtype=np.float32).tobytes()
+            ))
+            session.commit()
+            return []
+        finally:
+            session.close()
+    
+    def _match_fingerprints(self, sketch: np.ndarray, threshold: float) -> List[Dict[str, Any]]:
+        """Compare a sketch with the in-memory fingerprint matrix."""
+        if self._fingerprint_matrix is None:
+            return []
+        
+        sketch = np.asarray(sketch, dtype=np.float32)
+        rows = np.flatnonzero(
+            np.array([meta['dim'] == len(sketch) for meta in self._fingerprint_meta])
+        )
+        if len(rows) == 0:
+            return []
+        
+        correlations = self._fingerprint_matrix[rows, :len(sketch)] @ sketch
+        order = np.argsort(-correlations)
+        
+        return [
+            {
+                'name': self._fingerprint_meta[rows[i]]['name'],
+                'factor_id': self._fingerprint_meta[rows[i]]['factor_id'],
+                'correlation': float(correlations[i])
+            }
+            for i in order if correlations[i] > threshold
+        ]
+    
+    def _refresh_fingerprints(self, session: Optional[Session] = None):
+        """Load fingerprints added since the last refresh (in session, if given)."""
+        last_id = self._fingerprint_ids[-1] if self._fingerprint_ids else 0
+        own_session = session is None
+        session = session or self.get_session()
+        try:
+            new_rows = session.query(SignalFingerprint).filter(
+                SignalFingerprint.id > last_id
+            ).order_by(SignalFingerprint.id).all()
+        finally:
+            if own_session:
+                session.close()
+        
+        if not new_rows:
+            return
+        
+        width = max([row.dim for row in new_rows] + [
+            self._fingerprint_matrix.shape[1] if self._fingerprint_matrix is not None else 0
+        ])
+        block = np.zeros((len(new_rows), width), dtype=np.float32)
+        for i, row in enumerate(new_rows):
+            block[i, :row.dim] = np.frombuffer(row.sketch, dtype=np.float32)
+            self._fingerprint_ids.append(row.id)
+            self._fingerprint_meta.append({'name': row.name, 'factor_id': row.factor_id, 'dim': row.dim})
+        
+        if self._fingerprint_matrix is None:
+            self._fingerprint_matrix = block
+        else:
+            if self._fingerprint_matrix.shape[1] < width:
+                self._fingerprint_matrix = np.pad(
+                    self._fingerprint_matrix,
+                    ((0, 0), (0, width - self._fingerprint_matrix.shape[1]))
+                )
+            self._fingerprint_matrix = np.vstack([self._fingerprint_matrix, block])
+    
+    def log_scheduler_decisions(self, decisions: List[Dict[str, Any]]):
+        """Record a batch of scheduler decisions in one transaction."""
+        session = self.get_session()
+        try:
+            session.add_all([SchedulerDecision(**decision) for decision in decisions])
+            session.commit()
+        finally:
+            session.close()
+    
+    def get_cpu_seconds_used(self, day: str) -> float:
+        """Total scheduler CPU seconds spent on a given day (YYYY-MM-DD)."""
+        session = self.get_session()
+        try:
+            total = session.query(func.sum(SchedulerDecision.cpu_seconds)).filter(
+                SchedulerDecision.day == day
+            ).scalar()
+            return float(total or 0.0)
+        finally:
+            session.close()
+    
+    def get_scheduler_decisions(self, cycle_id: str) -> List[SchedulerDecision]:
+        """Get the decisions of one scheduler cycle in order."""
+        session = self.get_session()
+        try:
+            return session.query(SchedulerDecision).filter(
+                SchedulerDecision.cycle_id == cycle_id
+            ).order_by(SchedulerDecision.id).all()
+        finally:
+            session.close()
+    
     def get_top_runs(self, limit: int = 10, order_by: str = "sharpe") -> List[Run]:
         """Get top runs ordered by a metric."""
         session = self.get_session()
@@ -307,3 +706,94 @@ class ExperimentStore:
         finally:
             session.close()
 
+
+
+class RunWriter:
+    """Single writer that commits runs from many producers in batches.
+    
+    Producers (threads, or worker processes handed writer.queue) put
+    ExperimentStore.log_run records on the queue instead of writing to the
+    database themselves. One thread commits them with log_runs, up to
+    batch_size records or flush_interval seconds at a time, so run logging
+    costs one write transaction per batch instead of several per run.
+    
+    Usage:
+        with RunWriter("experiments.db") as writer:
+            ...  # producers call writer.submit(record) or writer.queue.put(record)
+        writer.run_ids  # IDs of the committed runs
+    """
+    
+    def __init__(
+        self,
+        db_path: str = "experiments.db",
+        batch_size: int = 200,
+        flush_interval: float = 0.5
+    ):
+        """Initialize the writer (call start, or use it as a context manager).
+        
+        Args:
+            db_path: ExperimentStore database
+            batch_size: Maximum records per transaction
+            flush_interval: Seconds to wait for more records before committing
+        """
+        self.store = ExperimentStore(db_path)
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.queue = multiprocessing.Queue()
+        self.run_ids: List[int] = []
+        self.n_failed = 0
+        self._thread: Optional[threading.Thread] = None
+    
+    def submit(self, record: Dict[str, Any]):
+        """Queue one run record (the ExperimentStore.log_run arguments)."""
+        self.queue.put(record)
+    
+    def start(self) -> 'RunWriter':
+        """Start the writer thread."""
+        self._thread = threading.Thread(target=self._run, name="run-writer", daemon=True)
+        self._thread.start()
+        return self
+    
+    def close(self):
+        """Commit everything still queued and stop the writer thread."""
+        if self._thread is not None:
+            self.queue.put(None)
+            self._thread.join()
+            self._thread = None
+    
+    def __enter__(self) -> 'RunWriter':
+        return self.start()
+    
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+    
+    def _run(self):
+        stopping = False
+        while not stopping:
+            batch = [self.queue.get()]
+            deadline = time.monotonic() + self.flush_interval
+            while batch[-1] is not None and len(batch) < self.batch_size:
+                try:
+                    batch.append(self.queue.get(timeout=max(0.0, deadline - time.monotonic())))
+                except queue.Empty:
+                    break
+            if batch[-1] is None:
+                stopping = True
+                batch.pop()
+            if batch:
+                self._commit(batch)
+    
+    def _commit(self, batch: List[Dict[str, Any]]):
+        try:
+            self.run_ids.extend(run.id for run in self.store.log_runs(batch))
+            return
+        except Exception as e:
+            logger.warning("Batch of %d runs failed (%s); committing one by one", len(batch), e)
+        
+        # Keep the good records of a batch that contains a bad one
+        for record in batch:
+            try:
+                self.run_ids.append(self.store.log_run(**record).id)
+            except Exception as e:
+                self.n_failed += 1
+                logger.error("Could not log run for factor %s: %s", record.get('factor_id'), e)
@@ -13,6 +13,7 @@ from ..backtest.metrics import (
 from ..backtest.multidim_eval import MultiDimensionalEvaluator
 from ..backtest.decay_monitor import AlphaDecayMonitor
 from ..analysis.guidelines import get_analysis_guidelines
+from ..archive.success_factors import SuccessFactorArchive
 
 
 @dataclass
@@ -70,9 +71,16 @@ class BacktestAnalysis:
 class BacktestAnalyst:
     """Analyze backtest results comprehensively."""
     
-    def __init__(self):
-        """Initialize backtest analyst."""
-        self.evaluator = MultiDimensionalEvaluator()
+    def __init__(self, archive: Optional[SuccessFactorArchive] = None):
+        """Initialize backtest analyst.
+        
+        Args:
+            archive: Success factor archive whose benchmark library scores
+                diversity and originality (none if omitted)
+        """
+        self.evaluator = MultiDimensionalEvaluator(
+            archive.benchmark_library if archive is not None else None
+        )
         self.decay_monitor = AlphaDecayMonitor()
         self.guidelines = get_analysis_guidelines()
     
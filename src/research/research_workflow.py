@@ -8,6 +8,7 @@ from ..research.hypothesis import HypothesisManager, ResearchHypothesis, Hypothe
 from ..research.factor_design import FactorDesigner, FactorDesign
 from ..research.backtest_analysis import BacktestAnalyst, BacktestAnalysis
 from ..memory.store import ExperimentStore
+from ..archive.success_factors import SuccessFactorArchive
 from ..rag.retriever import HybridRetriever
 from ..agents.researcher import ResearcherAgent
 from ..agents.feature_agent import FeatureAgent
@@ -32,7 +33,8 @@ class ResearchWorkflow:
         self,
         store: ExperimentStore,
         retriever: HybridRetriever,
-        index_path: str = "./kb.index"
+        index_path: str = "./kb.index",
+        archive: Optional[SuccessFactorArchive] = None
     ):
         """Initialize research workflow.
         
@@ -40,14 +42,16 @@ class ResearchWorkflow:
             store: Experiment store
             retriever: RAG retriever
             index_path: Path to RAG index
+            archive: Success factor archive (default directory if omitted)
         """
         self.store = store
         self.retriever = retriever
+        self.archive = archive if archive is not None else SuccessFactorArchive()
         
         # Initialize components
         self.hypothesis_manager = HypothesisManager(store, retriever)
         self.designer = FactorDesigner(DSLParser())
-        self.analyst = BacktestAnalyst()
+        self.analyst = BacktestAnalyst(archive=self.archive)
         
         # Initialize agents
         self.researcher = ResearcherAgent(
@@ -29,6 +29,11 @@ class DataProvenanceSchema(BaseModel):
         description="Path to cached data file"
     )
     
+    data_hash: Optional[str] = Field(
+        None,
+        description="SHA256 content hash of the cleaned panels"
+    )
+    
     data_quality: Optional[dict] = Field(
         None,
         description="Data quality metrics (missing_rate, outliers, etc.)"
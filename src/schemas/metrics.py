@@ -22,6 +22,9 @@ class MetricsSchema(BaseModel):
     
     # Advanced risk metrics
     psr: Optional[float] = Field(None, description="Probabilistic Sharpe ratio")
+    dsr: Optional[float] = Field(None, description="Deflated Sharpe ratio (adjusted for number of trials)")
+    sharpe_ci_low: Optional[float] = Field(None, description="Bootstrap Sharpe confidence interval lower bound")
+    sharpe_ci_high: Optional[float] = Field(None, description="Bootstrap Sharpe confidence interval upper bound")
     sortino: Optional[float] = Field(None, description="Sortino ratio")
     calmar: Optional[float] = Field(None, description="Calmar ratio")
     var_95: Optional[float] = Field(None, description="Value at Risk (95%)")
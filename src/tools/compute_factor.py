@@ -6,7 +6,10 @@ from typing import Dict, Any, Optional
 from pathlib import Path
 import yaml
 
-from ..factors.dsl import DSLParser
+from ..data.calendar import align_dates
+from ..data.market_data import MarketData
+from ..data.universe import apply_universe_mask
+from ..factors.context import CandidateContext
 from ..factors.primitives import PRIMITIVES
 from ..memory.factor_registry import FactorSpec
 
@@ -14,7 +17,9 @@ from ..memory.factor_registry import FactorSpec
 def compute_factor(
     factor_yaml: str,
     prices_df: pd.DataFrame,
-    returns_df: Optional[pd.DataFrame] = None
+    returns_df: Optional[pd.DataFrame] = None,
+    context: Optional[CandidateContext] = None,
+    market_data: Optional[MarketData] = None
 ) -> Dict[str, Any]:
     """Compute factor signals from Factor DSL YAML.
     
@@ -22,6 +27,10 @@ def compute_factor(
         factor_yaml: Factor DSL YAML string
         prices_df: DataFrame of prices (columns = tickers, rows = dates)
         returns_df: Optional DataFrame of returns (if None, computed from prices)
+        context: Candidate context; its parsed spec and validation are used
+            instead of parsing again, and the result is cached on it
+        market_data: OHLCV panels for custom code (open/high/low/volume);
+            if it has a universe, signals of non-members are set to NaN
     
     Returns:
         Dictionary with:
@@ -29,23 +38,34 @@ def compute_factor(
         - schema: Schema report
         - warnings: List of warnings
     """
-    parser = DSLParser()
+    if context is None:
+        context = CandidateContext.from_yaml(factor_yaml)
+    elif context.result is not None:
+        return context.result
     
-    # Parse factor spec
-    try:
-        spec = parser.parse(factor_yaml)
-    except Exception as e:
+    context.result = _compute_factor(context, prices_df, returns_df, market_data)
+    return context.result
+
+
+def _compute_factor(
+    context: CandidateContext,
+    prices_df: pd.DataFrame,
+    returns_df: Optional[pd.DataFrame],
+    market_data: Optional[MarketData] = None
+) -> Dict[str, Any]:
+    """Compute signals for a parsed and validated candidate."""
+    if context.parse_error is not None:
         return {
             'signals': None,
             'schema': None,
-            'warnings': [f"Parse error: {e}"],
-            'error': str(e)
+            'warnings': [f"Parse error: {context.parse_error}"],
+            'error': context.parse_error
         }
     
-    # Validate no-lookahead
-    is_valid, warnings = parser.validate_no_lookahead(spec)
+    spec = context.spec
+    warnings = list(context.warnings)
     
-    if not is_valid:
+    if not context.is_valid:
         return {
             'signals': None,
             'schema': None,
@@ -69,7 +89,8 @@ def compute_factor(
                     signal_spec.custom_code,
                     prices_df,
                     returns_df,
-                    signal_spec.normalize
+                    signal_spec.normalize,
+                    market_data
                 )
             else:
                 # Execute DSL expression
@@ -107,9 +128,12 @@ def compute_factor(
         for ticker in prices_df.columns:
             signals_df[ticker] = primary_signal
     
-    # Align with prices
-    common_dates = signals_df.index.intersection(prices_df.index)
-    signals_df = signals_df.loc[common_dates]
+    # Align with prices (no-op when the signals are on the prices' calendar)
+    signals_df = align_dates(signals_df, prices_df)[0]
+    
+    # Only tickers in the universe on each date carry a signal
+    if market_data is not None:
+        signals_df = apply_universe_mask(signals_df, market_data.universe_mask)
     
     schema_report = {
         'factor_name': spec.name,
@@ -185,7 +209,8 @@ def _compute_custom_signal(
     code: str,
     prices_df: pd.DataFrame,
     returns_df: pd.DataFrame,
-    normalize: Optional[str] = None
+    normalize: Optional[str] = None,
+    market_data: Optional[MarketData] = None
 ) -> pd.Series:
     """Compute a signal using custom Python code.
     
@@ -194,6 +219,7 @@ def _compute_custom_signal(
         prices_df: Prices DataFrame
         returns_df: Returns DataFrame
         normalize: Normalization method
+        market_data: OHLCV panels available to the code
     
     Returns:
         Signal series
@@ -205,7 +231,8 @@ def _compute_custom_signal(
         code,
         prices_df,
         returns_df,
-        timeout=60
+        timeout=60,
+        market_data=market_data
     )
     
     if not result['success']:
@@ -1,12 +1,16 @@
 """MCP tool: Fetch data from yfinance with caching."""
 
-import yfinance as yf
 import pandas as pd
 from pathlib import Path
 from typing import List, Optional, Dict, Any
 from datetime import datetime
 import yaml
 
+from ..data.market_store import MarketDataStore
+from ..data.providers import MarketDataProvider, YFinanceProvider
+from ..data.refresh import refresh_store
+from ..data.universe import UniverseMembership
+
 
 def load_universe_config(config_path: Optional[Path] = None) -> Dict:
     """Load universe configuration."""
@@ -22,23 +26,35 @@ def fetch_data(
     start: Optional[datetime] = None,
     end: Optional[datetime] = None,
     fields: Optional[List[str]] = None,
-    cache_dir: Optional[Path] = None
+    cache_dir: Optional[Path] = None,
+    store: Optional[MarketDataStore] = None,
+    provider: Optional[MarketDataProvider] = None,
+    max_workers: int = 8,
+    rate_limit: Optional[float] = 10.0
 ) -> pd.DataFrame:
     """Fetch data from yfinance with caching.
     
+    Bars are cached per ticker in a MarketDataStore, and only the date
+    ranges a ticker is missing are downloaded, whatever universe it is
+    requested with. Extending the window of a stored universe fetches just
+    the new days.
+    
     Args:
         tickers: List of ticker symbols
         start: Start date
-        end: End date
+        end: End date (exclusive)
         fields: Fields to fetch (default: ['Close', 'Open', 'High', 'Low', 'Volume'])
         cache_dir: Cache directory (default: data/cache)
+        store: Market data store (default: a store in cache_dir)
+        provider: Source of missing bars (default: yfinance)
+        max_workers: Maximum concurrent provider requests
+        rate_limit: Maximum provider requests per second (None: unlimited)
     
     Returns:
         DataFrame with MultiIndex (Date, Ticker) and columns as fields
     """
-    if cache_dir is None:
-        cache_dir = Path("data/cache")
-    cache_dir.mkdir(parents=True, exist_ok=True)
+    if store is None:
+        store = MarketDataStore(cache_dir or Path("data/cache"))
     
     if fields is None:
         fields = ['Close', 'Open', 'High', 'Low', 'Volume']
@@ -50,52 +66,27 @@ def fetch_data(
     if end is None:
         end = datetime.now()
     
-    # Check cache
-    cache_file = cache_dir / f"{'_'.join(sorted(tickers))}_{start.date()}_{end.date()}.parquet"
-    
-    if cache_file.exists():
-        try:
-            cached_data = pd.read_parquet(cache_file)
-            # Check if cached data covers the requested range
-            if cached_data.index.min() <= pd.Timestamp(start) and cached_data.index.max() >= pd.Timestamp(end):
-                return cached_data
-        except:
-            pass
-    
-    # Fetch from yfinance
-    data_dict = {}
-    
-    for ticker in tickers:
-        try:
-            ticker_obj = yf.Ticker(ticker)
-            hist = ticker_obj.history(start=start, end=end)
-            
-            if len(hist) == 0:
-                continue
-            
-            # Select requested fields
-            available_fields = [f for f in fields if f in hist.columns]
-            ticker_data = hist[available_fields].copy()
-            ticker_data['Ticker'] = ticker
-            
-            data_dict[ticker] = ticker_data
-        except Exception as e:
-            print(f"Error fetching {ticker}: {e}")
-            continue
-    
-    if len(data_dict) == 0:
+    # The end date is exclusive, as in yfinance
+    last = pd.Timestamp(end).normalize() - pd.Timedelta(days=1)
+    
+    # Fetch missing ranges (all OHLCV fields, so any later field request hits)
+    stats = refresh_store(
+        store,
+        provider or YFinanceProvider(),
+        tickers,
+        start,
+        last,
+        max_workers=max_workers,
+        rate_limit=rate_limit
+    )
+    for ticker, error in stats['failed'].items():
+        print(f"Error fetching {ticker}: {error}")
+    
+    all_data = store.read(tickers, start=start, end=last, fields=fields)
+    
+    if len(all_data) == 0:
         raise ValueError("No data fetched for any ticker")
     
-    # Combine all tickers
-    all_data = pd.concat(data_dict.values())
-    all_data = all_data.reset_index().set_index(['Date', 'Ticker'])
-    
-    # Save to cache
-    try:
-        all_data.to_parquet(cache_file)
-    except:
-        pass
-    
     return all_data
 
 
@@ -128,26 +119,27 @@ def fetch_index_data(
         return data.iloc[:, 0].unstack(level='Ticker')[index_symbol]
 
 
-def get_universe_tickers(universe_name: str = "sp500") -> List[str]:
-    """Get ticker list for a universe.
+def get_universe_tickers(
+    universe_name: str = "sp500",
+    as_of: Optional[datetime] = None,
+    start: Optional[datetime] = None,
+    end: Optional[datetime] = None
+) -> List[str]:
+    """Get ticker list for a universe from its constituent file.
     
     Args:
         universe_name: Universe name (sp500, nasdaq100, russell1000)
+        as_of: Return the members on this date
+        start: With end, return every ticker that was a member at any
+            point in [start, end] (survivorship-free)
+        end: End of the membership window
     
     Returns:
-        List of ticker symbols
+        List of ticker symbols (all tickers ever listed if no dates are given)
     """
-    # For now, return a sample list
-    # In production, this would fetch from a proper source
-    
-    if universe_name == "sp500":
-        # Sample S&P 500 tickers (in production, fetch full list)
-        return ["AAPL", "MSFT", "GOOGL", "AMZN", "NVDA", "META", "TSLA", "BRK-B", "V", "JNJ"]
-    elif universe_name == "nasdaq100":
-        return ["AAPL", "MSFT", "GOOGL", "AMZN", "NVDA", "META", "TSLA", "AVGO", "COST", "NFLX"]
-    elif universe_name == "russell1000":
-        # Sample (would need full list)
-        return ["AAPL", "MSFT", "GOOGL", "AMZN", "NVDA"]
-    else:
-        raise ValueError(f"Unknown universe: {universe_name}")
-
+    membership = UniverseMembership.load(universe_name)
+    if as_of is not None:
+        return membership.members(as_of)
+    if start is not None or end is not None:
+        return membership.members_between(start, end)
+    return membership.tickers
@@ -1,6 +1,6 @@
 """MCP tool: Log run to database and generate summary card."""
 
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional
 from datetime import datetime
 from pathlib import Path
 
@@ -41,11 +41,13 @@ def log_run(
     """
     store = ExperimentStore(db_path)
     
-    # Create run
-    run = store.create_run(
+    # Run, metrics and issues in one transaction
+    run = store.log_run(
         factor_id=factor_id,
         start_date=start_date,
         end_date=end_date,
+        metrics=metrics,
+        issues=issues,
         in_sample_start=in_sample_start,
         in_sample_end=in_sample_end,
         out_sample_start=out_sample_start,
@@ -54,21 +56,8 @@ def log_run(
         status="completed"
     )
     
-    # Create metrics
-    metric = store.create_metrics(run.id, metrics)
-    
-    # Create issues
-    if issues:
-        for issue in issues:
-            store.create_issue(
-                run_id=run.id,
-                issue_type=issue.get('type', 'unknown'),
-                detail=issue.get('detail', ''),
-                severity=issue.get('severity', 'warning')
-            )
-    
     # Generate summary card
-    summary = generate_summary_card(run, metric, issues or [])
+    summary = generate_summary_card(run, run.metrics[0], issues or [])
     
     return {
         'run_id': run.id,
@@ -76,6 +65,29 @@ def log_run(
     }
 
 
+def log_runs(records: List[Dict[str, Any]], db_path: str = "experiments.db") -> List[Dict[str, Any]]:
+    """Log a batch of runs (e.g. collected from parallel workers) in one transaction.
+    
+    Args:
+        records: Dicts with the log_run arguments except db_path; each may
+            also carry 'lessons' (create_lesson argument dicts)
+        db_path: Database path
+    
+    Returns:
+        List of dictionaries with run_id and summary, in the order of records
+    """
+    store = ExperimentStore(db_path)
+    runs = store.log_runs(records)
+    
+    return [
+        {
+            'run_id': run.id,
+            'summary': generate_summary_card(run, run.metrics[0], record.get('issues') or [])
+        }
+        for run, record in zip(runs, records)
+    ]
+
+
 def generate_summary_card(run, metric, issues: list) -> str:
     """Generate human-readable summary card.
     
@@ -7,8 +7,12 @@ from datetime import datetime
 
 from ..backtest.pipeline import walkforward_backtest
 from ..backtest.validator import validate_run
+from ..backtest.statistics import significance_metrics
 from ..memory.factor_registry import FactorSpec
 from .compute_factor import compute_factor
+from ..factors.context import CandidateContext
+from ..data.market_data import MarketData
+from ..data.quality import panel_hash
 from ..utils.manifest_generator import create_manifest
 
 
@@ -17,7 +21,10 @@ def run_backtest(
     prices_df,
     returns_df,
     split_cfg: Optional[Dict[str, Any]] = None,
-    output_dir: Optional[Path] = None
+    output_dir: Optional[Path] = None,
+    n_trials: Optional[int] = None,
+    context: Optional[CandidateContext] = None,
+    market_data: Optional[MarketData] = None
 ) -> Dict[str, Any]:
     """Run backtest and return metrics.
     
@@ -27,6 +34,11 @@ def run_backtest(
         returns_df: Returns DataFrame
         split_cfg: Walk-forward split configuration
         output_dir: Output directory for artifacts
+        n_trials: Number of candidates tried so far, used to deflate the Sharpe ratio
+        context: Candidate context; its parsed spec and any signals already
+            computed for it are reused
+        market_data: OHLCV panels for custom code, if signals must be computed;
+            its universe membership mask is applied to the backtest
     
     Returns:
         Dictionary with:
@@ -35,13 +47,14 @@ def run_backtest(
         - issues: Validation issues
         - is_valid: Whether run passed validation
     """
-    from ..factors.dsl import DSLParser
+    if context is None:
+        context = CandidateContext.from_yaml(factor_yaml)
+    if context.parse_error is not None:
+        raise ValueError(f"Failed to parse Factor DSL: {context.parse_error}")
+    spec = context.spec
     
-    parser = DSLParser()
-    spec = parser.parse(factor_yaml)
-    
-    # Compute factor signals
-    factor_result = compute_factor(factor_yaml, prices_df, returns_df)
+    # Compute factor signals (cached on the context)
+    factor_result = compute_factor(factor_yaml, prices_df, returns_df, context=context, market_data=market_data)
     
     if factor_result['signals'] is None:
         return {
@@ -54,6 +67,10 @@ def run_backtest(
     
     signals_df = factor_result['signals']
     
+    backtest_config = split_cfg
+    if market_data is not None and market_data.universe_mask is not None:
+        backtest_config = {**(split_cfg or {}), 'universe_mask': market_data.universe_mask}
+    
     # Run walk-forward backtest
     try:
         backtest_result = walkforward_backtest(
@@ -61,7 +78,7 @@ def run_backtest(
             prices_df=prices_df,
             returns_df=returns_df,
             factor_spec=spec,
-            config=split_cfg
+            config=backtest_config
         )
     except Exception as e:
         return {
@@ -74,13 +91,20 @@ def run_backtest(
     
     metrics = backtest_result['overall_metrics']
     
+    # Significance: PSR, DSR (deflated by number of trials) and bootstrap CI
+    metrics.update(significance_metrics(
+        backtest_result['returns'],
+        n_trials=n_trials or 1
+    ))
+    
     # Validate run
     is_valid, issues = validate_run(
         signals_df=signals_df,
         returns_df=returns_df,
         prices_df=prices_df,
         positions_df=backtest_result.get('positions', None),
-        metrics=metrics
+        metrics=metrics,
+        context=backtest_result.get('validation_context')
     )
     
     # Save artifacts
@@ -186,6 +210,8 @@ def run_backtest(
                 status='completed',
                 metadata={
                     'backtest_config': split_cfg or {},
+                    # Exact data the run used (see data.quality.panel_hash)
+                    'data_hash': market_data.data_hash if market_data is not None else panel_hash({'Close': prices_df}),
                     'is_valid': is_valid,
                     'num_issues': len(issues)
                 }
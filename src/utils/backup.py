@@ -2,6 +2,7 @@
 
 import shutil
 import sqlite3
+from contextlib import closing
 from pathlib import Path
 from datetime import datetime
 from typing import Optional
@@ -39,8 +40,10 @@ def backup_database(
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         backup_file = backup_path / f"{db_path_obj.stem}_{timestamp}.db"
         
-        # Copy database
-        shutil.copy2(db_path, backup_file)
+        # Online backup: consistent while other processes write, and
+        # includes commits not yet checkpointed from the WAL file
+        with closing(sqlite3.connect(db_path)) as source, closing(sqlite3.connect(backup_file)) as target:
+            source.backup(target)
         
         logger.info(f"Database backed up to: {backup_file}")
         
@@ -96,6 +99,10 @@ def restore_database(
             logger.error(f"Backup file not found: {backup_file}")
             return False
         
+        # A WAL left over from the replaced database must not be replayed onto the backup
+        for suffix in ("-wal", "-shm"):
+            Path(f"{target_path}{suffix}").unlink(missing_ok=True)
+        
         # Copy backup to target
         shutil.copy2(backup_file, target_path)
         
@@ -9,6 +9,8 @@ from ..memory.lessons import LessonManager
 from ..agents.researcher import ResearcherAgent
 from ..backtest.decay_monitor import AlphaDecayMonitor
 from ..backtest.multidim_eval import MultiDimensionalEvaluator
+from ..archive.success_factors import SuccessFactorArchive
+from .scheduler import SuccessiveHalvingScheduler, make_backtest_evaluator
 
 
 class ContinuousImprovementLoop:
@@ -17,19 +19,25 @@ class ContinuousImprovementLoop:
     def __init__(
         self,
         db_path: str = "experiments.db",
-        index_path: str = "./kb.index"
+        index_path: str = "./kb.index",
+        daily_cpu_budget: float = 3600.0,
+        archive: Optional[SuccessFactorArchive] = None
     ):
         """Initialize continuous improvement loop.
         
         Args:
             db_path: Database path
             index_path: RAG index path
+            daily_cpu_budget: CPU seconds per day for mutation evaluation
+            archive: Success factor archive (default directory if omitted)
         """
+        self.daily_cpu_budget = daily_cpu_budget
         self.store = ExperimentStore(db_path)
         self.lesson_manager = LessonManager(self.store)
         self.researcher = ResearcherAgent(db_path=db_path, index_path=index_path)
         self.decay_monitor = AlphaDecayMonitor(store=self.store)
-        self.evaluator = MultiDimensionalEvaluator()
+        self.archive = archive if archive is not None else SuccessFactorArchive()
+        self.evaluator = MultiDimensionalEvaluator(self.archive.benchmark_library)
     
     def recognize_success_patterns(
         self,
@@ -192,6 +200,32 @@ class ContinuousImprovementLoop:
         
         return mutations
     
+    def evaluate_mutations(
+        self,
+        mutations: List[str],
+        prices_df,
+        returns_df
+    ) -> Dict[str, Any]:
+        """Rank mutations with the successive-halving scheduler.
+        
+        Args:
+            mutations: Mutated factor YAMLs
+            prices_df: Prices DataFrame
+            returns_df: Returns DataFrame
+        
+        Returns:
+            Scheduler results keyed by mutation index
+        """
+        scheduler = SuccessiveHalvingScheduler(
+            make_backtest_evaluator(prices_df, returns_df),
+            daily_cpu_budget=self.daily_cpu_budget,
+            store=self.store
+        )
+        return scheduler.run(
+            {f"mutation_{i}": mutation for i, mutation in enumerate(mutations)},
+            cycle_id=f"improvement_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+        )
+    
     def adjust_targets(
         self,
         current_performance: Dict[str, float],
@@ -239,13 +273,17 @@ class ContinuousImprovementLoop:
     def run_improvement_cycle(
         self,
         n_mutations: int = 3,
-        focus_on_top: int = 5
+        focus_on_top: int = 5,
+        prices_df=None,
+        returns_df=None
     ) -> Dict[str, Any]:
         """Run complete improvement cycle.
         
         Args:
             n_mutations: Number of mutations per successful factor
             focus_on_top: Number of top factors to mutate
+            prices_df: Prices for evaluating mutations (skipped if None)
+            returns_df: Returns for evaluating mutations
         
         Returns:
             Improvement cycle results
@@ -273,7 +311,12 @@ class ContinuousImprovementLoop:
                     )
                     mutations.extend(factor_mutations)
         
-        # 4. Adjust targets
+        # 4. Evaluate mutations, spending most compute on the promising ones
+        mutation_schedule = None
+        if mutations and prices_df is not None and returns_df is not None:
+            mutation_schedule = self.evaluate_mutations(mutations, prices_df, returns_df)
+        
+        # 5. Adjust targets
         current_perf = {
             'sharpe': success_patterns['patterns'][0].metrics[0].sharpe 
                      if success_patterns['patterns'] else 0.0,
@@ -295,6 +338,7 @@ class ContinuousImprovementLoop:
             'success_patterns': success_patterns,
             'failure_patterns': failure_patterns,
             'mutations': mutations,
+            'mutation_schedule': mutation_schedule,
             'new_targets': new_targets
         }
 
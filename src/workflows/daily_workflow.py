@@ -8,6 +8,7 @@ import json
 from ..agents.orchestrator import Orchestrator
 from ..memory.store import ExperimentStore
 from ..memory.lessons import LessonManager
+from .scheduler import SuccessiveHalvingScheduler, make_backtest_evaluator
 
 
 class DailyWorkflow:
@@ -17,7 +18,8 @@ class DailyWorkflow:
         self,
         universe: str = "sp500",
         db_path: str = "experiments.db",
-        index_path: str = "./kb.index"
+        index_path: str = "./kb.index",
+        daily_cpu_budget: float = 3600.0
     ):
         """Initialize daily workflow.
         
@@ -25,8 +27,10 @@ class DailyWorkflow:
             universe: Universe name
             db_path: Database path
             index_path: RAG index path
+            daily_cpu_budget: CPU seconds per day for candidate evaluation
         """
         self.universe = universe
+        self.daily_cpu_budget = daily_cpu_budget
         self.orchestrator = Orchestrator(universe=universe, db_path=db_path, index_path=index_path)
         self.store = ExperimentStore(db_path)
         self.lesson_manager = LessonManager(self.store)
@@ -93,6 +97,10 @@ class DailyWorkflow:
     ) -> Dict[str, Any]:
         """Execution phase.
         
+        Candidates are scheduled by successive halving: all of them are
+        backtested on a short recent window, and only the top fraction is
+        promoted to longer histories and the full backtest.
+        
         Args:
             factor_proposals: List of factor YAML strings
             n_parallel: Number of parallel executions
@@ -108,66 +116,89 @@ class DailyWorkflow:
             'processed': 0,
             'successful': 0,
             'failed': 0,
+            'eliminated': 0,
             'runs': []
         }
         
+        # Register candidates
+        from ..factors.dsl import DSLParser
+        parser = DSLParser()
+        candidates = {}
+        
         for i, factor_yaml in enumerate(factor_proposals):
-            print(f"\n[{i+1}/{len(factor_proposals)}] Processing factor...")
-            
             try:
-                # Parse factor
-                from ..factors.dsl import DSLParser
-                parser = DSLParser()
                 spec = parser.parse(factor_yaml)
-                
-                # Register factor
                 factor = self.store.create_factor(
                     name=spec.name,
                     yaml=factor_yaml,
                     tags=[]
                 )
-                
-                # Compute features
-                print("  Computing features...")
-                feature_result = self.orchestrator.feature_agent.compute_features(
-                    factor_yaml,
-                    self.orchestrator.prices_df,
-                    self.orchestrator.returns_df
-                )
-                
-                if not feature_result['success']:
-                    print(f"  ✗ Feature computation failed: {feature_result.get('error')}")
-                    results['failed'] += 1
-                    continue
-                
-                # Run backtest
-                print("  Running backtest...")
-                backtest_result = self.orchestrator.backtester.run_backtest(
-                    factor_yaml=factor_yaml,
-                    prices_df=self.orchestrator.prices_df,
-                    returns_df=self.orchestrator.returns_df,
-                    run_id=f"daily_{datetime.now().strftime('%Y%m%d')}_{factor.id}"
-                )
-                
-                if backtest_result.get('metrics'):
-                    metrics = backtest_result['metrics']
-                    print(f"  ✓ Backtest complete: Sharpe={metrics.get('sharpe', 0):.2f}")
-                    results['successful'] += 1
-                else:
-                    print(f"  ✗ Backtest failed")
-                    results['failed'] += 1
-                
-                results['processed'] += 1
-                results['runs'].append({
-                    'factor_id': factor.id,
-                    'metrics': backtest_result.get('metrics'),
-                    'success': backtest_result.get('metrics') is not None
-                })
-                
+                candidates[str(factor.id)] = factor_yaml
             except Exception as e:
-                print(f"  ✗ Error: {e}")
+                print(f"  ✗ [{i+1}/{len(factor_proposals)}] Error: {e}")
                 results['failed'] += 1
-                continue
+        
+        if not candidates:
+            return results
+        
+        # Short windows for the whole pool, full backtest (with artifacts) for survivors
+        contexts = {}
+        quick_evaluate = make_backtest_evaluator(
+            self.orchestrator.prices_df,
+            self.orchestrator.returns_df,
+            contexts=contexts
+        )
+        full_metrics = {}
+        
+        def evaluate(candidate_id: str, factor_yaml: str, rung: Dict[str, Any]) -> Optional[float]:
+            if rung.get('history_days') is not None:
+                return quick_evaluate(candidate_id, factor_yaml, rung)
+            
+            backtest_result = self.orchestrator.backtester.run_backtest(
+                factor_yaml=factor_yaml,
+                prices_df=self.orchestrator.prices_df,
+                returns_df=self.orchestrator.returns_df,
+                run_id=f"daily_{datetime.now().strftime('%Y%m%d')}_{candidate_id}",
+                split_cfg={'walk_forward': rung.get('walk_forward', {})},
+                context=contexts.get(candidate_id)
+            )
+            if backtest_result.status != "SUCCESS":
+                return None
+            
+            full_metrics[candidate_id] = backtest_result.content.data['metrics']
+            return full_metrics[candidate_id].get('sharpe')
+        
+        scheduler = SuccessiveHalvingScheduler(
+            evaluate,
+            daily_cpu_budget=self.daily_cpu_budget,
+            store=self.store
+        )
+        schedule = scheduler.run(candidates, cycle_id=f"daily_{datetime.now().strftime('%Y%m%d_%H%M%S')}")
+        
+        for candidate_id in schedule['ranking']:
+            metrics = full_metrics.get(candidate_id)
+            
+            if metrics:
+                print(f"  ✓ Factor {candidate_id}: Sharpe={metrics.get('sharpe', 0):.2f}")
+                results['successful'] += 1
+            elif schedule['rung_reached'][candidate_id] < len(scheduler.rungs) - 1:
+                results['eliminated'] += 1
+            else:
+                results['failed'] += 1
+            
+            results['processed'] += 1
+            results['runs'].append({
+                'factor_id': int(candidate_id),
+                'metrics': metrics,
+                'success': metrics is not None,
+                'rung_reached': schedule['rung_reached'][candidate_id]
+            })
+        
+        results['schedule'] = {
+            'ranking': schedule['ranking'],
+            'cpu_seconds': schedule['cpu_seconds'],
+            'budget_exhausted': schedule['budget_exhausted']
+        }
         
         print(f"\n执行完成: {results['successful']}/{results['processed']} 成功")
         return results
@@ -0,0 +1,528 @@
+"""SQLite-backed job queue for distributed factor evaluation.
+
+Producers enqueue factor YAMLs; any number of worker processes, on one host
+or on several hosts sharing the queue file, claim jobs, compute signals,
+screen and backtest them, and write results to the ExperimentStore.
+
+Claims are leases: a worker owns a job until its lease expires, and a
+background thread heartbeats to extend the lease while the job runs. Jobs
+whose worker died are picked up again once the lease lapses; failed jobs
+are retried with backoff up to max_attempts.
+
+The queue needs no service beyond SQLite file locking. When hosts share
+the file over a network filesystem, that filesystem must support POSIX
+locks (e.g. NFSv4 with locking enabled).
+
+Usage:
+    python -m src.workflows.job_queue enqueue --queue jobs.db factor1.yaml factor2.yaml
+    python -m src.workflows.job_queue worker --queue jobs.db --prices prices.parquet --workers 4
+    python -m src.workflows.job_queue status --queue jobs.db
+"""
+
+import argparse
+import json
+import multiprocessing
+import os
+import socket
+import sqlite3
+import threading
+import time
+from contextlib import closing
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Union
+
+import pandas as pd
+
+from ..data.panel_snapshot import PanelSnapshot
+from ..memory.store import RunWriter
+
+JOB_STATUSES = ('queued', 'running', 'done', 'failed')
+
+# Handler: job payload -> JSON-serializable result
+JobHandler = Callable[[Dict[str, Any]], Dict[str, Any]]
+
+
+def _json_default(value: Any) -> Any:
+    if hasattr(value, 'item'):
+        return value.item()
+    return str(value)
+
+
+class JobQueue:
+    """Durable FIFO of JSON jobs with leases, heartbeats and retries."""
+
+    def __init__(self, path: str = "experiments/jobs.db", timeout: float = 60.0):
+        """Open (or create) a queue.
+
+        Args:
+            path: SQLite file holding the queue
+            timeout: Seconds to wait for the database lock
+        """
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.timeout = timeout
+
+        with closing(self._connect()) as conn:
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS jobs (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    payload TEXT NOT NULL,
+                    status TEXT NOT NULL DEFAULT 'queued',
+                    priority INTEGER NOT NULL DEFAULT 0,
+                    attempts INTEGER NOT NULL DEFAULT 0,
+                    max_attempts INTEGER NOT NULL DEFAULT 3,
+                    worker_id TEXT,
+                    available_at REAL NOT NULL,
+                    lease_expires REAL,
+                    created_at REAL NOT NULL,
+                    started_at REAL,
+                    finished_at REAL,
+                    result TEXT,
+                    error TEXT
+                )
+            """)
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_jobs_claim ON jobs (status, priority, available_at)"
+            )
+
+    def _connect(self) -> sqlite3.Connection:
+        # Autocommit mode; write transactions are opened explicitly with BEGIN IMMEDIATE
+        conn = sqlite3.connect(str(self.path), timeout=self.timeout, isolation_level=None)
+        conn.row_factory = sqlite3.Row
+        return conn
+
+    def enqueue(self, payload: Dict[str, Any], priority: int = 0, max_attempts: int = 3) -> int:
+        """Add one job; returns its ID."""
+        return self.enqueue_many([payload], priority=priority, max_attempts=max_attempts)[0]
+
+    def enqueue_many(
+        self,
+        payloads: List[Dict[str, Any]],
+        priority: int = 0,
+        max_attempts: int = 3
+    ) -> List[int]:
+        """Add several jobs in one transaction.
+
+        Args:
+            payloads: JSON-serializable job payloads
+            priority: Higher priorities are claimed first
+            max_attempts: Attempts before a job is marked failed
+
+        Returns:
+            Job IDs, in payload order
+        """
+        now = time.time()
+        conn = self._connect()
+        try:
+            conn.execute("BEGIN IMMEDIATE")
+            ids = [
+                conn.execute(
+                    "INSERT INTO jobs (payload, priority, max_attempts, available_at, created_at) "
+                    "VALUES (?, ?, ?, ?, ?)",
+                    (json.dumps(payload, default=_json_default), priority, max_attempts, now, now)
+                ).lastrowid
+                for payload in payloads
+            ]
+            conn.execute("COMMIT")
+            return ids
+        except BaseException:
+            if conn.in_transaction:
+                conn.execute("ROLLBACK")
+            raise
+        finally:
+            conn.close()
+
+    def claim(self, worker_id: str, lease_seconds: float = 60.0) -> Optional[Dict[str, Any]]:
+        """Lease the next available job.
+
+        Jobs whose lease has expired (their worker stopped heartbeating) are
+        returned to the queue, or failed if out of attempts, first.
+
+        Args:
+            worker_id: Identifier of the claiming worker
+            lease_seconds: Lease length; extend it with heartbeat()
+
+        Returns:
+            Dictionary with 'id', 'payload' and 'attempts', or None if no
+            job is available
+        """
+        now = time.time()
+        conn = self._connect()
+        try:
+            conn.execute("BEGIN IMMEDIATE")
+            conn.execute("""
+                UPDATE jobs
+                SET status = CASE WHEN attempts >= max_attempts THEN 'failed' ELSE 'queued' END,
+                    error = 'lease expired (worker ' || worker_id || ')',
+                    finished_at = CASE WHEN attempts >= max_attempts THEN ? ELSE NULL END,
+                    worker_id = NULL, lease_expires = NULL
+                WHERE status = 'running' AND lease_expires < ?
+            """, (now, now))
+
+            row = conn.execute("""
+                SELECT id, payload, attempts FROM jobs
+                WHERE status = 'queued' AND available_at <= ?
+                ORDER BY priority DESC, id
+                LIMIT 1
+            """, (now,)).fetchone()
+
+            if row is None:
+                conn.execute("COMMIT")
+                return None
+
+            conn.execute("""
+                UPDATE jobs
+                SET status = 'running', worker_id = ?, attempts = attempts + 1,
+                    lease_expires = ?, started_at = ?
+                WHERE id = ?
+            """, (worker_id, now + lease_seconds, now, row['id']))
+            conn.execute("COMMIT")
+            return {'id': row['id'], 'payload': json.loads(row['payload']), 'attempts': row['attempts'] + 1}
+        except BaseException:
+            if conn.in_transaction:
+                conn.execute("ROLLBACK")
+            raise
+        finally:
+            conn.close()
+
+    def heartbeat(self, job_id: int, worker_id: str, lease_seconds: float = 60.0) -> bool:
+        """Extend a lease; returns False if the worker no longer holds it."""
+        with closing(self._connect()) as conn:
+            updated = conn.execute(
+                "UPDATE jobs SET lease_expires = ? WHERE id = ? AND worker_id = ? AND status = 'running'",
+                (time.time() + lease_seconds, job_id, worker_id)
+            ).rowcount
+        return updated == 1
+
+    def complete(self, job_id: int, worker_id: str, result: Dict[str, Any]) -> bool:
+        """Mark a job done with its result; returns False if the lease was lost."""
+        with closing(self._connect()) as conn:
+            updated = conn.execute("""
+                UPDATE jobs
+                SET status = 'done', result = ?, error = NULL, finished_at = ?, lease_expires = NULL
+                WHERE id = ? AND worker_id = ? AND status = 'running'
+            """, (json.dumps(result, default=_json_default), time.time(), job_id, worker_id)).rowcount
+        return updated == 1
+
+    def fail(self, job_id: int, worker_id: str, error: str, retry_delay: float = 5.0) -> bool:
+        """Record a failed attempt.
+
+        The job is queued again after retry_delay * 2^(attempts - 1) seconds,
+        or marked failed once it has used max_attempts.
+
+        Returns:
+            False if the worker no longer held the lease
+        """
+        now = time.time()
+        with closing(self._connect()) as conn:
+            updated = conn.execute("""
+                UPDATE jobs
+                SET status = CASE WHEN attempts >= max_attempts THEN 'failed' ELSE 'queued' END,
+                    available_at = ? + ? * (1 << (attempts - 1)),
+                    finished_at = CASE WHEN attempts >= max_attempts THEN ? ELSE NULL END,
+                    error = ?, worker_id = NULL, lease_expires = NULL
+                WHERE id = ? AND worker_id = ? AND status = 'running'
+            """, (now, retry_delay, now, error, job_id, worker_id)).rowcount
+        return updated == 1
+
+    def get(self, job_id: int) -> Optional[Dict[str, Any]]:
+        """Job record, with payload and result decoded."""
+        with closing(self._connect()) as conn:
+            row = conn.execute("SELECT * FROM jobs WHERE id = ?", (job_id,)).fetchone()
+        if row is None:
+            return None
+        job = dict(row)
+        job['payload'] = json.loads(job['payload'])
+        job['result'] = json.loads(job['result']) if job['result'] else None
+        return job
+
+    def counts(self) -> Dict[str, int]:
+        """Number of jobs per status."""
+        with closing(self._connect()) as conn:
+            rows = conn.execute("SELECT status, COUNT(*) FROM jobs GROUP BY status").fetchall()
+        counts = {status: 0 for status in JOB_STATUSES}
+        counts.update({status: n for status, n in rows})
+        return counts
+
+
+class QueueWorker:
+    """Claim jobs and run them through a handler, heartbeating while they run."""
+
+    def __init__(
+        self,
+        queue: JobQueue,
+        handler: JobHandler,
+        worker_id: Optional[str] = None,
+        lease_seconds: float = 60.0,
+        heartbeat_interval: Optional[float] = None,
+        poll_interval: float = 1.0,
+        retry_delay: float = 5.0
+    ):
+        """Initialize the worker.
+
+        Args:
+            queue: Job queue
+            handler: Runs one job payload and returns its result
+            worker_id: Identifier (default: hostname:pid)
+            lease_seconds: Lease length per claim and heartbeat
+            heartbeat_interval: Seconds between heartbeats (default: a third of the lease)
+            poll_interval: Seconds to sleep when the queue is empty
+            retry_delay: Base delay before a failed job is retried
+        """
+        self.queue = queue
+        self.handler = handler
+        self.worker_id = worker_id or f"{socket.gethostname()}:{os.getpid()}"
+        self.lease_seconds = lease_seconds
+        self.heartbeat_interval = heartbeat_interval or lease_seconds / 3
+        self.poll_interval = poll_interval
+        self.retry_delay = retry_delay
+
+    def _heartbeat(self, job_id: int, stop: threading.Event):
+        while not stop.wait(self.heartbeat_interval):
+            try:
+                if not self.queue.heartbeat(job_id, self.worker_id, self.lease_seconds):
+                    print(f"  [{self.worker_id}] lost lease on job {job_id}")
+                    return
+            except sqlite3.OperationalError as e:
+                # Transient lock contention; the lease covers a few missed beats
+                print(f"  [{self.worker_id}] heartbeat failed for job {job_id}: {e}")
+
+    def run_one(self) -> Optional[int]:
+        """Claim and run one job; returns its ID, or None if the queue was empty."""
+        job = self.queue.claim(self.worker_id, self.lease_seconds)
+        if job is None:
+            return None
+
+        stop = threading.Event()
+        heartbeat = threading.Thread(target=self._heartbeat, args=(job['id'], stop), daemon=True)
+        heartbeat.start()
+        try:
+            result = self.handler(job['payload'])
+        except Exception as e:
+            stop.set()
+            heartbeat.join()
+            self.queue.fail(job['id'], self.worker_id, f"{type(e).__name__}: {e}", self.retry_delay)
+            print(f"  [{self.worker_id}] job {job['id']} failed (attempt {job['attempts']}): {e}")
+            return job['id']
+
+        stop.set()
+        heartbeat.join()
+        if not self.queue.complete(job['id'], self.worker_id, result):
+            # The lease expired and the job was handed to another worker
+            print(f"  [{self.worker_id}] job {job['id']} finished after its lease was lost")
+        return job['id']
+
+    def run(self, max_jobs: Optional[int] = None, idle_timeout: Optional[float] = None) -> int:
+        """Process jobs until stopped.
+
+        Args:
+            max_jobs: Stop after this many jobs
+            idle_timeout: Stop after the queue has been empty this long
+
+        Returns:
+            Number of jobs processed
+        """
+        processed = 0
+        idle_since = time.time()
+
+        while max_jobs is None or processed < max_jobs:
+            if self.run_one() is not None:
+                processed += 1
+                idle_since = time.time()
+                continue
+            if idle_timeout is not None and time.time() - idle_since >= idle_timeout:
+                break
+            time.sleep(self.poll_interval)
+
+        return processed
+
+
+def make_factor_handler(
+    prices_df: Union[pd.DataFrame, str],
+    returns_df: Optional[pd.DataFrame],
+    db_path: str = "experiments.db",
+    screening_thresholds: Optional[Dict[str, Any]] = None,
+    duplicate_threshold: float = 0.95,
+    output_base_dir: str = "experiments/runs",
+    run_queue: Optional[Any] = None
+) -> JobHandler:
+    """Build a handler that evaluates factor YAML jobs.
+
+    Each job payload has 'factor_yaml' and optionally 'tags'. The factor is
+    registered (or looked up by name, when a job is retried), deduplicated,
+    screened and backtested as in Orchestrator.run_iteration, and
+    successful backtests are logged as runs. With run_queue, runs are put
+    on a RunWriter queue instead of being written by the worker; their
+    results then carry no run_id, since the writer commits them later.
+
+    Args:
+        prices_df: Prices DataFrame, or a panel snapshot directory
+        returns_df: Returns DataFrame (None: computed from the prices)
+        db_path: ExperimentStore database
+        screening_thresholds: Screening cascade thresholds (default: policy rules)
+        duplicate_threshold: Fingerprint correlation treated as a duplicate
+        output_base_dir: Backtest artifact directory
+        run_queue: RunWriter.queue to send runs to (default: log each run directly)
+
+    Returns:
+        Handler for QueueWorker
+    """
+    from ..agents.candidate_pipeline import evaluate_candidate, init_candidate_worker
+    from ..factors.context import CandidateContext
+    from ..factors.dsl import DSLParser
+    from ..memory.policy_manager import PolicyManager
+    from ..memory.store import ExperimentStore
+    from ..tools.logbook import log_run
+
+    if screening_thresholds is None:
+        screening_thresholds = PolicyManager().get_screening_thresholds()
+    init_candidate_worker(
+        prices_df, returns_df, db_path, screening_thresholds, duplicate_threshold, output_base_dir
+    )
+    store = ExperimentStore(db_path)
+    parser = DSLParser()
+    dates = PanelSnapshot(prices_df).dates if isinstance(prices_df, str) else prices_df.index
+
+    def handle(payload: Dict[str, Any]) -> Dict[str, Any]:
+        factor_yaml = payload['factor_yaml']
+        context = CandidateContext.from_yaml(factor_yaml, parser)
+        if context.parse_error is not None:
+            raise ValueError(f"Failed to parse Factor DSL: {context.parse_error}")
+        spec = context.spec
+        factor = store.get_factor_by_name(spec.name) or store.create_factor(
+            name=spec.name,
+            yaml=factor_yaml,
+            tags=payload.get('tags', [])
+        )
+        run_id = f"run_{factor.id}_{time.strftime('%Y%m%d_%H%M%S')}"
+
+        outcome = evaluate_candidate(factor_yaml, factor.id, run_id, store.count_runs() + 1, context=context)
+        result = {'status': outcome['status'], 'factor_id': factor.id, 'factor_name': spec.name}
+        if 'screen' in outcome:
+            result['screening'] = outcome['screen']['stats']
+
+        if outcome['status'] == 'feature_failed':
+            result['error'] = outcome['feature_result'].content.summary
+        elif outcome['status'] == 'duplicate':
+            result['duplicate_of'] = outcome['duplicate']['name']
+            result['correlation'] = outcome['duplicate']['correlation']
+        elif outcome['status'] == 'screened':
+            result['rejected_at'] = outcome['screen']['rejected_at']
+        elif outcome['status'] == 'backtest_failed':
+            result['error'] = outcome['backtest_result'].content.summary
+        else:
+            metrics = outcome['backtest_result'].content.data['metrics']
+            record = {
+                'factor_id': factor.id,
+                'start_date': dates.min(),
+                'end_date': dates.max(),
+                'metrics': metrics,
+                'regime_label': None,
+                'issues': []
+            }
+            if run_queue is not None:
+                run_queue.put(record)
+            else:
+                result['run_id'] = log_run(db_path=db_path, **record)['run_id']
+            result.update(
+                metrics=metrics,
+                backtest_seconds=outcome['backtest_seconds']
+            )
+
+        return result
+
+    return handle
+
+
+def _worker_process(
+    queue_path: str,
+    prices_path: str,
+    db_path: str,
+    max_jobs: Optional[int],
+    idle_timeout: float,
+    run_queue: Optional[Any] = None
+):
+    if PanelSnapshot.exists(prices_path):
+        # Memory-mapped: worker processes on a host share the page cache
+        handler = make_factor_handler(prices_path, None, db_path=db_path, run_queue=run_queue)
+    else:
+        prices_df = pd.read_parquet(prices_path)
+        handler = make_factor_handler(prices_df, prices_df.pct_change(1), db_path=db_path, run_queue=run_queue)
+    processed = QueueWorker(JobQueue(queue_path), handler).run(max_jobs=max_jobs, idle_timeout=idle_timeout)
+    print(f"Worker {socket.gethostname()}:{os.getpid()} processed {processed} jobs")
+
+
+def run_workers(
+    n_workers: int,
+    queue_path: str,
+    prices_path: str,
+    db_path: str = "experiments.db",
+    max_jobs: Optional[int] = None,
+    idle_timeout: float = 30.0
+):
+    """Run factor-evaluation workers in n_workers local processes.
+
+    Workers send their runs to a RunWriter in this process, which commits
+    them to the ExperimentStore in batches. Workers still write directly
+    when they register a factor or index its fingerprint, since they need
+    the factor ID and the duplicate verdict at once; those are short
+    transactions, and WAL mode with a busy timeout lets them wait their
+    turn.
+
+    Args:
+        n_workers: Number of worker processes
+        queue_path: Queue database
+        prices_path: Parquet file with the prices panel (dates x tickers)
+        db_path: ExperimentStore database
+        max_jobs: Jobs per worker before it exits
+        idle_timeout: Seconds a worker waits on an empty queue before exiting
+    """
+    with RunWriter(db_path) as writer:
+        processes = [
+            multiprocessing.Process(
+                target=_worker_process,
+                args=(queue_path, prices_path, db_path, max_jobs, idle_timeout, writer.queue)
+            )
+            for _ in range(n_workers)
+        ]
+        for process in processes:
+            process.start()
+        for process in processes:
+            process.join()
+    print(f"Logged {len(writer.run_ids)} runs ({writer.n_failed} failed)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Distributed factor evaluation queue")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    enqueue_parser = subparsers.add_parser("enqueue", help="Add factor YAML files to the queue")
+    enqueue_parser.add_argument("--queue", type=str, default="experiments/jobs.db", help="Queue database")
+    enqueue_parser.add_argument("--priority", type=int, default=0, help="Job priority")
+    enqueue_parser.add_argument("files", nargs="+", help="Factor YAML files")
+
+    worker_parser = subparsers.add_parser("worker", help="Run workers on this host")
+    worker_parser.add_argument("--queue", type=str, default="experiments/jobs.db", help="Queue database")
+    worker_parser.add_argument("--prices", type=str, required=True, help="Prices panel parquet or panel snapshot directory")
+    worker_parser.add_argument("--db", type=str, default="experiments.db", help="Experiment database")
+    worker_parser.add_argument("--workers", type=int, default=os.cpu_count() or 1, help="Worker processes")
+    worker_parser.add_argument("--idle_timeout", type=float, default=30.0, help="Exit after idling this long")
+
+    status_parser = subparsers.add_parser("status", help="Show job counts")
+    status_parser.add_argument("--queue", type=str, default="experiments/jobs.db", help="Queue database")
+
+    args = parser.parse_args()
+    queue = JobQueue(args.queue)
+
+    if args.command == "enqueue":
+        payloads = [{'factor_yaml': Path(f).read_text()} for f in args.files]
+        ids = queue.enqueue_many(payloads, priority=args.priority)
+        print(f"Enqueued {len(ids)} jobs ({ids[0]}-{ids[-1]})")
+    elif args.command == "worker":
+        run_workers(args.workers, args.queue, args.prices, db_path=args.db, idle_timeout=args.idle_timeout)
+    else:
+        print(json.dumps(queue.counts(), indent=2))
+
+
+if __name__ == "__main__":
+    main()
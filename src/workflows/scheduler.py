@@ -0,0 +1,219 @@
+"""Successive-halving compute scheduler for candidate pools.
+
+All candidates are first evaluated on a short recent window with a single
+split. After each rung the top 1/eta are promoted to a longer history with
+more walk-forward splits, so the full-history evaluation is only paid for a
+few survivors. Evaluations are charged against a CPU-seconds budget per day
+that is shared by all cycles through the experiment store.
+"""
+
+import math
+import time
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+
+from ..backtest.pipeline import walkforward_backtest
+from ..factors.context import CandidateContext
+from ..factors.dsl import DSLParser
+from ..memory.store import ExperimentStore
+from ..tools.compute_factor import compute_factor
+
+# history_days=None means the full history
+DEFAULT_RUNGS = [
+    {'history_days': 378, 'walk_forward': {'n_splits': 1, 'min_train_days': 126}},
+    {'history_days': 756, 'walk_forward': {'n_splits': 3}},
+    {'history_days': None, 'walk_forward': {'n_splits': 5}}
+]
+
+# Evaluation callback: (candidate_id, payload, rung) -> score (higher is better)
+EvaluateFn = Callable[[str, Any, Dict[str, Any]], Optional[float]]
+
+
+class SuccessiveHalvingScheduler:
+    """Allocate evaluation budget to the most promising candidates."""
+
+    def __init__(
+        self,
+        evaluate_fn: EvaluateFn,
+        rungs: Optional[List[Dict[str, Any]]] = None,
+        eta: float = 3.0,
+        daily_cpu_budget: float = 3600.0,
+        store: Optional[ExperimentStore] = None
+    ):
+        """Initialize the scheduler.
+
+        Args:
+            evaluate_fn: Scores one candidate on one rung
+            rungs: Rung definitions with 'history_days' and 'walk_forward'
+            eta: Keep the top 1/eta of candidates after each rung
+            daily_cpu_budget: CPU seconds available per day across all cycles
+            store: Experiment store for decisions and budget accounting
+        """
+        self.evaluate_fn = evaluate_fn
+        self.rungs = rungs or DEFAULT_RUNGS
+        self.eta = eta
+        self.daily_cpu_budget = daily_cpu_budget
+        self.store = store
+
+    def remaining_budget(self, day: Optional[str] = None) -> float:
+        """CPU seconds left for a day (YYYY-MM-DD, default today)."""
+        day = day or datetime.now().strftime('%Y-%m-%d')
+        used = self.store.get_cpu_seconds_used(day) if self.store else 0.0
+        return max(self.daily_cpu_budget - used, 0.0)
+
+    def run(self, candidates: Dict[str, Any], cycle_id: Optional[str] = None) -> Dict[str, Any]:
+        """Run successive halving over a candidate pool.
+
+        Args:
+            candidates: Mapping of candidate ID to payload passed to evaluate_fn
+            cycle_id: Identifier used when logging decisions
+
+        Returns:
+            Dictionary with:
+            - ranking: Candidate IDs, best first (highest rung reached, then score)
+            - scores: Last score per candidate
+            - rung_reached: Highest rung each candidate was evaluated on
+            - decisions: Logged decision records
+            - cpu_seconds: CPU time spent in this cycle
+            - budget_exhausted: Whether the daily budget stopped the cycle
+        """
+        cycle_id = cycle_id or f"sh_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+        day = datetime.now().strftime('%Y-%m-%d')
+        budget = self.remaining_budget(day)
+
+        scores: Dict[str, float] = {}
+        rung_reached: Dict[str, int] = {}
+        decisions: List[Dict[str, Any]] = []
+        spent = 0.0
+        budget_exhausted = False
+        alive = list(candidates)
+
+        for rung_index, rung in enumerate(self.rungs):
+            rung_scores = {}
+            rung_seconds = {}
+
+            for candidate_id in alive:
+                if spent >= budget:
+                    budget_exhausted = True
+                    break
+
+                start = time.process_time()
+                try:
+                    score = self.evaluate_fn(candidate_id, candidates[candidate_id], rung)
+                except Exception as e:
+                    print(f"  ✗ {candidate_id} failed on rung {rung_index}: {e}")
+                    score = None
+                elapsed = time.process_time() - start
+                spent += elapsed
+
+                if score is None or not np.isfinite(score):
+                    score = -np.inf
+                rung_scores[candidate_id] = score
+                rung_seconds[candidate_id] = elapsed
+                scores[candidate_id] = score
+                rung_reached[candidate_id] = rung_index
+
+            is_last = rung_index == len(self.rungs) - 1
+            ordered = sorted(rung_scores, key=rung_scores.get, reverse=True)
+            if budget_exhausted or is_last:
+                promoted = []
+            else:
+                n_keep = max(1, math.ceil(len(alive) / self.eta))
+                promoted = [c for c in ordered[:n_keep] if np.isfinite(rung_scores[c])]
+
+            for candidate_id in alive:
+                if candidate_id not in rung_scores:
+                    decision = 'budget_exhausted'
+                elif is_last or budget_exhausted:
+                    decision = 'completed'
+                else:
+                    decision = 'promoted' if candidate_id in promoted else 'eliminated'
+
+                score = rung_scores.get(candidate_id)
+                decisions.append({
+                    'cycle_id': cycle_id,
+                    'day': day,
+                    'candidate': str(candidate_id),
+                    'rung': rung_index,
+                    'history_days': rung.get('history_days'),
+                    'n_splits': rung.get('walk_forward', {}).get('n_splits'),
+                    'score': float(score) if score is not None and np.isfinite(score) else None,
+                    'cpu_seconds': rung_seconds.get(candidate_id, 0.0),
+                    'decision': decision,
+                    'budget_seconds': budget
+                })
+
+            if self.store:
+                self.store.log_scheduler_decisions(decisions[-len(alive):])
+
+            print(f"  Rung {rung_index}: evaluated {len(rung_scores)}/{len(alive)}, "
+                  f"promoted {len(promoted)} (CPU {spent:.1f}s / {budget:.1f}s)")
+
+            alive = promoted
+            if not alive:
+                break
+
+        ranking = sorted(scores, key=lambda c: (rung_reached[c], scores[c]), reverse=True)
+
+        return {
+            'ranking': ranking,
+            'scores': scores,
+            'rung_reached': rung_reached,
+            'decisions': decisions,
+            'cpu_seconds': spent,
+            'budget_exhausted': budget_exhausted
+        }
+
+
+def make_backtest_evaluator(
+    prices_df: pd.DataFrame,
+    returns_df: pd.DataFrame,
+    metric: str = 'sharpe',
+    contexts: Optional[Dict[str, CandidateContext]] = None
+) -> EvaluateFn:
+    """Build an evaluate_fn that walk-forward backtests factor YAMLs.
+
+    Signals are computed once per candidate on the full history and sliced
+    to each rung's window.
+
+    Args:
+        prices_df: Prices DataFrame
+        returns_df: Returns DataFrame
+        metric: Overall metric used as the score
+        contexts: Dict to keep each candidate's CandidateContext in, so the
+            caller can reuse the parsed spec and signals (e.g. for a full
+            backtest of the survivors)
+
+    Returns:
+        Callable (candidate_id, factor_yaml, rung) -> score
+    """
+    parser = DSLParser()
+    if contexts is None:
+        contexts = {}
+
+    def evaluate(candidate_id: str, factor_yaml: str, rung: Dict[str, Any]) -> Optional[float]:
+        if candidate_id not in contexts:
+            contexts[candidate_id] = CandidateContext.from_yaml(factor_yaml, parser)
+        context = contexts[candidate_id]
+        signals_df = compute_factor(factor_yaml, prices_df, returns_df, context=context)['signals']
+        if signals_df is None:
+            return None
+        spec = context.spec
+
+        history_days = rung.get('history_days')
+        if history_days:
+            signals_df = signals_df.iloc[-history_days:]
+
+        result = walkforward_backtest(
+            signals_df=signals_df,
+            prices_df=prices_df,
+            returns_df=returns_df,
+            factor_spec=spec,
+            config={'walk_forward': rung.get('walk_forward', {})}
+        )
+        return result['overall_metrics'].get(metric)
+
+    return evaluate
@@ -0,0 +1,122 @@
+"""Tests for the concurrent candidate pipeline."""
+
+import pickle
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+from src.agents.candidate_pipeline import (
+    CandidatePipeline,
+    evaluate_candidate,
+    init_candidate_worker
+)
+from src.factors.context import CandidateContext
+
+
+def _cpu_work(value):
+    """Busy-loop for ~0.2s of CPU, then return the value squared."""
+    end = time.process_time() + 0.2
+    while time.process_time() < end:
+        pass
+    return value * value
+
+
+def test_pipeline_overlaps_proposals_and_workers():
+    """Slow proposals and CPU work overlap; results arrive as they complete."""
+    counter = iter(range(100))
+    finished = []
+
+    def propose():
+        time.sleep(0.2)  # LLM latency
+        return next(counter)
+
+    with ProcessPoolExecutor(max_workers=2) as executor:
+        pipeline = CandidatePipeline(max_workers=2, max_concurrent_proposals=2, executor=executor)
+        stats = pipeline.run(
+            6,
+            propose,
+            lambda proposal: (proposal,),
+            _cpu_work,
+            lambda args, result: finished.append((args[0], result))
+        )
+
+    assert sorted(finished) == [(i, i * i) for i in range(6)]
+    assert stats['n_evaluated'] == 6
+    # Serial would be 6 * (0.2 + 0.2) = 2.4s
+    assert stats['wall_seconds'] < 1.8
+    assert 0 < stats['worker_utilization'] <= 1.0
+    assert stats['worker_cpu_seconds'] >= 6 * 0.2 * 0.9
+
+
+def test_pipeline_reports_errors():
+    """Failed proposals are dropped; failing candidates go to error_fn."""
+    proposals = iter([None, 1, 2])
+    errors = []
+
+    def prepare(proposal):
+        if proposal == 2:
+            raise ValueError("bad spec")
+        return (proposal,)
+
+    stats = CandidatePipeline(max_workers=1).run(
+        3,
+        lambda: next(proposals),
+        prepare,
+        _cpu_work,
+        lambda args, result: None,
+        lambda proposal, error: errors.append((proposal, str(error)))
+    )
+
+    assert stats['n_proposed'] == 2
+    assert stats['n_evaluated'] == 1
+    assert errors == [(2, 'bad spec')]
+
+
+def test_evaluate_candidate_in_worker(tmp_path, sample_factor_yaml):
+    """The worker runs features, dedup and screening against its own store."""
+    rng = np.random.default_rng(31)
+    dates = pd.bdate_range('2020-01-01', periods=800)
+    returns = pd.DataFrame(rng.normal(0, 0.02, (800, 30)), index=dates, columns=[f"T{i}" for i in range(30)])
+    prices = 100 * (1 + returns).cumprod()
+
+    init_candidate_worker(
+        prices,
+        returns,
+        str(tmp_path / 'experiments.db'),
+        {},
+        0.95,
+        str(tmp_path / 'runs')
+    )
+
+    first = evaluate_candidate(sample_factor_yaml, 1, 'run_1', 1)
+    second = evaluate_candidate(sample_factor_yaml, 2, 'run_2', 2)
+
+    # DSL expressions are broadcast to every ticker, so screening checks them over time only;
+    # validation then fails the 30-ticker panel on sample size
+    assert first['screen']['passed'] and first['screen']['stats']['broadcast']
+    assert list(first['screen']['seconds']) == ['sanity']
+    assert first['status'] == 'backtest_failed'
+    assert second['status'] == 'duplicate'
+    assert second['duplicate']['factor_id'] == 1
+
+
+def test_worker_uses_the_callers_context(tmp_path, sample_factor_yaml, monkeypatch):
+    """A context built in the main process is pickled to the worker and not parsed again."""
+    rng = np.random.default_rng(32)
+    dates = pd.bdate_range('2020-01-01', periods=300)
+    returns = pd.DataFrame(rng.normal(0, 0.01, (300, 10)), index=dates, columns=[f"T{i}" for i in range(10)])
+    init_candidate_worker(
+        100 * (1 + returns).cumprod(), returns, str(tmp_path / 'experiments.db'), {}, 0.95, str(tmp_path / 'runs')
+    )
+    context = pickle.loads(pickle.dumps(CandidateContext.from_yaml(sample_factor_yaml)))
+
+    def fail(*args, **kwargs):
+        raise AssertionError("candidate parsed again in the worker")
+
+    monkeypatch.setattr(CandidateContext, 'from_yaml', classmethod(fail))
+    outcome = evaluate_candidate(sample_factor_yaml, 1, 'run_1', 1, context=context)
+
+    assert outcome['status'] == 'screened'
+    assert context.signals is not None
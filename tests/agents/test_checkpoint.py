@@ -0,0 +1,56 @@
+"""Tests for loop checkpoints."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.agents.checkpoint import LoopCheckpoint, signal_cache_key
+
+
+def test_state_roundtrip(tmp_path):
+    """Saved state, including numpy and pandas values, is reloaded."""
+    checkpoint = LoopCheckpoint(str(tmp_path / 'ckpt'))
+    assert not checkpoint.exists
+
+    checkpoint.update(
+        kind='discovery',
+        iteration=3,
+        current={'metrics': {'sharpe': np.float64(1.25), 'n': np.int64(4)}},
+        start=pd.Timestamp('2020-01-02')
+    )
+
+    reloaded = LoopCheckpoint(str(tmp_path / 'ckpt'))
+    assert reloaded.exists
+    assert reloaded.state['iteration'] == 3
+    assert reloaded.state['current']['metrics'] == {'sharpe': 1.25, 'n': 4}
+    assert reloaded.state['start'] == '2020-01-02T00:00:00'
+
+
+def test_failed_save_keeps_previous_state(tmp_path):
+    """A save that fails midway leaves the last good state and no temp files."""
+    checkpoint = LoopCheckpoint(str(tmp_path / 'ckpt'))
+    checkpoint.update(iteration=1)
+
+    with pytest.raises(TypeError):
+        checkpoint.update(iteration=2, bad=object())
+
+    assert LoopCheckpoint(str(tmp_path / 'ckpt')).state['iteration'] == 1
+    assert [p.name for p in (tmp_path / 'ckpt').iterdir()] == ['state.json']
+
+
+def test_signal_cache(tmp_path):
+    """Signals are stored under the factor's cache key."""
+    checkpoint = LoopCheckpoint(str(tmp_path / 'ckpt'))
+    signals = pd.DataFrame(
+        np.random.default_rng(0).normal(size=(5, 2)),
+        index=pd.bdate_range('2020-01-01', periods=5),
+        columns=['AAPL', 'MSFT']
+    )
+
+    key = checkpoint.save_signals('name: f1', signals)
+
+    assert key == signal_cache_key('name: f1')
+    pd.testing.assert_frame_equal(checkpoint.load_signals(key), signals, check_freq=False)
+    assert checkpoint.load_signals(signal_cache_key('name: f2')) is None
+    assert checkpoint.load_signals(signal_cache_key('name: f1', data_hash='abc')) is None
+    assert checkpoint.save_signals('name: f1', signals, data_hash='abc') == signal_cache_key('name: f1', 'abc')
@@ -1,7 +1,7 @@
 """Unit tests for Critic Agent."""
 
 import pytest
-from unittest.mock import Mock, patch
+from unittest.mock import Mock
 
 from src.agents.critic import CriticAgent
 from src.memory.store import ExperimentStore
@@ -13,14 +13,10 @@ class TestCriticAgent:
     @pytest.fixture
     def critic(self, temp_db):
         """Create Critic Agent instance."""
-        # Mock both possible import paths
-        with patch('langchain_community.llms.Ollama'), \
-             patch('langchain.llms.Ollama'):
-            agent = CriticAgent(
-                model_name="deepseek-r1",
-                db_path=temp_db.db_path
-            )
-            return agent
+        return CriticAgent(
+            model_name="deepseek-r1",
+            db_path=temp_db.db_path
+        )
     
     def test_initialization(self, critic):
         """Test agent initialization."""
@@ -0,0 +1,72 @@
+"""Tests for the LLM response cache and its use in the gateway."""
+
+import time
+
+import pytest
+
+from src.agents.llm_cache import LLMResponseCache, cache_key
+from src.agents.llm_gateway import CallableBackend, LLMGateway, LLMGatewayError
+
+
+def test_cache_key_covers_all_fields():
+    base = cache_key('m', 'prompt', 0.3, 1)
+    assert base == cache_key('m', 'prompt', 0.3, 1)
+    assert len({base, cache_key('n', 'prompt', 0.3, 1), cache_key('m', 'other', 0.3, 1),
+                cache_key('m', 'prompt', 0.5, 1), cache_key('m', 'prompt', 0.3, 2)}) == 5
+
+
+def test_ttl_expiry(tmp_path):
+    cache = LLMResponseCache(str(tmp_path / 'cache.sqlite'), ttl_seconds=0.05)
+    cache.put('k', 'v')
+    assert cache.get('k') == 'v'
+    time.sleep(0.1)
+    assert cache.get('k') is None
+    assert cache.stats()['entries'] == 0
+
+
+def test_lru_eviction_by_entries_and_bytes(tmp_path):
+    cache = LLMResponseCache(str(tmp_path / 'cache.sqlite'), max_entries=3, max_bytes=None)
+    for key in 'abc':
+        cache.put(key, key * 10)
+        time.sleep(0.01)
+    cache.get('a')  # 'b' is now least recently used
+    cache.put('d', 'dddd')
+    assert cache.get('b') is None
+    assert all(cache.get(key) is not None for key in 'acd')
+
+    cache = LLMResponseCache(str(tmp_path / 'bytes.sqlite'), max_entries=None, max_bytes=25)
+    for key in 'abc':
+        cache.put(key, key * 10)
+        time.sleep(0.01)
+    assert cache.get('a') is None
+    assert cache.stats() == {'entries': 2, 'bytes': 20, 'path': str(tmp_path / 'bytes.sqlite')}
+
+
+def test_gateway_replays_from_cache(tmp_path):
+    """Repeated requests hit the cache; cache-only mode replays without the backend."""
+    calls = []
+
+    def backend(prompt, model, temperature):
+        calls.append(prompt)
+        return f"answer to {prompt}"
+
+    path = str(tmp_path / 'cache.sqlite')
+    gateway = LLMGateway(cache=LLMResponseCache(path))
+    gateway.register('ollama', CallableBackend(backend))
+    try:
+        assert gateway.complete('q', temperature=0.3) == 'answer to q'
+        assert gateway.complete('q', temperature=0.3) == 'answer to q'
+        assert gateway.complete('q', temperature=0.7) == 'answer to q'
+        assert calls == ['q', 'q']
+        assert gateway.stats['cache_hits'] == 1
+    finally:
+        gateway.close()
+
+    replay = LLMGateway(cache=LLMResponseCache(path), cache_mode='cache_only')
+    replay.register('ollama', CallableBackend(lambda *args: pytest.fail('backend called in cache-only mode')))
+    try:
+        assert replay.complete('q', temperature=0.3) == 'answer to q'
+        with pytest.raises(LLMGatewayError, match='cache-only'):
+            replay.complete('new prompt', temperature=0.3)
+    finally:
+        replay.close()
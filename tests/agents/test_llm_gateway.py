@@ -0,0 +1,203 @@
+"""Tests for the LLM gateway against a local mock Ollama server."""
+
+import asyncio
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from src.agents.llm_gateway import CallableBackend, LLMGateway, LLMGatewayError, OllamaBackend
+
+
+class MockOllamaServer:
+    """Echo server for /api/generate and list-prompt /v1/completions."""
+
+    def __init__(self, delay: float = 0.0, fail_first: int = 0, status: int = 500):
+        self.delay = delay
+        self.fail_first = fail_first
+        self.status = status
+        self.requests = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.lock = threading.Lock()
+
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_POST(self):
+                payload = json.loads(self.rfile.read(int(self.headers['Content-Length'])))
+                with server.lock:
+                    server.requests.append((self.path, payload))
+                    fail = len(server.requests) <= server.fail_first
+                    server.in_flight += 1
+                    server.max_in_flight = max(server.max_in_flight, server.in_flight)
+                try:
+                    time.sleep(server.delay)
+                finally:
+                    # Count the request as done before answering, so the client cannot
+                    # send its next request while this one still looks in flight
+                    with server.lock:
+                        server.in_flight -= 1
+
+                if fail:
+                    self.send_response(server.status)
+                    self.end_headers()
+                    return
+
+                if self.path == '/api/generate':
+                    body = {'response': f"echo: {payload['prompt']}", 'done': True}
+                else:
+                    body = {'choices': [
+                        {'index': i, 'text': f"echo: {prompt}"}
+                        for i, prompt in reversed(list(enumerate(payload['prompt'])))
+                    ]}
+                data = json.dumps(body).encode('utf-8')
+                self.send_response(200)
+                self.send_header('Content-Type', 'application/json')
+                self.send_header('Content-Length', str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+            def log_message(self, *args):
+                pass
+
+        self.httpd = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+        self.url = f"http://127.0.0.1:{self.httpd.server_address[1]}"
+        self.thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+        self.thread.start()
+
+    def close(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+
+@pytest.fixture
+def make_server():
+    servers = []
+
+    def make(**kwargs):
+        server = MockOllamaServer(**kwargs)
+        servers.append(server)
+        return server
+
+    yield make
+    for server in servers:
+        server.close()
+
+
+@pytest.fixture
+def gateway():
+    gateway = LLMGateway(timeout=2.0, backoff=0.01)
+    yield gateway
+    gateway.close()
+
+
+def test_complete_posts_to_generate(make_server, gateway):
+    """Single prompts use /api/generate with the model and temperature."""
+    server = make_server()
+    gateway.register('ollama', OllamaBackend(base_url=server.url, model='test-model'))
+
+    assert gateway.complete('hello', temperature=0.3) == 'echo: hello'
+
+    path, payload = server.requests[0]
+    assert path == '/api/generate'
+    assert payload == {'model': 'test-model', 'prompt': 'hello', 'stream': False, 'options': {'temperature': 0.3}}
+
+
+def test_concurrency_limit(make_server, gateway):
+    """No more than max_concurrency requests reach the server at once."""
+    server = make_server(delay=0.05)
+    gateway.register('ollama', OllamaBackend(base_url=server.url, max_concurrency=2))
+
+    texts = gateway.complete_many([f"p{i}" for i in range(8)])
+
+    assert texts == [f"echo: p{i}" for i in range(8)]
+    assert server.max_in_flight == 2
+
+
+def test_batching_coalesces_prompts(make_server, gateway):
+    """Concurrent prompts are sent as list-prompt batches, answers in order."""
+    server = make_server()
+    gateway.register('ollama', OllamaBackend(base_url=server.url, max_batch_size=4))
+
+    async def ask_all():
+        return await asyncio.gather(*(gateway.generate(f"p{i}") for i in range(10)))
+
+    texts = asyncio.run(ask_all())
+
+    assert texts == [f"echo: p{i}" for i in range(10)]
+    assert [len(payload['prompt']) for _, payload in server.requests] == [4, 4, 2]
+    assert all(path == '/v1/completions' for path, _ in server.requests)
+
+
+def test_retries_server_errors(make_server, gateway):
+    """Transient 5xx responses are retried."""
+    server = make_server(fail_first=2)
+    gateway.register('ollama', OllamaBackend(base_url=server.url))
+
+    assert gateway.complete('hello') == 'echo: hello'
+    assert len(server.requests) == 3
+    assert gateway.stats['retries'] == 2
+
+
+def test_client_errors_are_not_retried(make_server, gateway):
+    """4xx responses fail immediately."""
+    server = make_server(fail_first=5, status=404)
+    gateway.register('ollama', OllamaBackend(base_url=server.url))
+
+    with pytest.raises(LLMGatewayError):
+        gateway.complete('hello')
+    assert len(server.requests) == 1
+
+
+def test_timeout_then_failure(gateway):
+    """Attempts that exceed the timeout are retried, then reported as failures."""
+    calls = []
+
+    def slow(prompt, model, temperature):
+        calls.append(prompt)
+        time.sleep(0.3)
+        return 'late'
+
+    gateway.timeout = 0.05
+    gateway.register('slow', CallableBackend(slow))
+
+    with pytest.raises(LLMGatewayError, match='timed out'):
+        gateway.complete('hello', backend='slow')
+    assert len(calls) == gateway.max_retries + 1
+
+
+def test_timed_out_calls_keep_their_slot(gateway):
+    """A call still running after its timeout counts against max_concurrency."""
+    lock = threading.Lock()
+    in_flight = [0, 0]  # current, max
+
+    def slow(prompt, model, temperature):
+        with lock:
+            in_flight[0] += 1
+            in_flight[1] = max(in_flight[1], in_flight[0])
+        time.sleep(0.1)
+        with lock:
+            in_flight[0] -= 1
+        return 'late'
+
+    gateway.timeout = 0.02
+    gateway.max_retries = 1
+    gateway.register('slow', CallableBackend(slow, max_concurrency=1))
+
+    async def ask_all():
+        return await asyncio.gather(
+            *(gateway.generate(f"p{i}", backend='slow') for i in range(3)), return_exceptions=True
+        )
+
+    results = asyncio.run(ask_all())
+
+    assert all(isinstance(result, LLMGatewayError) for result in results)
+    assert in_flight[1] == 1
+
+
+def test_unknown_backend(gateway):
+    with pytest.raises(LLMGatewayError, match='Unknown'):
+        gateway.complete('hello', backend='missing')
@@ -1,7 +1,7 @@
 """Unit tests for Reporter Agent."""
 
 import pytest
-from unittest.mock import Mock, patch
+from unittest.mock import Mock
 
 from src.agents.reporter import ReporterAgent
 
@@ -12,12 +12,10 @@ class TestReporterAgent:
     @pytest.fixture
     def reporter(self, temp_db):
         """Create Reporter Agent instance."""
-        with patch('src.agents.reporter.Ollama'):
-            agent = ReporterAgent(
-                model_name="deepseek-r1",
-                db_path=temp_db.db_path
-            )
-            return agent
+        return ReporterAgent(
+            model_name="deepseek-r1",
+            db_path=temp_db.db_path
+        )
     
     def test_initialization(self, reporter):
         """Test agent initialization."""
@@ -0,0 +1,94 @@
+"""Tests for the memory-mapped benchmark library."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.archive.benchmark_library import BenchmarkLibrary
+from src.archive.success_factors import SuccessFactorArchive
+from src.backtest.multidim_eval import MultiDimensionalEvaluator
+
+
+@pytest.fixture
+def dates():
+    return pd.bdate_range('2018-01-01', periods=500)
+
+
+@pytest.fixture
+def benchmarks(dates):
+    """Benchmarks with different spans, gaps and one constant series."""
+    rng = np.random.default_rng(7)
+    series = [pd.Series(rng.normal(size=500), index=dates) for _ in range(6)]
+    series[1] = series[1].iloc[200:]
+    series[2].iloc[50:80] = np.nan
+    series[3] = pd.Series(1.0, index=dates)
+    return series
+
+
+def test_correlations_match_series_corr(tmp_path, dates, benchmarks):
+    """Matrix correlations equal pairwise-complete Series.corr."""
+    library = BenchmarkLibrary(tmp_path / 'library')
+    for i, bench in enumerate(benchmarks):
+        library.add(f"bench_{i}", bench)
+
+    candidate = pd.Series(np.random.default_rng(8).normal(size=500), index=dates) + benchmarks[0]
+    expected = [candidate.corr(bench) for bench in benchmarks]
+
+    np.testing.assert_allclose(library.correlations(candidate).to_numpy(), expected, atol=1e-6)
+
+
+def test_library_persists_and_appends(tmp_path, benchmarks):
+    """Reopening the library sees earlier rows; new rows append."""
+    library = BenchmarkLibrary(tmp_path / 'library')
+    library.add('first', benchmarks[0])
+
+    reopened = BenchmarkLibrary(tmp_path / 'library')
+    reopened.add('second', benchmarks[1])
+
+    assert reopened.names == ['first', 'second']
+    assert reopened.get('second').index.equals(benchmarks[1].index)
+    assert reopened.correlations(benchmarks[0])['first'] == pytest.approx(1.0, abs=1e-6)
+
+
+def test_archive_factor_updates_library(tmp_path, dates):
+    """Archiving a factor adds its average signal to the library."""
+    archive = SuccessFactorArchive(str(tmp_path / 'archive'))
+    signals = pd.DataFrame(np.random.default_rng(9).normal(size=(500, 5)), index=dates)
+
+    archive_path = archive.archive_factor(
+        factor_name='test_factor',
+        factor_yaml='name: test_factor',
+        agent_outputs={},
+        computations={'signals': signals},
+        backtest_results={'metrics': {}},
+        conversation_log=[]
+    )
+
+    assert archive.benchmark_library.names == [archive_path.split('/')[-1]]
+
+
+def test_evaluator_uses_library(tmp_path, dates, benchmarks):
+    """Diversity/originality can be scored against the library."""
+    library = BenchmarkLibrary(tmp_path / 'library')
+    for i, bench in enumerate(benchmarks):
+        library.add(f"bench_{i}", bench)
+
+    rng = np.random.default_rng(10)
+    returns = pd.Series(rng.normal(0, 0.01, 500), index=dates)
+    result = MultiDimensionalEvaluator().evaluate(benchmarks[0], returns, benchmark_library=library)
+
+    assert result['diversity']['n_benchmarks'] == len(benchmarks)
+    assert result['originality']['avg_distance'] < 1.0
+
+
+def test_evaluator_defaults_to_archive_library(tmp_path, dates, benchmarks):
+    """An evaluator built from an archive scores against its library."""
+    archive = SuccessFactorArchive(str(tmp_path / 'archive'))
+    for i, bench in enumerate(benchmarks):
+        archive.benchmark_library.add(f"bench_{i}", bench)
+
+    rng = np.random.default_rng(11)
+    returns = pd.Series(rng.normal(0, 0.01, 500), index=dates)
+    result = MultiDimensionalEvaluator(archive.benchmark_library).evaluate(benchmarks[0], returns)
+
+    assert result['diversity']['n_benchmarks'] == len(benchmarks)
@@ -0,0 +1,68 @@
+"""Tests for the online IC-decay tracker."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.backtest.decay_monitor import AlphaDecayMonitor, OnlineICTracker
+
+
+@pytest.fixture
+def decaying_factor():
+    """Signal whose predictive power fades linearly; rounded to create ties."""
+    rng = np.random.default_rng(0)
+    dates = pd.bdate_range('2018-01-01', periods=600)
+    returns = rng.normal(size=600)
+    signals = np.round(np.linspace(0.6, 0.0, 600) * returns + rng.normal(size=600), 1)
+    return pd.Series(signals, index=dates), pd.Series(returns, index=dates)
+
+
+def test_online_ic_matches_batch(decaying_factor):
+    """Incremental rank updates reproduce the batch rolling IC and half-life."""
+    signals, returns = decaying_factor
+    batch = AlphaDecayMonitor().track_ic_decay(signals, returns, window=63)
+
+    tracker = OnlineICTracker(window=63)
+    online = [tracker.update(d, s, r) for d, s, r in zip(signals.index, signals, returns)]
+    online = [ic for ic in online if ic is not None]
+
+    np.testing.assert_allclose(online, batch['ic_series'].to_numpy(), atol=1e-12)
+    assert tracker.summary()['half_life'] == pytest.approx(batch['half_life'])
+    assert tracker.summary()['decay_detected']
+
+
+def test_missing_observations_are_skipped():
+    """NaN observations do not enter the window."""
+    tracker = OnlineICTracker(window=5)
+    assert tracker.update('2020-01-01', np.nan, 0.1) is None
+    assert tracker.count == 0
+
+
+def test_summary_keys_are_stable(decaying_factor):
+    """Empty and filled trackers report the same summary keys."""
+    signals, returns = decaying_factor
+    tracker = OnlineICTracker(window=5)
+    empty = tracker.summary()
+    assert empty['last_ic'] is None and empty['last_date'] is None
+
+    for d, s, r in zip(signals.index[:20], signals.iloc[:20], returns.iloc[:20]):
+        tracker.update(d, s, r)
+    assert tracker.summary().keys() == empty.keys()
+
+
+def test_state_round_trip(decaying_factor, tmp_path):
+    """Saved trackers resume exactly where they stopped."""
+    signals, returns = decaying_factor
+    monitor = AlphaDecayMonitor()
+    for d, s, r in zip(signals.index[:400], signals.iloc[:400], returns.iloc[:400]):
+        monitor.update_live_ic('momentum', d, s, r)
+    monitor.save_trackers(tmp_path / 'trackers.json')
+
+    restored = AlphaDecayMonitor()
+    assert restored.load_trackers(tmp_path / 'trackers.json') == 1
+
+    for d, s, r in zip(signals.index[400:], signals.iloc[400:], returns.iloc[400:]):
+        expected = monitor.update_live_ic('momentum', d, s, r)
+        result = restored.update_live_ic('momentum', d, s, r)
+
+    assert result == expected
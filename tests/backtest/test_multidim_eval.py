@@ -0,0 +1,78 @@
+"""Tests for the multi-dimensional evaluator's shared context."""
+
+import numpy as np
+import pandas as pd
+import pytest
+from scipy.spatial.distance import cosine
+
+from src.backtest.metrics import information_coefficient, rolling_information_coefficient
+from src.backtest.multidim_eval import MultiDimensionalEvaluator
+
+
+@pytest.fixture
+def eval_data():
+    """Returns, prices, a few candidate signals and benchmarks."""
+    rng = np.random.default_rng(5)
+    dates = pd.bdate_range('2020-01-01', periods=600)
+    returns = pd.Series(rng.normal(0, 0.01, 600), index=dates)
+    prices = (1 + returns).cumprod() * 100
+
+    signals = {
+        f"factor_{i}": pd.Series(rng.normal(size=600) + 20 * i * returns.values, index=dates)
+        for i in range(4)
+    }
+    benchmarks = [pd.Series(rng.normal(size=600), index=dates) for _ in range(3)]
+
+    return signals, returns, prices, benchmarks
+
+
+def test_rolling_ic_matches_loop():
+    """Vectorized rolling IC equals the per-window loop, including NaN windows."""
+    rng = np.random.default_rng(0)
+    scores = pd.Series(rng.normal(size=300))
+    returns = pd.Series(rng.normal(size=300))
+    scores.iloc[:25] = np.nan
+    returns.iloc[150] = np.nan
+
+    loop = [
+        information_coefficient(scores.iloc[i - 21:i], returns.iloc[i - 21:i])
+        for i in range(21, len(scores))
+    ]
+
+    np.testing.assert_allclose(rolling_information_coefficient(scores, returns, 21), loop, atol=1e-12)
+
+
+def test_originality_matches_cosine_distance(eval_data):
+    """Matrix-based originality equals scipy cosine distance on z-scores."""
+    signals, returns, _, benchmarks = eval_data
+    signal = signals['factor_1']
+
+    def zscore(values):
+        return (values - values.mean()) / (values.std() + 1e-10)
+
+    expected = np.mean([cosine(zscore(signal.values), zscore(b.values)) for b in benchmarks])
+    result = MultiDimensionalEvaluator().evaluate(signal, returns, benchmark_signals=benchmarks)
+
+    assert result['originality']['avg_distance'] == pytest.approx(expected)
+
+
+def test_batch_matches_individual(eval_data):
+    """evaluate_batch gives the same results as evaluating one by one."""
+    signals, returns, prices, benchmarks = eval_data
+    evaluator = MultiDimensionalEvaluator()
+
+    batch = evaluator.evaluate_batch(signals, returns, prices, benchmarks)
+
+    assert set(batch) == set(signals)
+    for name, signal in signals.items():
+        single = evaluator.evaluate(signal, returns, prices, benchmarks)
+        assert batch[name]['overall_score'] == pytest.approx(single['overall_score'])
+        assert batch[name]['stability'] == pytest.approx(single['stability'])
+
+
+def test_insufficient_data_returns_empty():
+    """Fewer than 10 aligned observations give empty results."""
+    signals = pd.Series(np.arange(5.0))
+    returns = pd.Series(np.arange(5.0))
+
+    assert MultiDimensionalEvaluator().evaluate(signals, returns)['overall_score'] == 0.0
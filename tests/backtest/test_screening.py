@@ -0,0 +1,84 @@
+"""Tests for the pre-backtest screening cascade."""
+
+from types import SimpleNamespace
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.backtest.screening import ScreeningCascade
+from src.memory.policy_manager import PolicyManager
+
+
+@pytest.fixture
+def market():
+    """Returns panel for 80 tickers over 600 dates."""
+    rng = np.random.default_rng(21)
+    dates = pd.bdate_range('2020-01-01', periods=600)
+    tickers = [f"T{i}" for i in range(80)]
+    return pd.DataFrame(rng.normal(0, 0.01, (600, 80)), index=dates, columns=tickers)
+
+
+@pytest.fixture
+def factor_spec():
+    return SimpleNamespace(
+        portfolio=SimpleNamespace(scheme='long_short_deciles', weight='equal', notional=1.0)
+    )
+
+
+def test_constant_signal_rejected_at_sanity(market, factor_spec):
+    """A signal with no cross-sectional dispersion stops at stage 1."""
+    signals = pd.DataFrame(1.0, index=market.index, columns=market.columns)
+
+    result = ScreeningCascade().screen(signals, market, factor_spec)
+
+    assert result['rejected_at'] == 'sanity'
+    assert list(result['seconds']) == ['sanity']
+
+
+def test_broadcast_signal_skips_cross_sectional_stages(market, factor_spec):
+    """A time series copied to every ticker is checked over time only."""
+    series = market.mean(axis=1).rolling(20).mean()
+    signals = pd.DataFrame({ticker: series for ticker in market.columns})
+
+    result = ScreeningCascade().screen(signals, market, factor_spec)
+
+    assert result['passed'] and result['rejected_at'] is None
+    assert result['stats']['broadcast'] and result['stats']['time_std'] > 0.2
+    assert list(result['seconds']) == ['sanity']
+
+
+def test_anti_predictive_signal_rejected_at_ic(market, factor_spec):
+    """A signal negatively related to next-day returns stops at stage 2."""
+    noise = np.random.default_rng(22).normal(0, 0.01, market.shape)
+    signals = -market.shift(-1) + noise
+
+    result = ScreeningCascade().screen(signals, market, factor_spec)
+
+    assert result['rejected_at'] == 'ic'
+    assert result['stats']['ic_mean'] < 0
+
+
+def test_predictive_signal_passes(market, factor_spec):
+    """A predictive signal survives all three stages."""
+    noise = np.random.default_rng(23).normal(0, 0.01, market.shape)
+    signals = market.shift(-1) + noise
+
+    result = ScreeningCascade().screen(signals, market, factor_spec)
+
+    assert result['passed']
+    assert result['stats']['ic_mean'] > 0.3
+    assert result['stats']['single_split_sharpe'] > 0
+
+
+def test_thresholds_from_policy_manager(tmp_path, market, factor_spec):
+    """Policy rules override the default thresholds."""
+    policy = PolicyManager(rules_path=str(tmp_path / 'missing.json'))
+    policy.rules['screening'] = {'min_single_split_sharpe': 1e6}
+    noise = np.random.default_rng(24).normal(0, 0.01, market.shape)
+
+    cascade = ScreeningCascade(policy.get_screening_thresholds())
+    result = cascade.screen(market.shift(-1) + noise, market, factor_spec)
+
+    assert result['rejected_at'] == 'single_split'
+    assert cascade.thresholds['min_ic'] == 0.0
@@ -0,0 +1,96 @@
+"""Tests for significance statistics (PSR, DSR, stationary bootstrap)."""
+
+import time
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.backtest.statistics import (
+    probabilistic_sharpe_ratio,
+    deflated_sharpe_ratio,
+    expected_max_sharpe,
+    stationary_bootstrap_indices,
+    bootstrap_sharpe_distribution,
+    bootstrap_sharpe_ci,
+    significance_metrics
+)
+
+
+@pytest.fixture
+def skilled_returns():
+    """Daily returns with a positive drift (annualized Sharpe ~2)."""
+    rng = np.random.default_rng(0)
+    return pd.Series(rng.normal(0.0008, 0.006, 1000))
+
+
+class TestSharpeSignificance:
+    """Test PSR and DSR."""
+
+    def test_psr_bounds(self, skilled_returns):
+        """PSR is a probability and high for a skilled strategy."""
+        psr = probabilistic_sharpe_ratio(skilled_returns)
+        assert 0.0 <= psr <= 1.0
+        assert psr > 0.95
+
+    def test_psr_flat_returns(self):
+        """Flat returns have no evidence of skill."""
+        assert probabilistic_sharpe_ratio(pd.Series([0.0] * 100)) == pytest.approx(0.5)
+
+    def test_dsr_decreases_with_trials(self, skilled_returns):
+        """More trials raise the bar for significance."""
+        dsr_1 = deflated_sharpe_ratio(skilled_returns, n_trials=1)
+        dsr_100 = deflated_sharpe_ratio(skilled_returns, n_trials=100)
+        dsr_10000 = deflated_sharpe_ratio(skilled_returns, n_trials=10000)
+
+        assert dsr_1 == pytest.approx(probabilistic_sharpe_ratio(skilled_returns))
+        assert dsr_1 > dsr_100 > dsr_10000
+
+    def test_expected_max_sharpe(self):
+        """Expected max Sharpe grows with the number of trials."""
+        assert expected_max_sharpe(1, 0.01) == 0.0
+        assert 0 < expected_max_sharpe(10, 0.01) < expected_max_sharpe(1000, 0.01)
+
+
+class TestStationaryBootstrap:
+    """Test the vectorized stationary bootstrap."""
+
+    def test_indices_shape_and_range(self):
+        """Index matrix has one row per resample with valid positions."""
+        idx = stationary_bootstrap_indices(500, 200, mean_block_length=10, seed=1)
+        assert idx.shape == (200, 500)
+        assert idx.min() >= 0
+        assert idx.max() < 500
+
+    def test_indices_form_blocks(self):
+        """Consecutive indices mostly advance by one within blocks."""
+        idx = stationary_bootstrap_indices(1000, 50, mean_block_length=20, seed=2)
+        steps = np.diff(idx, axis=1)
+        continuation = ((steps == 1) | (steps == -999)).mean()
+        assert continuation == pytest.approx(1 - 1 / 20, abs=0.02)
+
+    def test_ci_contains_point_estimate(self, skilled_returns):
+        """Bootstrap interval brackets the sample Sharpe ratio."""
+        sample_sharpe = skilled_returns.mean() / skilled_returns.std() * np.sqrt(252)
+        low, high = bootstrap_sharpe_ci(skilled_returns, n_resamples=1000)
+        assert low < sample_sharpe < high
+
+    @pytest.mark.performance
+    def test_thousands_of_resamples_under_a_second(self, skilled_returns):
+        """5000 resamples of a 4-year series evaluate well under a second."""
+        start = time.perf_counter()
+        sharpes = bootstrap_sharpe_distribution(skilled_returns, n_resamples=5000)
+        elapsed = time.perf_counter() - start
+
+        assert len(sharpes) == 5000
+        assert elapsed < 1.0
+
+
+def test_significance_metrics_keys(skilled_returns):
+    """All metrics consumed by run_backtest are present."""
+    result = significance_metrics(skilled_returns, n_trials=25)
+
+    for key in ['psr', 'dsr', 'sharpe_ci_low', 'sharpe_ci_high', 'n_trials']:
+        assert key in result
+    assert result['n_trials'] == 25
+    assert result['dsr'] <= result['psr']
@@ -0,0 +1,100 @@
+"""Tests for backtest validation with a shared context."""
+
+from types import SimpleNamespace
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.backtest.metrics import sharpe
+from src.backtest.pipeline import walkforward_backtest
+from src.backtest.validator import (
+    _window_sharpes,
+    build_validation_context,
+    check_stability,
+    check_turnover,
+    validate_run
+)
+
+
+@pytest.fixture
+def backtest_inputs():
+    """Signals, returns and prices for 120 tickers over ~4 years."""
+    rng = np.random.default_rng(3)
+    dates = pd.bdate_range('2019-01-01', periods=1000)
+    tickers = [f"T{i}" for i in range(120)]
+
+    signals = pd.DataFrame(rng.normal(size=(1000, 120)), index=dates, columns=tickers)
+    returns = pd.DataFrame(rng.normal(0.0003, 0.01, size=(1000, 120)), index=dates, columns=tickers)
+    prices = (1 + returns).cumprod() * 100
+
+    return signals, returns, prices
+
+
+def test_vectorized_stability_matches_loop():
+    """Non-overlapping window Sharpes equal the per-window metrics.sharpe loop."""
+    returns = pd.Series(np.random.default_rng(0).normal(0.0005, 0.01, 1300))
+
+    for rolling_period in (63, 100, 252):
+        loop = [
+            sharpe(returns.iloc[i - rolling_period:i])
+            for i in range(rolling_period, len(returns), rolling_period)
+        ]
+        n_windows = (len(returns) - 1) // rolling_period
+        windows = returns.to_numpy()[:n_windows * rolling_period].reshape(n_windows, rolling_period)
+
+        np.testing.assert_allclose(_window_sharpes(windows), loop)
+
+
+def test_stability_flags_unstable_sharpe():
+    """A strategy that stops working is flagged as unstable."""
+    rng = np.random.default_rng(2)
+    returns = pd.Series(np.concatenate([
+        rng.normal(0.002, 0.01, 504),
+        rng.normal(-0.002, 0.01, 600)
+    ]))
+
+    is_valid, issues = check_stability(returns, rolling_period=252, min_periods=4)
+
+    assert not is_valid
+    assert 'Unstable Sharpe' in issues[0]
+
+
+def test_precomputed_turnover_matches_positions():
+    """check_turnover gives the same verdict from a precomputed series."""
+    positions = pd.DataFrame(np.random.default_rng(1).normal(0, 0.05, (100, 10)))
+    daily_turnover = positions.diff().abs().sum(axis=1)
+
+    assert check_turnover(positions, 100.0) == check_turnover(None, 100.0, daily_turnover)
+
+
+def test_context_gives_same_issues(backtest_inputs):
+    """validate_run with the pipeline context reports the same issues."""
+    signals, returns, prices = backtest_inputs
+    spec = SimpleNamespace(
+        portfolio=SimpleNamespace(scheme='long_short_deciles', weight='equal', notional=1.0)
+    )
+    result = walkforward_backtest(signals, prices, returns, spec)
+    metrics = result['overall_metrics']
+
+    _, without_context = validate_run(signals, returns, prices, result['positions'], metrics)
+    context = result['validation_context']
+    context['returns'] = None  # stability only runs when returns are supplied
+    _, with_context = validate_run(
+        signals, returns, prices, result['positions'], metrics, context=context
+    )
+
+    assert with_context == without_context
+    assert len(result['turnover']) == len(result['returns'])
+
+
+def test_context_enables_stability_check(backtest_inputs):
+    """Passing portfolio returns in the context runs the stability check."""
+    signals, returns, prices = backtest_inputs
+    context = build_validation_context(
+        signals, returns, prices, portfolio_returns=returns.mean(axis=1).iloc[:100]
+    )
+
+    _, issues = validate_run(signals, returns, prices, None, {}, context=context)
+
+    assert any(issue['type'] == 'unstable_performance' for issue in issues)
@@ -0,0 +1,68 @@
+"""Tests for the trading calendar and positional date alignment."""
+
+import numpy as np
+import pandas as pd
+
+from src.backtest.portfolio import construct_portfolio
+from src.data.calendar import TradingCalendar, align_dates, date_slice
+
+
+def test_nyse_sessions():
+    """Holidays, observed days and special closures are not sessions."""
+    calendar = TradingCalendar.from_config('sp500')
+
+    assert calendar.name == 'NYSE'
+    assert len(calendar.sessions_between('2024-01-01', '2024-12-31')) == 252
+    assert len(calendar.sessions_between('2012-01-01', '2012-12-31')) == 250
+    closed = ['2024-07-04', '2022-06-20', '2021-12-24', '2024-03-29', '2012-10-29', '2025-01-09']
+    assert not calendar.is_session(closed).any()
+    # New Year's Day on a Saturday is not observed on the Friday before
+    assert calendar.is_session(['2021-12-31', '2024-07-05']).all()
+    assert TradingCalendar.from_config('nasdaq100').name == 'NASDAQ'
+
+
+def test_align_puts_frames_on_sessions():
+    """Non-session rows are dropped, missing sessions added, aligned frames kept."""
+    calendar = TradingCalendar()
+    dates = pd.bdate_range('2024-06-28', '2024-07-10')  # includes July 4th
+    frame = pd.DataFrame({'AAPL': np.arange(len(dates), dtype=float)}, index=dates)
+    frame = frame.drop(pd.Timestamp('2024-07-08'))
+
+    aligned = calendar.align(frame)
+
+    assert aligned.index.equals(calendar.sessions_between('2024-06-28', '2024-07-10'))
+    assert pd.Timestamp('2024-07-04') not in aligned.index
+    assert np.isnan(aligned.loc['2024-07-08', 'AAPL'])
+    assert aligned.loc['2024-07-05', 'AAPL'] == frame.loc['2024-07-05', 'AAPL']
+    assert calendar.align(aligned) is aligned
+
+
+def test_align_dates_by_position():
+    """Frames on one index pass through; others are cut to the common dates."""
+    dates = pd.bdate_range('2024-01-01', periods=10)
+    a = pd.DataFrame(np.arange(20.0).reshape(10, 2), index=dates)
+    b = pd.DataFrame(np.ones((10, 2)), index=dates)
+
+    same_a, same_b = align_dates(a, b)
+    assert same_a is a and same_b is b
+
+    short_a, short_b = align_dates(a, b.iloc[3:])
+    assert short_a.index.equals(dates[3:]) and short_b.index.equals(dates[3:])
+    pd.testing.assert_frame_equal(short_a, a.loc[dates[3:]])
+
+    rows = date_slice(dates, dates[2], pd.Timestamp('2024-01-09'))
+    assert a.iloc[rows].index.equals(dates[(dates >= dates[2]) & (dates <= '2024-01-09')])
+
+
+def test_portfolio_same_for_aligned_and_misaligned_inputs():
+    """Positional alignment matches label intersection."""
+    rng = np.random.default_rng(0)
+    dates = pd.bdate_range('2024-01-01', periods=60)
+    scores = pd.DataFrame(rng.normal(size=(60, 20)), index=dates)
+    returns = pd.DataFrame(rng.normal(0, 0.01, size=(60, 20)), index=dates)
+
+    positions, portfolio_returns = construct_portfolio(scores.iloc[5:], returns)
+    expected_positions, expected_returns = construct_portfolio(scores.iloc[5:], returns.iloc[5:])
+
+    pd.testing.assert_frame_equal(positions, expected_positions)
+    pd.testing.assert_series_equal(portfolio_returns, expected_returns)
@@ -0,0 +1,64 @@
+"""Tests for the lazy MarketData container."""
+
+import numpy as np
+import pandas as pd
+
+from src.data.market_data import MarketData
+from src.data.market_store import MarketDataStore
+from src.data.panel_snapshot import write_panel_snapshot
+
+
+def _panel(value, n_dates=30):
+    dates = pd.bdate_range('2021-01-01', periods=n_dates)
+    return pd.DataFrame(value, index=dates, columns=['AAPL', 'MSFT'], dtype='float64')
+
+
+def test_fields_load_once_on_first_access():
+    """Each loader runs once, only when its field is used."""
+    calls = []
+
+    def loader(field, value):
+        def load():
+            calls.append(field)
+            return _panel(value)
+        return load
+
+    data = MarketData({'Close': loader('Close', 100.0), 'Volume': loader('Volume', 1e6)})
+    assert data.loaded_fields == [] and data.memory_usage() == {'total': 0}
+
+    assert data.volume.iloc[0, 0] == 1e6
+    assert data.field('volume') is data.volume
+    assert calls == ['Volume']
+
+    usage = data.memory_usage()
+    assert usage == {'Volume': 30 * 2 * 8, 'total': 30 * 2 * 8}
+    assert (data.returns.iloc[1:] == 0).all().all()
+    assert calls == ['Volume', 'Close']
+
+
+def test_from_store_reads_one_field(tmp_path):
+    """A store-backed container reads only the requested field."""
+    store = MarketDataStore(str(tmp_path))
+    for ticker in ['AAPL', 'MSFT']:
+        bars = pd.DataFrame({'Close': 10.0, 'High': 11.0, 'Volume': 5.0}, index=pd.bdate_range('2021-01-01', periods=10))
+        store.write(ticker, bars)
+
+    data = MarketData.from_store(store, ['AAPL', 'MSFT'], start='2021-01-04', end='2021-01-08')
+
+    high = data.high
+    assert data.loaded_fields == ['High']
+    assert high.shape == (5, 2) and (high == 11.0).all().all()
+
+
+def test_from_snapshot(tmp_path):
+    """Snapshot-backed fields are memory-mapped float32 panels."""
+    wide = _panel(np.arange(60, dtype=float).reshape(30, 2))
+    long = pd.concat({'Close': wide.stack(), 'Volume': (wide * 10).stack()}, axis=1)
+    long.index.names = ['Date', 'Ticker']
+    write_panel_snapshot(long, str(tmp_path / 'snap'))
+
+    data = MarketData.from_snapshot(str(tmp_path / 'snap'))
+
+    assert data.fields == ['Close', 'Volume']
+    assert data.volume.dtypes.eq(np.float32).all()
+    assert data.loaded_fields == ['Volume']
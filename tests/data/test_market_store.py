@@ -0,0 +1,87 @@
+"""Tests for the partitioned market data store."""
+
+import numpy as np
+import pandas as pd
+
+from src.data.market_store import MarketDataStore, merge_ranges
+
+
+def _bars(start, periods, seed=0):
+    rng = np.random.default_rng(seed)
+    dates = pd.bdate_range(start, periods=periods, tz='America/New_York')
+    close = 100 + rng.normal(0, 1, periods).cumsum()
+    return pd.DataFrame({
+        'Open': close, 'High': close + 1, 'Low': close - 1, 'Close': close,
+        'Volume': rng.integers(1_000, 10_000, periods)
+    }, index=dates)
+
+
+def test_write_and_read_slice(tmp_path):
+    """Reads return the requested tickers, fields and dates only."""
+    store = MarketDataStore(str(tmp_path))
+    store.write('AAPL', _bars('2019-12-02', 60, seed=1))
+    store.write('^GSPC', _bars('2019-12-02', 60, seed=2))
+
+    data = store.read(['AAPL', '^GSPC', 'MISSING'], start='2020-01-02', end='2020-01-10', fields=['Close'])
+
+    assert list(data.columns) == ['Close']
+    assert set(data.index.get_level_values('Ticker')) == {'AAPL', '^GSPC'}
+    dates = data.index.get_level_values('Date')
+    assert dates.min() == pd.Timestamp('2020-01-02') and dates.max() == pd.Timestamp('2020-01-10')
+    assert len(data) == 2 * 7
+
+
+def test_merge_replaces_overlapping_bars(tmp_path):
+    """Rewritten dates replace stored ones; the fetched ranges are merged."""
+    store = MarketDataStore(str(tmp_path))
+    store.write('AAPL', _bars('2020-01-01', 10), start='2020-01-01', end='2020-01-14')
+    update = _bars('2020-01-13', 5) * 2
+    store.write('AAPL', update)
+
+    reloaded = MarketDataStore(str(tmp_path))
+    close = reloaded.read(['AAPL'])['Close'].droplevel('Ticker')
+    assert len(close) == 13
+    assert close.loc['2020-01-13'] == update['Close'].iloc[0]
+    assert reloaded.coverage('AAPL') == [(pd.Timestamp('2020-01-01'), pd.Timestamp('2020-01-17'))]
+    assert reloaded.covers('AAPL', '2020-01-06', '2020-01-17')
+    assert not reloaded.covers('AAPL', '2020-01-06', '2020-01-20')
+
+
+def test_merge_ranges_bridges_weekends():
+    """Ranges separated only by a weekend are one range."""
+    ts = pd.Timestamp
+    assert merge_ranges([(ts('2020-01-06'), ts('2020-01-10')), (ts('2020-01-13'), ts('2020-01-17'))]) == [
+        (ts('2020-01-06'), ts('2020-01-17'))
+    ]
+    assert len(merge_ranges([(ts('2020-01-06'), ts('2020-01-09')), (ts('2020-01-13'), ts('2020-01-17'))])) == 2
+
+
+def test_fetch_data_reuses_stored_tickers(tmp_path):
+    """A different universe or a narrower window does not refetch stored tickers."""
+    from src.data.providers import LocalFileProvider
+    from src.tools.fetch_data import fetch_data
+
+    source = tmp_path / 'source'
+    source.mkdir()
+    for i, ticker in enumerate(['AAPL', 'MSFT']):
+        _bars('2020-01-01', 300, seed=i).tz_localize(None).rename_axis('Date').to_csv(source / f"{ticker}.csv")
+
+    class CountingProvider(LocalFileProvider):
+        calls = []
+
+        def fetch(self, ticker, start, end):
+            self.calls.append(ticker)
+            return super().fetch(ticker, start, end)
+
+    provider = CountingProvider(str(source))
+    start, end = pd.Timestamp('2020-01-01'), pd.Timestamp('2021-01-01')
+
+    data = fetch_data(['AAPL', 'MSFT'], start=start, end=end, cache_dir=tmp_path / 'cache', provider=provider)
+    assert sorted(provider.calls) == ['AAPL', 'MSFT']
+    assert data.index.get_level_values('Date').max() == pd.Timestamp('2020-12-31')
+
+    subset = fetch_data(['MSFT'], start=pd.Timestamp('2020-06-01'), end=end, fields=['Close'],
+                        cache_dir=tmp_path / 'cache', provider=provider)
+    assert sorted(provider.calls) == ['AAPL', 'MSFT']
+    assert list(subset.columns) == ['Close']
+    assert subset.index.get_level_values('Date').min() == pd.Timestamp('2020-06-01')
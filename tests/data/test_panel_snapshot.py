@@ -0,0 +1,64 @@
+"""Tests for memory-mapped panel snapshots."""
+
+import numpy as np
+import pandas as pd
+
+from src.data.panel_snapshot import PanelSnapshot, write_panel_snapshot
+
+
+def _long_frame(n_dates=50, tickers=('MSFT', 'AAPL', 'GOOGL')):
+    dates = pd.bdate_range('2021-01-01', periods=n_dates)
+    rng = np.random.default_rng(0)
+    wide = {field: pd.DataFrame(rng.uniform(10, 20, (n_dates, len(tickers))), index=dates, columns=list(tickers))
+            for field in ['Close', 'Volume']}
+    long = pd.concat({field: panel.stack() for field, panel in wide.items()}, axis=1)
+    long.index.names = ['Date', 'Ticker']
+    return long, wide
+
+
+def test_roundtrip_without_copy(tmp_path):
+    """Fields come back as float32 frames backed by the memory map."""
+    long, wide = _long_frame()
+    write_panel_snapshot(long, str(tmp_path / 'snap'), metadata={'universe': 'test'})
+
+    snapshot = PanelSnapshot(str(tmp_path / 'snap'))
+    close = snapshot.field('Close')
+
+    assert snapshot.metadata == {'universe': 'test'}
+    assert list(close.columns) == ['AAPL', 'GOOGL', 'MSFT']
+    assert close.dtypes.eq(np.float32).all()
+    pd.testing.assert_frame_equal(
+        close, wide['Close'][['AAPL', 'GOOGL', 'MSFT']].astype(np.float32),
+        check_names=False, check_freq=False
+    )
+    block = close._mgr.blocks[0].values
+    assert block.flags['C_CONTIGUOUS']
+    base = block
+    while base is not None and not isinstance(base, np.memmap):
+        base = base.base
+    assert base is not None
+
+
+def test_edits_stay_private(tmp_path):
+    """In-place edits do not reach the file or other readers."""
+    long, _ = _long_frame()
+    write_panel_snapshot(long, str(tmp_path / 'snap'))
+
+    close = PanelSnapshot(str(tmp_path / 'snap')).field('Close')
+    original = float(close.iloc[0, 0])
+    close.iloc[0, 0] = -1.0
+
+    assert PanelSnapshot(str(tmp_path / 'snap')).field('Close').iloc[0, 0] == np.float32(original)
+
+
+def test_rewrite_replaces_snapshot(tmp_path):
+    """Writing again swaps in the new panel and leaves no temporary directories."""
+    long, _ = _long_frame(n_dates=50)
+    write_panel_snapshot(long, str(tmp_path / 'snap'))
+    longer, _ = _long_frame(n_dates=80)
+    write_panel_snapshot(longer, str(tmp_path / 'snap'), fields=['Close'])
+
+    snapshot = PanelSnapshot(str(tmp_path / 'snap'))
+    assert snapshot.fields == ['Close']
+    assert len(snapshot.field('Close')) == 80
+    assert [p.name for p in tmp_path.iterdir()] == ['snap']
@@ -0,0 +1,79 @@
+"""Tests for the data-quality cleaning stage and panel hashing."""
+
+import numpy as np
+import pandas as pd
+
+from src.data.market_data import MarketData
+from src.data.quality import clean_panels, panel_hash
+
+
+def _panels():
+    dates = pd.bdate_range('2021-01-04', periods=20)
+    rng = np.random.default_rng(0)
+    close = pd.DataFrame(
+        100 * np.exp(rng.normal(0, 0.01, size=(20, 4)).cumsum(axis=0)),
+        index=dates,
+        columns=['AAA', 'BBB', 'CCC', 'DDD']
+    )
+    close.iloc[:15, 3] = np.nan          # DDD: 25% coverage
+    close.iloc[5:7, 1] = np.nan          # BBB: 2-day gap, filled
+    close.iloc[10:17, 2] = np.nan        # CCC: 7-day gap, 2 days stay missing
+    close.iloc[18, 0] *= 2.0             # AAA: bad tick
+    volume = pd.DataFrame(1e6, index=dates, columns=close.columns)
+    return {'Close': close, 'Volume': volume}
+
+
+def test_clean_panels_applies_each_step_and_reports_it():
+    """Coverage, ffill, incomplete and extreme-move steps are all reported."""
+    result = clean_panels(_panels())
+    report = result['report']
+    close = result['panels']['Close']
+
+    assert report['input'] == {'dates': 20, 'tickers': 4}
+    assert report['dropped_tickers'] == ['DDD']
+    assert report['filled_cells']['Close'] == 2 + 5
+    assert report['dropped_incomplete_dates'] == 2
+    # The bad tick moves twice: up on day 18 and back down on day 19
+    assert report['dropped_extreme_dates'] == ['2021-01-28', '2021-01-29']
+    assert report['output'] == {'dates': 16, 'tickers': 3}
+    assert report['missing_rate'] == 0.0
+    assert report['data_hash'] == result['data_hash'] == panel_hash(result['panels'])
+
+    assert list(close.columns) == ['AAA', 'BBB', 'CCC']
+    assert result['panels']['Volume'].index.equals(close.index)
+    assert (result['returns'].abs() <= 0.5).all().all()
+
+
+def test_point_in_time_cleaning_keeps_incomplete_dates():
+    """With drop_incomplete_dates off, gaps stay NaN instead of dropping dates."""
+    result = clean_panels(_panels(), drop_incomplete_dates=False)
+
+    assert result['report']['dropped_incomplete_dates'] == 0
+    assert result['report']['output']['dates'] == 18
+    assert result['panels']['Close']['CCC'].isna().sum() == 2
+
+
+def test_panel_hash_depends_only_on_content():
+    """Layout, dtype width and NaN payloads do not change the hash; values do."""
+    close = _panels()['Close']
+    reference = panel_hash(close)
+
+    assert panel_hash(close.copy()) == reference
+    assert panel_hash(pd.DataFrame(np.asfortranarray(close.to_numpy()), index=close.index, columns=close.columns)) == reference
+    as_float32 = close.astype(np.float32)
+    assert panel_hash(as_float32) == panel_hash(as_float32.astype(np.float64))
+
+    changed = close.copy()
+    changed.iloc[0, 0] += 1e-9
+    assert panel_hash(changed) != reference
+    assert panel_hash(close.rename(columns={'AAA': 'ZZZ'})) != reference
+    assert panel_hash({'Close': close}) != panel_hash({'Open': close})
+
+
+def test_market_data_hash_is_cached():
+    """MarketData hashes its closes once and matches panel_hash."""
+    close = _panels()['Close']
+    data = MarketData.from_frames(close=close)
+
+    assert data.data_hash == panel_hash({'Close': close})
+    assert data.data_hash is data.data_hash
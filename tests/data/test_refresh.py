@@ -0,0 +1,161 @@
+"""Tests for incremental store refresh."""
+
+import time
+
+import numpy as np
+import pandas as pd
+
+from src.data.market_store import MarketDataStore
+from src.data.providers import LocalFileProvider
+from src.data.refresh import TokenBucket, refresh_store
+
+
+class RecordingProvider(LocalFileProvider):
+    """Local provider that records the ranges it is asked for."""
+
+    def __init__(self, directory, latency=0.0):
+        super().__init__(directory, latency=latency)
+        self.requests = []
+
+    def fetch(self, ticker, start, end):
+        self.requests.append((ticker, start, end))
+        return super().fetch(ticker, start, end)
+
+
+def _write_source(directory, tickers, end):
+    directory.mkdir(exist_ok=True)
+    dates = pd.bdate_range('2020-01-01', end, name='Date')
+    for i, ticker in enumerate(tickers):
+        close = 100 + np.random.default_rng(i).normal(0, 1, len(dates)).cumsum()
+        pd.DataFrame({'Close': close, 'Volume': 1e6}, index=dates).to_csv(directory / f"{ticker}.csv")
+
+
+def test_missing_ranges(tmp_path):
+    """Gaps inside and after the fetched ranges are found; weekend gaps are not."""
+    store = MarketDataStore(str(tmp_path))
+    store.write('AAPL', pd.DataFrame(), start='2020-01-06', end='2020-01-10')
+    store.write('AAPL', pd.DataFrame(), start='2020-01-20', end='2020-01-24')
+
+    ts = pd.Timestamp
+    assert store.missing_ranges('AAPL', '2020-01-01', '2020-01-31') == [
+        (ts('2020-01-01'), ts('2020-01-05')),
+        (ts('2020-01-11'), ts('2020-01-19')),
+        (ts('2020-01-25'), ts('2020-01-31')),
+    ]
+    assert store.missing_ranges('AAPL', '2020-01-06', '2020-01-12') == []
+    assert store.missing_ranges('MSFT', '2020-01-06', '2020-01-10') == [(ts('2020-01-06'), ts('2020-01-10'))]
+
+
+def test_refresh_fetches_only_new_days(tmp_path):
+    """A later refresh asks the provider only for the days added since."""
+    source = tmp_path / 'source'
+    _write_source(source, ['AAPL', 'MSFT'], '2020-06-30')
+    store = MarketDataStore(str(tmp_path / 'store'))
+    provider = RecordingProvider(str(source))
+
+    refresh_store(store, provider, ['AAPL', 'MSFT'], '2020-01-01', '2020-06-30')
+    _write_source(source, ['AAPL', 'MSFT'], '2020-07-03')
+    provider.requests.clear()
+
+    stats = refresh_store(store, provider, ['AAPL', 'MSFT'], '2020-01-01', '2020-07-03')
+
+    assert provider.requests == [
+        ('AAPL', pd.Timestamp('2020-07-01'), pd.Timestamp('2020-07-03')),
+        ('MSFT', pd.Timestamp('2020-07-01'), pd.Timestamp('2020-07-03')),
+    ]
+    assert stats == {'ranges': 2, 'bars': 6, 'retries': 0, 'failed': {}}
+    close = store.read(['AAPL'], fields=['Close'])
+    assert len(close) == len(pd.bdate_range('2020-01-01', '2020-07-03'))
+
+
+def test_refresh_leaves_unpublished_days_open(tmp_path):
+    """Recent days without bars are asked for again; failures are reported."""
+    source = tmp_path / 'source'
+    today = pd.Timestamp.today().normalize()
+    _write_source(source, ['AAPL'], today - pd.Timedelta(days=10))
+    store = MarketDataStore(str(tmp_path / 'store'))
+    provider = RecordingProvider(str(source))
+
+    stats = refresh_store(store, provider, ['AAPL', 'NOPE'], today - pd.Timedelta(days=30), today)
+
+    assert list(stats['failed']) == ['NOPE']
+    assert store.coverage('AAPL')[-1][1] < today - pd.Timedelta(days=3)
+    assert store.missing_ranges('AAPL', today - pd.Timedelta(days=30), today)
+
+
+def test_concurrent_refresh_overlaps_requests(tmp_path):
+    """With several workers, slow requests overlap and every ticker is stored."""
+    tickers = [f"T{i}" for i in range(12)]
+    source = tmp_path / 'source'
+    _write_source(source, tickers, '2020-03-31')
+    provider = RecordingProvider(str(source), latency=0.1)
+    store = MarketDataStore(str(tmp_path / 'store'))
+
+    started = time.perf_counter()
+    stats = refresh_store(store, provider, tickers, '2020-01-01', '2020-03-31', max_workers=6)
+    elapsed = time.perf_counter() - started
+
+    assert stats['ranges'] == len(tickers) and not stats['failed']
+    assert elapsed < 0.6 * len(tickers) * 0.1
+    assert set(MarketDataStore(str(tmp_path / 'store')).tickers()) == set(tickers)
+
+
+def test_token_bucket_limits_rate():
+    """After the initial burst, tokens are handed out at the configured rate."""
+    bucket = TokenBucket(rate=50, capacity=1)
+    started = time.perf_counter()
+    for _ in range(11):
+        bucket.acquire()
+    assert time.perf_counter() - started >= 0.18
+
+
+def test_transient_errors_are_retried(tmp_path):
+    """A request that fails once is retried and its bars are stored."""
+    source = tmp_path / 'source'
+    _write_source(source, ['AAPL'], '2020-01-31')
+
+    class FlakyProvider(LocalFileProvider):
+        attempts = 0
+
+        def fetch(self, ticker, start, end):
+            FlakyProvider.attempts += 1
+            if FlakyProvider.attempts == 1:
+                raise ConnectionError("reset by peer")
+            return super().fetch(ticker, start, end)
+
+    store = MarketDataStore(str(tmp_path / 'store'))
+    stats = refresh_store(store, FlakyProvider(str(source)), ['AAPL'], '2020-01-01', '2020-01-31', backoff=0.01)
+
+    assert stats['retries'] == 1 and not stats['failed']
+    assert len(store.read(['AAPL'])) == len(pd.bdate_range('2020-01-01', '2020-01-31'))
+
+
+def test_empty_response_is_not_recorded_as_fetched(tmp_path):
+    """An empty answer for past sessions fails and is fetched again next time."""
+    source = tmp_path / 'source'
+    _write_source(source, ['AAPL'], '2020-01-31')
+
+    class RateLimitedProvider(LocalFileProvider):
+        calls = 0
+
+        def fetch(self, ticker, start, end):
+            RateLimitedProvider.calls += 1
+            if RateLimitedProvider.calls == 1:
+                return pd.DataFrame()
+            return super().fetch(ticker, start, end)
+
+    store = MarketDataStore(str(tmp_path / 'store'))
+    provider = RateLimitedProvider(str(source))
+
+    stats = refresh_store(store, provider, ['AAPL'], '2020-01-01', '2020-01-31', max_retries=0)
+    assert 'AAPL' in stats['failed'] and stats['ranges'] == 0
+    assert store.missing_ranges('AAPL', '2020-01-01', '2020-01-31')
+
+    stats = refresh_store(store, provider, ['AAPL'], '2020-01-01', '2020-01-31', max_retries=0)
+    assert not stats['failed'] and stats['ranges'] == 1
+    assert len(store.read(['AAPL'])) == len(pd.bdate_range('2020-01-01', '2020-01-31'))
+
+    # A range without sessions (New Year's Day) has no bars and is still recorded
+    holiday = MarketDataStore(str(tmp_path / 'holiday'))
+    stats = refresh_store(holiday, provider, ['AAPL'], '2021-01-01', '2021-01-03')
+    assert not stats['failed'] and holiday.missing_ranges('AAPL', '2021-01-01', '2021-01-03') == []
@@ -0,0 +1,128 @@
+"""Tests for point-in-time universe membership."""
+
+import numpy as np
+import pandas as pd
+
+from src.backtest.metrics import cross_sectional_ic, information_coefficient
+from src.backtest.portfolio import construct_portfolio, long_short_weights
+from src.data.market_data import MarketData
+from src.data.universe import UniverseMembership, apply_universe_mask
+from src.factors.primitives import RANK
+from src.tools.compute_factor import compute_factor
+from src.tools.fetch_data import get_universe_tickers
+
+FACTOR_YAML = """
+name: "universe_test"
+universe: "sp500"
+frequency: "D"
+signals:
+  - id: "mom"
+    custom_code: |
+      signals = close.pct_change(5)
+portfolio:
+  scheme: "long_short_deciles"
+  weight: "equal"
+  notional: 1.0
+"""
+
+
+def _membership(tmp_path):
+    (tmp_path / 'test.csv').write_text(
+        "# test universe\n"
+        "ticker,start_date,end_date\n"
+        "AAA,,\n"
+        "BBB,2021-01-06,\n"
+        "CCC,,2021-01-07\n"
+        "DDD,2021-01-05,2021-01-06\n"
+        "DDD,2021-01-12,\n"
+    )
+    return UniverseMembership.load('test', directory=str(tmp_path))
+
+
+def test_mask_follows_spells(tmp_path):
+    """Members are True only inside their spells, including re-joins."""
+    membership = _membership(tmp_path)
+    dates = pd.bdate_range('2021-01-04', '2021-01-13')
+    mask = membership.mask(dates, ['AAA', 'BBB', 'CCC', 'DDD', 'ZZZ'])
+
+    assert mask.dtypes.eq(bool).all()
+    assert mask['AAA'].all() and not mask['ZZZ'].any()
+    assert list(mask.index[mask['BBB']]) == list(dates[dates >= '2021-01-06'])
+    assert list(mask.index[mask['CCC']]) == list(dates[dates <= '2021-01-07'])
+    ddd_dates = ['2021-01-05', '2021-01-06', '2021-01-12', '2021-01-13']
+    assert list(mask.index[mask['DDD']]) == list(pd.to_datetime(ddd_dates))
+
+    assert membership.members('2021-01-08') == ['AAA', 'BBB']
+    assert membership.members_between('2021-01-08', '2021-01-11') == ['AAA', 'BBB']
+    assert membership.tickers == ['AAA', 'BBB', 'CCC', 'DDD']
+
+
+def test_get_universe_tickers_reads_constituent_file():
+    """Shipped universes are read from configs/universes."""
+    tickers = get_universe_tickers('sp500')
+    assert 'AAPL' in tickers and tickers == sorted(tickers)
+    assert get_universe_tickers('nasdaq100', as_of='2024-01-02') == get_universe_tickers('nasdaq100')
+
+
+def test_non_members_get_no_rank_position_or_ic(tmp_path):
+    """Primitives, portfolio construction and IC skip masked-out cells."""
+    membership = _membership(tmp_path)
+    dates = pd.bdate_range('2021-01-04', periods=8)
+    tickers = ['AAA', 'BBB', 'CCC', 'DDD']
+    rng = np.random.default_rng(0)
+    scores = pd.DataFrame(rng.normal(size=(8, 4)), index=dates, columns=tickers)
+    returns = pd.DataFrame(rng.normal(0, 0.01, size=(8, 4)), index=dates, columns=tickers)
+    mask = membership.mask(dates, tickers)
+
+    ranks = RANK(scores, mask=mask)
+    assert ranks.isna().equals(~mask)
+
+    weights = long_short_weights(scores.to_numpy(), mask=mask.to_numpy(), long_pct=0.5, short_pct=0.5)
+    assert (weights[~mask.to_numpy()] == 0).all()
+
+    positions, _ = construct_portfolio(scores, returns, universe_mask=mask)
+    assert (positions.to_numpy()[~mask.to_numpy()] == 0).all()
+
+    # Scrambling non-members' values must not change the IC
+    scrambled = scores.where(mask, 1e6)
+    assert np.allclose(
+        cross_sectional_ic(scores, returns, mask=mask),
+        cross_sectional_ic(scrambled, returns, mask=mask)
+    )
+    member = mask['DDD']
+    assert information_coefficient(scores['DDD'], returns['DDD'], mask=member) == information_coefficient(
+        scores['DDD'][member], returns['DDD'][member]
+    )
+
+
+def test_cross_sectional_ic_matches_spearman():
+    """Vectorized per-date IC equals scipy's Spearman correlation."""
+    rng = np.random.default_rng(1)
+    dates = pd.bdate_range('2021-01-04', periods=5)
+    scores = pd.DataFrame(rng.normal(size=(5, 6)), index=dates)
+    returns = pd.DataFrame(rng.normal(size=(5, 6)), index=dates)
+    scores.iloc[2, 1] = np.nan
+
+    ic = cross_sectional_ic(scores, returns)
+    for date in dates:
+        assert np.isclose(ic[date], information_coefficient(scores.loc[date], returns.loc[date]))
+
+
+def test_compute_factor_masks_signals_with_market_data_universe(tmp_path):
+    """Signals computed with a universe-aware MarketData are NaN for non-members."""
+    membership = _membership(tmp_path)
+    dates = pd.bdate_range('2021-01-04', periods=10)
+    prices = pd.DataFrame(
+        100 + np.arange(40, dtype=float).reshape(10, 4),
+        index=dates,
+        columns=['AAA', 'BBB', 'CCC', 'DDD']
+    )
+    market_data = MarketData.from_frames(universe=membership, close=prices)
+
+    result = compute_factor(FACTOR_YAML, prices, market_data=market_data)
+
+    signals = result['signals']
+    mask = market_data.universe_mask
+    assert mask.index.equals(prices.index) and mask.columns.equals(prices.columns)
+    assert signals.where(~mask).isna().all().all()
+    assert signals.equals(apply_universe_mask(signals, mask))
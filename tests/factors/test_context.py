@@ -0,0 +1,66 @@
+"""Tests for the per-candidate context."""
+
+import pandas as pd
+
+from src.agents.backtester import BacktesterAgent
+from src.agents.feature_agent import FeatureAgent
+from src.factors import dsl
+from src.factors.context import CandidateContext
+from src.tools import compute_factor as compute_factor_module
+
+
+def test_invalid_yaml_records_parse_error():
+    """Parse errors are kept on the context instead of raised."""
+    context = CandidateContext.from_yaml("name: [unclosed")
+
+    assert context.spec is None
+    assert context.parse_error
+    assert context.signals is None
+
+
+def test_features_and_backtest_share_one_parse_and_compute(
+    monkeypatch, tmp_path, sample_factor_yaml, sample_prices_returns
+):
+    """With a shared context the YAML is parsed and computed once."""
+    prices, returns = sample_prices_returns
+    calls = {'parse': 0, 'compute': 0}
+
+    original_parse = dsl.DSLParser.parse
+    original_compute = compute_factor_module._compute_factor
+
+    def counting_parse(self, factor_yaml):
+        calls['parse'] += 1
+        return original_parse(self, factor_yaml)
+
+    def counting_compute(*args, **kwargs):
+        calls['compute'] += 1
+        return original_compute(*args, **kwargs)
+
+    monkeypatch.setattr(dsl.DSLParser, 'parse', counting_parse)
+    monkeypatch.setattr(compute_factor_module, '_compute_factor', counting_compute)
+
+    context = CandidateContext.from_yaml(sample_factor_yaml)
+    feature_result = FeatureAgent().compute_features(sample_factor_yaml, prices, returns, context=context)
+    assert feature_result.status == "SUCCESS"
+
+    # The sample panel is too small to pass validation; only the work done matters here
+    BacktesterAgent(output_base_dir=tmp_path).run_backtest(
+        factor_yaml=sample_factor_yaml,
+        prices_df=prices,
+        returns_df=returns,
+        run_id='ctx',
+        context=context
+    )
+
+    assert calls == {'parse': 1, 'compute': 1}
+    assert context.signals is feature_result.content.data['signals']
+
+
+def test_attached_signals_are_used():
+    """Signals restored elsewhere are returned without recomputing."""
+    context = CandidateContext.from_yaml("name: f\nsignals: []\n")
+    signals = pd.DataFrame({'AAPL': [0.1, 0.2]})
+    context.attach_signals(signals)
+
+    result = compute_factor_module.compute_factor(context.factor_yaml, pd.DataFrame(), context=context)
+    assert result['signals'] is signals
@@ -167,3 +167,26 @@ result = signal
         
         assert result['success']
         assert isinstance(result['signals'], pd.DataFrame)
+    
+    def test_market_data_fields_loaded_on_use(self, sample_data):
+        """Code sees the OHLCV fields it names; the others are not loaded."""
+        from src.data.market_data import MarketData
+        
+        prices, returns = sample_data
+        loaded = []
+        
+        def loader(field):
+            def load():
+                loaded.append(field)
+                return prices * 1000
+            return load
+        
+        market_data = MarketData({f: loader(f) for f in ['High', 'Low', 'Volume']}, close=prices)
+        code = """
+vol_surge = volume / volume.rolling(5).mean()
+result = vol_surge.rank(axis=1, pct=True)
+"""
+        result = execute_nonlinear_factor(code, prices, returns, market_data=market_data)
+        
+        assert result['success']
+        assert loaded == ['Volume']
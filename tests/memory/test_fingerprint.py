@@ -0,0 +1,108 @@
+"""Tests for signal fingerprints and the near-duplicate index."""
+
+import multiprocessing
+import time
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.memory.fingerprint import signal_fingerprint
+from src.memory.store import ExperimentStore
+
+
+def _index_concurrently(db_path, sketch, factor_id, barrier, results):
+    store = ExperimentStore(db_path)
+    barrier.wait()
+    matches = store.add_fingerprint_if_unique(f"candidate_{factor_id}", sketch, factor_id=factor_id)
+    results.put((factor_id, bool(matches)))
+
+
+@pytest.fixture
+def panel():
+    """Random signal panel, 750 dates x 200 tickers."""
+    rng = np.random.default_rng(11)
+    dates = pd.bdate_range('2019-01-01', periods=750)
+    tickers = [f"T{i}" for i in range(200)]
+    return pd.DataFrame(rng.normal(size=(750, 200)), index=dates, columns=tickers)
+
+
+def test_sketch_approximates_correlation(panel):
+    """Sketch dot products track the correlation of the panels."""
+    rng = np.random.default_rng(12)
+    noise = pd.DataFrame(rng.normal(size=panel.shape), index=panel.index, columns=panel.columns)
+
+    for mix in (0.0, 0.3, 1.0):
+        other = panel + mix * noise
+        expected = np.corrcoef(panel.to_numpy().ravel(), other.to_numpy().ravel())[0, 1]
+
+        estimate = signal_fingerprint(panel) @ signal_fingerprint(other)
+        assert estimate == pytest.approx(expected, abs=0.05)
+
+
+def test_sketch_invariant_to_scale_and_layout(panel):
+    """Rescaled, shifted or column-shuffled panels share a fingerprint."""
+    base = signal_fingerprint(panel)
+    shuffled = (3 * panel + 1)[panel.columns[::-1]]
+
+    assert base @ signal_fingerprint(shuffled) == pytest.approx(1.0, abs=1e-5)
+    assert np.linalg.norm(signal_fingerprint(panel * np.nan)) == 0.0
+
+
+def test_store_flags_near_duplicates(tmp_path, panel):
+    """The store finds transformed copies and ignores unrelated signals."""
+    store = ExperimentStore(str(tmp_path / 'experiments.db'))
+    rng = np.random.default_rng(13)
+    for i in range(50):
+        other = pd.DataFrame(rng.normal(size=panel.shape), index=panel.index, columns=panel.columns)
+        store.add_fingerprint(f"unrelated_{i}", signal_fingerprint(other))
+    store.add_fingerprint('original', signal_fingerprint(panel), factor_id=None)
+
+    near_copy = 2 * panel + 0.1 * rng.normal(size=panel.shape)
+    start = time.perf_counter()
+    matches = store.find_similar_fingerprints(signal_fingerprint(near_copy))
+    elapsed = time.perf_counter() - start
+
+    assert [m['name'] for m in matches] == ['original']
+    assert matches[0]['correlation'] > 0.95
+    assert elapsed < 0.5
+
+    reopened = ExperimentStore(str(tmp_path / 'experiments.db'))
+    assert reopened.find_similar_fingerprints(signal_fingerprint(panel))[0]['name'] == 'original'
+    assert reopened.find_similar_fingerprints(signal_fingerprint(-panel)) == []
+
+
+def test_broadcast_time_series_signals(panel):
+    """Signals identical across tickers are fingerprinted by their time series."""
+    series = panel.iloc[:, 0]
+    broadcast = pd.DataFrame({ticker: series for ticker in panel.columns})
+    shifted = pd.DataFrame({ticker: series.shift(5) for ticker in panel.columns})
+
+    assert np.linalg.norm(signal_fingerprint(broadcast)) == pytest.approx(1.0)
+    assert signal_fingerprint(broadcast) @ signal_fingerprint(broadcast * 2) == pytest.approx(1.0, abs=1e-5)
+    assert abs(signal_fingerprint(broadcast) @ signal_fingerprint(shifted)) < 0.2
+
+
+def test_concurrent_candidates_are_deduplicated(tmp_path, panel):
+    """Workers indexing near-identical signals at once: exactly one is kept."""
+    db_path = str(tmp_path / 'experiments.db')
+    ExperimentStore(db_path)
+    sketch = signal_fingerprint(panel)
+    barrier, results = multiprocessing.Barrier(4), multiprocessing.Queue()
+
+    processes = [
+        multiprocessing.Process(target=_index_concurrently, args=(db_path, sketch, i, barrier, results))
+        for i in range(4)
+    ]
+    for process in processes:
+        process.start()
+    for process in processes:
+        process.join()
+    outcomes = dict(results.get() for _ in processes)
+
+    assert sorted(outcomes.values()) == [False, True, True, True]
+    store = ExperimentStore(db_path)
+    assert len(store.find_similar_fingerprints(sketch)) == 1
+    # The kept candidate is not a duplicate of itself when retried
+    kept = next(factor_id for factor_id, duplicate in outcomes.items() if not duplicate)
+    assert store.add_fingerprint_if_unique('retry', sketch, factor_id=kept) == []
@@ -0,0 +1,152 @@
+"""Tests for run logging, SQLite concurrency settings and the batched writer."""
+
+import multiprocessing
+import sqlite3
+import time
+from datetime import datetime
+
+import pytest
+from sqlalchemy.exc import IntegrityError
+
+from src.memory.store import ExperimentStore, Issue, Lesson, Metric, Run, RunWriter
+from src.tools.logbook import log_run, log_runs
+
+METRICS = {
+    'sharpe': 1.2, 'ann_ret': 0.1, 'ann_vol': 0.08, 'maxdd': -0.15, 'avg_ic': 0.03,
+    'ir': 0.6, 'turnover_monthly': 25.0, 'hit_rate': 0.53
+}
+
+
+def _record(**kwargs):
+    record = {
+        'factor_id': 1,
+        'start_date': datetime(2020, 1, 1),
+        'end_date': datetime(2024, 1, 1),
+        'metrics': METRICS
+    }
+    record.update(kwargs)
+    return record
+
+
+def _count(store, model):
+    session = store.get_session()
+    try:
+        return session.query(model).count()
+    finally:
+        session.close()
+
+
+def _produce(run_queue, seeds):
+    for seed in seeds:
+        run_queue.put(_record(seed=seed))
+
+
+def test_log_run_writes_run_metrics_issues_and_lessons(tmp_path):
+    """One call stores every row, with lessons linked to the new run."""
+    store = ExperimentStore(str(tmp_path / "experiments.db"))
+    run = store.log_run(
+        **_record(),
+        issues=[{'type': 'unstable_ic', 'detail': 'IC flips sign', 'severity': 'error'}],
+        lessons=[{'title': 'Short lookbacks are noisy', 'body': '...', 'tags': ['momentum']}],
+        regime_label='bull'
+    )
+
+    assert run.status == 'completed' and run.regime_label == 'bull'
+    assert run.metrics[0].sharpe == 1.2 and run.issues[0].type == 'unstable_ic'
+    assert [_count(store, model) for model in (Run, Metric, Issue, Lesson)] == [1, 1, 1, 1]
+    assert store.get_failed_runs()[0].id == run.id
+
+    session = store.get_session()
+    try:
+        assert session.query(Lesson).one().source_run_id == run.id
+    finally:
+        session.close()
+
+
+def test_log_runs_is_one_transaction(tmp_path):
+    """A batch is written in order, and a bad record rolls back the whole batch."""
+    db_path = str(tmp_path / "experiments.db")
+    store = ExperimentStore(db_path)
+
+    runs = store.log_runs([_record(seed=seed) for seed in range(50)])
+    assert [run.seed for run in runs] == list(range(50))
+    assert [run.id for run in runs] == sorted(run.id for run in runs)
+
+    with pytest.raises(IntegrityError):
+        store.log_runs([_record(), _record(factor_id=None)])
+    assert _count(store, Run) == _count(store, Metric) == 50
+
+    # Stores on the same file share the process-wide engine
+    assert ExperimentStore(db_path).engine is store.engine
+
+
+def test_logbook_batch_matches_single(tmp_path):
+    """log_runs returns the same run ids and summary cards as log_run."""
+    db_path = str(tmp_path / "experiments.db")
+    issues = [{'type': 'high_turnover', 'detail': 'turnover 80%'}]
+
+    single = log_run(**_record(), issues=issues, db_path=db_path)
+    batch = log_runs([_record(issues=issues), _record()], db_path=db_path)
+
+    assert [result['run_id'] for result in batch] == [single['run_id'] + 1, single['run_id'] + 2]
+    assert batch[0]['summary'].split('\n')[1:] == single['summary'].split('\n')[1:]
+    assert 'high_turnover' in batch[0]['summary']
+    assert 'No issues detected' in batch[1]['summary']
+
+
+def test_connections_use_wal_and_busy_timeout(tmp_path):
+    """Every pooled connection is set up for concurrent access."""
+    store = ExperimentStore(str(tmp_path / "experiments.db"))
+
+    with store.engine.connect() as conn:
+        assert conn.exec_driver_sql("PRAGMA journal_mode").scalar() == 'wal'
+        assert conn.exec_driver_sql("PRAGMA busy_timeout").scalar() == 30000
+        assert conn.exec_driver_sql("PRAGMA synchronous").scalar() == 1  # NORMAL
+
+
+def test_writes_are_not_blocked_by_an_open_read(tmp_path):
+    """A long read transaction in another connection does not lock out writers."""
+    db_path = str(tmp_path / "experiments.db")
+    store = ExperimentStore(db_path)
+    store.log_run(**_record())
+
+    reader = sqlite3.connect(db_path, isolation_level=None)
+    try:
+        reader.execute("BEGIN")
+        assert reader.execute("SELECT COUNT(*) FROM runs").fetchone()[0] == 1
+
+        start = time.perf_counter()
+        store.log_run(**_record())
+        assert time.perf_counter() - start < 1.0
+        # The reader keeps its snapshot until its transaction ends
+        assert reader.execute("SELECT COUNT(*) FROM runs").fetchone()[0] == 1
+        reader.execute("COMMIT")
+    finally:
+        reader.close()
+    assert store.count_runs() == 2
+
+
+def test_run_writer_commits_runs_from_worker_processes(tmp_path):
+    """Runs queued by several processes are all committed by the one writer."""
+    db_path = str(tmp_path / "experiments.db")
+
+    with RunWriter(db_path, batch_size=25, flush_interval=0.05) as writer:
+        processes = [
+            multiprocessing.Process(target=_produce, args=(writer.queue, range(i * 40, (i + 1) * 40)))
+            for i in range(3)
+        ]
+        for process in processes:
+            process.start()
+        for process in processes:
+            process.join()
+        # A bad record is dropped without losing the rest of its batch
+        writer.submit(_record(factor_id=None))
+
+    assert len(writer.run_ids) == 120 and writer.n_failed == 1
+    store = ExperimentStore(db_path)
+    assert store.count_runs() == 120
+    session = store.get_session()
+    try:
+        assert sorted(seed for (seed,) in session.query(Run.seed)) == list(range(120))
+    finally:
+        session.close()
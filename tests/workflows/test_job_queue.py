@@ -0,0 +1,127 @@
+"""Tests for the SQLite job queue."""
+
+import multiprocessing
+import os
+import time
+
+import numpy as np
+import pandas as pd
+
+from src.workflows.job_queue import JobQueue, QueueWorker, make_factor_handler
+
+
+def _square(payload):
+    time.sleep(0.01)
+    return {'value': payload['x'] ** 2, 'pid': os.getpid()}
+
+
+def _work(queue_path):
+    QueueWorker(JobQueue(queue_path), _square, poll_interval=0.01).run(idle_timeout=0.5)
+
+
+def test_claim_order_and_completion(tmp_path):
+    """Higher priority first, then FIFO; completed jobs keep their result."""
+    queue = JobQueue(str(tmp_path / 'jobs.db'))
+    low = queue.enqueue({'x': 1})
+    high = queue.enqueue({'x': 2}, priority=5)
+
+    job = queue.claim('w1')
+    assert job['id'] == high and job['payload'] == {'x': 2}
+    assert queue.complete(job['id'], 'w1', {'ok': True})
+
+    assert queue.claim('w1')['id'] == low
+    assert queue.claim('w1') is None
+    assert queue.get(high)['result'] == {'ok': True}
+    assert queue.counts() == {'queued': 0, 'running': 1, 'done': 1, 'failed': 0}
+
+
+def test_expired_lease_is_reclaimed(tmp_path):
+    """A job whose worker stops heartbeating goes to another worker."""
+    queue = JobQueue(str(tmp_path / 'jobs.db'))
+    job_id = queue.enqueue({'x': 1})
+
+    queue.claim('dead', lease_seconds=0.05)
+    assert queue.claim('alive') is None
+    time.sleep(0.1)
+
+    job = queue.claim('alive')
+    assert job['id'] == job_id and job['attempts'] == 2
+    assert not queue.heartbeat(job_id, 'dead')
+    assert not queue.complete(job_id, 'dead', {})
+    assert queue.heartbeat(job_id, 'alive')
+
+
+def test_failed_jobs_retry_then_fail(tmp_path):
+    """Failures are retried until max_attempts."""
+    queue = JobQueue(str(tmp_path / 'jobs.db'))
+    job_id = queue.enqueue({'x': 1}, max_attempts=2)
+
+    def broken(payload):
+        raise RuntimeError("boom")
+
+    worker = QueueWorker(queue, broken, worker_id='w', retry_delay=0.0)
+    assert worker.run_one() == job_id
+    assert queue.get(job_id)['status'] == 'queued'
+    assert worker.run_one() == job_id
+
+    job = queue.get(job_id)
+    assert job['status'] == 'failed' and job['attempts'] == 2
+    assert 'boom' in job['error']
+    assert worker.run_one() is None
+
+
+def test_heartbeat_keeps_long_jobs(tmp_path):
+    """Heartbeats extend the lease while a job outlives it."""
+    queue = JobQueue(str(tmp_path / 'jobs.db'))
+    job_id = queue.enqueue({'x': 3})
+
+    def slow(payload):
+        time.sleep(0.5)
+        assert queue.claim('other') is None
+        return {}
+
+    QueueWorker(queue, slow, worker_id='w', lease_seconds=0.2, heartbeat_interval=0.05).run_one()
+    assert queue.get(job_id)['status'] == 'done'
+
+
+def test_workers_process_each_job_once(tmp_path):
+    """Concurrent worker processes share the queue without double claims."""
+    queue_path = str(tmp_path / 'jobs.db')
+    queue = JobQueue(queue_path)
+    ids = queue.enqueue_many([{'x': i} for i in range(40)])
+
+    processes = [multiprocessing.Process(target=_work, args=(queue_path,)) for _ in range(4)]
+    for process in processes:
+        process.start()
+    for process in processes:
+        process.join()
+
+    jobs = [queue.get(job_id) for job_id in ids]
+    assert all(job['status'] == 'done' and job['attempts'] == 1 for job in jobs)
+    assert [job['result']['value'] for job in jobs] == [i ** 2 for i in range(40)]
+    assert len({job['result']['pid'] for job in jobs}) > 1
+
+
+def test_factor_handler_records_outcome(tmp_path, sample_factor_yaml):
+    """Factor jobs are registered in the store; a retry is not its own duplicate."""
+    rng = np.random.default_rng(5)
+    dates = pd.bdate_range('2020-01-01', periods=600)
+    returns = pd.DataFrame(rng.normal(0, 0.02, (600, 20)), index=dates, columns=[f"T{i}" for i in range(20)])
+    prices = 100 * (1 + returns).cumprod()
+
+    handler = make_factor_handler(
+        prices, returns,
+        db_path=str(tmp_path / 'experiments.db'),
+        screening_thresholds={},
+        output_base_dir=str(tmp_path / 'runs')
+    )
+
+    first = handler({'factor_yaml': sample_factor_yaml})
+    retry = handler({'factor_yaml': sample_factor_yaml})
+
+    # DSL signals are broadcast to every ticker, so they skip the cross-sectional screens;
+    # validation then fails the 20-ticker panel on sample size
+    assert first['screening']['broadcast']
+    assert first['status'] == 'backtest_failed'
+    assert retry['status'] == 'backtest_failed'
+    assert retry['factor_id'] == first['factor_id']
@@ -0,0 +1,66 @@
+"""Tests for the successive-halving scheduler."""
+
+import time
+
+import numpy as np
+
+from src.memory.store import ExperimentStore
+from src.workflows.scheduler import SuccessiveHalvingScheduler, make_backtest_evaluator
+
+
+def _quality_evaluator(evaluations):
+    """Score = candidate quality; records every (candidate, rung) evaluated."""
+    def evaluate(candidate_id, quality, rung):
+        evaluations.append((candidate_id, rung['history_days']))
+        return quality
+    return evaluate
+
+
+def test_promotes_top_fraction(tmp_path):
+    """Each rung keeps the top 1/eta; only survivors reach the full history."""
+    store = ExperimentStore(str(tmp_path / 'experiments.db'))
+    evaluations = []
+    candidates = {f"c{i}": float(i) for i in range(9)}
+
+    scheduler = SuccessiveHalvingScheduler(_quality_evaluator(evaluations), eta=3, store=store)
+    result = scheduler.run(candidates, cycle_id='cycle')
+
+    assert [len([e for e in evaluations if e[1] == days]) for days in (378, 756, None)] == [9, 3, 1]
+    assert result['ranking'][:3] == ['c8', 'c7', 'c6']
+
+    decisions = store.get_scheduler_decisions('cycle')
+    assert len(decisions) == 13
+    assert sum(d.decision == 'promoted' for d in decisions) == 4
+    assert [d.decision for d in decisions if d.rung == 2] == ['completed']
+
+
+def test_daily_cpu_budget_is_shared(tmp_path):
+    """CPU seconds logged by earlier cycles count against today's budget."""
+    store = ExperimentStore(str(tmp_path / 'experiments.db'))
+
+    def busy(candidate_id, quality, rung):
+        end = time.process_time() + 0.02
+        while time.process_time() < end:
+            pass
+        return quality
+
+    scheduler = SuccessiveHalvingScheduler(busy, daily_cpu_budget=0.05, store=store)
+    first = scheduler.run({f"c{i}": float(i) for i in range(6)}, cycle_id='first')
+
+    assert first['budget_exhausted']
+    assert any(d.decision == 'budget_exhausted' for d in store.get_scheduler_decisions('first'))
+    assert scheduler.remaining_budget() == 0.0
+
+    second = scheduler.run({'late': 1.0}, cycle_id='second')
+    assert second['scores'] == {}
+    assert store.get_scheduler_decisions('second')[0].decision == 'budget_exhausted'
+
+
+def test_backtest_evaluator_scores_rungs(sample_prices, sample_returns, sample_factor_yaml):
+    """The backtest evaluator returns finite Sharpe ratios on each rung."""
+    evaluate = make_backtest_evaluator(sample_prices, sample_returns)
+    scheduler = SuccessiveHalvingScheduler(evaluate)
+
+    for rung in scheduler.rungs:
+        score = evaluate('momentum', sample_factor_yaml, rung)
+        assert np.isfinite(score)